@@ -1,7 +1,8 @@
 # core/admin.py
 from django.contrib import admin
+from django.utils import timezone
 
-from .models import Address, ApiKey
+from .models import Address, ApiKey, OutboxMessage, OutboxStatus, WebhookEndpoint
 
 
 @admin.register(Address)
@@ -133,3 +134,84 @@ class ApiKeyAdmin(admin.ModelAdmin):
 
     is_expired.boolean = True
     is_expired.short_description = "Expired"
+
+
+@admin.register(WebhookEndpoint)
+class WebhookEndpointAdmin(admin.ModelAdmin):
+    """Admin interface for WebhookEndpoint model."""
+
+    list_display = ["public_id", "name", "url", "resources", "is_active"]
+    list_display_links = ["public_id", "name"]
+    list_filter = ["is_active"]
+    search_fields = ["public_id", "name", "url"]
+    readonly_fields = ["public_id", "secret", "created_at", "updated_at", "deleted_at"]
+    list_per_page = 50
+    ordering = ["name"]
+
+    fieldsets = (
+        (
+            "Endpoint",
+            {
+                "fields": ("name", "url", "resources", "is_active"),
+                "description": "Where and which change events are delivered",
+            },
+        ),
+        (
+            "Delivery",
+            {
+                "fields": ("max_concurrency", "batch_size", "secret"),
+                "description": "Share the secret with the partner to verify "
+                "the X-Webhook-Signature header",
+            },
+        ),
+        (
+            "Audit Information",
+            {
+                "fields": ("public_id", "created_at", "updated_at", "deleted_at"),
+                "classes": ("collapse",),
+                "description": "Timestamps for auditing",
+            },
+        ),
+    )
+
+
+@admin.action(description="Retry selected messages now")
+def retry_selected(modeladmin, request, queryset):
+    """Put the selected messages, e.g. dead letters, back in the outbox."""
+    count = queryset.update(
+        status=OutboxStatus.PENDING,
+        attempts=0,
+        next_attempt_at=timezone.now(),
+        locked_until=None,
+    )
+    modeladmin.message_user(request, f"{count} messages queued for delivery.")
+
+
+@admin.register(OutboxMessage)
+class OutboxMessageAdmin(admin.ModelAdmin):
+    """Admin interface for OutboxMessage model."""
+
+    list_display = [
+        "id",
+        "__str__",
+        "endpoint",
+        "status",
+        "attempts",
+        "next_attempt_at",
+    ]
+    list_filter = ["status", "endpoint"]
+    readonly_fields = [
+        "endpoint",
+        "event",
+        "created_at",
+        "status",
+        "attempts",
+        "next_attempt_at",
+        "locked_until",
+        "last_error",
+    ]
+    list_per_page = 50
+    actions = [retry_selected]
+
+    def has_add_permission(self, request):
+        return False
@@ -1,15 +1,36 @@
 # core/api.py
-from django.shortcuts import get_object_or_404
-from ninja import Router
+import codecs
 
+from django.conf import settings
+from django.db import IntegrityError
+from django.http import HttpResponse, StreamingHttpResponse
+from django.shortcuts import get_object_or_404
+from ninja import File, Query, Router, UploadedFile
+from ninja.errors import HttpError
+
+from core import events
+from core.deletion import delete_response, restore_deleted_at
+from core.exports import export_response
+from core.imports import CSVImportError, import_csv
+from core.models import ChangeRecord
 from core.models.address import Address
+from core.sync import sync_page
 
 from .schemas import (
     AddressIn,
     AddressListOut,
     AddressOut,
     AddressPatch,
+    ChangeFilter,
+    ChangeRecordOut,
     ErrorResponse,
+    EventFilter,
+    ExportFilter,
+    ImportOut,
+    RestoreIn,
+    RestoreOut,
+    SyncFilter,
+    SyncOut,
     ValidationErrorResponse,
 )
 
@@ -29,6 +50,40 @@ def list_addresses(request):
     return addresses
 
 
+@router.get("/addresses/sync", response=SyncOut[AddressListOut], tags=["Addresses"])
+def sync_addresses(request, filters: Query[SyncFilter]):
+    """
+    List the addresses created, updated or deleted since the previous sync.
+
+    Pass the `next_token` of each response as `updated_since` in the next
+    request; deleted addresses are returned by public ID only.
+    """
+    return sync_page(Address.all_objects.all(), filters.updated_since, filters.limit)
+
+
+@router.get("/addresses/export", tags=["Addresses"])
+def export_addresses(request, filters: Query[ExportFilter]):
+    """Stream every address as NDJSON or CSV (gzipped if accepted)."""
+    return export_response(
+        request,
+        Address.objects.all(),
+        [
+            "public_id",
+            "line1",
+            "line2",
+            "postal_code",
+            "city",
+            "state",
+            "country",
+            "created_at",
+            "updated_at",
+        ],
+        {},
+        filters.format,
+        "addresses",
+    )
+
+
 @router.get(
     "/addresses/{public_id}",
     response={200: AddressOut, 404: ErrorResponse},
@@ -142,19 +197,148 @@ def partial_update_address(request, public_id: str, payload: AddressPatch):
 
 
 @router.delete("/addresses/{public_id}", response={204: None}, tags=["Addresses"])
-def delete_address(request, public_id: str):
+def delete_address(
+    request, response: HttpResponse, public_id: str, purge: bool = False
+):
     """
-    Permanently delete an address.
+    Soft-delete an address, or permanently delete it with `purge=true`.
 
-    Warning: This action cannot be undone. Ensure no entities (venues, athletes)
-    are referencing this address before deletion.
+    Venues and people referencing a soft-deleted address keep the reference,
+    so it is intact after a restore. Purging sets their address to null.
 
     Args:
         public_id: The unique public identifier for the address
+        purge: Permanently delete the address, even if already soft-deleted
 
     Returns:
-        204 No Content on successful deletion
+        204 No Content on successful deletion, with the soft-delete timestamp
+        in the X-Deleted-At header
     """
-    address = get_object_or_404(Address, public_id=public_id)
-    address.delete()
-    return 204, None
+    return delete_response(response, Address, public_id, purge)
+
+
+@router.post(
+    "/restore",
+    response={200: RestoreOut, 404: ErrorResponse, 409: ErrorResponse},
+    tags=["Restore"],
+)
+def restore(request, payload: RestoreIn):
+    """
+    Restore every record soft-deleted at a given timestamp.
+
+    A soft delete stamps the record and everything cascading from it (e.g.
+    the activities of a season, and their results) with the same timestamp,
+    returned in the X-Deleted-At header: posting it back undoes the delete.
+    Records soft-deleted earlier on their own are not restored.
+
+    Args:
+        payload: The timestamp of the soft delete to reverse
+
+    Returns:
+        Number of restored records, in total and per model
+    """
+    try:
+        total, restored = restore_deleted_at(payload.deleted_at)
+    except IntegrityError as err:
+        raise HttpError(
+            409, "Restoring would conflict with records created since"
+        ) from err
+    if not total:
+        raise HttpError(404, "No record was deleted at this timestamp")
+
+    return {"deleted_at": payload.deleted_at, "total": total, "restored": restored}
+
+
+@router.get("/changes", response=list[ChangeRecordOut], tags=["Changes"])
+def list_changes(request, filters: Query[ChangeFilter]):
+    """
+    List the change history, newest first.
+
+    Each entry holds the changed fields with their values before and after.
+    Bounding the time range with `since` and `until` limits the scan to the
+    monthly partitions of that range.
+    """
+    changes = ChangeRecord.objects.all()
+    if filters.model:
+        changes = changes.filter(model=filters.model)
+    if filters.public_id:
+        changes = changes.filter(public_id=filters.public_id)
+    if filters.since:
+        changes = changes.filter(changed_at__gte=filters.since)
+    if filters.until:
+        changes = changes.filter(changed_at__lt=filters.until)
+    return changes[: filters.limit]
+
+
+@router.get("/events", response={200: None, 400: ErrorResponse}, tags=["Events"])
+def stream_events(request, filters: Query[EventFilter]):
+    """
+    Stream change events as Server-Sent Events (`text/event-stream`).
+
+    Each `change` event carries the resource, public ID, operation, update
+    time and season of a record written, once committed. Reconnecting with
+    the `Last-Event-ID` header resumes after that event, or starts with a
+    `reset` event when the events missed are no longer available, meaning
+    the client should reload its data. Served by the ASGI application only.
+    """
+    unknown = set(filters.resource) - events.resource_names()
+    if unknown:
+        raise HttpError(400, f"Unknown resources: {', '.join(sorted(unknown))}")
+
+    response = StreamingHttpResponse(
+        events.stream(
+            set(filters.resource),
+            filters.season,
+            request.headers.get("Last-Event-ID"),
+        ),
+        content_type="text/event-stream",
+    )
+    response["Cache-Control"] = "no-cache"
+    # Stops nginx from buffering the stream
+    response["X-Accel-Buffering"] = "no"
+    return response
+
+
+@router.post(
+    "/imports/{resource}",
+    response={200: ImportOut, 400: ErrorResponse, 413: ErrorResponse},
+    tags=["Imports"],
+)
+def import_records(request, resource: str, file: File[UploadedFile]):
+    """
+    Import records from a CSV file, e.g. to onboard a federation.
+
+    The header names the fields of the input schema of the resource
+    (`athletes`, `coaches`, `venues` or `addresses`). Rows with a `public_id`
+    column update that record, the others are created. Invalid rows are left
+    out and reported with their line number; the others are imported.
+
+    Files up to `IMPORT_MAX_UPLOAD_BYTES` are imported, within the request, and
+    the first `IMPORT_MAX_REJECTS` rejected rows are listed. Larger files are
+    imported with the import_csv management command, which validates rows with
+    a pool of processes and writes every reject to a file.
+    """
+    if file.size > settings.IMPORT_MAX_UPLOAD_BYTES:
+        raise HttpError(
+            413,
+            f"Files over {settings.IMPORT_MAX_UPLOAD_BYTES} bytes are imported "
+            "with the import_csv management command",
+        )
+
+    rejects = []
+
+    def collect(reject):
+        if len(rejects) < settings.IMPORT_MAX_REJECTS:
+            rejects.append(reject)
+
+    try:
+        counts = import_csv(
+            resource,
+            codecs.iterdecode(file, "utf-8-sig"),
+            collect,
+            workers=0,
+            chunk_size=settings.IMPORT_CHUNK_SIZE,
+        )
+    except (CSVImportError, UnicodeDecodeError) as err:
+        raise HttpError(400, str(err)) from err
+    return {**counts.as_dict(), "rejects": rejects}
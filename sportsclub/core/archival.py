@@ -0,0 +1,242 @@
+# core/archival.py
+"""
+Archival and purge of rows soft-deleted a long time ago.
+
+Rows are moved (or deleted) one model at a time, in batches of consecutive
+primary keys, each batch in its own short transaction so live tables are never
+locked for long. Batches are selected with `FOR UPDATE SKIP LOCKED`, so rows
+being written meanwhile are left for the next run.
+
+Archive tables live in the `archive` schema, named after the live tables, and
+are created on first use with the columns of the live table plus
+`archived_at`. Columns added to a live table later are added to its archive
+table too, so archives keep working across migrations.
+
+What a hard delete would do to other rows is done with raw SQL as well:
+
+- memberships in many-to-many relations are archived (or purged) along;
+- derived rows without soft deletion (e.g. ranking snapshots) are purged;
+- `SET_NULL` references from other rows are set to null.
+
+A row still referenced by a `CASCADE` foreign key from a row that is live, or
+not due yet, is kept until that row goes too. Models are processed dependants
+first, so a whole soft-deleted cascade goes in a single run.
+"""
+
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import datetime
+
+from django.db import connection, models, transaction
+
+from core.deletion import auditory_models
+from core.models import Auditory
+
+ARCHIVE_SCHEMA = "archive"
+
+
+@dataclass
+class Batch:
+    """Outcome of one batch: the model, its row count and the last key seen."""
+
+    model: type[models.Model]
+    rows: int
+    last_pk: int
+
+
+def _qn(name: str) -> str:
+    return connection.ops.quote_name(name)
+
+
+def archive_table(model) -> str:
+    """Return the quoted name of the archive table of a model."""
+    return f"{_qn(ARCHIVE_SCHEMA)}.{_qn(model._meta.db_table)}"
+
+
+def ensure_archive_table(model):
+    """Create the archive table of a model, or add the columns it lacks."""
+    table = _qn(model._meta.db_table)
+    with connection.cursor() as cursor:
+        cursor.execute(f"CREATE SCHEMA IF NOT EXISTS {_qn(ARCHIVE_SCHEMA)}")
+        # Created without constraints, so rows can be archived in any order
+        cursor.execute(
+            f"""
+            CREATE TABLE IF NOT EXISTS {archive_table(model)} AS
+            SELECT *, NULL::timestamptz AS archived_at FROM {table} WITH NO DATA
+            """
+        )
+        cursor.execute(
+            """
+            SELECT live.attname, format_type(live.atttypid, live.atttypmod)
+            FROM pg_attribute live
+            WHERE live.attrelid = %s::regclass
+              AND live.attnum > 0
+              AND NOT live.attisdropped
+              AND NOT EXISTS (
+                  SELECT 1 FROM pg_attribute archived
+                  WHERE archived.attrelid = %s::regclass
+                    AND archived.attname = live.attname
+                    AND NOT archived.attisdropped
+              )
+            """,
+            [table, archive_table(model)],
+        )
+        for column, column_type in cursor.fetchall():
+            cursor.execute(
+                f"ALTER TABLE {archive_table(model)} "
+                f"ADD COLUMN {_qn(column)} {column_type}"
+            )
+
+
+def _memberships(model) -> list[tuple[type[models.Model], str]]:
+    """Through models of the many-to-many relations of a model, with a column."""
+    memberships = [
+        (field.remote_field.through, field.m2m_column_name())
+        for field in model._meta.local_many_to_many
+    ]
+    memberships += [
+        (relation.through, relation.field.m2m_reverse_name())
+        for relation in model._meta.related_objects
+        if relation.many_to_many
+    ]
+    return memberships
+
+
+def _references(model) -> list:
+    """Reverse foreign keys to a model."""
+    return [
+        relation
+        for relation in model._meta.related_objects
+        if relation.one_to_many or relation.one_to_one
+    ]
+
+
+def _is_blocking(relation) -> bool:
+    """Whether referencing rows must be gone before the referenced ones."""
+    if relation.on_delete is models.CASCADE:
+        return issubclass(relation.related_model, Auditory)
+    return relation.on_delete is not models.SET_NULL
+
+
+def processing_order() -> list[type[Auditory]]:
+    """Return the models with soft deletion, each after its dependants."""
+    pending, ordered = auditory_models(), []
+    while pending:
+        ready = [
+            model
+            for model in pending
+            if not any(
+                relation.related_model in pending
+                and relation.related_model is not model
+                for relation in _references(model)
+                if _is_blocking(relation)
+            )
+        ]
+        # A dependency cycle would never become ready: keep the rest as is
+        ready = ready or pending
+        ordered += ready
+        pending = [model for model in pending if model not in ready]
+    return ordered
+
+
+def _eligible_sql(model) -> str:
+    """WHERE clause selecting the rows of a model that can go."""
+    table = _qn(model._meta.db_table)
+    conditions = [f"{table}.deleted_at < %(cutoff)s"]
+    for relation in _references(model):
+        if _is_blocking(relation):
+            related_table = _qn(relation.related_model._meta.db_table)
+            conditions.append(
+                f"NOT EXISTS (SELECT 1 FROM {related_table} r "
+                f"WHERE r.{_qn(relation.field.column)} = {table}.id)"
+            )
+    return " AND ".join(conditions)
+
+
+def count_due(model, cutoff: datetime) -> int:
+    """Count the rows of a model that would be archived or purged."""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"SELECT COUNT(*) FROM {_qn(model._meta.db_table)} "
+            f"WHERE {_eligible_sql(model)}",
+            {"cutoff": cutoff},
+        )
+        return cursor.fetchone()[0]
+
+
+def _move(cursor, model, column: str, ids: list[int], archive: bool):
+    """Archive (unless purging) and delete the rows whose `column` is in `ids`."""
+    table = _qn(model._meta.db_table)
+    condition = f"{_qn(column)} = ANY(%(ids)s)"
+    if archive:
+        columns = ", ".join(_qn(f.column) for f in model._meta.concrete_fields)
+        cursor.execute(
+            f"""
+            INSERT INTO {archive_table(model)} ({columns}, archived_at)
+            SELECT {columns}, NOW() FROM {table} WHERE {condition}
+            """,
+            {"ids": ids},
+        )
+    cursor.execute(f"DELETE FROM {table} WHERE {condition}", {"ids": ids})
+
+
+def _process_batch(
+    model, cutoff: datetime, after_pk: int, size: int, archive: bool
+) -> Batch:
+    table = _qn(model._meta.db_table)
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            SELECT id FROM {table}
+            WHERE id > %(after)s AND {_eligible_sql(model)}
+            ORDER BY id
+            LIMIT %(size)s
+            FOR UPDATE SKIP LOCKED
+            """,
+            {"cutoff": cutoff, "after": after_pk, "size": size},
+        )
+        ids = [row[0] for row in cursor.fetchall()]
+        if not ids:
+            return Batch(model, 0, after_pk)
+
+        for through, column in _memberships(model):
+            _move(cursor, through, column, ids, archive)
+        for relation in _references(model):
+            related_table = _qn(relation.related_model._meta.db_table)
+            column = _qn(relation.field.column)
+            if relation.on_delete is models.SET_NULL:
+                cursor.execute(
+                    f"UPDATE {related_table} SET {column} = NULL "
+                    f"WHERE {column} = ANY(%(ids)s)",
+                    {"ids": ids},
+                )
+            elif not _is_blocking(relation):
+                cursor.execute(
+                    f"DELETE FROM {related_table} WHERE {column} = ANY(%(ids)s)",
+                    {"ids": ids},
+                )
+        _move(cursor, model, "id", ids, archive)
+    return Batch(model, len(ids), ids[-1])
+
+
+def archive_soft_deleted(
+    cutoff: datetime, batch_size: int = 1000, archive: bool = True
+) -> Iterator[Batch]:
+    """
+    Archive (or purge) the rows soft-deleted before `cutoff`, batch by batch.
+
+    The generator yields after each committed batch, so callers can report
+    progress and throttle between batches.
+    """
+    for model in processing_order():
+        if archive:
+            ensure_archive_table(model)
+            for through, _ in _memberships(model):
+                ensure_archive_table(through)
+        last_pk = 0
+        while True:
+            batch = _process_batch(model, cutoff, last_pk, batch_size, archive)
+            if not batch.rows:
+                break
+            last_pk = batch.last_pk
+            yield batch
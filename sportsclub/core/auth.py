@@ -76,7 +76,7 @@ class DynamicAuth:
     def __init__(self):
         self.header_auth = ApiKeyHeaderAuth()
 
-    def __call__(self, request, key: str | None = Header(None)) -> User | None:
+    def __call__(self, request) -> User | None:
         """
         Authenticate user, bypassing authentication in DEBUG mode.
 
@@ -87,6 +87,8 @@ class DynamicAuth:
 
         from django.conf import settings
 
+        # Ninja calls `auth(request)`: the header is not injected as an argument
+        key = request.headers.get(self.header_auth.param_name)
         key_provided = "yes" if key else "no"
         # Check both settings.DEBUG and environment variable
         debug_env = os.getenv("DEBUG", "False").lower() == "true"
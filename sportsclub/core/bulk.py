@@ -0,0 +1,67 @@
+# core/bulk.py
+"""
+Helpers shared by the bulk loaders: CSV imports (`core.imports`), synthetic
+clubs (`scheduling.synthetic`) and snapshots (`core.snapshots`).
+
+Rows are prepared in chunks by a pool of processes with `ordered_map`, while
+the calling process loads the previous chunks with `COPY ... FROM STDIN`, in
+text format (`copy_value`), into tables and columns quoted with `quote`.
+"""
+
+import multiprocessing
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any
+
+import django
+from django.db import connection
+
+
+def ordered_map(
+    function: Callable[..., Any], tasks: Iterable[tuple], workers: int
+) -> Iterator[Any]:
+    """
+    Yield `function(*task)` for each task, in order, from a pool of processes.
+
+    At most two tasks per worker are read ahead, so memory does not grow with
+    the number of tasks. Without workers, tasks run in the calling process.
+    `function` must be importable by the workers, i.e. defined in a module.
+    """
+    if not workers:
+        for task in tasks:
+            yield function(*task)
+        return
+
+    # Fresh interpreters, rather than forks of a process running threads
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(
+        workers, mp_context=context, initializer=django.setup
+    ) as pool:
+        pending: deque[Future] = deque()
+        for task in tasks:
+            pending.append(pool.submit(function, *task))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def copy_value(value) -> str:
+    """Format a value for `COPY ... FROM STDIN` in text format."""
+    if value is None:
+        return r"\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+def quote(name: str) -> str:
+    """Quote a table or column name for raw SQL."""
+    return connection.ops.quote_name(name)
@@ -0,0 +1,98 @@
+# core/cache.py
+"""
+Versioned cache namespaces.
+
+Every namespace keeps a version number in the cache, and keys built with
+`make_key()` embed it. Bumping the version invalidates all the keys of a
+namespace at once, without having to know or delete them one by one; stale
+entries simply expire or are evicted by the cache backend.
+
+Bumps are also published on the invalidation bus (see `core.invalidation`):
+with a cache backend kept in process memory, such as the default
+`LocMemCache`, the other workers bump their own copy of the version when they
+receive them.
+"""
+
+import time
+from collections.abc import Callable
+from typing import Any
+
+from django.core.cache import DEFAULT_CACHE_ALIAS, cache, caches
+from django.core.cache.backends.locmem import LocMemCache
+
+from core import invalidation
+
+
+def _version_key(namespace: str) -> str:
+    return f"{namespace}:version"
+
+
+def _initial_version() -> int:
+    # If the version key is evicted while data keys survive, restarting from a
+    # small number could resurrect stale entries, so seed it from the clock.
+    return time.time_ns() // 1_000_000
+
+
+def get_version(namespace: str) -> int:
+    """Return the current version of a namespace, initialising it if needed."""
+    version = cache.get(_version_key(namespace))
+    if version is None:
+        cache.add(_version_key(namespace), _initial_version(), timeout=None)
+        version = cache.get(_version_key(namespace))
+    return version
+
+
+def get_versions(*namespaces: str) -> list[int]:
+    """Return the current versions of several namespaces in one cache lookup."""
+    found = cache.get_many([_version_key(namespace) for namespace in namespaces])
+    return [
+        found.get(_version_key(namespace)) or get_version(namespace)
+        for namespace in namespaces
+    ]
+
+
+def _increment(namespace: str) -> int:
+    try:
+        return cache.incr(_version_key(namespace))
+    except ValueError:
+        # The version key does not exist (never used or evicted)
+        version = _initial_version()
+        cache.set(_version_key(namespace), version, timeout=None)
+        return version
+
+
+def bump_version(namespace: str) -> int:
+    """Invalidate every key of a namespace by incrementing its version."""
+    version = _increment(namespace)
+    invalidation.publish(namespace)
+    return version
+
+
+@invalidation.register
+def _evict(namespaces: set[str] | None):
+    # A shared backend already has the versions bumped by other processes
+    if not isinstance(caches[DEFAULT_CACHE_ALIAS], LocMemCache):
+        return
+    if namespaces is None:
+        cache.clear()
+    else:
+        for namespace in namespaces:
+            _increment(namespace)
+
+
+def make_key(namespace: str, *parts: Any) -> str:
+    """Build a cache key bound to the current version of a namespace."""
+    suffix = ":".join(str(part) for part in parts)
+    return f"{namespace}:v{get_version(namespace)}:{suffix}"
+
+
+def get_or_set(
+    namespace: str, parts: tuple, default: Callable[[], Any], timeout: int | None
+) -> Any:
+    """Return the cached value for `parts`, computing it with `default` on a miss."""
+    key = make_key(namespace, *parts)
+    value = cache.get(key)
+    if value is None:
+        value = default()
+        cache.set(key, value, timeout=timeout)
+    return value
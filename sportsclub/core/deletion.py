@@ -0,0 +1,145 @@
+# core/deletion.py
+"""
+Set-based soft deletion of `Auditory` records and their dependants.
+
+Soft-deleting a record also soft-deletes the rows that would be removed along
+with it by a hard delete, that is those reached through `CASCADE` foreign keys
+from other `Auditory` models. Each level of the cascade is a single `UPDATE`
+filtered by a subquery on its parent level, so nothing is loaded into Python
+however many rows depend on the record. Every row gets the same `deleted_at`
+timestamp, which is how `restore_deleted_at()` reverses a whole cascade.
+
+Non-`Auditory` dependants (e.g. ranking snapshots) and `SET_NULL` references
+are left untouched, so they are still in place after a restore; they go away
+with the record when it is purged with `delete()`.
+
+`UPDATE` statements do not send `pre_save` or `post_save`, so
+`pre_cascade_update` is sent instead, once per model, before its rows change.
+
+The DELETE endpoints of the API go through `delete_response()`.
+"""
+
+from datetime import datetime
+
+from django.apps import apps
+from django.db import models, transaction
+from django.dispatch import Signal
+from django.http import HttpResponse
+from django.shortcuts import get_object_or_404
+from django.utils import timezone
+
+from core.models import Auditory
+
+# Sent with `queryset` (the rows about to change, in their current state) and
+# `deleted_at` (the value they are about to get, None for a restore).
+pre_cascade_update = Signal()
+
+
+def _cascading_relations(model) -> list:
+    """Reverse foreign keys from `Auditory` models that cascade on delete."""
+    return [
+        relation
+        for relation in model._meta.related_objects
+        if relation.one_to_many
+        and relation.on_delete is models.CASCADE
+        and issubclass(relation.related_model, Auditory)
+    ]
+
+
+def _update(queryset, deleted_at: datetime | None, counter: dict[str, int]):
+    model = queryset.model
+    pre_cascade_update.send(sender=model, queryset=queryset, deleted_at=deleted_at)
+    count = queryset.update(deleted_at=deleted_at, updated_at=timezone.now())
+    if count:
+        label = model._meta.label
+        counter[label] = counter.get(label, 0) + count
+
+
+def _cascade(model, parents, deleted_at: datetime, counter: dict[str, int]):
+    """Soft-delete the live dependants of `parents`, deepest levels first."""
+    for relation in _cascading_relations(model):
+        children = relation.related_model.objects.filter(
+            **{f"{relation.field.name}__in": parents}
+        )
+        # Grandchildren are selected through their still live parents, so
+        # they are handled before those are updated.
+        _cascade(relation.related_model, children, deleted_at, counter)
+        _update(children, deleted_at, counter)
+
+
+def soft_delete_cascade(instance: Auditory) -> tuple[int, dict[str, int]]:
+    """
+    Soft-delete a record and, with set-based updates, its live dependants.
+
+    The record itself is saved with `soft_delete()`, so its own signals are
+    sent as usual.
+
+    Returns:
+        Number of soft-deleted rows, in total and per model label, like
+        `Model.delete()`
+    """
+    deleted_at = timezone.now()
+    counter: dict[str, int] = {}
+    with transaction.atomic():
+        parents = type(instance).all_objects.filter(pk=instance.pk)
+        _cascade(type(instance), parents, deleted_at, counter)
+        instance.soft_delete(deleted_at)
+    label = instance._meta.label
+    counter = {label: 1, **counter}
+    return sum(counter.values()), counter
+
+
+def delete_response(
+    response: HttpResponse, model: type[Auditory], public_id: str, purge: bool
+) -> tuple[int, None]:
+    """
+    Soft-delete a record, or purge it, for a DELETE endpoint of the API.
+
+    A soft delete cascades (see `soft_delete_cascade()`) and sets the
+    X-Deleted-At header of the response, which can be posted to
+    /api/v1/core/restore to undo it. A purge permanently deletes the record,
+    even if already soft-deleted.
+
+    Raises:
+        Http404: If there is no such record, or it is soft-deleted and not
+            being purged
+
+    Returns:
+        The status and body of the endpoint: 204 No Content
+    """
+    manager = model.all_objects if purge else model.objects
+    instance = get_object_or_404(manager, public_id=public_id)
+    if purge:
+        instance.delete()
+    else:
+        soft_delete_cascade(instance)
+        response["X-Deleted-At"] = instance.deleted_at.isoformat()
+    return 204, None
+
+
+def auditory_models() -> list:
+    """Return every concrete model inheriting from `Auditory`."""
+    return [model for model in apps.get_models() if issubclass(model, Auditory)]
+
+
+def restore_deleted_at(deleted_at: datetime) -> tuple[int, dict[str, int]]:
+    """
+    Restore every record soft-deleted at exactly `deleted_at`.
+
+    Given the timestamp of a `soft_delete_cascade()`, this restores the record
+    along with all its dependants, but not rows deleted independently before.
+
+    Raises:
+        IntegrityError: If a restored row conflicts with a live one, e.g. a
+            person whose email was taken meanwhile. Nothing is restored then.
+
+    Returns:
+        Number of restored rows, in total and per model label
+    """
+    counter: dict[str, int] = {}
+    with transaction.atomic():
+        for model in auditory_models():
+            queryset = model.all_objects.filter(deleted_at=deleted_at)
+            if queryset.exists():
+                _update(queryset, None, counter)
+    return sum(counter.values()), counter
@@ -0,0 +1,298 @@
+# core/events.py
+"""
+Stream of change events, published with Postgres NOTIFY and served as SSE.
+
+Writes to the models registered with `register()` send a NOTIFY on `CHANNEL`
+in their transaction, so an event is only delivered once its write is
+committed. An event is a JSON object with an `id`, taken from a database
+sequence so that every worker sees the same IDs, the `resource`, `public_id`,
+`operation` (see `Operation`), `updated_at`, and `season`, the public ID of
+the season the record belongs to, if any. Set-based writes (cascading soft
+deletes, anonymisation) publish one event per row with a single statement.
+The same statement copies each event to the outbox of the webhook endpoints
+subscribed to its resource, for `core.webhooks` to deliver.
+
+Each worker process runs one `Listener` thread, started by the first stream,
+holding a connection that LISTENs to the channel. It keeps the latest
+`EVENTS_REPLAY_SIZE` events and hands every event to the queue of each
+connected stream. A stream reconnecting with a `Last-Event-ID` gets the events
+that followed it; when that event is no longer in the buffer, or the listener
+had to reconnect meanwhile, it gets a `reset` event instead, telling the client
+to reload its data.
+
+Streams are async iterators, served without holding a thread under ASGI only.
+"""
+
+import asyncio
+import json
+from collections import deque
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.core.exceptions import EmptyResultSet
+from django.db import connection, models
+from django.db.models import CharField, F
+from django.db.models.functions import Cast
+from django.db.models.signals import m2m_changed, post_save, pre_delete
+from django.utils import timezone
+
+from core.deletion import pre_cascade_update
+from core.listeners import ChannelListener
+from core.models import OutboxMessage, OutboxStatus, WebhookEndpoint
+
+CHANNEL = "core_change_events"
+SEQUENCE = "core_change_event_id"
+
+
+class Operation(models.TextChoices):
+    """Kinds of write reported by change events."""
+
+    CREATE = "create", "Create"
+    UPDATE = "update", "Update"
+    DELETE = "delete", "Delete"
+    RESTORE = "restore", "Restore"
+
+
+@dataclass(frozen=True)
+class Resource:
+    name: str
+    # Lookup from the model to the public ID of its season, if any
+    season: str | None
+
+
+_resources: dict[type[models.Model], Resource] = {}
+
+
+def register(model: type[models.Model], name: str, season: str | None = None):
+    """Publish change events for the writes to a model."""
+    _resources[model] = Resource(name, season)
+    post_save.connect(_publish_save, sender=model)
+    # Before the row, and the season it is looked up through, are gone
+    pre_delete.connect(_publish_delete, sender=model)
+    pre_cascade_update.connect(_publish_cascade_update, sender=model)
+    # Membership changes, e.g. the roster of a competition, update the record
+    for field in model._meta.many_to_many:
+        m2m_changed.connect(_publish_membership, sender=field.remote_field.through)
+
+
+def resource_names() -> set[str]:
+    """Return the names of the resources with change events."""
+    return {resource.name for resource in _resources.values()}
+
+
+def publish(queryset: models.QuerySet, operation: Operation, updated_at=None):
+    """
+    Send the change events of the rows of a queryset, in one statement.
+
+    Args:
+        queryset: Rows that changed, or are about to in the same transaction
+        operation: What happened to the rows
+        updated_at: Time of the change, when the rows do not have it yet
+    """
+    resource = _resources.get(queryset.model)
+    if resource is None:
+        return
+
+    season = F(resource.season) if resource.season else Cast(None, CharField())
+    rows = queryset.order_by().values("public_id", "updated_at", event_season=season)
+    try:
+        sql, params = rows.query.sql_with_params()
+    except EmptyResultSet:
+        # e.g. `pk__in=[]`
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            WITH changed AS MATERIALIZED (
+                SELECT json_build_object(
+                    'id', nextval(%s),
+                    'resource', %s,
+                    'public_id', source.public_id,
+                    'operation', %s,
+                    'updated_at', COALESCE(%s::timestamptz, source.updated_at),
+                    'season', source.event_season
+                ) AS event
+                FROM ({sql}) AS source
+            ), outbox AS (
+                INSERT INTO {OutboxMessage._meta.db_table} (
+                    endpoint_id, event, created_at, status, attempts,
+                    next_attempt_at, last_error
+                )
+                SELECT endpoint.id, changed.event::jsonb, now(), %s, 0, now(), ''
+                FROM changed, {WebhookEndpoint._meta.db_table} AS endpoint
+                WHERE endpoint.is_active AND endpoint.deleted_at IS NULL
+                  AND (cardinality(endpoint.resources) = 0
+                       OR %s = ANY(endpoint.resources))
+            )
+            SELECT pg_notify(%s, event::text) FROM changed
+            """,
+            [
+                SEQUENCE,
+                resource.name,
+                operation,
+                updated_at,
+                *params,
+                OutboxStatus.PENDING,
+                resource.name,
+                CHANNEL,
+            ],
+        )
+
+
+def _publish_instance(instance: models.Model, operation: Operation):
+    publish(type(instance)._base_manager.filter(pk=instance.pk), operation)
+
+
+def _publish_save(sender, instance, created, update_fields=None, **kwargs):
+    if created:
+        operation = Operation.CREATE
+    elif update_fields and "deleted_at" in update_fields:
+        # `soft_delete()` and `restore()`
+        operation = Operation.DELETE if instance.deleted_at else Operation.RESTORE
+    else:
+        operation = Operation.UPDATE
+    _publish_instance(instance, operation)
+
+
+def _publish_membership(sender, instance, action, reverse, model, pk_set, **kwargs):
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if not reverse:
+        _publish_instance(instance, Operation.UPDATE)
+    elif pk_set:
+        # e.g. `athlete.competition_activities.add(...)`
+        publish(model._base_manager.filter(pk__in=pk_set), Operation.UPDATE)
+
+
+def _publish_delete(sender, instance, **kwargs):
+    _publish_instance(instance, Operation.DELETE)
+
+
+def _publish_cascade_update(sender, queryset, deleted_at, **kwargs):
+    if deleted_at is None:
+        publish(queryset, Operation.RESTORE, timezone.now())
+    else:
+        publish(queryset, Operation.DELETE, deleted_at)
+
+
+# Queued to the streams when the listener may have missed events
+RESET = {}
+
+
+class Subscriber:
+    """Queue of the events for one stream, fed from the listener thread."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self.loop = loop
+        self.queue: asyncio.Queue = asyncio.Queue(settings.EVENTS_QUEUE_SIZE)
+        self.overflowed = False
+
+    def put(self, event: dict):
+        self.loop.call_soon_threadsafe(self._put, event)
+
+    def _put(self, event: dict):
+        if self.queue.full():
+            # Too slow a client: its stream ends, and it resumes from the buffer
+            self.overflowed = True
+        else:
+            self.queue.put_nowait(event)
+
+
+class Listener(ChannelListener):
+    """Thread LISTENing to the change events for every stream of the process."""
+
+    channel = CHANNEL
+
+    def __init__(self):
+        super().__init__()
+        self.buffer: deque[dict] = deque(maxlen=settings.EVENTS_REPLAY_SIZE)
+        self.subscribers: set[Subscriber] = set()
+
+    def subscribe(
+        self, loop: asyncio.AbstractEventLoop, last_event_id: str | None
+    ) -> tuple[Subscriber, list[dict]]:
+        """
+        Register a stream, with the events to replay after `last_event_id`.
+
+        The events to replay are just `RESET` if some may have been missed.
+        """
+        subscriber = Subscriber(loop)
+        with self.lock:
+            replay = []
+            if last_event_id is not None:
+                ids = [str(event["id"]) for event in self.buffer]
+                if last_event_id in ids:
+                    replay = list(self.buffer)[ids.index(last_event_id) + 1 :]
+                else:
+                    replay = [RESET]
+            self.subscribers.add(subscriber)
+        return subscriber, replay
+
+    def unsubscribe(self, subscriber: Subscriber):
+        with self.lock:
+            self.subscribers.discard(subscriber)
+
+    def dispatch(self, event: dict):
+        with self.lock:
+            if event is RESET:
+                self.buffer.clear()
+            else:
+                self.buffer.append(event)
+            for subscriber in self.subscribers:
+                subscriber.put(event)
+
+    def handle(self, payload: str):
+        self.dispatch(json.loads(payload))
+
+    def missed(self):
+        self.dispatch(RESET)
+
+
+listener = Listener()
+
+
+def _format(event: dict) -> str:
+    if event is RESET:
+        return "event: reset\ndata: {}\n\n"
+    return f"id: {event['id']}\nevent: change\ndata: {json.dumps(event)}\n\n"
+
+
+def _matches(event: dict, resources: set[str], season: str | None) -> bool:
+    return event is RESET or (
+        (not resources or event["resource"] in resources)
+        and (season is None or event["season"] == season)
+    )
+
+
+async def stream(
+    resources: set[str], season: str | None, last_event_id: str | None
+) -> AsyncIterator[str]:
+    """
+    Yield the change events as Server-Sent Events, until the client leaves.
+
+    Args:
+        resources: Only events of these resources, or of all if empty
+        season: Only events of records of the season with this public ID
+        last_event_id: ID of the last event received, to resume from it
+    """
+    listener.start()
+    subscriber, replay = listener.subscribe(asyncio.get_running_loop(), last_event_id)
+    try:
+        for event in replay:
+            if _matches(event, resources, season):
+                yield _format(event)
+
+        while not subscriber.overflowed:
+            try:
+                event = await asyncio.wait_for(
+                    subscriber.queue.get(), settings.EVENTS_KEEPALIVE_SECONDS
+                )
+            except TimeoutError:
+                # Comment lines keep proxies from closing idle streams
+                yield ": keep-alive\n\n"
+                continue
+            if _matches(event, resources, season):
+                yield _format(event)
+    finally:
+        listener.unsubscribe(subscriber)
@@ -0,0 +1,154 @@
+# core/exports.py
+"""
+Flat exports of the API resources, streamed as NDJSON or CSV.
+
+Rows are read with `.values()` from a server-side cursor, `EXPORT_CHUNK_SIZE`
+at a time, and written out a chunk at a time, so memory does not grow with the
+size of the export. Many-to-many lists (e.g. the athletes of a training) are
+aggregated by the database into an array of public IDs per row (see
+`related_public_ids()`), rather than prefetched.
+
+Responses are compressed with gzip while they stream, when the client accepts
+it, and streamed under ASGI too (see `core.streaming`).
+"""
+
+import csv
+import io
+import json
+import re
+from collections.abc import Iterable, Iterator
+from datetime import date, datetime
+from enum import StrEnum
+
+from django.conf import settings
+from django.contrib.postgres.expressions import ArraySubquery
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+from django.db.models import Expression, OuterRef
+from django.http import HttpRequest, StreamingHttpResponse
+from django.utils.cache import patch_vary_headers
+from django.utils.text import compress_sequence
+
+from core.streaming import streaming_body
+
+# As in `django.middleware.gzip`
+ACCEPTS_GZIP = re.compile(r"\bgzip\b")
+
+
+class ExportFormat(StrEnum):
+    """Formats of the exports."""
+
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+    @property
+    def content_type(self) -> str:
+        return {
+            ExportFormat.NDJSON: "application/x-ndjson",
+            ExportFormat.CSV: "text/csv; charset=utf-8",
+        }[self]
+
+
+def related_public_ids(model: type[models.Model], field_name: str) -> ArraySubquery:
+    """
+    Aggregate the public IDs of the live objects of a many-to-many field.
+
+    An `ARRAY(SELECT ...)` subquery per row, rather than `array_agg()` over a
+    join: with two many-to-many fields, joins would multiply each other's rows.
+    """
+    field = model._meta.get_field(field_name)
+    related = field.related_model
+    return ArraySubquery(
+        related.objects.filter(**{field.related_query_name(): OuterRef("pk")})
+        .order_by("public_id")
+        .values("public_id")
+    )
+
+
+def _rows(
+    queryset: models.QuerySet, fields: list[str], expressions: dict[str, Expression]
+) -> Iterator[list[dict]]:
+    """Read rows from a server-side cursor, a chunk at a time."""
+    chunk_size = settings.EXPORT_CHUNK_SIZE
+    rows = queryset.order_by("pk").values(*fields, **expressions)
+    chunk = []
+    for row in rows.iterator(chunk_size=chunk_size):
+        chunk.append(row)
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _csv_value(value):
+    if value is None:
+        return ""
+    if isinstance(value, list):
+        return ";".join(str(item) for item in value)
+    if isinstance(value, dict):
+        return json.dumps(value)
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value
+
+
+def _csv(chunks: Iterable[list[dict]], columns: list[str]) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    yield buffer.getvalue().encode()
+    for chunk in chunks:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows(
+            [_csv_value(row[column]) for column in columns] for row in chunk
+        )
+        yield buffer.getvalue().encode()
+
+
+def _ndjson(chunks: Iterable[list[dict]]) -> Iterator[bytes]:
+    encoder = DjangoJSONEncoder()
+    for chunk in chunks:
+        yield "".join(encoder.encode(row) + "\n" for row in chunk).encode()
+
+
+def export_response(
+    request: HttpRequest,
+    queryset: models.QuerySet,
+    fields: list[str],
+    expressions: dict[str, Expression],
+    export_format: ExportFormat,
+    name: str,
+) -> StreamingHttpResponse:
+    """
+    Stream the rows of a queryset in a format, as an attachment.
+
+    Args:
+        request: The request, whose `Accept-Encoding` may ask for gzip
+        queryset: Rows to export
+        fields: Fields of the rows, as given to `.values()`
+        expressions: Further columns, e.g. the public ID of a foreign key
+        export_format: Format of the body
+        name: Name of the file, without extension
+    """
+    chunks = _rows(queryset, fields, expressions)
+    if export_format is ExportFormat.CSV:
+        body = _csv(chunks, [*fields, *expressions])
+    else:
+        body = _ndjson(chunks)
+
+    gzip = bool(ACCEPTS_GZIP.search(request.headers.get("Accept-Encoding", "")))
+    if gzip:
+        body = compress_sequence(body)
+
+    response = StreamingHttpResponse(
+        streaming_body(request, body), content_type=export_format.content_type
+    )
+    response["Content-Disposition"] = (
+        f'attachment; filename="{name}.{export_format.value}"'
+    )
+    patch_vary_headers(response, ["Accept-Encoding"])
+    if gzip:
+        response["Content-Encoding"] = "gzip"
+    return response
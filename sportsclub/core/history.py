@@ -0,0 +1,241 @@
+# core/history.py
+"""
+Change history of the writes made through the API and the admin.
+
+`ChangeHistoryMiddleware` marks the requests whose writes are recorded; the
+signal handlers in `core.signals` diff each saved or deleted record and hand
+a `ChangeRecord` to `enqueue()` once the transaction commits. Set-based writes
+(cascading soft deletes and restores, imports, season rollovers) record one
+change per row through the signals they send instead. Records are put
+on an in-process queue and written by a background thread with one
+`bulk_create()` per batch, so requests never wait for the history. A record
+still queued when the process is killed is lost; the queue is drained on a
+normal exit.
+
+The table is partitioned by month on `changed_at`. `ensure_partitions()`
+creates the partitions of the coming months, and `drop_partitions()` expires
+old months by dropping whole partitions, which is instant whatever their size.
+Rows outside every monthly partition land in a default partition, from which
+they are moved when their month's partition is created. Personal data is
+removed from the history with `redact()` when people are anonymised.
+"""
+
+import atexit
+import logging
+import queue
+import threading
+import time
+from contextvars import ContextVar
+from datetime import date
+
+from django.conf import settings
+from django.db import DatabaseError, close_old_connections, connection, transaction
+from django.db.models import Model
+from django.http import HttpRequest
+
+from core.models import ChangeRecord
+
+logger = logging.getLogger(__name__)
+
+TABLE = ChangeRecord._meta.db_table
+DEFAULT_PARTITION = f"{TABLE}_default"
+
+# Request whose writes are being recorded, if any
+current_request: ContextVar[HttpRequest | None] = ContextVar(
+    "current_request", default=None
+)
+
+_queue: queue.SimpleQueue = queue.SimpleQueue()
+_writer: threading.Thread | None = None
+_writer_lock = threading.Lock()
+
+
+class ChangeHistoryMiddleware:
+    """Record the writes made while handling API and admin requests."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        token = current_request.set(request)
+        try:
+            return self.get_response(request)
+        finally:
+            current_request.reset(token)
+
+
+def current_user() -> tuple[int | None, str]:
+    """Return the ID and username of the user making the current request."""
+    request = current_request.get()
+    # Django Ninja stores the authenticated user in `request.auth`
+    user = getattr(request, "auth", None) or getattr(request, "user", None)
+    if user is None or not getattr(user, "is_authenticated", False):
+        return None, ""
+    return user.pk, user.get_username()
+
+
+def _write(records: list[ChangeRecord]):
+    try:
+        # A failed write must not break the transaction of the caller
+        with transaction.atomic():
+            ChangeRecord.objects.bulk_create(records)
+    except DatabaseError:
+        logger.exception("Could not write %d change records", len(records))
+
+
+def _write_batches(records: list[ChangeRecord]):
+    for start in range(0, len(records), settings.CHANGE_HISTORY_BATCH_SIZE):
+        _write(records[start : start + settings.CHANGE_HISTORY_BATCH_SIZE])
+
+
+def _run_writer():
+    batch_size = settings.CHANGE_HISTORY_BATCH_SIZE
+    while True:
+        batch = [_queue.get()]
+        deadline = time.monotonic() + settings.CHANGE_HISTORY_FLUSH_SECONDS
+        while len(batch) < batch_size:
+            try:
+                batch.append(_queue.get(timeout=max(deadline - time.monotonic(), 0)))
+            except queue.Empty:
+                break
+        _write(batch)
+        # The thread has its own connection, dropped if it went bad or stale
+        close_old_connections()
+
+
+def _start_writer():
+    global _writer
+    with _writer_lock:
+        if _writer is None or not _writer.is_alive():
+            _writer = threading.Thread(
+                target=_run_writer, name="change-history-writer", daemon=True
+            )
+            _writer.start()
+
+
+def enqueue(*records: ChangeRecord):
+    """Queue records for the background writer, or write them right away."""
+    if not settings.CHANGE_HISTORY_ASYNC:
+        _write_batches(list(records))
+        return
+    for record in records:
+        _queue.put(record)
+    _start_writer()
+
+
+def flush():
+    """Write the queued records from the calling thread."""
+    records = []
+    while True:
+        try:
+            records.append(_queue.get_nowait())
+        except queue.Empty:
+            break
+    _write_batches(records)
+
+
+atexit.register(flush)
+
+
+def redact(model: type[Model], public_ids: list[str], fields: list[str]):
+    """
+    Remove fields from the recorded changes of some records, e.g. personal data.
+
+    The records still queued by this process are written first, so they are
+    redacted too; those queued by other processes are not.
+    """
+    flush()
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            UPDATE {connection.ops.quote_name(TABLE)}
+            SET changes = changes - %s::text[]
+            WHERE model = %s AND public_id = ANY(%s) AND changes ?| %s::text[]
+            """,
+            [fields, model._meta.label, public_ids, fields],
+        )
+
+
+def _month_start(day: date, months: int = 0) -> date:
+    """Return the first day of the month `months` after the month of `day`."""
+    index = day.year * 12 + day.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    """Return the name of the partition holding the records of a month."""
+    return f"{TABLE}_y{month.year}m{month.month:02d}"
+
+
+def ensure_partitions(today: date, months_ahead: int) -> list[str]:
+    """
+    Create the monthly partitions from this month to `months_ahead` later.
+
+    Rows of those months already in the default partition are moved to the new
+    partition in the same transaction.
+
+    Returns:
+        Names of the partitions created
+    """
+    qn = connection.ops.quote_name
+    created = []
+    for offset in range(months_ahead + 1):
+        start, end = _month_start(today, offset), _month_start(today, offset + 1)
+        name = partition_name(start)
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute("SELECT to_regclass(%s)", [name])
+            if cursor.fetchone()[0] is not None:
+                continue
+            cursor.execute(
+                f"CREATE TABLE {qn(name)} (LIKE {qn(TABLE)} INCLUDING DEFAULTS)"
+            )
+            cursor.execute(
+                f"""
+                WITH moved AS (
+                    DELETE FROM {qn(DEFAULT_PARTITION)}
+                    WHERE changed_at >= %s AND changed_at < %s
+                    RETURNING *
+                )
+                INSERT INTO {qn(name)} SELECT * FROM moved
+                """,
+                [start, end],
+            )
+            # DDL takes no parameters; dates are safe to inline
+            cursor.execute(
+                f"ALTER TABLE {qn(TABLE)} ATTACH PARTITION {qn(name)} "
+                f"FOR VALUES FROM ('{start}') TO ('{end}')"
+            )
+        created.append(name)
+    return created
+
+
+def drop_partitions(today: date, retention_months: int) -> list[str]:
+    """
+    Drop the monthly partitions that ended more than `retention_months` ago.
+
+    Returns:
+        Names of the partitions dropped
+    """
+    cutoff = _month_start(today, -retention_months)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT child.relname
+            FROM pg_inherits
+            JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+            JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+            WHERE parent.relname = %s AND child.relname ~ '_y[0-9]{4}m[0-9]{2}$'
+            ORDER BY child.relname
+            """,
+            [TABLE],
+        )
+        names = [row[0] for row in cursor.fetchall()]
+
+    dropped = []
+    for name in names:
+        year, month = int(name[-7:-3]), int(name[-2:])
+        if _month_start(date(year, month, 1), 1) <= cutoff:
+            with connection.cursor() as cursor:
+                cursor.execute(f"DROP TABLE {connection.ops.quote_name(name)}")
+            dropped.append(name)
+    return dropped
@@ -0,0 +1,429 @@
+# core/imports.py
+"""
+Bulk import of records from CSV files.
+
+Rows are read as a stream and validated in chunks by a pool of processes, with
+the input schema of the API (e.g. `AthleteIn`), so imported records obey the
+same rules as those created one by one. Valid rows are loaded with `COPY` into
+a temporary staging table, then merged into the live table with a few
+set-based statements, all in one transaction:
+
+- rows with a `public_id` update that record, as a PUT would, and rows
+  without one are created;
+- rows referring to an unknown record or address, or breaking a unique
+  constraint (e.g. the email of another person, or of an earlier row), are
+  rejected.
+
+Rejected rows are handed to a callback, e.g. a `RejectFile`, with their line
+number and errors, and the other rows are imported regardless. Change events
+are published for the imported records (see `core.events`). `pre_import` and
+`post_import` are sent around the merge, for the change history of imports
+made through the API and for the caches derived from the records.
+"""
+
+import csv
+import io
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import asdict, dataclass
+from typing import IO
+
+from django.db import connection, models, transaction
+from django.db.models.expressions import RawSQL
+from django.dispatch import Signal
+from ninja import Schema
+from pydantic import ValidationError
+
+from core import events, nanoids
+from core.bulk import copy_value, ordered_map, quote
+from core.models import Address
+
+# Sent with `queryset`, the records about to be updated, in their current state
+pre_import = Signal()
+# Sent with `created` and `updated`, the primary keys of the records created
+# and updated, and `pks`, both of them
+post_import = Signal()
+
+# Column of the input schemas referring to an address, resolved when merging
+ADDRESS_COLUMN = "address_public_id"
+
+STAGING_TABLE = "core_import_staging"
+
+
+class CSVImportError(Exception):
+    """The CSV file cannot be imported at all, e.g. it lacks required columns."""
+
+
+@dataclass(frozen=True)
+class Importer:
+    model: type[models.Model]
+    schema: type[Schema]
+
+    @property
+    def columns(self) -> list[str]:
+        """Columns of the CSV files, besides the optional `public_id`."""
+        return list(self.schema.model_fields)
+
+
+@dataclass(frozen=True)
+class Reject:
+    """Row that was not imported."""
+
+    line: int
+    values: dict[str, str]
+    errors: str
+
+
+@dataclass
+class ImportCounts:
+    """Number of rows created, updated and rejected."""
+
+    created: int = 0
+    updated: int = 0
+    rejected: int = 0
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+_importers: dict[str, Importer] = {}
+
+
+def register(model: type[models.Model], name: str, schema: type[Schema]):
+    """Allow importing records of a model, validated with its input schema."""
+    _importers[name] = Importer(model, schema)
+
+
+def importer_names() -> set[str]:
+    """Return the names of the resources that can be imported."""
+    return set(_importers)
+
+
+class RejectFile:
+    """Write the rejected rows of an import as CSV, with their errors."""
+
+    def __init__(self, file: IO[str], name: str):
+        self.writer = csv.writer(file)
+        self.columns = ["public_id", *_importers[name].columns]
+        self.writer.writerow(["line", *self.columns, "errors"])
+
+    def __call__(self, reject: Reject):
+        values = [reject.values.get(column, "") for column in self.columns]
+        self.writer.writerow([reject.line, *values, reject.errors])
+
+
+# Chunk validation, run by the worker processes
+
+
+def _errors(err: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}"
+        for error in err.errors()
+    )
+
+
+def _validate(name: str, rows: list[tuple[int, dict]]) -> tuple[str, list[Reject]]:
+    """
+    Validate a chunk of rows.
+
+    Returns:
+        The valid rows in `COPY` text format, and the rejected rows
+    """
+    importer = _importers[name]
+    public_id_field = importer.model._meta.get_field("public_id")
+    new_public_ids = iter(nanoids.for_field(public_id_field, len(rows)))
+    lines, rejects = [], []
+    for line, values in rows:
+        if None in values or None in values.values():
+            rejects.append(Reject(line, values, "wrong number of values"))
+            continue
+        # Empty cells take the default of the schema
+        data = {
+            column: value for column, value in values.items() if value.strip() != ""
+        }
+        public_id = data.pop("public_id", None)
+        try:
+            valid = importer.schema.model_validate(data).model_dump(mode="json")
+        except ValidationError as err:
+            rejects.append(Reject(line, values, _errors(err)))
+            continue
+        row = [line, public_id, next(new_public_ids)]
+        row += [valid[column] for column in importer.columns]
+        lines.append("\t".join(copy_value(value) for value in row) + "\n")
+    return "".join(lines), rejects
+
+
+def _chunks(
+    reader: csv.DictReader, chunk_size: int
+) -> Iterator[list[tuple[int, dict]]]:
+    chunk = []
+    for values in reader:
+        chunk.append((reader.line_num, values))
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+# Staging and merge, run in the importing process
+
+
+def _create_staging(importer: Importer):
+    public_id_type = importer.model._meta.get_field("public_id").db_type(connection)
+    columns = [
+        "line integer",
+        f"public_id {public_id_type}",
+        f"new_public_id {public_id_type}",
+    ]
+    for column in importer.columns:
+        if column == ADDRESS_COLUMN:
+            db_type = public_id_type
+        else:
+            db_type = importer.model._meta.get_field(column).db_type(connection)
+        columns.append(f"{quote(column)} {db_type}")
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"CREATE TEMPORARY TABLE {STAGING_TABLE} ({', '.join(columns)}) "
+            "ON COMMIT DROP"
+        )
+
+
+def _reject_where(
+    importer: Importer, condition: str, errors: str, params=()
+) -> list[Reject]:
+    """Remove the staged rows matching a condition, and return them as rejects."""
+    columns = ["public_id", *importer.columns]
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            DELETE FROM {STAGING_TABLE} AS staged WHERE {condition}
+            RETURNING line, {", ".join(quote(column) for column in columns)}
+            """,
+            params,
+        )
+        rows = sorted(cursor.fetchall())
+    return [
+        Reject(
+            line,
+            {
+                column: "" if value is None else str(value)
+                for column, value in zip(columns, values, strict=True)
+            },
+            errors,
+        )
+        for line, *values in rows
+    ]
+
+
+def _reject_conflicts(importer: Importer) -> list[Reject]:
+    model = importer.model
+    table = quote(model._meta.db_table)
+    rejects = _reject_where(
+        importer,
+        f"""
+        staged.public_id IS NOT NULL AND NOT EXISTS (
+            SELECT 1 FROM {table} AS live
+            WHERE live.public_id = staged.public_id AND live.deleted_at IS NULL
+        )
+        """,
+        f"public_id: unknown {model._meta.verbose_name.lower()}",
+    )
+    rejects += _reject_where(
+        importer,
+        f"""
+        EXISTS (
+            SELECT 1 FROM {STAGING_TABLE} AS earlier
+            WHERE earlier.public_id = staged.public_id AND earlier.line < staged.line
+        )
+        """,
+        "public_id: already updated by an earlier row",
+    )
+    if ADDRESS_COLUMN in importer.columns:
+        rejects += _reject_where(
+            importer,
+            f"""
+            staged.{ADDRESS_COLUMN} IS NOT NULL AND NOT EXISTS (
+                SELECT 1 FROM {quote(Address._meta.db_table)} AS address
+                WHERE address.public_id = staged.{ADDRESS_COLUMN}
+                  AND address.deleted_at IS NULL
+            )
+            """,
+            f"{ADDRESS_COLUMN}: unknown address",
+        )
+
+    for constraint in model._meta.constraints:
+        fields = getattr(constraint, "fields", ())
+        if not isinstance(constraint, models.UniqueConstraint) or not (
+            fields and set(fields) <= set(importer.columns)
+        ):
+            continue
+        same = " AND ".join(
+            f"other.{quote(field)} = staged.{quote(field)}" for field in fields
+        )
+        # Conditional unique constraints of the models apply to live rows only
+        live = "AND other.deleted_at IS NULL" if constraint.condition else ""
+        errors = f"{', '.join(fields)}: already used"
+        rejects += _reject_where(
+            importer,
+            f"""
+            EXISTS (
+                SELECT 1 FROM {STAGING_TABLE} AS other
+                WHERE {same} AND other.line < staged.line
+            )
+            """,
+            f"{errors} by an earlier row",
+        )
+        rejects += _reject_where(
+            importer,
+            f"""
+            EXISTS (
+                SELECT 1 FROM {table} AS other
+                WHERE {same} {live}
+                  AND other.public_id IS DISTINCT FROM staged.public_id
+            )
+            """,
+            f"{errors} by another {model._meta.verbose_name.lower()}",
+        )
+    return sorted(rejects, key=lambda reject: reject.line)
+
+
+def _merge(importer: Importer) -> tuple[list[int], list[int]]:
+    """
+    Update and insert the staged rows into the live table.
+
+    Returns:
+        Primary keys of the created and updated records
+    """
+    table = quote(importer.model._meta.db_table)
+    targets, sources = [], []
+    for column in importer.columns:
+        if column == ADDRESS_COLUMN:
+            targets.append("address_id")
+            sources.append("address.id")
+        else:
+            targets.append(quote(column))
+            sources.append(f"staged.{quote(column)}")
+    addresses = f"""
+        {STAGING_TABLE} AS staged
+        LEFT JOIN {quote(Address._meta.db_table)} AS address
+          ON address.public_id = staged.{ADDRESS_COLUMN}
+         AND address.deleted_at IS NULL
+    """
+    if ADDRESS_COLUMN not in importer.columns:
+        addresses = f"{STAGING_TABLE} AS staged"
+    assignments = ", ".join(
+        f"{target} = {source}" for target, source in zip(targets, sources, strict=True)
+    )
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            UPDATE {table} AS live SET {assignments}, updated_at = now()
+            FROM {addresses}
+            WHERE live.public_id = staged.public_id
+            RETURNING live.id
+            """
+        )
+        updated = [pk for (pk,) in cursor.fetchall()]
+        cursor.execute(
+            f"""
+            INSERT INTO {table} (public_id, {", ".join(targets)},
+                                 created_at, updated_at)
+            SELECT staged.new_public_id, {", ".join(sources)}, now(), now()
+            FROM {addresses}
+            WHERE staged.public_id IS NULL
+            ORDER BY staged.line
+            RETURNING id
+            """
+        )
+        created = [pk for (pk,) in cursor.fetchall()]
+        cursor.execute(f"DROP TABLE {STAGING_TABLE}")
+    return created, updated
+
+
+def import_csv(
+    name: str,
+    lines: Iterable[str],
+    reject: Callable[[Reject], None],
+    workers: int = 0,
+    chunk_size: int = 1000,
+) -> ImportCounts:
+    """
+    Import the records of a CSV file.
+
+    Args:
+        name: Resource to import, e.g. "athletes"
+        lines: Lines of the file, which must have a header row
+        reject: Called with each row that is not imported
+        workers: Processes validating the rows, or 0 to validate in this one
+        chunk_size: Rows validated, and copied to the database, at once
+
+    Raises:
+        CSVImportError: If the resource cannot be imported, or the columns of
+            the file do not match its schema
+    """
+    importer = _importers.get(name)
+    if importer is None:
+        raise CSVImportError(f"Unknown resource: {name}")
+    reader = csv.DictReader(lines)
+    header = reader.fieldnames or []
+    unknown = set(header) - {"public_id", *importer.columns}
+    missing = {
+        column
+        for column, field in importer.schema.model_fields.items()
+        if field.is_required() and column not in header
+    }
+    if unknown or missing:
+        raise CSVImportError(
+            "; ".join(
+                f"{problem} columns: {', '.join(sorted(columns))}"
+                for problem, columns in (("Unknown", unknown), ("Missing", missing))
+                if columns
+            )
+        )
+
+    counts = ImportCounts()
+    columns = ["line", "public_id", "new_public_id", *importer.columns]
+    with transaction.atomic():
+        _create_staging(importer)
+        chunks = ((name, chunk) for chunk in _chunks(reader, chunk_size))
+        for copy_text, rejects in ordered_map(_validate, chunks, workers):
+            for row in rejects:
+                reject(row)
+            counts.rejected += len(rejects)
+            with connection.cursor() as cursor:
+                cursor.copy_expert(
+                    f"COPY {STAGING_TABLE} "
+                    f"({', '.join(quote(column) for column in columns)}) "
+                    "FROM STDIN",
+                    io.StringIO(copy_text),
+                )
+
+        rejects = _reject_conflicts(importer)
+        for row in rejects:
+            reject(row)
+        counts.rejected += len(rejects)
+
+        pre_import.send(
+            sender=importer.model,
+            queryset=importer.model._base_manager.filter(
+                public_id__in=RawSQL(
+                    f"SELECT public_id FROM {STAGING_TABLE} "
+                    "WHERE public_id IS NOT NULL",
+                    [],
+                )
+            ),
+        )
+        created, updated = _merge(importer)
+        counts.created, counts.updated = len(created), len(updated)
+        manager = importer.model._base_manager
+        events.publish(manager.filter(pk__in=created), events.Operation.CREATE)
+        events.publish(manager.filter(pk__in=updated), events.Operation.UPDATE)
+        if created or updated:
+            post_import.send(
+                sender=importer.model,
+                created=created,
+                updated=updated,
+                pks=created + updated,
+            )
+    return counts
@@ -0,0 +1,122 @@
+# core/invalidation.py
+"""
+Invalidation of the in-process caches of every worker.
+
+Caches kept in process memory (including the default `LocMemCache`) go stale
+in the other uvicorn workers, and in the other colour of a blue/green deploy,
+since model signals only run in the process that wrote. `publish()` sends the
+invalidated namespaces with a NOTIFY on `CHANNEL`, and every worker runs a
+`Listener`, started by the ASGI and WSGI applications, which hands the
+namespaces invalidated by other processes to the handlers added with
+`register()`. The publishing process invalidates its own caches itself (see
+`core.cache.bump_version()`).
+
+Delivery guarantees:
+
+- messages are sent in the transaction of the write, so they are delivered
+  once it commits, and never if it rolls back;
+- they reach every listening worker, in commit order, shortly after the
+  commit; until then the other workers may still serve stale entries;
+- messages sent while a listener is disconnected are lost, so it flushes the
+  caches when it is back, and so it does when it finds more than
+  `CACHE_INVALIDATION_MAX_BACKLOG` messages waiting, or a message of another
+  format version (`MESSAGE_VERSION`), e.g. from the next release during a
+  deploy.
+
+Handlers receive a set of namespaces, or `None` to flush everything.
+"""
+
+import json
+import logging
+import uuid
+from collections.abc import Callable
+
+from django.conf import settings
+from django.db import connection
+
+from core.listeners import ChannelListener
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "core_cache_invalidation"
+
+# Bumped when the format of the messages changes
+MESSAGE_VERSION = 1
+
+# NOTIFY payloads are limited to 8000 bytes
+MAX_PAYLOAD_BYTES = 7000
+
+# Identifies this process, whose own messages are ignored by its listener
+ORIGIN = uuid.uuid4().hex
+
+Handler = Callable[[set[str] | None], None]
+
+_handlers: list[Handler] = []
+
+
+def register(handler: Handler) -> Handler:
+    """Call a handler with the namespaces invalidated by other processes."""
+    _handlers.append(handler)
+    return handler
+
+
+def _notify(namespaces: list[str] | None):
+    message = {"v": MESSAGE_VERSION, "origin": ORIGIN, "namespaces": namespaces}
+    payload = json.dumps(message)
+    if len(payload.encode()) > MAX_PAYLOAD_BYTES:
+        payload = json.dumps({**message, "namespaces": None})
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT pg_notify(%s, %s)", [CHANNEL, payload])
+
+
+def publish(*namespaces: str):
+    """Invalidate namespaces in every other process, once the transaction commits."""
+    _notify(list(namespaces))
+
+
+def publish_flush():
+    """Flush the caches of every other process, once the transaction commits."""
+    _notify(None)
+
+
+def evict(namespaces: set[str] | None):
+    """Run the handlers on namespaces, or flush everything if `None`."""
+    for handler in _handlers:
+        try:
+            handler(namespaces)
+        except Exception:
+            logger.exception("Cache invalidation handler %r failed", handler)
+
+
+class Listener(ChannelListener):
+    """Thread evicting the caches of this process on other processes' writes."""
+
+    channel = CHANNEL
+
+    def handle(self, payload: str):
+        message = json.loads(payload)
+        if message.get("v") != MESSAGE_VERSION:
+            logger.info("Flushing caches on a message of version %s", message.get("v"))
+            evict(None)
+        elif message["origin"] != ORIGIN:
+            namespaces = message["namespaces"]
+            evict(None if namespaces is None else set(namespaces))
+
+    def receive(self, payloads: list[str]):
+        if len(payloads) > settings.CACHE_INVALIDATION_MAX_BACKLOG:
+            logger.warning("Flushing caches after %d invalidations", len(payloads))
+            evict(None)
+        else:
+            super().receive(payloads)
+
+    def missed(self):
+        evict(None)
+
+
+listener = Listener()
+
+
+def start_listener():
+    """Start the listener of this worker, unless disabled in the settings."""
+    if settings.CACHE_INVALIDATION_LISTEN:
+        listener.start()
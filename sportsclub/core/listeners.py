@@ -0,0 +1,88 @@
+# core/listeners.py
+"""
+Background threads receiving Postgres notifications.
+
+A `ChannelListener` holds its own database connection, LISTENing to one
+channel, and hands each payload to `handle()` as soon as it arrives; those
+that piled up while it was busy are handed together to `receive()`.
+Notifications sent while the connection is down are lost, so when it is back
+the listener calls `missed()`, for subclasses to recover, e.g. by telling
+their clients to reload.
+"""
+
+import logging
+import select
+import threading
+
+import psycopg2
+from django.conf import settings
+from django.db import DatabaseError, connection
+
+logger = logging.getLogger(__name__)
+
+
+class ChannelListener:
+    """Thread LISTENing to a channel, reconnecting when it loses the database."""
+
+    channel: str
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.stopping = threading.Event()
+        # Set while the connection LISTENs
+        self.listening = threading.Event()
+        self.thread: threading.Thread | None = None
+
+    def start(self):
+        with self.lock:
+            if self.thread is None or not self.thread.is_alive():
+                self.stopping.clear()
+                self.thread = threading.Thread(
+                    target=self.run, name=f"{self.channel}-listener", daemon=True
+                )
+                self.thread.start()
+
+    def stop(self):
+        self.stopping.set()
+        if self.thread is not None:
+            self.thread.join()
+
+    def handle(self, payload: str):
+        """Process the payload of a notification."""
+        raise NotImplementedError
+
+    def receive(self, payloads: list[str]):
+        """Process the notifications that arrived since the last poll."""
+        for payload in payloads:
+            self.handle(payload)
+
+    def missed(self):
+        """Recover from the notifications lost while disconnected."""
+
+    def run(self):
+        reconnecting = False
+        while not self.stopping.is_set():
+            try:
+                self._listen(reconnecting)
+            except (DatabaseError, psycopg2.Error, OSError):
+                logger.exception("Listener of %s lost its connection", self.channel)
+                reconnecting = True
+                self.stopping.wait(settings.EVENTS_RECONNECT_SECONDS)
+            finally:
+                self.listening.clear()
+                # The connection of this thread only
+                connection.close()
+
+    def _listen(self, reconnecting: bool):
+        with connection.cursor() as cursor:
+            cursor.execute(f"LISTEN {self.channel}")
+        self.listening.set()
+        if reconnecting:
+            self.missed()
+        pg_connection = connection.connection
+        while not self.stopping.is_set():
+            if select.select([pg_connection], [], [], 1.0) == ([], [], []):
+                continue
+            pg_connection.poll()
+            notifies, pg_connection.notifies = pg_connection.notifies, []
+            self.receive([notify.payload for notify in notifies])
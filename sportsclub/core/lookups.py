@@ -0,0 +1,24 @@
+# core/lookups.py
+"""Custom ORM lookups for PostgreSQL features Django does not expose."""
+
+from django.db.models import JSONField, Lookup
+
+
+@JSONField.register_lookup
+class JSONPathExists(Lookup):
+    """
+    Match JSON documents for which a SQL/JSON path returns at least one item.
+
+    Compiles to the `@?` operator, which a GIN index on the column can serve.
+    Usage: `Competition.objects.filter(score__path_exists="$.results.relays")`
+
+    The right-hand side is sent as a bound parameter, never interpolated, but it
+    is still a path expression: build it from trusted values only.
+    """
+
+    lookup_name = "path_exists"
+    prepare_rhs = False
+
+    def as_sql(self, compiler, connection):
+        lhs, lhs_params = self.process_lhs(compiler, connection)
+        return f"{lhs} @? %s::jsonpath", [*lhs_params, self.rhs]
@@ -0,0 +1,88 @@
+# core/management/commands/archive_soft_deleted.py
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from core.archival import archive_soft_deleted, count_due, processing_order
+
+
+class Command(BaseCommand):
+    help = (
+        "Move rows soft-deleted more than N days ago to the archive schema, or "
+        "purge them, in batches of primary keys with one transaction each"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=settings.SOFT_DELETE_RETENTION_DAYS,
+            help="Only rows soft-deleted more than this many days ago "
+            "(default: SOFT_DELETE_RETENTION_DAYS)",
+        )
+        parser.add_argument(
+            "--purge",
+            action="store_true",
+            help="Delete the rows permanently instead of archiving them",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Rows per batch and transaction (default: 1000)",
+        )
+        parser.add_argument(
+            "--sleep",
+            type=float,
+            default=0.5,
+            help="Seconds to wait between batches, to throttle the load on the "
+            "database (default: 0.5)",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only count the rows that would be archived or purged",
+        )
+
+    def handle(self, *args, **options):
+        if options["days"] < 0:
+            raise CommandError("--days must not be negative")
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size must be positive")
+
+        cutoff = timezone.now() - timedelta(days=options["days"])
+        verb = "purged" if options["purge"] else "archived"
+
+        if options["dry_run"]:
+            for model in processing_order():
+                due = count_due(model, cutoff)
+                if due:
+                    self.stdout.write(f"{model._meta.label}: {due} to be {verb}")
+            # Rows still referenced by due dependants are not counted, but a
+            # real run moves them too once the dependants are gone
+            return
+
+        totals: dict[str, int] = {}
+        started = time.monotonic()
+        for batch in archive_soft_deleted(
+            cutoff, options["batch_size"], archive=not options["purge"]
+        ):
+            label = batch.model._meta.label
+            totals[label] = totals.get(label, 0) + batch.rows
+            elapsed = time.monotonic() - started
+            self.stdout.write(
+                f"{label}: {totals[label]} {verb} "
+                f"(up to id {batch.last_pk}, {sum(totals.values()) / elapsed:.0f} "
+                "rows/s)"
+            )
+            if options["sleep"]:
+                time.sleep(options["sleep"])
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{sum(totals.values())} rows {verb} from {len(totals)} tables"
+            )
+        )
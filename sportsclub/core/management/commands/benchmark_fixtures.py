@@ -0,0 +1,129 @@
+# core/management/commands/benchmark_fixtures.py
+import json
+import tempfile
+import time
+from pathlib import Path
+
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import Max
+from people.models import Athlete
+
+from core.bulk_fixtures import load_fixtures
+from core.models import Address
+
+TIMESTAMP = "2025-01-01T00:00:00Z"
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare the time load_fixtures and loaddata take to load the same "
+        "generated fixture of addresses and athletes. Each load runs in a "
+        "transaction that is rolled back, but tables are locked meanwhile and "
+        "the caches are flushed: do not run it against a production database."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--rows",
+            type=int,
+            default=100_000,
+            help="Objects in the fixture, half addresses and half athletes "
+            "(default: 100000)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=5000,
+            help="Rows per INSERT statement of load_fixtures (default: 5000)",
+        )
+        parser.add_argument(
+            "--skip-loaddata",
+            action="store_true",
+            help="Only time load_fixtures, e.g. at a scale loaddata takes too long",
+        )
+
+    def handle(self, *args, **options):
+        if options["rows"] < 2 or options["batch_size"] < 1:
+            raise CommandError("--rows must be at least 2, and --batch-size positive")
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "benchmark.json"
+            self.stdout.write(f"Generating {options['rows']} objects...")
+            self._generate(path, options["rows"])
+
+            bulk = self._time(
+                "load_fixtures", lambda: load_fixtures([path], options["batch_size"])
+            )
+            if options["skip_loaddata"]:
+                return
+            loaddata = self._time(
+                "loaddata", lambda: call_command("loaddata", path, verbosity=0)
+            )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"load_fixtures took {bulk / loaddata:.1%} of the time of loaddata "
+                f"({loaddata / bulk:.1f} times faster)"
+            )
+        )
+
+    def _time(self, name: str, load) -> float:
+        with transaction.atomic():
+            start = time.perf_counter()
+            load()
+            elapsed = time.perf_counter() - start
+            # Undo everything the load wrote
+            transaction.set_rollback(True)
+        self.stdout.write(f"{name}: {elapsed:.2f} s")
+        return elapsed
+
+    def _generate(self, path: Path, rows: int):
+        """Write the fixture object by object, after the existing primary keys."""
+        first_address = (Address.all_objects.aggregate(Max("pk"))["pk__max"] or 0) + 1
+        first_athlete = (Athlete.all_objects.aggregate(Max("pk"))["pk__max"] or 0) + 1
+        addresses = rows // 2
+        with open(path, "w", encoding="utf-8") as file:
+            file.write("[\n")
+            for number in range(rows):
+                if number < addresses:
+                    obj = _address(first_address + number)
+                else:
+                    address = first_address + (number - addresses) % addresses
+                    obj = _athlete(first_athlete + number - addresses, address)
+                file.write(json.dumps(obj))
+                file.write(",\n" if number < rows - 1 else "\n]\n")
+
+
+def _address(pk: int) -> dict:
+    return {
+        "model": "core.address",
+        "pk": pk,
+        "fields": {
+            "public_id": f"bench_addr_{pk}",
+            "line1": f"Carrer Major, {pk}",
+            "city": "Palma",
+            "country": "Spain",
+            "created_at": TIMESTAMP,
+            "updated_at": TIMESTAMP,
+        },
+    }
+
+
+def _athlete(pk: int, address: int) -> dict:
+    return {
+        "model": "people.athlete",
+        "pk": pk,
+        "fields": {
+            "public_id": f"bench_ath_{pk}",
+            "first_name": "Athlete",
+            "last_name": str(pk),
+            "email": f"athlete.{pk}@benchmark.invalid",
+            "date_of_birth": "2000-01-01",
+            "address": address,
+            "height": 180.0,
+            "weight": 70.0,
+            "created_at": TIMESTAMP,
+            "updated_at": TIMESTAMP,
+        },
+    }
@@ -0,0 +1,58 @@
+# core/management/commands/club_snapshot.py
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.snapshots import SnapshotError, export_snapshot, restore_snapshot
+
+
+class Command(BaseCommand):
+    help = (
+        "Export a consistent snapshot of the whole club to a compressed archive, "
+        "or restore one, replacing every table of the club. Users are included; "
+        "webhooks are not."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("action", choices=["export", "restore"])
+        parser.add_argument("file", type=Path, help="Snapshot archive (.zip)")
+        parser.add_argument(
+            "--noinput",
+            "--no-input",
+            action="store_false",
+            dest="interactive",
+            help="Restore without asking for confirmation",
+        )
+
+    def handle(self, *args, **options):
+        path: Path = options["file"]
+        try:
+            if options["action"] == "export":
+                with open(path, "wb") as file:
+                    manifest = export_snapshot(file)
+                verb = "Exported"
+            else:
+                if (
+                    options["interactive"]
+                    and input(
+                        "This replaces every table of the club in the database. "
+                        "Type 'yes' to continue: "
+                    )
+                    != "yes"
+                ):
+                    raise CommandError("Restore cancelled")
+                with open(path, "rb") as file:
+                    manifest = restore_snapshot(file)
+                verb = "Restored"
+        except (OSError, SnapshotError) as err:
+            raise CommandError(str(err)) from err
+
+        for table in manifest.tables:
+            self.stdout.write(f"{table.label}: {table.rows}")
+        rows = sum(table.rows for table in manifest.tables)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{verb} {rows} row(s) of {len(manifest.tables)} tables "
+                f"({manifest.created_at})"
+            )
+        )
@@ -0,0 +1,47 @@
+# core/management/commands/dispatch_webhooks.py
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from core.webhooks import Dispatcher
+
+
+class Command(BaseCommand):
+    help = "Deliver the outbox of change events to the webhook endpoints"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=settings.WEBHOOK_WORKERS,
+            help="Deliveries in flight at once, across all endpoints "
+            "(default: WEBHOOK_WORKERS)",
+        )
+        parser.add_argument(
+            "--poll",
+            type=float,
+            default=settings.WEBHOOK_POLL_SECONDS,
+            help="Seconds between checks for due messages when idle "
+            "(default: WEBHOOK_POLL_SECONDS)",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Exit once no message is due, instead of running forever",
+        )
+
+    def handle(self, *args, **options):
+        if options["workers"] < 1 or options["poll"] <= 0:
+            raise CommandError("--workers and --poll must be positive")
+
+        dispatcher = Dispatcher(options["workers"])
+        batches = 0
+        try:
+            while True:
+                started = dispatcher.dispatch_once()
+                batches += started
+                if options["once"] and not started and not dispatcher.busy():
+                    break
+                dispatcher.wait(options["poll"])
+        finally:
+            dispatcher.shutdown()
+        self.stdout.write(self.style.SUCCESS(f"{batches} batches dispatched"))
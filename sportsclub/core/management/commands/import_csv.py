@@ -0,0 +1,68 @@
+# core/management/commands/import_csv.py
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from core.imports import CSVImportError, RejectFile, import_csv, importer_names
+
+
+class Command(BaseCommand):
+    help = (
+        "Import records from a CSV file whose header names the fields of the "
+        "API input schema. Rows with a public_id update that record; the "
+        "others are created. Invalid rows are written to a reject file."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("resource", choices=sorted(importer_names()))
+        parser.add_argument("file", type=Path, help="CSV file, UTF-8 encoded")
+        parser.add_argument(
+            "--rejects",
+            type=Path,
+            default=None,
+            help="Where to write the rejected rows (default: FILE.rejects.csv)",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=settings.IMPORT_WORKERS,
+            help="Processes validating the rows, 0 to validate in this one "
+            "(default: IMPORT_WORKERS)",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=settings.IMPORT_CHUNK_SIZE,
+            help="Rows validated and copied at once (default: IMPORT_CHUNK_SIZE)",
+        )
+
+    def handle(self, *args, **options):
+        if options["workers"] < 0 or options["chunk_size"] < 1:
+            raise CommandError("--workers cannot be negative, nor --chunk-size < 1")
+        source = options["file"]
+        rejects = options["rejects"] or source.with_suffix(".rejects.csv")
+
+        try:
+            with (
+                source.open(encoding="utf-8-sig", newline="") as lines,
+                rejects.open("w", encoding="utf-8", newline="") as reject_file,
+            ):
+                counts = import_csv(
+                    options["resource"],
+                    lines,
+                    RejectFile(reject_file, options["resource"]),
+                    options["workers"],
+                    options["chunk_size"],
+                )
+        except (CSVImportError, OSError, UnicodeDecodeError) as err:
+            raise CommandError(str(err)) from err
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{counts.created} created, {counts.updated} updated, "
+                f"{counts.rejected} rejected"
+            )
+        )
+        if counts.rejected:
+            self.stdout.write(self.style.WARNING(f"Rejected rows written to {rejects}"))
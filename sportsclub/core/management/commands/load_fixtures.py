@@ -0,0 +1,39 @@
+# core/management/commands/load_fixtures.py
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.bulk_fixtures import FixtureLoadError, load_fixtures
+
+
+class Command(BaseCommand):
+    help = (
+        "Load JSON or JSON Lines fixtures with bulk inserts, batch by batch as "
+        "they are read. Much faster than loaddata on large fixtures (see "
+        "benchmark_fixtures), but sends no signals: caches are flushed, and no "
+        "change events or history are written."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("files", nargs="+", type=Path, help="JSON fixture files")
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=5000,
+            help="Rows per INSERT statement (default: 5000)",
+        )
+
+    def handle(self, *args, **options):
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size must be positive")
+
+        try:
+            counts = load_fixtures(options["files"], options["batch_size"])
+        except FixtureLoadError as err:
+            raise CommandError(str(err)) from err
+
+        for label, count in counts.items():
+            self.stdout.write(f"{label}: {count}")
+        self.stdout.write(
+            self.style.SUCCESS(f"Installed {sum(counts.values())} object(s)")
+        )
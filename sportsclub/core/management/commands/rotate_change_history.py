@@ -0,0 +1,42 @@
+# core/management/commands/rotate_change_history.py
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from core.history import drop_partitions, ensure_partitions
+
+
+class Command(BaseCommand):
+    help = (
+        "Create the monthly partitions of the change history for the coming "
+        "months, and drop those past the retention period"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--months-ahead",
+            type=int,
+            default=3,
+            help="Months to create partitions for after the current one (default: 3)",
+        )
+        parser.add_argument(
+            "--retention-months",
+            type=int,
+            default=settings.CHANGE_HISTORY_RETENTION_MONTHS,
+            help="Drop partitions that ended more than this many months ago "
+            "(default: CHANGE_HISTORY_RETENTION_MONTHS)",
+        )
+
+    def handle(self, *args, **options):
+        if options["months_ahead"] < 0 or options["retention_months"] < 1:
+            raise CommandError(
+                "--months-ahead must not be negative and --retention-months "
+                "must be positive"
+            )
+
+        today = timezone.now().date()
+        for name in ensure_partitions(today, options["months_ahead"]):
+            self.stdout.write(f"Created {name}")
+        for name in drop_partitions(today, options["retention_months"]):
+            self.stdout.write(f"Dropped {name}")
+        self.stdout.write(self.style.SUCCESS("Change history partitions rotated"))
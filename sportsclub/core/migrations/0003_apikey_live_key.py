@@ -0,0 +1,23 @@
+# Generated by Django 6.0.2 on 2026-10-19 00:41
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0002_apikey'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='apikey',
+            name='core_apikey_key_8b1d45_idx',
+        ),
+        migrations.AddIndex(
+            model_name='apikey',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True), ('is_active', True)), fields=['key'], name='core_apikey_live_key'),
+        ),
+    ]
@@ -0,0 +1,63 @@
+# Generated by Django 6.0.2 on 2026-10-19 00:58
+
+import django.core.serializers.json
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def create_partitions(apps, schema_editor):
+    from core.history import ensure_partitions
+
+    ensure_partitions(timezone.now().date(), months_ahead=3)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_apikey_live_key'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ChangeRecord',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('changed_at', models.DateTimeField()),
+                ('model', models.CharField(help_text='Model label, e.g. people.Athlete', max_length=100)),
+                ('public_id', models.CharField(max_length=21)),
+                ('action', models.CharField(choices=[('create', 'Create'), ('update', 'Update'), ('soft_delete', 'Soft delete'), ('restore', 'Restore'), ('delete', 'Delete')], max_length=20)),
+                ('user_id', models.IntegerField(blank=True, null=True)),
+                ('username', models.CharField(blank=True, max_length=150)),
+                ('changes', models.JSONField(encoder=django.core.serializers.json.DjangoJSONEncoder, help_text='Changed fields, mapped to their [before, after] values')),
+            ],
+            options={
+                'verbose_name': 'Change record',
+                'verbose_name_plural': 'Change records',
+                'db_table': 'core_changerecord',
+                'ordering': ['-changed_at', '-id'],
+                'managed': False,
+            },
+        ),
+        # Django cannot create partitioned tables, so the model is unmanaged
+        migrations.RunSQL(
+            sql="""
+                CREATE TABLE core_changerecord (
+                    id bigint GENERATED BY DEFAULT AS IDENTITY,
+                    changed_at timestamp with time zone NOT NULL,
+                    model varchar(100) NOT NULL,
+                    public_id varchar(21) NOT NULL,
+                    action varchar(20) NOT NULL,
+                    user_id integer NULL,
+                    username varchar(150) NOT NULL,
+                    changes jsonb NOT NULL,
+                    PRIMARY KEY (id, changed_at)
+                ) PARTITION BY RANGE (changed_at);
+                CREATE TABLE core_changerecord_default
+                    PARTITION OF core_changerecord DEFAULT;
+                CREATE INDEX core_changerecord_object
+                    ON core_changerecord (model, public_id, changed_at DESC);
+            """,
+            reverse_sql="DROP TABLE core_changerecord;",
+        ),
+        migrations.RunPython(create_partitions, migrations.RunPython.noop),
+    ]
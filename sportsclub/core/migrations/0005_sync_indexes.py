@@ -0,0 +1,21 @@
+# Generated by Django 6.0.2 on 2026-10-19 01:05
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    # Build the indexes without blocking writes
+    atomic = False
+
+    dependencies = [
+        ('core', '0004_changerecord'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='address',
+            index=models.Index(fields=['updated_at', 'id'], name='core_address_sync'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 6.0.2 on 2026-10-19 01:32
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0005_sync_indexes'),
+    ]
+
+    operations = [
+        # IDs of the change events (see `core.events`), shared by all workers
+        migrations.RunSQL(
+            sql='CREATE SEQUENCE core_change_event_id',
+            reverse_sql='DROP SEQUENCE core_change_event_id',
+        ),
+    ]
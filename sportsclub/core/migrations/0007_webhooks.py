@@ -0,0 +1,58 @@
+# Generated by Django 6.0.2 on 2026-10-19 01:12
+
+import django.contrib.postgres.fields
+import django.core.serializers.json
+import django.db.models.deletion
+import nanoid_field.fields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0006_change_event_sequence'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WebhookEndpoint',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('public_id', nanoid_field.fields.NanoidField(alphabet='0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ', db_index=True, editable=False, max_length=21, unique=True)),
+                ('name', models.CharField(help_text='Partner owning the URL', max_length=100)),
+                ('url', models.URLField(max_length=500)),
+                ('secret', nanoid_field.fields.NanoidField(alphabet='0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ', editable=False, help_text='Key of the HMAC signature of the deliveries', max_length=21)),
+                ('resources', django.contrib.postgres.fields.ArrayField(base_field=models.CharField(max_length=50), blank=True, default=list, help_text='Resources whose changes are sent, e.g. competitions; all if empty', size=None)),
+                ('is_active', models.BooleanField(default=True)),
+                ('max_concurrency', models.PositiveSmallIntegerField(default=2, help_text='Deliveries in flight at once to this URL')),
+                ('batch_size', models.PositiveSmallIntegerField(default=100, help_text='Maximum number of events per delivery')),
+            ],
+            options={
+                'verbose_name': 'Webhook endpoint',
+                'verbose_name_plural': 'Webhook endpoints',
+            },
+        ),
+        migrations.CreateModel(
+            name='OutboxMessage',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('event', models.JSONField(encoder=django.core.serializers.json.DjangoJSONEncoder)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('dead', 'Dead')], default='pending', max_length=10)),
+                ('attempts', models.PositiveSmallIntegerField(default=0)),
+                ('next_attempt_at', models.DateTimeField()),
+                ('locked_until', models.DateTimeField(blank=True, null=True)),
+                ('last_error', models.TextField(blank=True)),
+                ('endpoint', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='outbox_messages', to='core.webhookendpoint')),
+            ],
+            options={
+                'verbose_name': 'Outbox message',
+                'verbose_name_plural': 'Outbox messages',
+                'ordering': ['id'],
+                'indexes': [models.Index(condition=models.Q(('status', 'pending')), fields=['endpoint', 'next_attempt_at'], name='core_outbox_pending')],
+            },
+        ),
+    ]
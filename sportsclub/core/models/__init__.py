@@ -4,11 +4,20 @@
 from .address import Address
 from .api_key import ApiKey
 from .auditory import Auditory
-from .managers import SoftDeleteManager
+from .change_record import ChangeAction, ChangeRecord
+from .managers import AuditoryManager, AuditoryQuerySet, SoftDeleteManager
+from .webhook import OutboxMessage, OutboxStatus, WebhookEndpoint
 
 __all__ = [
+    "AuditoryManager",
+    "AuditoryQuerySet",
     "SoftDeleteManager",
     "Auditory",
     "Address",
     "ApiKey",
+    "ChangeAction",
+    "ChangeRecord",
+    "OutboxMessage",
+    "OutboxStatus",
+    "WebhookEndpoint",
 ]
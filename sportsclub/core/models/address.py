@@ -1,9 +1,9 @@
 # core/models/address.py
 from django.db import models
 from django.db.models import Count, QuerySet
-from nanoid_field import NanoidField
 
 from core.models.auditory import Auditory
+from core.models.fields import NanoidField
 
 
 class Address(Auditory):
@@ -27,6 +27,8 @@ class Address(Auditory):
         # E.g., "Venues in Palma, Spain".
         indexes = [
             models.Index(fields=["city", "country"]),
+            # Range scans of the delta sync (see `core.sync`)
+            models.Index(fields=["updated_at", "id"], name="core_address_sync"),
         ]
 
     def __str__(self) -> str:
@@ -2,9 +2,9 @@
 from django.conf import settings
 from django.db import models
 from django.utils import timezone
-from nanoid_field import NanoidField
 
 from core.models.auditory import Auditory
+from core.models.fields import NanoidField
 
 
 class ApiKey(Auditory):
@@ -29,7 +29,12 @@ class ApiKey(Auditory):
         verbose_name = "API Key"
         verbose_name_plural = "API Keys"
         indexes = [
-            models.Index(fields=["key"]),
+            # Matches the lookup done on every authenticated request
+            models.Index(
+                fields=["key"],
+                condition=models.Q(is_active=True, deleted_at__isnull=True),
+                name="core_apikey_live_key",
+            ),
             models.Index(fields=["user", "is_active"]),
         ]
 
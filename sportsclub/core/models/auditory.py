@@ -2,13 +2,14 @@
 from django.db import models
 from django.utils import timezone
 
-from .managers import SoftDeleteManager
+from .managers import AuditoryManager, SoftDeleteManager
 
 
 class Auditory(models.Model):
     """
     Base class for auditory fields with support for soft-deletion.
-    It does not implement anonymisation or purging of records.
+    Purging is implemented by `core.archival`, and anonymisation of people by
+    `people.anonymisation`.
     It does not keep track of which user last performed a given operation.
     """
 
@@ -20,15 +21,20 @@ class Auditory(models.Model):
     objects = SoftDeleteManager()
 
     # Manager to access all records including soft-deleted
-    all_objects = models.Manager()
+    all_objects = AuditoryManager()
 
     class Meta:
         abstract = True
 
-    def soft_delete(self):
-        """Mark record as deleted without removing from database."""
+    def soft_delete(self, deleted_at=None):
+        """
+        Mark record as deleted without removing from database.
 
-        self.deleted_at = timezone.now()
+        Dependent records are left alone: see `core.deletion` to soft-delete
+        them too.
+        """
+
+        self.deleted_at = deleted_at or timezone.now()
         self.save(update_fields=["deleted_at", "updated_at"])
 
     def restore(self):
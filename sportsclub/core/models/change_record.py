@@ -0,0 +1,49 @@
+# core/models/change_record.py
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+
+
+class ChangeAction(models.TextChoices):
+    """Kinds of write recorded in the change history."""
+
+    CREATE = "create", "Create"
+    UPDATE = "update", "Update"
+    SOFT_DELETE = "soft_delete", "Soft delete"
+    RESTORE = "restore", "Restore"
+    DELETE = "delete", "Delete"
+
+
+class ChangeRecord(models.Model):
+    """
+    Append-only history of the writes made through the API and the admin.
+
+    The table is partitioned by month on `changed_at` (see `core.history`),
+    which Django cannot create: it is created by a migration and left
+    unmanaged. Its primary key is really (id, changed_at), as partitioned
+    tables require, but ids are unique on their own. `user_id` is not a
+    foreign key, so the history outlives the users it mentions.
+    """
+
+    id = models.BigAutoField(primary_key=True)
+    changed_at = models.DateTimeField()
+    model = models.CharField(
+        max_length=100, help_text="Model label, e.g. people.Athlete"
+    )
+    public_id = models.CharField(max_length=21)
+    action = models.CharField(max_length=20, choices=ChangeAction.choices)
+    user_id = models.IntegerField(null=True, blank=True)
+    username = models.CharField(max_length=150, blank=True)
+    changes = models.JSONField(
+        encoder=DjangoJSONEncoder,
+        help_text="Changed fields, mapped to their [before, after] values",
+    )
+
+    class Meta:
+        managed = False
+        db_table = "core_changerecord"
+        verbose_name = "Change record"
+        verbose_name_plural = "Change records"
+        ordering = ["-changed_at", "-id"]
+
+    def __str__(self):
+        return f"{self.action} {self.model} {self.public_id} by {self.username or '-'}"
@@ -10,3 +10,46 @@ class Discipline(StrEnum):
     RELAYS = "relays"
     HIGH_JUMP = "high_jump"
     LONG_JUMP = "long_jump"
+
+    @property
+    def lower_is_better(self) -> bool:
+        """Races are ranked by time (ascending), jumps by distance (descending)."""
+        return self in (Discipline.SPRINTS, Discipline.LONG_DISTANCE, Discipline.RELAYS)
+
+
+class AgeCategory(StrEnum):
+    """Age categories used to rank athletes against their peers."""
+
+    U10 = "u10"
+    U12 = "u12"
+    U14 = "u14"
+    U16 = "u16"
+    U18 = "u18"
+    U20 = "u20"
+    SENIOR = "senior"
+    # Athletes without a known date of birth
+    OPEN = "open"
+
+    @classmethod
+    def for_birth_year(cls, birth_year: int | None, season_year: int) -> "AgeCategory":
+        """
+        Return the category for an athlete born in `birth_year`.
+
+        As in federation rules, the category depends on the age reached during
+        the year the season starts, not on the exact date of birth.
+        """
+        if birth_year is None:
+            return cls.OPEN
+
+        age = season_year - birth_year
+        for limit, category in (
+            (10, cls.U10),
+            (12, cls.U12),
+            (14, cls.U14),
+            (16, cls.U16),
+            (18, cls.U18),
+            (20, cls.U20),
+        ):
+            if age < limit:
+                return category
+        return cls.SENIOR
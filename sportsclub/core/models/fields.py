@@ -0,0 +1,28 @@
+# core/models/fields.py
+from nanoid_field import NanoidField as BaseNanoidField
+
+from core import nanoids
+
+
+class NanoidField(BaseNanoidField):
+    """
+    NanoID field whose defaults are generated in batches (see `core.nanoids`).
+
+    A default stays a `nanoids.GeneratedId` until the object is saved, so that
+    bulk inserts tell it from a value set by the caller. Migrations see the
+    field of django-nanoid-field, which stores the same values.
+    """
+
+    def nanoid(self):
+        return nanoids.draw(self)
+
+    def pre_save(self, model_instance, add):
+        value = super().pre_save(model_instance, add)
+        if isinstance(value, nanoids.GeneratedId):
+            value = str(value)
+            setattr(model_instance, self.attname, value)
+        return value
+
+    def deconstruct(self):
+        name, _, args, kwargs = super().deconstruct()
+        return name, "nanoid_field.fields.NanoidField", args, kwargs
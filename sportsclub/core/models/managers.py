@@ -2,9 +2,47 @@
 """Custom model managers for the core app."""
 
 from django.db import models
+from nanoid_field import NanoidField
 
+from core import nanoids
 
-class SoftDeleteManager(models.Manager):
+
+class AuditoryQuerySet(models.QuerySet):
+    """QuerySet of the models with auditory fields."""
+
+    def bulk_create(self, objs, *args, **kwargs):
+        """
+        Insert objects in bulk, with new NanoIDs generated in one batch.
+
+        The unique NanoID fields (e.g. `public_id`) of new objects still holding
+        the default drawn when they were instantiated get IDs from
+        `nanoids.unique()`, checked against the table in one query per field.
+        Values set by the caller are inserted as they are, so one already used
+        raises an `IntegrityError`.
+        """
+        objs = list(objs)
+        new = [obj for obj in objs if obj.pk is None]
+        for field in self.model._meta.concrete_fields:
+            if not (isinstance(field, NanoidField) and field.unique):
+                continue
+            generated = [
+                obj
+                for obj in new
+                if isinstance(getattr(obj, field.attname), nanoids.GeneratedId)
+            ]
+            if not generated:
+                continue
+            values = nanoids.unique(self.model, field.name, len(generated))
+            for obj, value in zip(generated, values, strict=True):
+                setattr(obj, field.attname, value)
+        return super().bulk_create(objs, *args, **kwargs)
+
+
+class AuditoryManager(models.Manager.from_queryset(AuditoryQuerySet)):
+    """Manager of the models with auditory fields, including soft-deleted rows."""
+
+
+class SoftDeleteManager(AuditoryManager):
     """Manager that excludes soft-deleted objects by default."""
 
     def get_queryset(self):
@@ -0,0 +1,90 @@
+# core/models/webhook.py
+from django.contrib.postgres.fields import ArrayField
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+
+from core.models.auditory import Auditory
+from core.models.fields import NanoidField
+
+
+class WebhookEndpoint(Auditory):
+    """Partner URL notified of the change events (see `core.webhooks`)."""
+
+    id = models.BigAutoField(primary_key=True)
+    public_id = NanoidField(unique=True, editable=False, db_index=True)
+    name = models.CharField(max_length=100, help_text="Partner owning the URL")
+    url = models.URLField(max_length=500)
+    secret = NanoidField(
+        editable=False, help_text="Key of the HMAC signature of the deliveries"
+    )
+    resources = ArrayField(
+        models.CharField(max_length=50),
+        blank=True,
+        default=list,
+        help_text="Resources whose changes are sent, e.g. competitions; all if empty",
+    )
+    is_active = models.BooleanField(default=True)
+    max_concurrency = models.PositiveSmallIntegerField(
+        default=2, help_text="Deliveries in flight at once to this URL"
+    )
+    batch_size = models.PositiveSmallIntegerField(
+        default=100, help_text="Maximum number of events per delivery"
+    )
+
+    class Meta:
+        verbose_name = "Webhook endpoint"
+        verbose_name_plural = "Webhook endpoints"
+
+    def __str__(self) -> str:
+        return f"{self.name} ({self.url})"
+
+
+class OutboxStatus(models.TextChoices):
+    """Delivery state of an outbox message."""
+
+    PENDING = "pending", "Pending"
+    DEAD = "dead", "Dead"
+
+
+class OutboxMessage(models.Model):
+    """
+    Change event waiting to be delivered to a webhook endpoint.
+
+    Messages are inserted along with the write they describe, in the same
+    statement as its change event (see `core.events`), and deleted once
+    delivered. Messages that failed too many times are kept as dead letters.
+    """
+
+    id = models.BigAutoField(primary_key=True)
+    endpoint = models.ForeignKey(
+        WebhookEndpoint, on_delete=models.CASCADE, related_name="outbox_messages"
+    )
+    event = models.JSONField(encoder=DjangoJSONEncoder)
+    created_at = models.DateTimeField(auto_now_add=True)
+    status = models.CharField(
+        max_length=10, choices=OutboxStatus.choices, default=OutboxStatus.PENDING
+    )
+    attempts = models.PositiveSmallIntegerField(default=0)
+    next_attempt_at = models.DateTimeField()
+    # Set while a dispatcher is delivering the message
+    locked_until = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True)
+
+    class Meta:
+        verbose_name = "Outbox message"
+        verbose_name_plural = "Outbox messages"
+        ordering = ["id"]
+        indexes = [
+            # Due messages of an endpoint, as claimed by the dispatcher
+            models.Index(
+                fields=["endpoint", "next_attempt_at"],
+                condition=models.Q(status="pending"),
+                name="core_outbox_pending",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        event = self.event
+        return (
+            f"{event.get('operation')} {event.get('resource')} {event.get('public_id')}"
+        )
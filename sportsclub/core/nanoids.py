@@ -0,0 +1,131 @@
+# core/nanoids.py
+"""
+Batch generation of NanoIDs.
+
+The `NanoidField` of django-nanoid-field generates the ID of each object when
+it is instantiated, reading random bytes from the OS and building the string
+character by character for every ID. IDs are generated in batches instead:
+`generate()` reads the random bytes of a whole batch in one call, and maps them
+onto the alphabet in C with `bytes.translate()`. It uses the same rejection
+sampling as `nanoid`, so characters stay uniform over the alphabet.
+
+The public IDs of the models use `core.models.fields.NanoidField`, whose
+defaults are drawn from a pool of each process refilled by `generate()` (see
+`draw()`), and marked as `GeneratedId` until the object is saved.
+
+Collisions between random IDs of 21 characters are very unlikely, but not
+impossible. Rather than failing a batch halfway with an `IntegrityError`,
+`unique()` checks new IDs against the unique index of their column in one
+query, and replaces those already taken. `AuditoryQuerySet.bulk_create()` gives
+the objects it inserts with a generated ID new ones from `unique()` (see
+`core.models.managers`).
+"""
+
+import functools
+import os
+
+from django.db import models
+from nanoid_field import NanoidField
+
+
+@functools.cache
+def _translation(alphabet: str) -> tuple[bytes, bytes]:
+    """
+    Build the table mapping random bytes onto an alphabet.
+
+    As in `nanoid`, bytes are masked to the smallest power of two covering the
+    alphabet, and masked values outside of it are rejected.
+
+    Returns:
+        The translation table, and the bytes to delete
+    """
+    mask = (2 << (len(alphabet) - 1).bit_length() - 1) - 1
+    table = bytes(
+        ord(alphabet[byte & mask]) if byte & mask < len(alphabet) else 0
+        for byte in range(256)
+    )
+    rejected = bytes(byte for byte in range(256) if byte & mask >= len(alphabet))
+    return table, rejected
+
+
+def generate(alphabet: str, size: int, count: int) -> list[str]:
+    """Generate `count` distinct IDs of `size` characters of an ASCII alphabet."""
+    table, rejected = _translation(alphabet)
+    accepted = 1 - len(rejected) / 256
+    ids: dict[str, None] = {}
+    while len(ids) < count:
+        # Enough bytes for the missing IDs, with a margin for rejected bytes
+        missing = count - len(ids)
+        raw = os.urandom(int(missing * size / accepted * 1.1) + size)
+        chars = raw.translate(table, rejected).decode("ascii")
+        ids.update(
+            dict.fromkeys(
+                chars[start : start + size]
+                for start in range(0, len(chars) - size + 1, size)
+            )
+        )
+    return list(ids)[:count]
+
+
+def for_field(field: NanoidField, count: int) -> list[str]:
+    """Generate `count` distinct IDs with the alphabet and size of a field."""
+    return generate(field.alphabet, field.max_length, count)
+
+
+class GeneratedId(str):
+    """ID drawn for the default of a field, rather than set by the caller."""
+
+    __slots__ = ()
+
+
+# IDs generated ahead, by alphabet and size, for the defaults of fields
+POOL_SIZE = 1000
+_pools: dict[tuple[str, int], list[str]] = {}
+# A forked process must not hand out the IDs its parent hands out
+os.register_at_fork(after_in_child=_pools.clear)
+
+
+def draw(field: NanoidField) -> GeneratedId:
+    """Take an ID for the default of a field, from a batch generated ahead."""
+    pool = _pools.setdefault((field.alphabet, field.max_length), [])
+    try:
+        value = pool.pop()
+    except IndexError:
+        pool.extend(for_field(field, POOL_SIZE))
+        value = pool.pop()
+    return GeneratedId(value)
+
+
+def deduplicate(
+    model: type[models.Model], field: NanoidField, values: list[str]
+) -> list[str]:
+    """
+    Replace the values of a unique field already used, by a row or an earlier
+    value, with new IDs.
+
+    Soft-deleted rows are checked too, as they still hold their IDs.
+    """
+    while True:
+        taken = set(
+            model._base_manager.filter(**{f"{field.name}__in": values}).values_list(
+                field.name, flat=True
+            )
+        )
+        seen = set()
+        clashes = []
+        for index, value in enumerate(values):
+            if value in taken or value in seen:
+                clashes.append(index)
+            seen.add(value)
+        if not clashes:
+            return values
+
+        values = list(values)
+        for index, value in zip(clashes, for_field(field, len(clashes)), strict=True):
+            values[index] = value
+
+
+def unique(model: type[models.Model], field_name: str, count: int) -> list[str]:
+    """Generate `count` IDs for a unique field, unused by any row of the model."""
+    field = model._meta.get_field(field_name)
+    return deduplicate(model, field, for_field(field, count))
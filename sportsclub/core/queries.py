@@ -0,0 +1,126 @@
+# core/queries.py
+"""
+Fingerprints of SQL statements, to catch code querying once per row.
+
+The fingerprint of a statement is its shape: its SQL with literals,
+parameters and savepoint names replaced by `?`, and lists of them collapsed,
+so the queries run by an N+1 loop (e.g. a schema resolver or an admin column
+reading a relation of each row) share one fingerprint whatever their
+parameters.
+
+`RepeatedQueriesMiddleware` counts the fingerprints of the queries of each
+request and logs a warning for those run more than
+`QUERY_REPEAT_THRESHOLD` times, with the line of the project that ran the
+first query over the threshold. It is off unless the setting is set, as every
+query is then fingerprinted. Queries made while a streaming response is
+consumed, after the middleware returned, are not counted.
+
+In tests, `core.test.query_budget()` caps the queries of each request instead.
+"""
+
+import logging
+import re
+import traceback
+from collections import Counter
+from functools import lru_cache
+from pathlib import Path
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connection
+
+logger = logging.getLogger(__name__)
+
+# Named by Django after the thread and a counter, e.g. "s140228327787392_x23"
+_SAVEPOINT = re.compile(r'"s\d+_x\d+"')
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"(?<![\w.\"])-?\d+(?:\.\d+)?\b")
+_PARAMETER = re.compile(r"%s|%\(\w+\)s")
+_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_SPACE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=1024)
+def fingerprint(sql: str) -> str:
+    """
+    Shape of a statement, without its literals and parameters.
+
+    E.g. `SELECT ... WHERE "id" IN (%s, %s) LIMIT 21` and
+    `SELECT ... WHERE "id" IN (%s) LIMIT 21` are both
+    `SELECT ... WHERE "id" IN (...) LIMIT ?`.
+    """
+    sql = _SAVEPOINT.sub('"?"', sql)
+    sql = _STRING.sub("?", sql)
+    sql = _PARAMETER.sub("?", sql)
+    sql = _NUMBER.sub("?", sql)
+    sql = _LIST.sub("(...)", sql)
+    return _SPACE.sub(" ", sql).strip()
+
+
+def caller() -> str:
+    """Innermost line of the project in the current stack, outside this module."""
+    base = str(settings.BASE_DIR)
+    for frame in reversed(traceback.extract_stack()):
+        if (
+            frame.filename.startswith(base)
+            and "site-packages" not in frame.filename
+            and frame.filename != __file__
+        ):
+            path = Path(frame.filename).relative_to(base)
+            return f"{path}:{frame.lineno} in {frame.name}"
+    return "unknown location"
+
+
+class RepeatedQueries:
+    """
+    Execute wrapper counting the queries of each fingerprint.
+
+    The stack is only walked when a fingerprint goes over the threshold, so
+    that the queries of a well-behaved request cost a lookup each.
+    """
+
+    def __init__(self, threshold: int):
+        self.threshold = threshold
+        self.counts: Counter[str] = Counter()
+        self.locations: dict[str, str] = {}
+
+    def __call__(self, execute, sql, params, many, context):
+        shape = fingerprint(sql)
+        self.counts[shape] += 1
+        if self.counts[shape] == self.threshold + 1:
+            self.locations[shape] = caller()
+        return execute(sql, params, many, context)
+
+    def repeated(self) -> list[tuple[str, int, str]]:
+        """Fingerprints over the threshold, their count and location, most first."""
+        return [
+            (shape, count, self.locations[shape])
+            for shape, count in self.counts.most_common()
+            if count > self.threshold
+        ]
+
+
+class RepeatedQueriesMiddleware:
+    """Warn about the statements a request runs over and over, e.g. per row."""
+
+    def __init__(self, get_response):
+        self.threshold = settings.QUERY_REPEAT_THRESHOLD
+        if not self.threshold:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        queries = RepeatedQueries(self.threshold)
+        with connection.execute_wrapper(queries):
+            response = self.get_response(request)
+        for shape, count, location in queries.repeated():
+            logger.warning(
+                "%s %s ran the same query %d times, first over %d at %s: %s",
+                request.method,
+                request.path,
+                count,
+                self.threshold,
+                location,
+                shape,
+            )
+        return response
@@ -1,7 +1,28 @@
 # core/schemas.py
+from datetime import datetime
+from typing import Generic, TypeVar
+
+from django.conf import settings
 from ninja import Field, Schema
 from pydantic import ConfigDict, field_validator
 
+from core.exports import ExportFormat
+
+
+def resolve_live(field: str) -> staticmethod:
+    """
+    Resolver of a nullable foreign key, `None` while its record is soft-deleted.
+
+    A soft-deleted record stays referenced, so it is back after a restore.
+    E.g. `resolve_venue = resolve_live("venue")`.
+    """
+
+    def resolve(obj):
+        related = getattr(obj, field)
+        return related if related and not related.is_soft_deleted else None
+
+    return staticmethod(resolve)
+
 
 class AddressIn(Schema):
     """Schema for creating/updating an address."""
@@ -86,6 +107,111 @@ class AddressPatch(Schema):
     country: str | None = Field(None, max_length=100)
 
 
+class RestoreIn(Schema):
+    """Schema for restoring the records soft-deleted by one DELETE request."""
+
+    deleted_at: datetime = Field(
+        ..., description="Value of the X-Deleted-At header of the DELETE response"
+    )
+
+
+class RestoreOut(Schema):
+    """Schema for the number of restored records, in total and per model."""
+
+    deleted_at: datetime
+    total: int
+    restored: dict[str, int]
+
+
+class ChangeFilter(Schema):
+    """Query parameters for filtering the change history."""
+
+    model: str | None = Field(
+        None, description="Only changes of this model, e.g. `people.Athlete`"
+    )
+    public_id: str | None = Field(None, description="Only changes of this record")
+    since: datetime | None = Field(None, description="Only changes from this time")
+    until: datetime | None = Field(None, description="Only changes before this time")
+    limit: int = Field(100, ge=1, le=1000, description="Maximum number of changes")
+
+
+class ChangeRecordOut(Schema):
+    """Schema for one entry of the change history."""
+
+    changed_at: datetime
+    model: str
+    public_id: str
+    action: str
+    username: str
+    changes: dict[str, list]
+
+
+class SyncFilter(Schema):
+    """Query parameters for syncing a list (see `core.sync`)."""
+
+    updated_since: str | None = Field(
+        None,
+        description="`next_token` of the previous sync; omit it for a full sync",
+    )
+    limit: int = Field(
+        settings.SYNC_PAGE_SIZE,
+        ge=1,
+        le=settings.SYNC_PAGE_SIZE,
+        description="Maximum number of changed records",
+    )
+
+
+T = TypeVar("T")
+
+
+class SyncOut(Schema, Generic[T]):  # noqa: UP046
+    """Schema for the changes of a list since the previous sync."""
+
+    items: list[T] = Field(..., description="Records created or updated")
+    deleted: list[str] = Field(..., description="Public IDs of deleted records")
+    next_token: str = Field(..., description="Token for the next sync")
+    has_more: bool = Field(
+        ..., description="Whether more changes are waiting: sync again right away"
+    )
+
+
+class ExportFilter(Schema):
+    """Query parameters for exporting a resource (see `core.exports`)."""
+
+    format: ExportFormat = Field(
+        ExportFormat.NDJSON, description="`ndjson` (one JSON object per line) or `csv`"
+    )
+
+
+class EventFilter(Schema):
+    """Query parameters for filtering the change event stream."""
+
+    resource: list[str] = Field(
+        [], description="Only events of these resources, e.g. `competitions`"
+    )
+    season: str | None = Field(
+        None, description="Only events of records of the season with this public ID"
+    )
+
+
+class ImportRejectOut(Schema):
+    """Row of an imported CSV file that was not imported."""
+
+    line: int = Field(..., description="Line number in the file")
+    errors: str
+
+
+class ImportOut(Schema):
+    """Outcome of a CSV import."""
+
+    created: int
+    updated: int
+    rejected: int
+    rejects: list[ImportRejectOut] = Field(
+        ..., description="First rejected rows, up to IMPORT_MAX_REJECTS"
+    )
+
+
 class ErrorResponse(Schema):
     """Standard error response."""
 
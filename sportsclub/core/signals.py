@@ -0,0 +1,228 @@
+# core/signals.py
+"""
+Signal handlers recording the change history (see `core.history`), and
+registration of the change events and imports of core models (see
+`core.events` and `core.imports`).
+
+Set-based writes send no `post_save`, so their rows are recorded from the
+signals they send: `pre_cascade_update` for cascading soft deletes and
+restores, `pre_import` and `post_import` for imports, and any signal sent
+with the `pks` of inserted rows connected to `record_bulk_create()`, e.g. the
+`post_clone` of season rollovers.
+"""
+
+from contextvars import ContextVar
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from core import events, history, imports
+from core.deletion import pre_cascade_update
+from core.imports import post_import, pre_import
+from core.models import (
+    Address,
+    ApiKey,
+    Auditory,
+    ChangeAction,
+    ChangeRecord,
+    WebhookEndpoint,
+)
+from core.schemas import AddressIn
+
+events.register(Address, "addresses")
+imports.register(Address, "addresses", AddressIn)
+
+# Timestamps maintained by `Auditory` itself
+IGNORED_FIELDS = {"created_at", "updated_at"}
+# Fields holding secrets, never written to the history, which the API serves
+SECRET_FIELDS = {WebhookEndpoint: {"secret"}}
+
+
+# Values of the records an import is about to update, by primary key
+_import_before: ContextVar[dict[int, dict] | None] = ContextVar(
+    "import_before", default=None
+)
+
+
+def _tracked(model) -> bool:
+    # API keys are left out: their writes are mostly `last_used_at` updates on
+    # every authenticated request, and the keys themselves are secrets.
+    return (
+        history.current_request.get() is not None
+        and issubclass(model, Auditory)
+        and not issubclass(model, ApiKey)
+    )
+
+
+def _fields(model) -> list[str]:
+    secrets = SECRET_FIELDS.get(model, set())
+    return [
+        field.attname
+        for field in model._meta.concrete_fields
+        if not field.primary_key
+        and field.name not in IGNORED_FIELDS
+        and field.attname not in secrets
+    ]
+
+
+def _values(model, instance) -> dict:
+    return {field: getattr(instance, field) for field in _fields(model)}
+
+
+def _record(model, changes: list[tuple[str, ChangeAction, dict]]):
+    """Record the changes, as (public ID, action, changes) tuples, on commit."""
+    if not changes:
+        return
+    user_id, username = history.current_user()
+    changed_at = timezone.now()
+    records = [
+        ChangeRecord(
+            changed_at=changed_at,
+            model=model._meta.label,
+            public_id=public_id,
+            action=action,
+            user_id=user_id,
+            username=username,
+            changes=values,
+        )
+        for public_id, action, values in changes
+    ]
+    # Only writes that were committed make it to the history
+    transaction.on_commit(partial(history.enqueue, *records))
+
+
+@receiver(pre_save)
+def remember_values_before_save(sender, instance, **kwargs):
+    if _tracked(sender) and instance.pk is not None:
+        fields = list(_values(sender, instance))
+        instance._history_before = (
+            sender.all_objects.filter(pk=instance.pk).values(*fields).first()
+        )
+
+
+@receiver(post_save)
+def record_save(sender, instance, created, **kwargs):
+    if not _tracked(sender):
+        return
+
+    after = _values(sender, instance)
+    before = getattr(instance, "_history_before", None) or {}
+    changes = {
+        field: [before.get(field), value]
+        for field, value in after.items()
+        if created or before.get(field) != value
+    }
+    if not changes:
+        return
+
+    if created:
+        action = ChangeAction.CREATE
+    elif "deleted_at" not in changes:
+        action = ChangeAction.UPDATE
+    elif instance.deleted_at is None:
+        action = ChangeAction.RESTORE
+    else:
+        action = ChangeAction.SOFT_DELETE
+    _record(sender, [(instance.public_id, action, changes)])
+
+
+@receiver(post_delete)
+def record_delete(sender, instance, **kwargs):
+    if _tracked(sender):
+        changes = {
+            field: [value, None] for field, value in _values(sender, instance).items()
+        }
+        _record(sender, [(instance.public_id, ChangeAction.DELETE, changes)])
+
+
+# Membership changes made from the side declaring the many-to-many field (e.g.
+# `training.athletes.set(...)`) are recorded as a change of that field, with
+# the public IDs of the members before and after.
+@receiver(m2m_changed)
+def record_membership_change(sender, instance, action, reverse, model, **kwargs):
+    if reverse or not _tracked(type(instance)):
+        return
+
+    field = next(
+        field
+        for field in instance._meta.many_to_many
+        if field.remote_field.through is sender
+    )
+    members = getattr(instance, field.name)
+    if action.startswith("pre_"):
+        instance._history_members = sorted(members.values_list("public_id", flat=True))
+    elif action.startswith("post_"):
+        before = getattr(instance, "_history_members", [])
+        after = sorted(members.values_list("public_id", flat=True))
+        if before != after:
+            changes = {field.name: [before, after]}
+            _record(
+                type(instance), [(instance.public_id, ChangeAction.UPDATE, changes)]
+            )
+
+
+@receiver(pre_cascade_update)
+def record_cascade_update(sender, queryset, deleted_at, **kwargs):
+    if not _tracked(sender):
+        return
+    action = ChangeAction.RESTORE if deleted_at is None else ChangeAction.SOFT_DELETE
+    _record(
+        sender,
+        [
+            (public_id, action, {"deleted_at": [before, deleted_at]})
+            for public_id, before in queryset.values_list("public_id", "deleted_at")
+        ],
+    )
+
+
+@receiver(pre_import)
+def remember_values_before_import(sender, queryset, **kwargs):
+    if _tracked(sender):
+        rows = queryset.values("pk", *_fields(sender))
+        _import_before.set({row.pop("pk"): row for row in rows})
+
+
+@receiver(post_import)
+def record_import(sender, created, updated, **kwargs):
+    before = _import_before.get() or {}
+    _import_before.set(None)
+    if not _tracked(sender):
+        return
+
+    changes = []
+    rows = sender._base_manager.filter(pk__in=created + updated).order_by("pk")
+    for row in rows.values("pk", *_fields(sender)):
+        old = before.get(row.pop("pk"))
+        if old is None:
+            values = {field: [None, value] for field, value in row.items()}
+            changes.append((row["public_id"], ChangeAction.CREATE, values))
+            continue
+        values = {
+            field: [old[field], value]
+            for field, value in row.items()
+            if old[field] != value
+        }
+        if values:
+            changes.append((row["public_id"], ChangeAction.UPDATE, values))
+    _record(sender, changes)
+
+
+def record_bulk_create(sender, pks, **kwargs):
+    """Record the creation of rows inserted without `post_save`, by their `pks`."""
+    if not _tracked(sender):
+        return
+    rows = sender._base_manager.filter(pk__in=pks).order_by("pk")
+    _record(
+        sender,
+        [
+            (
+                row["public_id"],
+                ChangeAction.CREATE,
+                {field: [None, value] for field, value in row.items()},
+            )
+            for row in rows.values(*_fields(sender))
+        ],
+    )
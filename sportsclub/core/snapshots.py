@@ -0,0 +1,237 @@
+# core/snapshots.py
+"""
+Snapshots of the whole club, for staging refreshes and disaster recovery.
+
+`export_snapshot()` writes every table of the club to a ZIP archive: one
+compressed member per table in `COPY` text format, and a `manifest.json`
+listing the tables, their columns and row counts, and the migrations the
+database was at. Tables are read in one REPEATABLE READ transaction, so the
+snapshot is consistent even while the API keeps writing, and each table is
+streamed by `COPY ... TO STDOUT` into its member as the server sends it.
+Memory use does not depend on the size of the database.
+
+`restore_snapshot()` replaces the tables of the club with those of a snapshot,
+in one transaction: the tables are truncated, loaded with `COPY ... FROM
+STDIN` straight from the archive members, and their sequences reset. The
+database must be at the migrations of the snapshot. As with
+`core.bulk_fixtures`, no signal is sent, and caches are flushed.
+
+Snapshots include the users, as API keys refer to them, but not their groups
+and permissions, which refer to content types of the exporting database.
+Webhook endpoints and their outbox are left out, so that a restored staging
+database never delivers events to the receivers of production. The archive
+schema of purged rows (see `core.archival`) is not included either.
+"""
+
+import json
+import zipfile
+from collections.abc import Iterator
+from dataclasses import asdict, dataclass, field
+from typing import IO
+
+from django.apps import apps
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management.color import no_style
+from django.db import connection, models, transaction
+from django.db.migrations.recorder import MigrationRecorder
+from django.utils import timezone
+
+from core import invalidation
+from core.bulk import quote
+from core.models import OutboxMessage, WebhookEndpoint
+
+FORMAT_VERSION = 1
+MANIFEST = "manifest.json"
+APPS = ["core", "people", "inventory", "scheduling"]
+EXCLUDED = {WebhookEndpoint, OutboxMessage}
+
+
+class SnapshotError(Exception):
+    """A snapshot cannot be taken or restored, e.g. it does not fit the schema."""
+
+
+@dataclass
+class SnapshotTable:
+    """A table of a snapshot, as listed in its manifest."""
+
+    label: str
+    table: str
+    # Name of the archive member holding the rows
+    member: str
+    columns: list[str]
+    rows: int = 0
+
+
+@dataclass
+class Manifest:
+    """Contents of a snapshot."""
+
+    created_at: str
+    migrations: dict[str, list[str]]
+    tables: list[SnapshotTable] = field(default_factory=list)
+    version: int = FORMAT_VERSION
+
+    @classmethod
+    def from_json(cls, data: dict) -> "Manifest":
+        if data.get("version") != FORMAT_VERSION:
+            raise SnapshotError(
+                f"Unsupported snapshot version {data.get('version')}, "
+                f"expected {FORMAT_VERSION}"
+            )
+        tables = [SnapshotTable(**table) for table in data["tables"]]
+        return cls(data["created_at"], data["migrations"], tables)
+
+
+def snapshot_models() -> list[type[models.Model]]:
+    """Models whose tables are in snapshots, many-to-many tables included."""
+    snapshot = [get_user_model()]
+    for label in APPS:
+        snapshot += [
+            model
+            for model in apps.get_app_config(label).get_models(
+                include_auto_created=True
+            )
+            if model not in EXCLUDED and not model._meta.proxy
+        ]
+    return snapshot
+
+
+def _migrations() -> dict[str, list[str]]:
+    applied = MigrationRecorder(connection).applied_migrations()
+    labels = {model._meta.app_label for model in snapshot_models()}
+    return {
+        label: sorted(name for app, name in applied if app == label)
+        for label in sorted(labels)
+    }
+
+
+class _RowCounter:
+    """Count the rows written to a stream in `COPY` text format."""
+
+    def __init__(self, stream: IO[bytes]):
+        self.stream = stream
+        self.rows = 0
+
+    def write(self, data: bytes | str) -> int:
+        if isinstance(data, str):
+            data = data.encode()
+        # Newlines within values are escaped, so each one ends a row
+        self.rows += data.count(b"\n")
+        return self.stream.write(data)
+
+
+def export_snapshot(file: IO[bytes]) -> Manifest:
+    """
+    Write a snapshot of the club to a binary file, which needs not be seekable.
+
+    Raises:
+        SnapshotError: If called within a transaction, as the snapshot would
+            not be isolated from it
+
+    Returns:
+        The manifest of the snapshot
+    """
+    if connection.in_atomic_block:
+        raise SnapshotError("Snapshots cannot be taken within a transaction")
+
+    with (
+        transaction.atomic(),
+        zipfile.ZipFile(file, "w", zipfile.ZIP_DEFLATED) as archive,
+    ):
+        with connection.cursor() as cursor:
+            # Must come first in the transaction: every table is then read
+            # as of this point
+            cursor.execute("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ, READ ONLY")
+        manifest = Manifest(
+            created_at=timezone.now().isoformat(), migrations=_migrations()
+        )
+        for model in snapshot_models():
+            table = SnapshotTable(
+                label=model._meta.label_lower,
+                table=model._meta.db_table,
+                member=f"tables/{model._meta.label_lower}.copy",
+                columns=[field.column for field in model._meta.concrete_fields],
+            )
+            columns = ", ".join(quote(column) for column in table.columns)
+            with (
+                archive.open(table.member, "w", force_zip64=True) as member,
+                connection.cursor() as cursor,
+            ):
+                counter = _RowCounter(member)
+                # A query rather than a table name, as partitioned tables
+                # (e.g. the change history) cannot be copied directly
+                cursor.copy_expert(
+                    f"COPY (SELECT {columns} FROM {quote(table.table)}) TO STDOUT",
+                    counter,
+                )
+            table.rows = counter.rows
+            manifest.tables.append(table)
+        archive.writestr(MANIFEST, json.dumps(asdict(manifest), indent=2))
+    return manifest
+
+
+def read_manifest(archive: zipfile.ZipFile) -> Manifest:
+    try:
+        return Manifest.from_json(json.loads(archive.read(MANIFEST)))
+    except (KeyError, ValueError, TypeError) as err:
+        raise SnapshotError(f"Invalid snapshot manifest: {err}") from err
+
+
+def _check_schema(manifest: Manifest) -> Iterator[type[models.Model]]:
+    """Check that the snapshot fits this database, and yield its models."""
+    if manifest.migrations != _migrations():
+        raise SnapshotError(
+            "The snapshot was taken at other migrations than those applied: "
+            "migrate both databases to the same state first"
+        )
+    for table in manifest.tables:
+        try:
+            model = apps.get_model(table.label)
+        except LookupError as err:
+            raise SnapshotError(f"Unknown model {table.label}") from err
+        columns = [field.column for field in model._meta.concrete_fields]
+        if model._meta.db_table != table.table or columns != table.columns:
+            raise SnapshotError(f"The columns of {table.label} do not match")
+        yield model
+
+
+def restore_snapshot(file: IO[bytes]) -> Manifest:
+    """
+    Replace the tables of the club with those of a snapshot.
+
+    Raises:
+        SnapshotError: If the file is not a snapshot, or it does not fit the
+            schema of the database
+
+    Returns:
+        The manifest of the snapshot
+    """
+    try:
+        archive = zipfile.ZipFile(file)
+    except zipfile.BadZipFile as err:
+        raise SnapshotError(f"Not a snapshot: {err}") from err
+
+    with archive, transaction.atomic():
+        manifest = read_manifest(archive)
+        restored = list(_check_schema(manifest))
+        with connection.cursor() as cursor:
+            # Also empties the tables referring to the restored ones, e.g. the
+            # log of the admin
+            cursor.execute(
+                "TRUNCATE "
+                + ", ".join(quote(table.table) for table in manifest.tables)
+                + " CASCADE"
+            )
+            # Foreign keys are checked at commit, so tables load in any order
+            for table in manifest.tables:
+                columns = ", ".join(quote(column) for column in table.columns)
+                with archive.open(table.member) as member:
+                    cursor.copy_expert(
+                        f"COPY {quote(table.table)} ({columns}) FROM STDIN", member
+                    )
+            for sql in connection.ops.sequence_reset_sql(no_style(), restored):
+                cursor.execute(sql)
+        invalidation.publish_flush()
+    cache.clear()
+    return manifest
@@ -0,0 +1,35 @@
+# core/streaming.py
+"""
+Bodies of streaming responses, produced a chunk at a time under WSGI and ASGI.
+
+Under ASGI, Django reads a synchronous iterator whole before sending it, as
+it may access the database, so a body streamed from a cursor would be built
+in memory first. `streaming_body()` has the sync thread produce such bodies
+one chunk at a time instead.
+"""
+
+from collections.abc import AsyncIterator, Iterator
+
+from asgiref.sync import sync_to_async
+from django.core.handlers.asgi import ASGIRequest
+from django.http import HttpRequest
+
+
+async def _in_sync_thread(chunks: Iterator[bytes]) -> AsyncIterator[bytes]:
+    """Produce the chunks in the sync thread, one at a time."""
+    next_chunk = sync_to_async(next, thread_sensitive=True)
+    try:
+        while (chunk := await next_chunk(chunks, None)) is not None:
+            yield chunk
+    finally:
+        # Closes the server-side cursor when the client went away
+        await sync_to_async(chunks.close, thread_sensitive=True)()
+
+
+def streaming_body(
+    request: HttpRequest, chunks: Iterator[bytes]
+) -> Iterator[bytes] | AsyncIterator[bytes]:
+    """Body of a `StreamingHttpResponse` to a request, streamed by its server."""
+    if isinstance(request, ASGIRequest):
+        return _in_sync_thread(chunks)
+    return chunks
@@ -0,0 +1,146 @@
+# core/sync.py
+"""
+Delta sync of the API lists, for clients keeping an offline copy.
+
+A sync token is a signed position `(updated_at, id)` in a model's rows. A sync
+page holds the rows after that position in `(updated_at, id)` order, which
+the `<app>_<model>_sync` indexes serve as a range scan: live rows are sent
+whole, and soft-deleted rows as tombstones (their public ID). Every write,
+soft delete and restore moves `updated_at` forward, so the next page of a
+client always includes what changed since its last sync.
+
+Rows are only synced once `updated_at` is older than a watermark, so that no
+row with an earlier `updated_at` can still be committed later, as the token
+would then have moved past it:
+
+- `updated_at` is set by the application before the write, and a transaction
+  still open may commit rows older than rows committed by later transactions:
+  the watermark never passes the start of the oldest open transaction that
+  has written. Transactions that have only read hold no transaction ID yet,
+  and the rows they may still write get an `updated_at` from that write, after
+  the watermark, so a long report or an idle session does not stall the sync.
+  A long writing transaction still does: a warning is logged when it holds
+  the watermark back more than `SYNC_STALL_WARNING_SECONDS`;
+- the clocks of the application servers and of the database drift: the
+  watermark is kept `SYNC_CLOCK_SKEW_SECONDS` behind the database clock.
+
+Tombstones only last until `core.archival` purges the rows, after
+`SOFT_DELETE_RETENTION_DAYS`: older tokens are refused, and the client has
+to sync from scratch. Permanent deletes (`purge=true`) leave no tombstone.
+"""
+
+import logging
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.core import signing
+from django.db import connection, models
+from django.utils import timezone
+
+SALT = "core.sync"
+
+logger = logging.getLogger(__name__)
+
+
+class InvalidSyncTokenError(Exception):
+    """The sync token was not issued for this list."""
+
+
+class ExpiredSyncTokenError(Exception):
+    """The sync token is older than the tombstones kept."""
+
+
+def watermark() -> datetime:
+    """Return the time before which every committed row is visible."""
+    with connection.cursor() as cursor:
+        if connection.in_atomic_block:
+            # Activity is otherwise read from the snapshot taken on its first
+            # access in the transaction
+            cursor.execute("SELECT pg_stat_clear_snapshot()")
+        cursor.execute(
+            """
+            SELECT clock_timestamp(), MIN(xact_start)
+            FROM pg_stat_activity
+            WHERE datname = current_database()
+              AND backend_type = 'client backend'
+              AND backend_xid IS NOT NULL
+              AND pid <> pg_backend_pid()
+            """
+        )
+        now, oldest = cursor.fetchone()
+    if oldest is not None and oldest < now:
+        stall = (now - oldest).total_seconds()
+        if stall > settings.SYNC_STALL_WARNING_SECONDS:
+            logger.warning(
+                "A transaction open for %.0f s is holding back the delta sync", stall
+            )
+        now = oldest
+    return now - timedelta(seconds=settings.SYNC_CLOCK_SKEW_SECONDS)
+
+
+def make_token(model: type[models.Model], updated_at: datetime, pk: int) -> str:
+    """Return the sync token of a position in the rows of a model."""
+    return signing.dumps(
+        [model._meta.label, updated_at.isoformat(), pk], salt=SALT, compress=True
+    )
+
+
+def read_token(model: type[models.Model], token: str) -> tuple[datetime, int]:
+    """
+    Return the position `(updated_at, id)` of a sync token.
+
+    Raises:
+        InvalidSyncTokenError: The token was forged, or issued for another model
+        ExpiredSyncTokenError: Tombstones may have been purged since the token
+    """
+    try:
+        label, updated_at, pk = signing.loads(token, salt=SALT)
+        updated_at = datetime.fromisoformat(updated_at)
+    except (signing.BadSignature, TypeError, ValueError) as err:
+        raise InvalidSyncTokenError from err
+    if label != model._meta.label:
+        raise InvalidSyncTokenError
+
+    retention = timedelta(days=settings.SOFT_DELETE_RETENTION_DAYS)
+    if updated_at < timezone.now() - retention:
+        raise ExpiredSyncTokenError
+    return updated_at, pk
+
+
+def sync_page(queryset: models.QuerySet, token: str | None, limit: int) -> dict:
+    """
+    Return the rows changed since a sync token, or all rows without a token.
+
+    Args:
+        queryset: Rows to sync, soft-deleted ones included (`all_objects`)
+        token: Token returned by the previous page, if any
+        limit: Maximum number of rows, live or deleted, in the page
+
+    Returns:
+        The live rows as `items`, the public IDs of the soft-deleted rows as
+        `deleted`, the token of the next page as `next_token`, and whether
+        more rows are already waiting as `has_more`
+    """
+    model = queryset.model
+    upper = watermark()
+    rows = queryset.filter(updated_at__lt=upper).order_by("updated_at", "pk")
+    if token:
+        updated_at, pk = read_token(model, token)
+        rows = rows.filter(updated_at__gte=updated_at).exclude(
+            updated_at=updated_at, pk__lte=pk
+        )
+
+    page = list(rows[: limit + 1])
+    has_more = len(page) > limit
+    page = page[:limit]
+    if has_more:
+        next_token = make_token(model, page[-1].updated_at, page[-1].pk)
+    else:
+        # Every row before the watermark was sent: resume from there
+        next_token = make_token(model, upper, 0)
+    return {
+        "items": [row for row in page if row.deleted_at is None],
+        "deleted": [row.public_id for row in page if row.deleted_at is not None],
+        "next_token": next_token,
+        "has_more": has_more,
+    }
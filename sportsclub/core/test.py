@@ -0,0 +1,82 @@
+# core/test.py
+"""Test runner and helpers for the project."""
+
+from collections import Counter
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.core.signals import request_finished, request_started
+from django.db import connection
+from django.test.runner import DiscoverRunner
+
+from core.queries import fingerprint
+
+
+class TestRunner(DiscoverRunner):
+    """
+    Test runner writing the change history synchronously.
+
+    A background writer would insert records through its own connection,
+    outside the transaction each test runs in, so they would leak between
+    tests. Django swaps the email backend in tests for the same reason.
+    """
+
+    def setup_test_environment(self, **kwargs):
+        super().setup_test_environment(**kwargs)
+        settings.CHANGE_HISTORY_ASYNC = False
+
+
+@contextmanager
+def query_budget(max_queries: int):
+    """
+    Fail when a request made in the block runs more than `max_queries` queries.
+
+    Unlike `assertNumQueries()`, the budget is per request, so the queries of
+    the set-up and of other requests do not count, and it is an upper bound:
+    set up more rows than the budget, and a query per row goes over it whatever
+    the rows. Works as a decorator of test methods too. Only the requests of
+    the synchronous test client are counted.
+
+    Raises:
+        AssertionError: If a request went over the budget, listing its most
+            repeated queries, or if no request was made
+    """
+    requests: list[tuple[str, list[str]]] = []
+    # Queries of the request being handled, if any
+    current: list[str] | None = None
+
+    def started(sender, environ=None, **kwargs):
+        nonlocal current
+        current = []
+        requests.append(
+            (f"{environ['REQUEST_METHOD']} {environ['PATH_INFO']}", current)
+        )
+
+    def finished(sender, **kwargs):
+        nonlocal current
+        current = None
+
+    def count(execute, sql, params, many, context):
+        if current is not None:
+            current.append(sql)
+        return execute(sql, params, many, context)
+
+    request_started.connect(started)
+    request_finished.connect(finished)
+    try:
+        with connection.execute_wrapper(count):
+            yield
+    finally:
+        request_started.disconnect(started)
+        request_finished.disconnect(finished)
+
+    if not requests:
+        raise AssertionError("No request was made within the query budget")
+    for name, queries in requests:
+        if len(queries) > max_queries:
+            repeated = Counter(fingerprint(sql) for sql in queries).most_common(3)
+            raise AssertionError(
+                f"{name} ran {len(queries)} queries, over its budget of "
+                f"{max_queries}. Most repeated:\n"
+                + "\n".join(f"{times} x {shape}" for shape, times in repeated)
+            )
@@ -0,0 +1,131 @@
+# core/tests/test_archival.py
+"""Tests for the archival and purge of old soft-deleted rows."""
+
+from datetime import UTC, date, datetime, timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.utils import timezone
+from inventory.models import Venue
+from people.models import Athlete
+from scheduling.models import Competition, Ranking, Result, Season, Training
+
+from core.archival import archive_table, ensure_archive_table, processing_order
+from core.deletion import soft_delete_cascade
+
+
+class ArchiveSoftDeletedTest(TestCase):
+    """Test suite for the archive_soft_deleted command."""
+
+    def setUp(self):
+        """Set up a season soft-deleted long ago, with its dependants."""
+        self.athlete = Athlete.objects.create(
+            first_name="Usain", last_name="Bolt", email="usain.bolt@example.com"
+        )
+        self.season = Season.objects.create(
+            name="2020-2021 Season",
+            start_date=date(2020, 9, 1),
+            end_date=date(2021, 6, 30),
+        )
+        competition = Competition.objects.create(
+            name="Spring Championship",
+            date=datetime(2021, 4, 15, 10, 0, tzinfo=UTC),
+            season=self.season,
+        )
+        competition.athletes.add(self.athlete)
+        Result.objects.create(
+            competition=competition,
+            athlete=self.athlete,
+            discipline="sprints",
+            mark="9.58",
+        )
+        Ranking.refresh_season(self.season.pk)
+        soft_delete_cascade(self.season)
+        self._age(Season, Competition, Result)
+
+    def _age(self, *models, days=100):
+        for model in models:
+            model.all_objects.exclude(deleted_at=None).update(
+                deleted_at=timezone.now() - timedelta(days=days)
+            )
+
+    def _archived(self, model) -> int:
+        with connection.cursor() as cursor:
+            cursor.execute(f"SELECT COUNT(*) FROM {archive_table(model)}")
+            return cursor.fetchone()[0]
+
+    def _run(self, *args):
+        out = StringIO()
+        call_command(
+            "archive_soft_deleted", "--sleep=0", "--batch-size=1", *args, stdout=out
+        )
+        return out.getvalue()
+
+    def test_processing_order(self):
+        """Test that dependants are processed before the rows they reference."""
+        order = processing_order()
+        self.assertLess(order.index(Result), order.index(Competition))
+        self.assertLess(order.index(Competition), order.index(Season))
+        self.assertLess(order.index(Result), order.index(Athlete))
+
+    def test_archive(self):
+        """Test that old soft-deleted rows are moved to the archive tables."""
+        output = self._run("--days=90")
+
+        self.assertIn("3 rows archived", output)
+        for model in (Season, Competition, Result):
+            self.assertFalse(model.all_objects.exists())
+            self.assertEqual(self._archived(model), 1)
+        self.assertEqual(self._archived(Competition.athletes.through), 1)
+        self.assertFalse(Ranking.objects.exists())
+        self.assertTrue(Athlete.objects.filter(pk=self.athlete.pk).exists())
+
+    def test_recent_and_live_rows_are_kept(self):
+        """Test that rows deleted recently, or still referenced, stay."""
+        Result.all_objects.update(deleted_at=timezone.now())
+        self._run("--days=90")
+
+        # The result is not due yet, so its competition and season stay too
+        self.assertEqual(Result.all_objects.count(), 1)
+        self.assertEqual(Competition.all_objects.count(), 1)
+        self.assertEqual(Season.all_objects.count(), 1)
+
+    def test_purge(self):
+        """Test that --purge deletes rows and clears SET_NULL references."""
+        venue = Venue.objects.create(name="Palau Blaugrana")
+        training = Training.objects.create(
+            name="Session",
+            date=timezone.now(),
+            season=Season.objects.create(
+                name="2025-2026 Season",
+                start_date=date(2025, 9, 1),
+                end_date=date(2026, 6, 30),
+            ),
+            venue=venue,
+        )
+        venue.soft_delete()
+        self._age(Venue)
+
+        output = self._run("--days=90", "--purge")
+
+        self.assertIn("4 rows purged", output)
+        self.assertFalse(Venue.all_objects.exists())
+        self.assertFalse(Result.all_objects.exists())
+        training.refresh_from_db()
+        self.assertIsNone(training.venue_id)
+
+    def test_dry_run(self):
+        """Test that --dry-run only reports counts."""
+        output = self._run("--days=90", "--dry-run")
+        self.assertIn("scheduling.Result: 1 to be archived", output)
+        self.assertEqual(Result.all_objects.count(), 1)
+
+    def test_archive_table_follows_new_columns(self):
+        """Test that columns missing from an archive table are added back."""
+        ensure_archive_table(Season)
+        with connection.cursor() as cursor:
+            cursor.execute(f"ALTER TABLE {archive_table(Season)} DROP COLUMN name")
+        self._run("--days=90")
+        self.assertEqual(self._archived(Season), 1)
@@ -0,0 +1,51 @@
+# core/tests/test_auth.py
+"""Tests for the API key authentication."""
+
+import os
+from datetime import timedelta
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from core.models import ApiKey
+
+
+@override_settings(DEBUG=False)
+@mock.patch.dict(os.environ, {"DEBUG": "False"})
+class ApiKeyHeaderAuthTest(TestCase):
+    """Test suite for authenticating with the X-API-Key header."""
+
+    def setUp(self):
+        """Set up a user with an API key."""
+        self.user = User.objects.create(username="mills")
+        self.api_key = ApiKey.objects.create(user=self.user, name="Scripts")
+
+    def test_valid_key(self):
+        """Test that a request with a live key is authenticated."""
+        response = self.client.get(
+            "/api/v1/core/addresses", headers={"X-API-Key": self.api_key.key}
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.api_key.refresh_from_db()
+        self.assertIsNotNone(self.api_key.last_used_at)
+
+    def test_missing_or_unknown_key(self):
+        """Test that requests without a live key are refused."""
+        self.assertEqual(self.client.get("/api/v1/core/addresses").status_code, 401)
+        response = self.client.get(
+            "/api/v1/core/addresses", headers={"X-API-Key": "unknown"}
+        )
+        self.assertEqual(response.status_code, 401)
+
+    def test_expired_key(self):
+        """Test that expired keys are refused."""
+        self.api_key.expires_at = timezone.now() - timedelta(days=1)
+        self.api_key.save()
+
+        response = self.client.get(
+            "/api/v1/core/addresses", headers={"X-API-Key": self.api_key.key}
+        )
+        self.assertEqual(response.status_code, 401)
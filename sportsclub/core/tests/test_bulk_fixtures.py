@@ -0,0 +1,126 @@
+# core/tests/test_bulk_fixtures.py
+"""Tests for the bulk fixture loader."""
+
+import io
+import json
+import tempfile
+from datetime import UTC, datetime
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management import call_command
+from django.test import TestCase
+from inventory.models import Venue
+from people.models import Athlete, Coach
+from scheduling.models import Competition, Season, Training
+
+from core.bulk_fixtures import dependency_order, load_fixtures
+from core.models import Address
+
+FIXTURES = [
+    settings.BASE_DIR / path
+    for path in (
+        # In the wrong order on purpose
+        "scheduling/fixtures/trainings.json",
+        "scheduling/fixtures/competitions.json",
+        "scheduling/fixtures/seasons.json",
+        "people/fixtures/athletes.json",
+        "people/fixtures/coaches.json",
+        "inventory/fixtures/venues.json",
+        "core/fixtures/addresses.json",
+    )
+]
+
+
+class BulkFixtureTest(TestCase):
+    """Test suite for loading the project fixtures with bulk inserts."""
+
+    def test_dependency_order(self):
+        """Test that the targets of relations are loaded first."""
+        order = dependency_order([Training, Athlete, Season, Venue, Address])
+        self.assertLess(order.index(Address), order.index(Venue))
+        self.assertLess(order.index(Address), order.index(Athlete))
+        self.assertLess(order.index(Venue), order.index(Training))
+        self.assertLess(order.index(Season), order.index(Training))
+
+    def test_load(self):
+        """Test that objects, memberships and timestamps are loaded as is."""
+        counts = load_fixtures(FIXTURES)
+
+        self.assertEqual(counts["core.address"], Address.objects.count())
+        self.assertEqual(counts["scheduling.training"], Training.objects.count())
+        competition = Competition.objects.get(pk=1)
+        self.assertEqual(
+            sorted(competition.athletes.values_list("pk", flat=True)),
+            [1, 2, 3, 4, 5, 6, 7, 8],
+        )
+        self.assertEqual(
+            sorted(competition.coaches.values_list("pk", flat=True)), [1, 2]
+        )
+        self.assertEqual(competition.updated_at, datetime(2025, 1, 1, tzinfo=UTC))
+        self.assertEqual(Coach.objects.get(pk=1).address_id, 10)
+
+    def test_sequences_are_reset(self):
+        """Test that rows created after loading get new primary keys."""
+        load_fixtures(FIXTURES)
+        address = Address.objects.create(line1="Carrer Major, 1")
+        self.assertEqual(address.pk, Address.objects.count())
+        self.assertGreater(address.updated_at, datetime(2025, 1, 2, tzinfo=UTC))
+
+    def test_reload_updates(self):
+        """Test that loading again updates the rows and replaces memberships."""
+        load_fixtures(FIXTURES)
+        competition = Competition.objects.get(pk=1)
+        competition.name = "Renamed"
+        competition.save()
+        competition.athletes.set([9, 10])
+
+        load_fixtures(FIXTURES)
+
+        competition.refresh_from_db()
+        self.assertEqual(competition.name, "Campionat de Balears Absolut")
+        self.assertEqual(competition.athletes.count(), 8)
+        self.assertEqual(Competition.objects.count(), 5)
+
+    def test_duplicates_keep_the_last(self):
+        """Test that objects listed twice, in a file or in two, load as last listed."""
+        competition = json.loads(FIXTURES[1].read_text())[0]
+        competition["fields"].update(name="Renamed", athletes=[9, 10])
+        address = json.loads(FIXTURES[-1].read_text())[0]
+        moved = {**address, "fields": {**address["fields"], "city": "Inca"}}
+        with tempfile.TemporaryDirectory() as directory:
+            overrides = Path(directory) / "overrides.jsonl"
+            overrides.write_text(
+                "\n".join(json.dumps(obj) for obj in (address, moved, competition))
+            )
+            load_fixtures([*FIXTURES, overrides])
+
+        self.assertEqual(Address.objects.get(pk=address["pk"]).city, "Inca")
+        competition = Competition.objects.get(pk=competition["pk"])
+        self.assertEqual(competition.name, "Renamed")
+        self.assertEqual(
+            sorted(competition.athletes.values_list("pk", flat=True)), [9, 10]
+        )
+
+    def test_small_batches(self):
+        """Test that batches referring to rows of later batches load all the same."""
+        load_fixtures(FIXTURES, batch_size=2)
+        self.assertEqual(Competition.objects.get(pk=1).athletes.count(), 8)
+        self.assertEqual(Coach.objects.get(pk=1).address_id, 10)
+
+    def test_benchmark(self):
+        """Test that the benchmark times both loaders and leaves nothing behind."""
+        out = io.StringIO()
+        call_command("benchmark_fixtures", "--rows=40", "--batch-size=7", stdout=out)
+        self.assertIn("load_fixtures: ", out.getvalue())
+        self.assertIn("loaddata: ", out.getvalue())
+        self.assertIn("of the time of loaddata", out.getvalue())
+        self.assertFalse(Address.objects.exists())
+
+    def test_command(self):
+        """Test that the command reports the objects loaded per model."""
+        out = io.StringIO()
+        call_command("load_fixtures", *[str(path) for path in FIXTURES], stdout=out)
+        self.assertIn("people.athlete: 10", out.getvalue())
+        total = sum(len(json.loads(Path(path).read_text())) for path in FIXTURES)
+        self.assertIn(f"Installed {total} object(s)", out.getvalue())
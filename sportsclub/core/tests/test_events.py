@@ -0,0 +1,152 @@
+# core/tests/test_events.py
+"""Tests for the change event stream."""
+
+import asyncio
+import json
+import time
+from datetime import UTC, date, datetime
+
+from django.test import TestCase, TransactionTestCase
+from scheduling.models import Competition, Season
+
+from core import events
+from core.deletion import soft_delete_cascade
+
+
+def _event(event_id, resource="competitions", season="s1"):
+    return {"id": event_id, "resource": resource, "season": season}
+
+
+class ListenerReplayTest(TestCase):
+    """Test suite for resuming streams from the replay buffer."""
+
+    def setUp(self):
+        """Set up a listener with a few buffered events."""
+        self.loop = asyncio.new_event_loop()
+        self.listener = events.Listener()
+        for event_id in (1, 2, 3):
+            self.listener.dispatch(_event(event_id))
+
+    def tearDown(self):
+        self.loop.close()
+
+    def test_resume_after_last_event(self):
+        """Test that the events after the Last-Event-ID are replayed."""
+        _, replay = self.listener.subscribe(self.loop, "2")
+        self.assertEqual(replay, [_event(3)])
+
+    def test_reset_when_event_is_gone(self):
+        """Test that an event no longer buffered asks the client to reload."""
+        _, replay = self.listener.subscribe(self.loop, "0")
+        self.assertEqual(replay, [events.RESET])
+
+    def test_new_stream(self):
+        """Test that a stream without Last-Event-ID replays nothing."""
+        _, replay = self.listener.subscribe(self.loop, None)
+        self.assertEqual(replay, [])
+
+    def test_slow_subscriber_overflows(self):
+        """Test that a full queue ends the stream instead of growing."""
+        subscriber, _ = self.listener.subscribe(self.loop, None)
+        subscriber.queue = asyncio.Queue(1)
+        self.listener.dispatch(_event(4))
+        self.listener.dispatch(_event(5))
+        self.loop.run_until_complete(asyncio.sleep(0))
+        self.assertTrue(subscriber.overflowed)
+
+    def test_unknown_resource(self):
+        """Test that filtering on an unknown resource is refused."""
+        response = self.client.get("/api/v1/core/events", {"resource": "medals"})
+        self.assertEqual(response.status_code, 400)
+
+
+class ChangeEventStreamTest(TransactionTestCase):
+    """Test suite for events going through Postgres LISTEN/NOTIFY."""
+
+    def setUp(self):
+        """Start the listener of this process."""
+        self.loop = asyncio.new_event_loop()
+        events.listener.start()
+        self.assertTrue(events.listener.listening.wait(5))
+        self.season = Season.objects.create(
+            name="2024-2025 Season",
+            start_date=date(2024, 9, 1),
+            end_date=date(2025, 6, 30),
+        )
+        # Notifications arrive asynchronously: wait for the one of the season,
+        # so that it is not received by the subscribers of the tests
+        deadline = time.monotonic() + 5
+        while not any(
+            event.get("public_id") == self.season.public_id
+            for event in list(events.listener.buffer)
+        ):
+            self.assertLess(time.monotonic(), deadline)
+            time.sleep(0.01)
+
+    def tearDown(self):
+        events.listener.stop()
+        events.listener.subscribers.clear()
+        self.loop.close()
+
+    def _receive(self, subscriber, count):
+        async def receive():
+            return [
+                await asyncio.wait_for(subscriber.queue.get(), 5) for _ in range(count)
+            ]
+
+        return self.loop.run_until_complete(receive())
+
+    def test_events_of_writes(self):
+        """Test that saves and cascading soft deletes are published."""
+        subscriber, _ = events.listener.subscribe(self.loop, None)
+        competition = Competition.objects.create(
+            name="Spring Championship",
+            date=datetime(2025, 4, 15, 10, 0, tzinfo=UTC),
+            season=self.season,
+        )
+        soft_delete_cascade(self.season)
+
+        created, cascaded, deleted = self._receive(subscriber, 3)
+        self.assertEqual(created["resource"], "competitions")
+        self.assertEqual(created["public_id"], competition.public_id)
+        self.assertEqual(created["operation"], "create")
+        self.assertEqual(created["season"], self.season.public_id)
+        self.assertEqual(
+            (cascaded["resource"], cascaded["operation"]), ("competitions", "delete")
+        )
+        self.assertEqual(
+            (deleted["resource"], deleted["operation"]), ("seasons", "delete")
+        )
+        self.assertLess(created["id"], cascaded["id"])
+
+    def test_stream_filters_and_resumes(self):
+        """Test the SSE framing, the filters and the Last-Event-ID replay."""
+        subscriber, _ = events.listener.subscribe(self.loop, None)
+        other = Season.objects.create(
+            name="2025-2026 Season",
+            start_date=date(2025, 9, 1),
+            end_date=date(2026, 6, 30),
+        )
+        for season in (other, self.season):
+            Competition.objects.create(
+                name="Spring Championship",
+                date=datetime(2025, 4, 15, 10, 0, tzinfo=UTC),
+                season=season,
+            )
+        first = self._receive(subscriber, 3)[0]
+
+        async def replay():
+            stream = events.stream(
+                {"competitions"}, self.season.public_id, str(first["id"])
+            )
+            try:
+                return await anext(stream)
+            finally:
+                await stream.aclose()
+
+        message = self.loop.run_until_complete(replay())
+        lines = message.splitlines()
+        self.assertEqual(lines[1], "event: change")
+        data = json.loads(lines[2].removeprefix("data: "))
+        self.assertEqual(lines[0], f"id: {data['id']}")
+        self.assertEqual(data["season"], self.season.public_id)
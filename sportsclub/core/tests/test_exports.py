@@ -0,0 +1,143 @@
+# core/tests/test_exports.py
+"""Tests for the streaming exports of the API resources."""
+
+import csv
+import gzip
+import io
+import json
+from datetime import UTC, date, datetime
+
+from django.test import TestCase, override_settings
+from people.models import Athlete, Coach
+from scheduling.models import Competition, Season, Training
+
+from core.models import Address
+
+
+def _body(response) -> bytes:
+    return b"".join(response.streaming_content)
+
+
+class ExportAPITest(TestCase):
+    """Test suite for the /export endpoints."""
+
+    def setUp(self):
+        """Set up a training and a competition with their participants."""
+        self.address = Address.objects.create(line1="Av. de Jaume III, 15")
+        self.bolt = Athlete.objects.create(
+            first_name="Usain",
+            last_name="Bolt",
+            email="usain.bolt@example.com",
+            date_of_birth=date(1986, 8, 21),
+            address=self.address,
+        )
+        self.blake = Athlete.objects.create(
+            first_name="Yohan", last_name="Blake", email="yohan.blake@example.com"
+        )
+        self.mills = Coach.objects.create(
+            first_name="Glen", last_name="Mills", email="glen.mills@example.com"
+        )
+        season = Season.objects.create(
+            name="Temporada 2025",
+            start_date=date(2025, 1, 1),
+            end_date=date(2025, 12, 31),
+        )
+        self.training = Training.objects.create(
+            name="Series en pista",
+            date=datetime(2025, 3, 1, 9, tzinfo=UTC),
+            season=season,
+            focus="Ritme, de competicio",
+        )
+        self.training.athletes.set([self.bolt, self.blake])
+        self.training.coaches.set([self.mills])
+        Competition.objects.create(
+            name="Campionat de Balears",
+            date=datetime(2025, 6, 1, 10, tzinfo=UTC),
+            season=season,
+            score={"results": {"sprints": {"gold": 1}}},
+        )
+
+    def test_ndjson(self):
+        """Test that rows are streamed as JSON lines, with their participants."""
+        response = self.client.get("/api/v1/scheduling/trainings/export")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        self.assertIn('filename="trainings.ndjson"', response["Content-Disposition"])
+        (row,) = [json.loads(line) for line in _body(response).splitlines()]
+        self.assertEqual(row["public_id"], self.training.public_id)
+        self.assertEqual(
+            row["athlete_public_ids"],
+            sorted([self.bolt.public_id, self.blake.public_id]),
+        )
+        self.assertEqual(row["coach_public_ids"], [self.mills.public_id])
+        self.assertIsNone(row["venue_public_id"])
+        self.assertEqual(row["date"], "2025-03-01T09:00:00Z")
+
+    def test_csv(self):
+        """Test that lists are joined and scores kept as JSON in CSV exports."""
+        response = self.client.get(
+            "/api/v1/scheduling/competitions/export", {"format": "csv"}
+        )
+
+        self.assertEqual(response["Content-Type"], "text/csv; charset=utf-8")
+        (row,) = csv.DictReader(io.StringIO(_body(response).decode()))
+        self.assertEqual(
+            json.loads(row["score"]), {"results": {"sprints": {"gold": 1}}}
+        )
+        self.assertEqual(row["athlete_public_ids"], "")
+
+        response = self.client.get(
+            "/api/v1/scheduling/trainings/export", {"format": "csv"}
+        )
+        (row,) = csv.DictReader(io.StringIO(_body(response).decode()))
+        self.assertEqual(row["focus"], "Ritme, de competicio")
+        self.assertEqual(len(row["athlete_public_ids"].split(";")), 2)
+
+    def test_empty_csv_has_header(self):
+        """Test that exports without rows still name their columns."""
+        Address.objects.all().delete()
+        response = self.client.get("/api/v1/core/addresses/export", {"format": "csv"})
+        (header,) = _body(response).decode().splitlines()
+        self.assertTrue(header.startswith("public_id,line1,"))
+
+    def test_gzip(self):
+        """Test that the export is compressed when the client accepts gzip."""
+        response = self.client.get(
+            "/api/v1/people/athletes/export", headers={"accept-encoding": "gzip"}
+        )
+
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertIn("Accept-Encoding", response["Vary"])
+        rows = [
+            json.loads(line) for line in gzip.decompress(_body(response)).splitlines()
+        ]
+        self.assertEqual(rows[0]["address_public_id"], self.address.public_id)
+        self.assertEqual(rows[0]["date_of_birth"], "1986-08-21")
+
+    def test_soft_deleted_rows_are_left_out(self):
+        """Test that only live rows and participants are exported."""
+        self.blake.soft_delete()
+        response = self.client.get("/api/v1/people/athletes/export")
+        self.assertEqual(len(_body(response).splitlines()), 1)
+
+        response = self.client.get("/api/v1/scheduling/trainings/export")
+        row = json.loads(_body(response))
+        self.assertEqual(row["athlete_public_ids"], [self.bolt.public_id])
+
+    @override_settings(EXPORT_CHUNK_SIZE=1)
+    def test_chunks(self):
+        """Test that rows are written a chunk at a time, in a stable order."""
+        response = self.client.get("/api/v1/people/athletes/export")
+        chunks = list(response.streaming_content)
+        self.assertEqual(len(chunks), 2)
+        self.assertEqual(json.loads(chunks[0])["public_id"], self.bolt.public_id)
+
+    async def test_asgi_streams(self):
+        """Test that ASGI responses produce the chunks one at a time."""
+        response = await self.async_client.get("/api/v1/people/athletes/export")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.is_async)
+        body = b"".join([chunk async for chunk in response])
+        self.assertEqual(len(body.splitlines()), 2)
@@ -0,0 +1,326 @@
+# core/tests/test_history.py
+"""Tests for the change history."""
+
+import json
+from datetime import UTC, date, datetime
+
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test import RequestFactory, TestCase, override_settings
+from people.anonymisation import anonymise
+from people.models import Athlete
+from scheduling.models import Season, Training
+
+from core import history, nanoids
+from core.models import Address, ChangeAction, ChangeRecord, WebhookEndpoint
+
+
+class ChangeHistoryAPITest(TestCase):
+    """Test suite for the changes recorded from API requests."""
+
+    def _changes(self, public_id):
+        return list(ChangeRecord.objects.filter(public_id=public_id).order_by("id"))
+
+    def test_create_update_delete(self):
+        """Test that each write records the changed fields and the user."""
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                "/api/v1/core/addresses",
+                {"line1": "Carrer Major 1", "city": "Palma"},
+                content_type="application/json",
+            )
+        public_id = response.json()["public_id"]
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.patch(
+                f"/api/v1/core/addresses/{public_id}",
+                {"city": "Soller"},
+                content_type="application/json",
+            )
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.delete(f"/api/v1/core/addresses/{public_id}")
+
+        created, updated, deleted = self._changes(public_id)
+        self.assertEqual(created.action, ChangeAction.CREATE)
+        self.assertEqual(created.model, "core.Address")
+        self.assertEqual(created.changes["city"], [None, "Palma"])
+        self.assertEqual(created.username, "test")
+        self.assertEqual(updated.action, ChangeAction.UPDATE)
+        self.assertEqual(updated.changes, {"city": ["Palma", "Soller"]})
+        self.assertEqual(deleted.action, ChangeAction.SOFT_DELETE)
+        self.assertEqual(list(deleted.changes), ["deleted_at"])
+
+    def test_membership_change(self):
+        """Test that many-to-many changes record the members before and after."""
+        athlete = Athlete.objects.create(
+            first_name="Usain", last_name="Bolt", email="usain.bolt@example.com"
+        )
+        training = Training.objects.create(
+            name="Session",
+            date=datetime(2025, 1, 15, 18, 0, tzinfo=UTC),
+            season=Season.objects.create(
+                name="2024-2025 Season",
+                start_date=date(2024, 9, 1),
+                end_date=date(2025, 6, 30),
+            ),
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.patch(
+                f"/api/v1/scheduling/trainings/{training.public_id}",
+                {"athlete_public_ids": [athlete.public_id]},
+                content_type="application/json",
+            )
+
+        (change,) = self._changes(training.public_id)
+        self.assertEqual(change.changes, {"athletes": [[], [athlete.public_id]]})
+
+    def test_writes_outside_requests_are_not_recorded(self):
+        """Test that scripts and commands leave no history."""
+        with self.captureOnCommitCallbacks(execute=True):
+            Address.objects.create(line1="Carrer Major 1")
+        self.assertFalse(ChangeRecord.objects.exists())
+
+    def test_list_changes(self):
+        """Test filtering the history of a record."""
+        with self.captureOnCommitCallbacks(execute=True):
+            for line1 in ("Carrer Major 1", "Passeig Maritim"):
+                self.client.post(
+                    "/api/v1/core/addresses",
+                    {"line1": line1},
+                    content_type="application/json",
+                )
+        public_id = ChangeRecord.objects.earliest("id").public_id
+
+        response = self.client.get(
+            "/api/v1/core/changes", {"model": "core.Address", "public_id": public_id}
+        )
+        self.assertEqual(response.status_code, 200)
+        (change,) = response.json()
+        self.assertEqual(change["changes"]["line1"], [None, "Carrer Major 1"])
+
+
+class BulkWriteHistoryTest(TestCase):
+    """Test suite for the changes recorded from set-based writes of requests."""
+
+    def setUp(self):
+        """Set up a season with a training."""
+        self.season = Season.objects.create(
+            name="2024-2025 Season",
+            start_date=date(2024, 9, 2),
+            end_date=date(2025, 6, 30),
+        )
+        self.training = Training.objects.create(
+            name="Session",
+            date=datetime(2024, 9, 10, 18, 0, tzinfo=UTC),
+            season=self.season,
+        )
+
+    def _actions(self, public_id):
+        return list(
+            ChangeRecord.objects.filter(public_id=public_id)
+            .order_by("id")
+            .values_list("action", flat=True)
+        )
+
+    def test_cascade_and_restore(self):
+        """Test that cascaded soft deletes and their restore are recorded per row."""
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.delete(
+                f"/api/v1/scheduling/seasons/{self.season.public_id}"
+            )
+        deleted_at = response["X-Deleted-At"]
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(
+                "/api/v1/core/restore",
+                data=json.dumps({"deleted_at": deleted_at}),
+                content_type="application/json",
+            )
+
+        for public_id in (self.season.public_id, self.training.public_id):
+            self.assertEqual(
+                self._actions(public_id),
+                [ChangeAction.SOFT_DELETE, ChangeAction.RESTORE],
+            )
+        change = ChangeRecord.objects.filter(
+            public_id=self.training.public_id, action=ChangeAction.SOFT_DELETE
+        ).get()
+        self.assertEqual(change.changes["deleted_at"][0], None)
+        self.assertEqual(change.changes["deleted_at"][1][:19], deleted_at[:19])
+
+    def test_import(self):
+        """Test that imported rows are recorded as created or updated."""
+        address = Address.objects.create(line1="Carrer Major 1", city="Palma")
+        upload = SimpleUploadedFile(
+            "addresses.csv",
+            f"public_id,line1,city\n{address.public_id},Carrer Major 1,Inca\n"
+            ",Passeig Maritim,Palma\n".encode(),
+            content_type="text/csv",
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post("/api/v1/core/imports/addresses", {"file": upload})
+
+        updated = ChangeRecord.objects.get(public_id=address.public_id)
+        self.assertEqual(updated.action, ChangeAction.UPDATE)
+        self.assertEqual(updated.changes, {"city": ["Palma", "Inca"]})
+        created = ChangeRecord.objects.exclude(public_id=address.public_id).get()
+        self.assertEqual(created.action, ChangeAction.CREATE)
+        self.assertEqual(created.changes["line1"], [None, "Passeig Maritim"])
+
+    def test_clone(self):
+        """Test that the activities copied by a rollover are recorded as created."""
+        target = Season.objects.create(
+            name="2025-2026 Season",
+            start_date=date(2025, 9, 1),
+            end_date=date(2026, 6, 30),
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(
+                f"/api/v1/scheduling/seasons/{self.season.public_id}/clone",
+                data=json.dumps({"target_season_public_id": target.public_id}),
+                content_type="application/json",
+            )
+
+        clone = Training.objects.get(season=target)
+        (change,) = ChangeRecord.objects.filter(public_id=clone.public_id)
+        self.assertEqual(change.action, ChangeAction.CREATE)
+        self.assertEqual(change.changes["season_id"], [None, target.pk])
+
+    def test_anonymisation_redacts_history(self):
+        """Test that the personal fields of anonymised people leave the history."""
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                "/api/v1/people/athletes",
+                {
+                    "first_name": "Usain",
+                    "last_name": "Bolt",
+                    "email": "usain.bolt@example.com",
+                },
+                content_type="application/json",
+            )
+        public_id = response.json()["public_id"]
+
+        list(anonymise(Athlete.objects.filter(public_id=public_id)))
+
+        (change,) = ChangeRecord.objects.filter(public_id=public_id)
+        self.assertNotIn("email", change.changes)
+        self.assertNotIn("first_name", change.changes)
+        self.assertIn("public_id", change.changes)
+
+
+class WebhookSecretHistoryTest(TestCase):
+    """Test suite for keeping the secrets of webhook endpoints out of the history."""
+
+    def _changes(self) -> list[dict]:
+        return [
+            record.changes
+            for record in ChangeRecord.objects.filter(
+                model="core.WebhookEndpoint"
+            ).order_by("id")
+        ]
+
+    def test_create_from_admin(self):
+        """Test that creating an endpoint records it without its secret."""
+        user = get_user_model().objects.create_superuser(
+            "admin", "admin@example.com", "password"
+        )
+        self.client.force_login(user)
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                "/admin/core/webhookendpoint/add/",
+                {
+                    "name": "Federacio",
+                    "url": "https://partner.example.org/hooks",
+                    "resources": "",
+                    "is_active": "on",
+                    "max_concurrency": 2,
+                    "batch_size": 100,
+                },
+            )
+        self.assertEqual(response.status_code, 302)
+
+        (changes,) = self._changes()
+        self.assertEqual(changes["name"], [None, "Federacio"])
+        self.assertNotIn("secret", changes)
+        secret = WebhookEndpoint.objects.get().secret
+        response = self.client.get(
+            "/api/v1/core/changes", {"model": "core.WebhookEndpoint"}
+        )
+        self.assertNotIn(secret, response.content.decode())
+
+    def test_rotate(self):
+        """Test that rotating the secret of an endpoint never records it."""
+        endpoint = WebhookEndpoint.objects.create(
+            name="Federacio", url="https://partner.example.org/hooks"
+        )
+        old_secret = endpoint.secret
+        token = history.current_request.set(RequestFactory().post("/admin/"))
+        try:
+            with self.captureOnCommitCallbacks(execute=True):
+                (endpoint.secret,) = nanoids.for_field(
+                    WebhookEndpoint._meta.get_field("secret"), 1
+                )
+                endpoint.batch_size = 50
+                endpoint.save()
+        finally:
+            history.current_request.reset(token)
+
+        (changes,) = self._changes()
+        self.assertEqual(changes, {"batch_size": [100, 50]})
+        for secret in (old_secret, endpoint.secret):
+            self.assertNotIn(secret, str(changes))
+
+
+class ChangeHistoryWriterTest(TestCase):
+    """Test suite for the batched writer and the monthly partitions."""
+
+    def _record(self, changed_at):
+        return ChangeRecord(
+            changed_at=changed_at,
+            model="core.Address",
+            public_id="abc",
+            action=ChangeAction.UPDATE,
+            changes={},
+        )
+
+    def _partition_of(self, record_id) -> str:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT tableoid::regclass::text FROM {history.TABLE} WHERE id = %s",
+                [record_id],
+            )
+            return cursor.fetchone()[0]
+
+    @override_settings(CHANGE_HISTORY_ASYNC=True, CHANGE_HISTORY_BATCH_SIZE=2)
+    def test_flush(self):
+        """Test that queued records are written in batches by flush()."""
+        for _ in range(3):
+            history._queue.put(self._record(datetime.now(UTC)))
+        # One savepoint and one insert per batch
+        with self.assertNumQueries(6):
+            history.flush()
+        self.assertEqual(ChangeRecord.objects.count(), 3)
+
+    def test_rows_move_to_new_partition(self):
+        """Test that a new partition takes its rows from the default one."""
+        record = self._record(datetime(2030, 5, 10, tzinfo=UTC))
+        history.enqueue(record)
+        self.assertEqual(self._partition_of(record.pk), history.DEFAULT_PARTITION)
+
+        created = history.ensure_partitions(date(2030, 5, 1), months_ahead=1)
+
+        self.assertEqual(
+            created, ["core_changerecord_y2030m05", "core_changerecord_y2030m06"]
+        )
+        self.assertEqual(self._partition_of(record.pk), created[0])
+        self.assertEqual(history.ensure_partitions(date(2030, 5, 1), 1), [])
+
+    def test_drop_partitions(self):
+        """Test that months past the retention are dropped whole."""
+        history.ensure_partitions(date(2030, 1, 1), months_ahead=2)
+        history.enqueue(self._record(datetime(2030, 1, 20, tzinfo=UTC)))
+
+        dropped = history.drop_partitions(date(2030, 3, 15), retention_months=1)
+
+        self.assertIn("core_changerecord_y2030m01", dropped)
+        self.assertNotIn("core_changerecord_y2030m02", dropped)
+        self.assertFalse(ChangeRecord.objects.filter(public_id="abc").exists())
@@ -0,0 +1,199 @@
+# core/tests/test_imports.py
+"""Tests for the bulk CSV imports."""
+
+import csv
+import io
+import tempfile
+from pathlib import Path
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import TestCase
+from inventory.models import Venue
+from people.models import Athlete
+
+from core.imports import CSVImportError, RejectFile, import_csv
+from core.models import Address, OutboxMessage, WebhookEndpoint
+
+HEADER = "first_name,last_name,email,height,address_public_id\n"
+
+
+class ImportTest(TestCase):
+    """Test suite for validating, staging and merging imported rows."""
+
+    def setUp(self):
+        """Set up an address and an athlete already in the club."""
+        self.address = Address.objects.create(line1="Av. de Jaume III, 15")
+        self.bolt = Athlete.objects.create(
+            first_name="Usain", last_name="Bolt", email="usain.bolt@example.com"
+        )
+        self.rejects = []
+
+    def _import(self, text, name="athletes", **kwargs):
+        return import_csv(name, io.StringIO(text), self.rejects.append, **kwargs)
+
+    def test_create(self):
+        """Test that valid rows are created, with their address and defaults."""
+        counts = self._import(
+            HEADER
+            + f"Yohan,Blake,yohan.blake@example.com,180.5,{self.address.public_id}\n"
+            + "Asafa,Powell,asafa.powell@example.com,,\n"
+        )
+
+        self.assertEqual((counts.created, counts.updated, counts.rejected), (2, 0, 0))
+        blake = Athlete.objects.get(email="yohan.blake@example.com")
+        self.assertEqual(blake.address, self.address)
+        self.assertEqual(float(blake.height), 180.5)
+        self.assertEqual(len(blake.public_id), len(self.bolt.public_id))
+        powell = Athlete.objects.get(email="asafa.powell@example.com")
+        self.assertIsNone(powell.height)
+        self.assertEqual(powell.phone, "")
+
+    def test_update_by_public_id(self):
+        """Test that rows with a public ID replace that record."""
+        counts = self._import(
+            "public_id,first_name,last_name,email\n"
+            f"{self.bolt.public_id},Usain St Leo,Bolt,usain.bolt@example.com\n"
+            "unknownid123,Yohan,Blake,yohan.blake@example.com\n"
+        )
+
+        self.assertEqual((counts.created, counts.updated, counts.rejected), (0, 1, 1))
+        self.bolt.refresh_from_db()
+        self.assertEqual(self.bolt.first_name, "Usain St Leo")
+        self.assertEqual(self.rejects[0].line, 3)
+        self.assertIn("unknown athlete", self.rejects[0].errors)
+
+    def test_rejects(self):
+        """Test that invalid rows are rejected with their line and errors."""
+        counts = self._import(
+            HEADER
+            + "Yohan,Blake,not-an-email,,\n"
+            + ",Powell,asafa.powell@example.com,,\n"
+            + "Asafa,Powell,asafa.powell@example.com,-1,\n"
+            + "Johan,Blake,yohan.blake@example.com,,unknown\n"
+            + "Usain,Bolt,usain.bolt@example.com,,\n"
+            + "Tyson,Gay,tyson.gay@example.com,,\n"
+            + "Tyson,Gay,tyson.gay@example.com,,\n"
+            + "Too,Many,too.many@example.com,,,extra\n"
+        )
+
+        self.assertEqual((counts.created, counts.rejected), (1, 7))
+        errors = {reject.line: reject.errors for reject in self.rejects}
+        self.assertIn("email", errors[2])
+        self.assertIn("first_name", errors[3])
+        self.assertIn("height", errors[4])
+        self.assertIn("unknown address", errors[5])
+        self.assertIn("by another athlete", errors[6])
+        self.assertNotIn(7, errors)
+        self.assertIn("by an earlier row", errors[8])
+        self.assertEqual(errors[9], "wrong number of values")
+
+    def test_columns_are_checked(self):
+        """Test that files whose columns do not match the schema are refused."""
+        with self.assertRaisesMessage(CSVImportError, "Missing columns: email"):
+            self._import("first_name,last_name\nYohan,Blake\n")
+        with self.assertRaisesMessage(CSVImportError, "Unknown columns: shoe_size"):
+            self._import(HEADER.strip() + ",shoe_size\n")
+        with self.assertRaisesMessage(CSVImportError, "Unknown resource"):
+            self._import(HEADER, name="medals")
+
+    def test_change_events(self):
+        """Test that imported records are published like single writes."""
+        WebhookEndpoint.objects.create(
+            name="Federation", url="http://127.0.0.1:9/", resources=["venues"]
+        )
+        self._import("name,venue_type,capacity\nEstadi,stadium,20000\n", "venues")
+
+        venue = Venue.objects.get()
+        event = OutboxMessage.objects.get().event
+        self.assertEqual(
+            (event["public_id"], event["operation"]), (venue.public_id, "create")
+        )
+
+    def test_worker_processes(self):
+        """Test that rows validated by a pool of processes are imported in order."""
+        rows = "".join(
+            f"Athlete,Number {index},athlete{index}@example.com,,\n"
+            for index in range(25)
+        )
+        counts = self._import(HEADER + rows, workers=2, chunk_size=10)
+
+        self.assertEqual(counts.created, 25)
+        self.assertEqual(
+            list(
+                Athlete.objects.exclude(pk=self.bolt.pk)
+                .order_by("id")
+                .values_list("last_name", flat=True)[:3]
+            ),
+            ["Number 0", "Number 1", "Number 2"],
+        )
+
+
+class ImportInterfacesTest(TestCase):
+    """Test suite for the import command and endpoint."""
+
+    def test_command_writes_rejects(self):
+        """Test that the command imports a file and writes its reject file."""
+        with tempfile.TemporaryDirectory() as directory:
+            source = Path(directory) / "coaches.csv"
+            source.write_text(
+                "first_name,last_name,email,certification\n"
+                "Glen,Mills,glen.mills@example.com,\n"
+                "Stephen,Francis,stephen.francis@example.com,astronaut\n"
+            )
+            out = io.StringIO()
+            call_command(
+                "import_csv", "coaches", str(source), "--workers=0", stdout=out
+            )
+
+            self.assertIn("1 created, 0 updated, 1 rejected", out.getvalue())
+            with open(source.with_suffix(".rejects.csv"), newline="") as file:
+                rejects = list(csv.DictReader(file))
+        self.assertEqual(rejects[0]["line"], "3")
+        self.assertEqual(rejects[0]["certification"], "astronaut")
+        self.assertIn("certification", rejects[0]["errors"])
+
+    def test_endpoint(self):
+        """Test that the endpoint imports an upload and reports its rejects."""
+        upload = SimpleUploadedFile(
+            "addresses.csv",
+            b"\xef\xbb\xbfline1,city\nCarrer Major 1,Palma\n,Inca\n",
+            content_type="text/csv",
+        )
+        response = self.client.post("/api/v1/core/imports/addresses", {"file": upload})
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual((data["created"], data["rejected"]), (1, 1))
+        self.assertEqual(data["rejects"][0]["line"], 3)
+        self.assertEqual(Address.objects.get().city, "Palma")
+
+    def test_endpoint_limits(self):
+        """Test that the endpoint lists a few rejects and turns large files away."""
+        upload = SimpleUploadedFile(
+            "addresses.csv", b"line1\n" + b",\n" * 5, content_type="text/csv"
+        )
+        with self.settings(IMPORT_MAX_REJECTS=2):
+            response = self.client.post(
+                "/api/v1/core/imports/addresses", {"file": upload}
+            )
+        data = response.json()
+        self.assertEqual(data["rejected"], 5)
+        self.assertEqual([reject["line"] for reject in data["rejects"]], [2, 3])
+
+        upload.seek(0)
+        with self.settings(IMPORT_MAX_UPLOAD_BYTES=8):
+            response = self.client.post(
+                "/api/v1/core/imports/addresses", {"file": upload}
+            )
+        self.assertEqual(response.status_code, 413)
+        self.assertFalse(Address.objects.exists())
+
+    def test_reject_file(self):
+        """Test that reject files have the columns of the resource."""
+        output = io.StringIO()
+        RejectFile(output, "venues")
+        self.assertEqual(
+            output.getvalue().strip(),
+            "line,public_id,name,venue_type,capacity,address_public_id,indoor,errors",
+        )
@@ -0,0 +1,114 @@
+# core/tests/test_invalidation.py
+"""Tests for the cache invalidation bus."""
+
+import json
+import queue
+
+from django.db import connection, transaction
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from core import cache, invalidation
+
+
+def _payload(*namespaces, origin="other-worker", version=invalidation.MESSAGE_VERSION):
+    return json.dumps({"v": version, "origin": origin, "namespaces": namespaces})
+
+
+class EvictionRecorderMixin:
+    """Record the namespaces handed to the invalidation handlers."""
+
+    def setUp(self):
+        self.evicted = queue.Queue()
+        invalidation.register(self.evicted.put)
+
+    def tearDown(self):
+        invalidation._handlers.remove(self.evicted.put)
+
+    def _evicted(self):
+        return [self.evicted.get_nowait() for _ in range(self.evicted.qsize())]
+
+
+class ListenerTest(EvictionRecorderMixin, TestCase):
+    """Test suite for the handling of invalidation messages."""
+
+    def setUp(self):
+        super().setUp()
+        self.listener = invalidation.Listener()
+
+    def test_other_process_bumps_local_version(self):
+        """Test that a message from another worker invalidates the local cache."""
+        version = cache.get_version("rankings")
+        self.listener.handle(_payload("rankings"))
+
+        self.assertEqual(cache.get_version("rankings"), version + 1)
+        self.assertEqual(self._evicted(), [{"rankings"}])
+
+    def test_own_messages_are_ignored(self):
+        """Test that the publishing process does not invalidate twice."""
+        self.listener.handle(_payload("rankings", origin=invalidation.ORIGIN))
+        self.assertEqual(self._evicted(), [])
+
+    def test_unknown_version_flushes(self):
+        """Test that messages of another release flush everything."""
+        self.listener.handle(_payload("rankings", version=2))
+        self.assertEqual(self._evicted(), [None])
+
+    @override_settings(CACHE_INVALIDATION_MAX_BACKLOG=2)
+    def test_backlog_flushes(self):
+        """Test that a listener falling behind flushes once instead."""
+        self.listener.receive([_payload("a"), _payload("b"), _payload("c")])
+        self.assertEqual(self._evicted(), [None])
+
+    def test_oversized_message_flushes(self):
+        """Test that too many namespaces for one NOTIFY become a flush."""
+        namespaces = [f"calendar:athlete:{index:06}" for index in range(1000)]
+        with CaptureQueriesContext(connection) as queries:
+            invalidation.publish(*namespaces)
+        self.assertIn('"namespaces": null', queries[0]["sql"])
+
+
+@override_settings(EVENTS_RECONNECT_SECONDS=0.1)
+class InvalidationBusTest(EvictionRecorderMixin, TransactionTestCase):
+    """Test suite for invalidations going through Postgres LISTEN/NOTIFY."""
+
+    def setUp(self):
+        """Start the listener of this process."""
+        super().setUp()
+        invalidation.listener.start()
+        self.assertTrue(invalidation.listener.listening.wait(5))
+
+    def tearDown(self):
+        invalidation.listener.stop()
+        super().tearDown()
+
+    def _notify(self, payload):
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT pg_notify(%s, %s)", [invalidation.CHANNEL, payload])
+
+    def test_committed_invalidations_only(self):
+        """Test that invalidations of rolled back writes are not delivered."""
+        try:
+            with transaction.atomic():
+                self._notify(_payload("rolled-back"))
+                raise RuntimeError
+        except RuntimeError:
+            pass
+        with transaction.atomic():
+            self._notify(_payload("committed"))
+
+        self.assertEqual(self.evicted.get(timeout=5), {"committed"})
+        self.assertEqual(self._evicted(), [])
+
+    def test_flush_after_reconnecting(self):
+        """Test that invalidations possibly lost while disconnected flush."""
+        with self.assertLogs("core.listeners", "ERROR"):
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    """
+                    SELECT pg_terminate_backend(pid) FROM pg_stat_activity
+                    WHERE query = %s
+                    """,
+                    [f"LISTEN {invalidation.CHANNEL}"],
+                )
+            self.assertIsNone(self.evicted.get(timeout=5))
@@ -135,8 +135,9 @@ class AddressMetaConfigurationTest(TestCase):
         """Test that database indexes are properly configured."""
         indexes = Address._meta.indexes
 
-        self.assertEqual(len(indexes), 1)
+        self.assertEqual(len(indexes), 2)
         self.assertEqual(indexes[0].fields, ["city", "country"])
+        self.assertEqual(indexes[1].fields, ["updated_at", "id"])
 
     def test_composite_index_field_order(self):
         """Test that composite index has correct field order for query optimization."""
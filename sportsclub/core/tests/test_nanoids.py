@@ -0,0 +1,124 @@
+# core/tests/test_nanoids.py
+"""Tests for the batch NanoID generator."""
+
+import time
+
+from django.contrib.auth.models import User
+from django.db import IntegrityError, transaction
+from django.test import TestCase
+
+from core import nanoids
+from core.models import Address, ApiKey
+
+
+class GenerateTest(TestCase):
+    """Test suite for generating IDs in batches."""
+
+    def test_ids(self):
+        """Test that IDs are distinct, of the given size and alphabet."""
+        ids = nanoids.generate("abc", 8, 500)
+
+        self.assertEqual(len(set(ids)), 500)
+        self.assertEqual({len(value) for value in ids}, {8})
+        self.assertEqual(set("".join(ids)), set("abc"))
+
+    def test_field_settings(self):
+        """Test that IDs follow the alphabet and size of the field."""
+        field = Address._meta.get_field("public_id")
+        ids = nanoids.for_field(field, 100)
+        self.assertEqual({len(value) for value in ids}, {field.max_length})
+        self.assertLessEqual(set("".join(ids)), set(field.alphabet))
+
+    def test_throughput(self):
+        """Test that 100,000 IDs are generated well within a second."""
+        field = Address._meta.get_field("public_id")
+        start = time.perf_counter()
+        nanoids.for_field(field, 100_000)
+        self.assertLess(time.perf_counter() - start, 1)
+
+
+class UniqueTest(TestCase):
+    """Test suite for checking IDs against the unique index of their column."""
+
+    def setUp(self):
+        self.address = Address.objects.create(line1="Av. de Jaume III, 15")
+        self.field = Address._meta.get_field("public_id")
+
+    def test_taken_values_are_replaced(self):
+        """Test that values used by a row or an earlier value are replaced."""
+        self.address.soft_delete()
+        values = [self.address.public_id, "free-value", "free-value"]
+        with self.assertNumQueries(2):
+            checked = nanoids.deduplicate(Address, self.field, values)
+
+        self.assertNotEqual(checked[0], self.address.public_id)
+        self.assertEqual(checked[1], "free-value")
+        self.assertNotEqual(checked[2], "free-value")
+
+    def test_unique(self):
+        """Test that new IDs are checked with one query."""
+        with self.assertNumQueries(1):
+            ids = nanoids.unique(Address, "public_id", 50)
+        self.assertEqual(len(set(ids)), 50)
+
+
+class BulkCreateTest(TestCase):
+    """Test suite for the NanoIDs of objects inserted in bulk."""
+
+    def setUp(self):
+        self.address = Address.objects.create(line1="Av. de Jaume III, 15")
+
+    def test_generated_ids_are_replaced(self):
+        """Test that the defaults of new objects get a batch of free IDs."""
+        addresses = [Address(line1=f"Carrer Major, {index}") for index in range(3)]
+        drawn = [address.public_id for address in addresses]
+        self.assertIsInstance(drawn[0], nanoids.GeneratedId)
+
+        # A check of the batch, and the insert
+        with self.assertNumQueries(2):
+            Address.objects.bulk_create(addresses)
+
+        self.assertEqual(Address.objects.count(), 4)
+        for address, value in zip(addresses, drawn, strict=True):
+            self.assertNotEqual(address.public_id, value)
+            self.assertIs(type(address.public_id), str)
+
+    def test_set_values_are_kept(self):
+        """Test that a public ID set by the caller is neither checked nor replaced."""
+        addresses = [Address(line1=f"Carrer Major, {index}") for index in range(2)]
+        addresses[1].public_id = self.address.public_id
+
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            Address.objects.bulk_create(addresses)
+        self.assertEqual(addresses[1].public_id, self.address.public_id)
+
+    def test_every_unique_field(self):
+        """Test that API keys get new public IDs and keys alike."""
+        user = User.objects.create_user("runner")
+        key = ApiKey(user=user, name="First")
+        drawn = (key.public_id, key.key)
+        ApiKey.all_objects.bulk_create([key])
+        self.assertNotEqual(key.public_id, drawn[0])
+        self.assertNotEqual(key.key, drawn[1])
+
+    def test_save_stores_plain_ids(self):
+        """Test that saved objects no longer hold a generated default."""
+        address = Address.objects.create(line1="Carrer Major, 1")
+        self.assertIs(type(address.public_id), str)
+        copy = Address(line1="Carrer Major, 1", public_id=address.public_id)
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            Address.objects.bulk_create([copy])
+
+    def test_upserts_keep_values(self):
+        """Test that upserts match existing rows by their values."""
+        address = Address(
+            pk=self.address.pk, public_id=self.address.public_id, line1="Renamed"
+        )
+        Address.all_objects.bulk_create(
+            [address],
+            update_conflicts=True,
+            unique_fields=["id"],
+            update_fields=["line1"],
+        )
+        self.address.refresh_from_db()
+        self.assertEqual(self.address.line1, "Renamed")
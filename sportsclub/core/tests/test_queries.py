@@ -0,0 +1,120 @@
+# core/tests/test_queries.py
+"""Tests for the query fingerprints, budgets and repeated queries warnings."""
+
+from django.core.exceptions import MiddlewareNotUsed
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+
+from core.models import Address
+from core.queries import RepeatedQueriesMiddleware, fingerprint
+from core.test import query_budget
+
+
+class FingerprintTest(TestCase):
+    """Test suite for the fingerprints of statements."""
+
+    def test_parameters_and_lists(self):
+        """Test that statements differing by their parameters share a fingerprint."""
+        self.assertEqual(
+            fingerprint('SELECT "t"."id" FROM "t" WHERE "t"."id" IN (%s, %s, %s)'),
+            fingerprint('SELECT "t"."id" FROM "t" WHERE "t"."id" IN (%s)'),
+        )
+        self.assertEqual(
+            fingerprint("SELECT * FROM t WHERE name = 'Bolt' LIMIT 21"),
+            "SELECT * FROM t WHERE name = ? LIMIT ?",
+        )
+
+    def test_identifiers_are_kept(self):
+        """Test that digits of identifiers and aliases are not taken for literals."""
+        self.assertEqual(
+            fingerprint('SELECT U0."id" FROM "people_athlete" U0 WHERE  U0."x1" = %s'),
+            'SELECT U0."id" FROM "people_athlete" U0 WHERE U0."x1" = ?',
+        )
+
+    def test_savepoints(self):
+        """Test that the savepoints of a transaction per row share a fingerprint."""
+        self.assertEqual(
+            fingerprint('SAVEPOINT "s140228327787392_x23"'),
+            fingerprint('SAVEPOINT "s140228327787392_x24"'),
+        )
+
+
+class QueryBudgetTest(TestCase):
+    """Test suite for the query budgets of the requests of a test."""
+
+    def setUp(self):
+        """Set up a few addresses."""
+        for number in range(3):
+            Address.objects.create(line1=f"Carrer de Sant Miquel, {number}")
+
+    def test_within_budget(self):
+        """Test that the queries of the set-up do not count against the budget."""
+        with query_budget(5):
+            Address.objects.create(line1="Passeig del Born, 1")
+            list(Address.objects.all())
+            self.client.get("/api/v1/core/addresses")
+
+    def test_over_budget(self):
+        """Test that a request over its budget fails, naming its queries."""
+        expected = "GET /api/v1/core/addresses ran"
+        with self.assertRaisesMessage(AssertionError, expected), query_budget(0):
+            self.client.get("/api/v1/core/addresses")
+
+    def test_budget_is_per_request(self):
+        """Test that the budget applies to each request, not to their sum."""
+        with query_budget(5):
+            for _ in range(3):
+                self.client.get("/api/v1/core/addresses")
+
+    def test_no_request(self):
+        """Test that a budget without requests fails, as it checked nothing."""
+        with self.assertRaises(AssertionError), query_budget(5):
+            list(Address.objects.all())
+
+    @query_budget(5)
+    def test_decorator(self):
+        """Test that the budget can decorate a test method."""
+        self.client.get("/api/v1/core/addresses")
+
+
+class RepeatedQueriesMiddlewareTest(TestCase):
+    """Test suite for the warnings about queries repeated by a request."""
+
+    def setUp(self):
+        """Set up a few addresses."""
+        self.addresses = [
+            Address.objects.create(line1=f"Carrer de Sant Miquel, {number}")
+            for number in range(4)
+        ]
+
+    def _per_row(self, request):
+        for address in self.addresses:
+            Address.objects.filter(pk=address.pk).exists()
+        Address.objects.count()
+        return HttpResponse()
+
+    @override_settings(QUERY_REPEAT_THRESHOLD=3)
+    def test_warning(self):
+        """Test that statements repeated over the threshold are logged once."""
+        middleware = RepeatedQueriesMiddleware(self._per_row)
+
+        with self.assertLogs("core.queries", "WARNING") as logs:
+            middleware(RequestFactory().get("/api/v1/core/addresses"))
+
+        (message,) = logs.output
+        self.assertIn("GET /api/v1/core/addresses ran the same query 4 times", message)
+        self.assertIn("core/tests/test_queries.py", message)
+        self.assertIn("in _per_row", message)
+
+    @override_settings(QUERY_REPEAT_THRESHOLD=4)
+    def test_under_threshold(self):
+        """Test that statements repeated up to the threshold are not logged."""
+        middleware = RepeatedQueriesMiddleware(self._per_row)
+
+        with self.assertNoLogs("core.queries", "WARNING"):
+            middleware(RequestFactory().get("/api/v1/core/addresses"))
+
+    def test_off_by_default(self):
+        """Test that the middleware is left out unless a threshold is set."""
+        with self.assertRaises(MiddlewareNotUsed):
+            RepeatedQueriesMiddleware(self._per_row)
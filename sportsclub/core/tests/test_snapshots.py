@@ -0,0 +1,137 @@
+# core/tests/test_snapshots.py
+"""Tests for the club snapshots."""
+
+import io
+import json
+import tempfile
+import zipfile
+from datetime import UTC, date, datetime
+from pathlib import Path
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.db import transaction
+from django.test import TransactionTestCase
+from people.models import Athlete
+from scheduling.models import Competition, Season
+
+from core.models import Address, ApiKey, WebhookEndpoint
+from core.snapshots import (
+    MANIFEST,
+    SnapshotError,
+    export_snapshot,
+    restore_snapshot,
+)
+
+
+class SnapshotTest(TransactionTestCase):
+    """Test suite for exporting and restoring snapshots of the club."""
+
+    def setUp(self):
+        """Set up a small club, with a user and an API key."""
+        self.address = Address.objects.create(line1="Av. de Jaume III, 15")
+        self.athlete = Athlete.objects.create(
+            first_name="Usain",
+            last_name="Bolt",
+            email="usain.bolt@example.com",
+            address=self.address,
+        )
+        season = Season.objects.create(
+            name="Temporada 2025",
+            start_date=date(2025, 1, 1),
+            end_date=date(2025, 12, 31),
+        )
+        self.competition = Competition.objects.create(
+            name="Campionat de Balears\tAbsolut",
+            date=datetime(2025, 6, 1, 10, tzinfo=UTC),
+            season=season,
+            score={"results": {"sprints": {"gold": 1}}},
+        )
+        self.competition.athletes.add(self.athlete)
+        user = User.objects.create_user("coach")
+        ApiKey.objects.create(user=user, name="Timing")
+        WebhookEndpoint.objects.create(name="Federation", url="http://127.0.0.1:9/")
+
+    def _export(self) -> io.BytesIO:
+        file = io.BytesIO()
+        export_snapshot(file)
+        file.seek(0)
+        return file
+
+    def test_manifest(self):
+        """Test that the manifest lists the tables and rows of the snapshot."""
+        with zipfile.ZipFile(self._export()) as archive:
+            manifest = json.loads(archive.read(MANIFEST))
+            tables = {table["label"]: table for table in manifest["tables"]}
+
+            self.assertEqual(tables["people.athlete"]["rows"], 1)
+            self.assertEqual(tables["scheduling.competition_athletes"]["rows"], 1)
+            self.assertEqual(tables["auth.user"]["rows"], 1)
+            self.assertIn("core.changerecord", tables)
+            self.assertNotIn("core.webhookendpoint", tables)
+            self.assertIn("0001_initial", manifest["migrations"]["people"])
+            member = archive.read(tables["people.athlete"]["member"])
+        self.assertIn(b"usain.bolt@example.com", member)
+
+    def test_restore(self):
+        """Test that restoring brings back every table as it was exported."""
+        snapshot = self._export()
+        self.competition.athletes.clear()
+        Athlete.objects.filter(pk=self.athlete.pk).update(first_name="Renamed")
+        Address.objects.create(line1="Carrer Major, 1")
+
+        restore_snapshot(snapshot)
+
+        athlete = Athlete.objects.get()
+        self.assertEqual(athlete.first_name, "Usain")
+        self.assertEqual(athlete.address, self.address)
+        competition = Competition.objects.get()
+        self.assertEqual(competition.name, "Campionat de Balears\tAbsolut")
+        self.assertEqual(competition.score, {"results": {"sprints": {"gold": 1}}})
+        self.assertEqual(list(competition.athletes.all()), [athlete])
+        self.assertEqual(ApiKey.objects.get().user.username, "coach")
+        self.assertEqual(Address.objects.count(), 1)
+        # Sequences continue after the restored rows
+        self.assertGreater(
+            Address.objects.create(line1="Carrer Major, 2").pk, self.address.pk
+        )
+
+    def test_export_is_isolated(self):
+        """Test that snapshots refuse to join the transaction of the caller."""
+        with transaction.atomic(), self.assertRaises(SnapshotError):
+            export_snapshot(io.BytesIO())
+
+    def test_schema_mismatch(self):
+        """Test that snapshots of other migrations are refused."""
+        snapshot = io.BytesIO()
+        with (
+            zipfile.ZipFile(self._export()) as source,
+            zipfile.ZipFile(snapshot, "w") as target,
+        ):
+            for item in source.infolist():
+                data = source.read(item)
+                if item.filename == MANIFEST:
+                    manifest = json.loads(data)
+                    manifest["migrations"]["people"].append("9999_future")
+                    data = json.dumps(manifest)
+                target.writestr(item, data)
+        snapshot.seek(0)
+
+        with self.assertRaisesMessage(SnapshotError, "other migrations"):
+            restore_snapshot(snapshot)
+        self.assertEqual(Athlete.objects.count(), 1)
+
+    def test_command(self):
+        """Test that the command exports to a file and restores from it."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = str(Path(directory) / "club.zip")
+            out = io.StringIO()
+            call_command("club_snapshot", "export", path, stdout=out)
+            self.assertIn("people.athlete: 1", out.getvalue())
+
+            Athlete.objects.all().delete()
+            out = io.StringIO()
+            call_command("club_snapshot", "restore", path, "--noinput", stdout=out)
+
+        self.assertIn("Restored", out.getvalue())
+        self.assertEqual(Athlete.objects.get().email, "usain.bolt@example.com")
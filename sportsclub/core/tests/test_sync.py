@@ -0,0 +1,132 @@
+# core/tests/test_sync.py
+"""Tests for the delta sync of the API lists."""
+
+from datetime import timedelta
+
+from django.db import connections
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from people.models import Athlete, Coach
+
+from core.sync import make_token, watermark
+
+URL = "/api/v1/people/athletes/sync"
+
+
+@override_settings(SYNC_CLOCK_SKEW_SECONDS=0)
+class SyncAPITest(TestCase):
+    """Test suite for the /sync endpoints."""
+
+    def setUp(self):
+        """Set up test data."""
+        self.bolt = Athlete.objects.create(
+            first_name="Usain", last_name="Bolt", email="usain.bolt@example.com"
+        )
+        self.blake = Athlete.objects.create(
+            first_name="Yohan", last_name="Blake", email="yohan.blake@example.com"
+        )
+
+    def _sync(self, token=None, **params):
+        if token:
+            params["updated_since"] = token
+        response = self.client.get(URL, params)
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_full_sync_then_nothing(self):
+        """Test that a sync without a token returns every athlete once."""
+        page = self._sync()
+        self.assertEqual(
+            [item["public_id"] for item in page["items"]],
+            [self.bolt.public_id, self.blake.public_id],
+        )
+        self.assertFalse(page["has_more"])
+
+        page = self._sync(page["next_token"])
+        self.assertEqual(page["items"], [])
+        self.assertEqual(page["deleted"], [])
+
+    def test_updates_and_tombstones(self):
+        """Test that only changed rows and deleted public IDs are returned."""
+        token = self._sync()["next_token"]
+        self.client.patch(
+            f"/api/v1/people/athletes/{self.blake.public_id}",
+            {"jersey_number": 5},
+            content_type="application/json",
+        )
+        self.client.delete(f"/api/v1/people/athletes/{self.bolt.public_id}")
+
+        page = self._sync(token)
+
+        self.assertEqual(
+            [(item["public_id"], item["jersey_number"]) for item in page["items"]],
+            [(self.blake.public_id, 5)],
+        )
+        self.assertEqual(page["deleted"], [self.bolt.public_id])
+
+    def test_pages(self):
+        """Test that a full sync can be done in several pages."""
+        page = self._sync(limit=1)
+        self.assertTrue(page["has_more"])
+        self.assertEqual(page["items"][0]["public_id"], self.bolt.public_id)
+
+        page = self._sync(page["next_token"], limit=1)
+        self.assertEqual(page["items"][0]["public_id"], self.blake.public_id)
+        self.assertFalse(page["has_more"])
+
+    @override_settings(SYNC_CLOCK_SKEW_SECONDS=60)
+    def test_recent_rows_wait_for_the_watermark(self):
+        """Test that rows are held back while clocks may still disagree."""
+        page = self._sync()
+        self.assertEqual(page["items"], [])
+
+        with override_settings(SYNC_CLOCK_SKEW_SECONDS=0):
+            self.assertEqual(len(self._sync(page["next_token"])["items"]), 2)
+
+    def test_invalid_tokens(self):
+        """Test that forged tokens and tokens of another list are refused."""
+        response = self.client.get(URL, {"updated_since": "forged"})
+        self.assertEqual(response.status_code, 400)
+
+        token = make_token(Coach, timezone.now(), 0)
+        response = self.client.get(URL, {"updated_since": token})
+        self.assertEqual(response.status_code, 400)
+
+    @override_settings(SOFT_DELETE_RETENTION_DAYS=90)
+    def test_expired_token(self):
+        """Test that tokens older than the tombstones kept are refused."""
+        token = make_token(Athlete, timezone.now() - timedelta(days=91), 0)
+        response = self.client.get(URL, {"updated_since": token})
+        self.assertEqual(response.status_code, 410)
+
+
+@override_settings(SYNC_CLOCK_SKEW_SECONDS=0)
+class WatermarkTest(TestCase):
+    """Test suite for the watermark of the delta sync."""
+
+    def setUp(self):
+        """Open a transaction on a second connection."""
+        self.other = connections.create_connection("default")
+        self.other.set_autocommit(False)
+        self.addCleanup(self.other.close)
+        self.addCleanup(self.other.rollback)
+
+    def _start(self, sql):
+        with self.other.cursor() as cursor:
+            cursor.execute(sql)
+            cursor.execute(
+                "SELECT xact_start FROM pg_stat_activity WHERE pid = pg_backend_pid()"
+            )
+            return cursor.fetchone()[0]
+
+    def test_reading_transaction_does_not_hold_back(self):
+        """Test that a transaction that has only read does not stall the sync."""
+        started = self._start("SELECT 1")
+        self.assertGreater(watermark(), started)
+
+    @override_settings(SYNC_STALL_WARNING_SECONDS=0)
+    def test_writing_transaction_holds_back(self):
+        """Test that a transaction that has written holds the watermark back."""
+        started = self._start("SELECT txid_current()")
+        with self.assertLogs("core.sync", "WARNING"):
+            self.assertEqual(watermark(), started)
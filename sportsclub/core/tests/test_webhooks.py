@@ -0,0 +1,198 @@
+# core/tests/test_webhooks.py
+"""Tests for the transactional outbox and its webhook delivery."""
+
+import json
+import threading
+from datetime import UTC, date, datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import transaction
+from django.test import TestCase, TransactionTestCase, override_settings
+from people.models import Athlete
+from scheduling.models import Competition, Season
+
+from core.models import OutboxMessage, OutboxStatus, WebhookEndpoint
+from core.webhooks import Dispatcher, claim, send_batch, signature
+
+
+class Receiver(BaseHTTPRequestHandler):
+    """Partner endpoint recording the deliveries, failing while told to."""
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        self.server.deliveries.append((dict(self.headers), body))
+        self.send_response(self.server.status)
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+def _season():
+    return Season.objects.create(
+        name="2024-2025 Season",
+        start_date=date(2024, 9, 1),
+        end_date=date(2025, 6, 30),
+    )
+
+
+def _competition(season):
+    return Competition.objects.create(
+        name="Spring Championship",
+        date=datetime(2025, 4, 15, 10, 0, tzinfo=UTC),
+        season=season,
+    )
+
+
+class OutboxTest(TestCase):
+    """Test suite for the messages written along with the changes."""
+
+    def setUp(self):
+        """Set up an endpoint for competitions and one for every resource."""
+        self.competitions = WebhookEndpoint.objects.create(
+            name="Federation",
+            url="http://127.0.0.1:9/",
+            resources=["competitions"],
+        )
+        self.everything = WebhookEndpoint.objects.create(
+            name="Newspaper", url="http://127.0.0.1:9/"
+        )
+
+    def test_messages_follow_subscriptions(self):
+        """Test that each endpoint gets the events of its resources only."""
+        season = _season()
+        competition = _competition(season)
+
+        events = [
+            message.event
+            for message in OutboxMessage.objects.filter(endpoint=self.competitions)
+        ]
+        self.assertEqual(len(events), 1)
+        self.assertEqual(events[0]["public_id"], competition.public_id)
+        self.assertEqual(events[0]["operation"], "create")
+        self.assertEqual(
+            self.everything.outbox_messages.filter(event__resource="seasons").count(),
+            1,
+        )
+
+    def test_no_message_without_commit(self):
+        """Test that a rolled back write leaves nothing to deliver."""
+        season = _season()
+        before = OutboxMessage.objects.count()
+        try:
+            with transaction.atomic():
+                _competition(season)
+                raise RuntimeError
+        except RuntimeError:
+            pass
+        self.assertEqual(OutboxMessage.objects.count(), before)
+
+    def test_inactive_endpoint(self):
+        """Test that disabled endpoints do not collect messages."""
+        WebhookEndpoint.objects.update(is_active=False)
+        _season()
+        self.assertFalse(OutboxMessage.objects.exists())
+
+    def test_roster_change(self):
+        """Test that adding an athlete to a competition is an update."""
+        competition = _competition(_season())
+        athlete = Athlete.objects.create(
+            first_name="Usain", last_name="Bolt", email="usain.bolt@example.com"
+        )
+        OutboxMessage.objects.all().delete()
+
+        competition.athletes.add(athlete)
+
+        message = self.competitions.outbox_messages.get()
+        self.assertEqual(message.event["operation"], "update")
+        self.assertEqual(message.event["public_id"], competition.public_id)
+
+
+@override_settings(WEBHOOK_TIMEOUT_SECONDS=5)
+class DeliveryTest(TransactionTestCase):
+    """Test suite for delivering the outbox to a local endpoint."""
+
+    def setUp(self):
+        """Start a partner endpoint and subscribe it to the competitions."""
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Receiver)
+        self.server.deliveries = []
+        self.server.status = 204
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.endpoint = WebhookEndpoint.objects.create(
+            name="Federation",
+            url=f"http://127.0.0.1:{self.server.server_port}/hooks",
+            resources=["competitions"],
+            batch_size=2,
+        )
+        season = _season()
+        for _ in range(3):
+            _competition(season)
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_signed_batches(self):
+        """Test that batches are signed, sized, and removed once delivered."""
+        self.assertTrue(send_batch(self.endpoint, claim(self.endpoint)))
+
+        headers, body = self.server.deliveries[0]
+        self.assertEqual(
+            headers["X-Webhook-Signature"],
+            signature(self.endpoint.secret, int(headers["X-Webhook-Timestamp"]), body),
+        )
+        self.assertEqual(len(json.loads(body)["events"]), 2)
+        self.assertEqual(self.endpoint.outbox_messages.count(), 1)
+
+    def test_claimed_messages_are_skipped(self):
+        """Test that a batch being delivered is not claimed again."""
+        first = claim(self.endpoint)
+        second = claim(self.endpoint)
+        self.assertEqual(len(first) + len(second), 3)
+        self.assertEqual(claim(self.endpoint), [])
+
+    @override_settings(WEBHOOK_MAX_ATTEMPTS=2)
+    def test_failures_are_retried_then_dead(self):
+        """Test that failed deliveries back off, then become dead letters."""
+        self.server.status = 500
+        messages = claim(self.endpoint)
+
+        with self.assertLogs("core.webhooks", "WARNING"):
+            self.assertFalse(send_batch(self.endpoint, messages))
+        message = OutboxMessage.objects.get(pk=messages[0].pk)
+        self.assertEqual((message.status, message.attempts), ("pending", 1))
+        self.assertGreater(message.next_attempt_at, message.created_at)
+        self.assertIn("500", message.last_error)
+        # Not due before the backoff
+        self.assertEqual(claim(self.endpoint), [OutboxMessage.objects.last()])
+
+        with self.assertLogs("core.webhooks", "WARNING"):
+            send_batch(self.endpoint, [message])
+        message.refresh_from_db()
+        self.assertEqual(message.status, OutboxStatus.DEAD)
+
+    def test_dispatcher_respects_concurrency(self):
+        """Test that an endpoint never gets more batches than it allows."""
+        self.endpoint.max_concurrency = 1
+        self.endpoint.save()
+        dispatcher = Dispatcher(workers=4)
+        try:
+            self.assertEqual(dispatcher.dispatch_once(), 1)
+        finally:
+            dispatcher.shutdown()
+
+    def test_command(self):
+        """Test that the command delivers every due message and exits."""
+        out = StringIO()
+        call_command("dispatch_webhooks", "--once", "--poll", "0.1", stdout=out)
+
+        self.assertIn("2 batches dispatched", out.getvalue())
+        self.assertFalse(OutboxMessage.objects.exists())
+        delivered = [
+            event["resource"]
+            for _, body in self.server.deliveries
+            for event in json.loads(body)["events"]
+        ]
+        self.assertEqual(delivered, ["competitions"] * 3)
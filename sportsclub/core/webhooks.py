@@ -0,0 +1,204 @@
+# core/webhooks.py
+"""
+Delivery of the outbox to the partners' webhook endpoints.
+
+Change events are copied to `OutboxMessage` rows in the transaction of the
+write (see `core.events`), so an event is delivered if and only if its write
+was committed, even if the process dies in between. `Dispatcher` delivers
+them from a pool of worker threads:
+
+- the due messages of an endpoint are claimed in batches of up to its
+  `batch_size`, oldest first, and locked for `WEBHOOK_TIMEOUT_SECONDS` (plus
+  a margin) so that other dispatchers skip them;
+- each batch is one POST of `{"events": [...]}`, signed with the secret of
+  the endpoint (see `signature()`);
+- at most `max_concurrency` batches of an endpoint are in flight at once, per
+  dispatcher process;
+- delivered messages are deleted; failed ones are retried with exponential
+  backoff and jitter, and kept as dead letters after `WEBHOOK_MAX_ATTEMPTS`.
+
+Batches of one endpoint may arrive out of order when it allows concurrent
+deliveries, and a batch may be delivered twice if a response is lost: each
+event has a unique `id` and its `updated_at` for receivers to deduplicate and
+order them.
+"""
+
+import hashlib
+import hmac
+import json
+import logging
+import random
+import threading
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from core.models import OutboxMessage, OutboxStatus, WebhookEndpoint
+
+logger = logging.getLogger(__name__)
+
+
+def signature(secret: str, timestamp: int, body: bytes) -> str:
+    """
+    Return the `X-Webhook-Signature` header of a delivery.
+
+    Receivers recompute the HMAC-SHA256 of `<X-Webhook-Timestamp>.<body>` with
+    the secret of their endpoint, compare it in constant time, and reject old
+    timestamps to prevent replays.
+    """
+    payload = str(timestamp).encode() + b"." + body
+    digest = hmac.new(secret.encode(), payload, hashlib.sha256).hexdigest()
+    return f"sha256={digest}"
+
+
+def retry_delay(attempts: int) -> timedelta:
+    """Return how long to wait after the given number of failed attempts."""
+    delay = min(
+        settings.WEBHOOK_RETRY_BASE_SECONDS * 2 ** (attempts - 1),
+        settings.WEBHOOK_RETRY_MAX_SECONDS,
+    )
+    # Jitter spreads the retries of the messages that failed together
+    return timedelta(seconds=delay * random.uniform(0.5, 1.0))
+
+
+def claim(endpoint: WebhookEndpoint) -> list[OutboxMessage]:
+    """Lock the next batch of due messages of an endpoint for delivery."""
+    now = timezone.now()
+    lease = timedelta(seconds=settings.WEBHOOK_TIMEOUT_SECONDS * 2)
+    with transaction.atomic():
+        messages = list(
+            OutboxMessage.objects.filter(
+                Q(locked_until__isnull=True) | Q(locked_until__lt=now),
+                endpoint=endpoint,
+                status=OutboxStatus.PENDING,
+                next_attempt_at__lte=now,
+            )
+            .order_by("id")
+            .select_for_update(skip_locked=True)[: endpoint.batch_size]
+        )
+        OutboxMessage.objects.filter(
+            pk__in=[message.pk for message in messages]
+        ).update(locked_until=now + lease)
+    return messages
+
+
+def deliver(endpoint: WebhookEndpoint, messages: list[OutboxMessage]):
+    """
+    POST a batch of messages to an endpoint.
+
+    Raises:
+        OSError: The endpoint could not be reached, or did not answer 2xx
+    """
+    body = json.dumps({"events": [message.event for message in messages]}).encode()
+    timestamp = int(time.time())
+    request = urllib.request.Request(
+        endpoint.url,
+        data=body,
+        method="POST",
+        headers={
+            "Content-Type": "application/json",
+            "User-Agent": "sportsclub-webhooks",
+            "X-Webhook-Timestamp": str(timestamp),
+            "X-Webhook-Signature": signature(endpoint.secret, timestamp, body),
+        },
+    )
+    # Non-2xx responses raise `HTTPError`, a subclass of `OSError`
+    with urllib.request.urlopen(request, timeout=settings.WEBHOOK_TIMEOUT_SECONDS):
+        pass
+
+
+def _record_failure(messages: list[OutboxMessage], error: str):
+    now = timezone.now()
+    for message in messages:
+        message.attempts += 1
+        message.last_error = error[:1000]
+        message.locked_until = None
+        message.next_attempt_at = now + retry_delay(message.attempts)
+        if message.attempts >= settings.WEBHOOK_MAX_ATTEMPTS:
+            message.status = OutboxStatus.DEAD
+    OutboxMessage.objects.bulk_update(
+        messages,
+        ["attempts", "last_error", "locked_until", "next_attempt_at", "status"],
+    )
+
+
+def send_batch(endpoint: WebhookEndpoint, messages: list[OutboxMessage]) -> bool:
+    """Deliver a claimed batch and record the outcome. Returns True if sent."""
+    try:
+        deliver(endpoint, messages)
+    except OSError as err:
+        logger.warning(
+            "Delivery of %d events to %s failed: %s", len(messages), endpoint, err
+        )
+        _record_failure(messages, str(err))
+        return False
+    OutboxMessage.objects.filter(pk__in=[message.pk for message in messages]).delete()
+    return True
+
+
+class Dispatcher:
+    """Deliver the outbox from a pool of threads, endpoint concurrency permitting."""
+
+    def __init__(self, workers: int):
+        self.pool = ThreadPoolExecutor(workers, thread_name_prefix="webhooks")
+        self.in_flight: dict[int, int] = {}
+        self.lock = threading.Lock()
+        self.finished = threading.Condition(self.lock)
+
+    def _free_slots(self, endpoint: WebhookEndpoint) -> int:
+        with self.lock:
+            return endpoint.max_concurrency - self.in_flight.get(endpoint.pk, 0)
+
+    def _run(self, endpoint: WebhookEndpoint, messages: list[OutboxMessage]):
+        try:
+            send_batch(endpoint, messages)
+        except Exception:
+            logger.exception("Could not record the delivery to %s", endpoint)
+        finally:
+            close_old_connections()
+            with self.lock:
+                self.in_flight[endpoint.pk] -= 1
+                self.finished.notify_all()
+
+    def dispatch_once(self) -> int:
+        """
+        Start delivering the due messages, as far as the limits allow.
+
+        Returns:
+            Number of batches started
+        """
+        started = 0
+        endpoints = WebhookEndpoint.objects.filter(
+            is_active=True,
+            outbox_messages__status=OutboxStatus.PENDING,
+            outbox_messages__next_attempt_at__lte=timezone.now(),
+        ).distinct()
+        for endpoint in endpoints:
+            while self._free_slots(endpoint) > 0:
+                messages = claim(endpoint)
+                if not messages:
+                    break
+                with self.lock:
+                    self.in_flight[endpoint.pk] = self.in_flight.get(endpoint.pk, 0) + 1
+                self.pool.submit(self._run, endpoint, messages)
+                started += 1
+        return started
+
+    def busy(self) -> bool:
+        """Return whether deliveries are in flight."""
+        with self.lock:
+            return any(self.in_flight.values())
+
+    def wait(self, timeout: float):
+        """Wait until a delivery finishes, for at most `timeout` seconds."""
+        with self.lock:
+            self.finished.wait(timeout)
+
+    def shutdown(self):
+        self.pool.shutdown(wait=True)
@@ -2,13 +2,25 @@
 from django.contrib import admin
 
 from .models import Venue
+from .utilization import annotate_recent_activity
+
+# Window of the utilization columns of the venue list
+RECENT_ACTIVITY_DAYS = 30
 
 
 @admin.register(Venue)
 class VenueAdmin(admin.ModelAdmin):
     """Admin interface for Venue model."""
 
-    list_display = ["public_id", "name", "get_city", "get_country"]
+    list_display = [
+        "public_id",
+        "name",
+        "get_city",
+        "get_country",
+        "capacity",
+        "get_recent_activities",
+        "get_recent_occupancy",
+    ]
     list_display_links = ["public_id", "name"]
     search_fields = [
         "public_id",
@@ -17,6 +29,7 @@ class VenueAdmin(admin.ModelAdmin):
         "address__country",
     ]
     list_filter = ["address__country", "address__city"]
+    list_select_related = ["address"]
     list_per_page = 50
     ordering = ["name"]
     save_on_top = True
@@ -46,6 +59,12 @@ class VenueAdmin(admin.ModelAdmin):
     # searchable dropdown instead of loading all addresses.
     autocomplete_fields = ["address"]
 
+    def get_queryset(self, request):
+        """Annotate recent utilization, so columns do not query per row."""
+        return annotate_recent_activity(
+            super().get_queryset(request), days=RECENT_ACTIVITY_DAYS
+        )
+
     @admin.display(description="City")
     def get_city(self, obj):
         """Display the city from the related address."""
@@ -55,3 +74,18 @@ class VenueAdmin(admin.ModelAdmin):
     def get_country(self, obj):
         """Display the country from the related address."""
         return obj.address.country if obj.address else "-"
+
+    @admin.display(
+        description=f"Activities ({RECENT_ACTIVITY_DAYS} days)",
+        ordering="recent_activities",
+    )
+    def get_recent_activities(self, obj):
+        """Display the number of activities held recently at the venue."""
+        return obj.recent_activities
+
+    @admin.display(description=f"Avg. occupancy ({RECENT_ACTIVITY_DAYS} days)")
+    def get_recent_occupancy(self, obj):
+        """Display the average head-count of recent activities over capacity."""
+        if not obj.recent_activities or not obj.capacity:
+            return "-"
+        return f"{obj.recent_headcount / obj.recent_activities / obj.capacity:.1%}"
@@ -1,10 +1,24 @@
 # inventory/api.py
+from core.deletion import delete_response
+from core.exports import export_response
 from core.models import Address
+from core.schemas import ExportFilter, SyncFilter, SyncOut
+from core.sync import sync_page
+from django.db.models import F
+from django.http import HttpResponse
 from django.shortcuts import get_object_or_404
-from ninja import Router
+from ninja import Query, Router
 
 from inventory.models import Venue
-from inventory.schemas import VenueIn, VenueListOut, VenueOut, VenuePatch
+from inventory.schemas import (
+    UtilizationFilter,
+    VenueIn,
+    VenueListOut,
+    VenueOut,
+    VenuePatch,
+    VenueUtilizationOut,
+)
+from inventory.utilization import venue_utilization
 
 router = Router()
 
@@ -19,6 +33,54 @@ def list_venues(request):
     return Venue.objects.select_related("address").all()
 
 
+@router.get("/venues/sync", response=SyncOut[VenueListOut], tags=["Venues"])
+def sync_venues(request, filters: Query[SyncFilter]):
+    """
+    List the venues created, updated or deleted since the previous sync.
+
+    Pass the `next_token` of each response as `updated_since` in the next
+    request; deleted venues are returned by public ID only.
+    """
+    return sync_page(
+        Venue.all_objects.select_related("address"),
+        filters.updated_since,
+        filters.limit,
+    )
+
+
+@router.get("/venues/export", tags=["Venues"])
+def export_venues(request, filters: Query[ExportFilter]):
+    """Stream every venue as NDJSON or CSV (gzipped if accepted)."""
+    return export_response(
+        request,
+        Venue.objects.all(),
+        [
+            "public_id",
+            "name",
+            "venue_type",
+            "capacity",
+            "indoor",
+            "created_at",
+            "updated_at",
+        ],
+        {"address_public_id": F("address__public_id")},
+        filters.format,
+        "venues",
+    )
+
+
+@router.get("/venues/utilization", response=list[VenueUtilizationOut], tags=["Venues"])
+def list_venue_utilization(request, filters: Query[UtilizationFilter]):
+    """
+    Report how busy every venue is, per week or month.
+
+    For each period: number of competitions and trainings, athlete head-count
+    compared with the venue capacity, and the busiest day. Reports are cached
+    until an activity, its list of athletes or a venue changes.
+    """
+    return venue_utilization(filters.period, None, filters.start, filters.end)
+
+
 @router.get("/venues/{public_id}", response=VenueOut, tags=["Venues"])
 def get_venue(request, public_id: str):
     """
@@ -36,6 +98,32 @@ def get_venue(request, public_id: str):
     return venue
 
 
+@router.get(
+    "/venues/{public_id}/utilization", response=VenueUtilizationOut, tags=["Venues"]
+)
+def get_venue_utilization(request, public_id: str, filters: Query[UtilizationFilter]):
+    """
+    Report how busy a venue is, per week or month.
+
+    Args:
+        public_id: The unique public identifier for the venue
+        filters: Period length and optional date range
+
+    Returns:
+        The venue utilization, without periods if it hosted no activity
+    """
+    venue = get_object_or_404(Venue, public_id=public_id)
+    report = venue_utilization(filters.period, venue.pk, filters.start, filters.end)
+    if report:
+        return report[0]
+    return {
+        "venue": venue,
+        "capacity": venue.capacity,
+        "indoor": venue.indoor,
+        "periods": [],
+    }
+
+
 @router.post("/venues", response={201: VenueOut}, tags=["Venues"])
 def create_venue(request, payload: VenueIn):
     """
@@ -116,16 +204,19 @@ def partial_update_venue(request, public_id: str, payload: VenuePatch):
 
 
 @router.delete("/venues/{public_id}", response={204: None}, tags=["Venues"])
-def delete_venue(request, public_id: str):
+def delete_venue(request, response: HttpResponse, public_id: str, purge: bool = False):
     """
-    Permanently delete a venue.
+    Soft-delete a venue, or permanently delete it with `purge=true`.
+
+    Activities held at a soft-deleted venue keep the reference, so it is
+    intact after a restore. Purging sets their venue to null.
 
     Args:
         public_id: The unique public identifier for the venue
+        purge: Permanently delete the venue, even if already soft-deleted
 
     Returns:
-        204 No Content on successful deletion
+        204 No Content on successful deletion, with the soft-delete timestamp
+        in the X-Deleted-At header
     """
-    venue = get_object_or_404(Venue, public_id=public_id)
-    venue.delete()
-    return 204, None
+    return delete_response(response, Venue, public_id, purge)
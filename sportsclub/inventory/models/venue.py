@@ -1,7 +1,7 @@
 # inventory/models/venue.py
 from core.models import Address, Auditory
+from core.models.fields import NanoidField
 from django.db import models
-from nanoid_field import NanoidField
 
 
 class VenueType(models.TextChoices):
@@ -32,6 +32,10 @@ class Venue(Auditory):
     class Meta:
         verbose_name = "Venue"
         verbose_name_plural = "Venues"
+        indexes = [
+            # Range scans of the delta sync (see `core.sync`)
+            models.Index(fields=["updated_at", "id"], name="inventory_venue_sync"),
+        ]
 
     def __str__(self) -> str:
         return self.name
@@ -1,8 +1,11 @@
 # inventory/schemas.py
-from core.schemas import AddressOut
+from datetime import date
+
+from core.schemas import AddressOut, resolve_live
 from ninja import Field, Schema
 
 from inventory.models import VenueType
+from inventory.utilization import Period
 
 
 class VenueRef(Schema):
@@ -51,6 +54,41 @@ class VenueOut(Schema):
     address: AddressOut | None
     indoor: bool
 
-    @staticmethod
-    def resolve_address(obj):
-        return obj.address if obj.address else None
+    resolve_address = resolve_live("address")
+
+
+class UtilizationFilter(Schema):
+    """Query parameters of venue utilization reports."""
+
+    period: Period = Field(Period.MONTH, description="Break down by week or month")
+    start: date | None = Field(None, description="First day to report on")
+    end: date | None = Field(None, description="Last day to report on")
+
+
+class UtilizationPeriodOut(Schema):
+    """Activities held at a venue during a week or a month."""
+
+    period_start: date
+    activities: int
+    competitions: int
+    trainings: int
+    headcount: int = Field(..., description="Athletes summed over all activities")
+    average_headcount: float
+    peak_headcount: int = Field(..., description="Athletes in the busiest activity")
+    average_occupancy: float | None = Field(
+        ..., description="Average head-count over capacity, if known"
+    )
+    peak_occupancy: float | None = Field(
+        ..., description="Peak head-count over capacity, if known"
+    )
+    peak_day: date = Field(..., description="Day with the most activities")
+    peak_day_activities: int
+
+
+class VenueUtilizationOut(Schema):
+    """Utilization of a venue, period by period."""
+
+    venue: VenueRef
+    capacity: int | None
+    indoor: bool
+    periods: list[UtilizationPeriodOut]
@@ -0,0 +1,26 @@
+# inventory/signals.py
+"""Signal handlers keeping derived inventory data up to date."""
+
+from core import events, imports
+from core.deletion import pre_cascade_update
+from core.imports import post_import
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from inventory import utilization
+from inventory.models import Venue
+from inventory.schemas import VenueIn
+
+events.register(Venue, "venues")
+imports.register(Venue, "venues", VenueIn)
+
+
+# Reports embed the name and capacity of venues. Activities are handled by the
+# scheduling app, which owns them.
+@receiver(post_save, sender=Venue)
+@receiver(post_delete, sender=Venue)
+@receiver(pre_cascade_update, sender=Venue)
+@receiver(post_import, sender=Venue)
+def invalidate_utilization_on_venue_change(sender, **kwargs):
+    transaction.on_commit(utilization.invalidate)
@@ -0,0 +1,169 @@
+# inventory/tests/test_api_venue_utilization.py
+"""API integration tests for venue utilization reports."""
+
+from datetime import UTC, date, datetime, timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from people.models import Athlete
+from scheduling.models import Competition, Season, Training
+
+from inventory.models import Venue
+
+
+class VenueUtilizationAPITestCase(TestCase):
+    """Test suite for venue utilization endpoints."""
+
+    def setUp(self):
+        """Set up sample data before each test."""
+        cache.clear()
+        self.season = Season.objects.create(
+            name="2024-2025 Season",
+            start_date=date(2024, 9, 1),
+            end_date=date(2025, 6, 30),
+        )
+        self.venue = Venue.objects.create(name="Palau Blaugrana", capacity=4)
+        self.athletes = [
+            Athlete.objects.create(
+                first_name="Athlete",
+                last_name=str(number),
+                email=f"athlete{number}@example.com",
+            )
+            for number in range(4)
+        ]
+        # Two trainings on Monday 3 March, one on Wednesday 5 March
+        for day, hour, athletes in (
+            (3, 8, self.athletes[:2]),
+            (3, 18, self.athletes[:1]),
+            (5, 8, self.athletes),
+        ):
+            training = Training.objects.create(
+                name="Session",
+                date=datetime(2025, 3, day, hour, 0, tzinfo=UTC),
+                season=self.season,
+                venue=self.venue,
+            )
+            training.athletes.set(athletes)
+        self.competition = Competition.objects.create(
+            name="Spring Championship",
+            date=datetime(2025, 4, 15, 10, 0, tzinfo=UTC),
+            season=self.season,
+            venue=self.venue,
+        )
+        self.url = f"/api/v1/inventory/venues/{self.venue.public_id}/utilization"
+
+    def test_venue_utilization_by_month(self):
+        """Test GET /api/v1/inventory/venues/{public_id}/utilization."""
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data["venue"]["public_id"], self.venue.public_id)
+        self.assertEqual(data["capacity"], 4)
+
+        march, april = data["periods"]
+        self.assertEqual(march["period_start"], "2025-03-01")
+        self.assertEqual(march["activities"], 3)
+        self.assertEqual(march["trainings"], 3)
+        self.assertEqual(march["competitions"], 0)
+        self.assertEqual(march["headcount"], 7)
+        self.assertEqual(march["peak_headcount"], 4)
+        self.assertEqual(march["peak_occupancy"], 1.0)
+        self.assertAlmostEqual(march["average_occupancy"], 7 / 3 / 4, places=4)
+        self.assertEqual(march["peak_day"], "2025-03-03")
+        self.assertEqual(march["peak_day_activities"], 2)
+
+        self.assertEqual(april["competitions"], 1)
+        self.assertEqual(april["headcount"], 0)
+
+    def test_venue_utilization_by_week(self):
+        """Test breaking the report down by week, starting on Monday."""
+        response = self.client.get(self.url, {"period": "week", "end": "2025-03-31"})
+        self.assertEqual(response.status_code, 200)
+        periods = response.json()["periods"]
+        self.assertEqual(len(periods), 1)
+        self.assertEqual(periods[0]["period_start"], "2025-03-03")
+        self.assertEqual(periods[0]["activities"], 3)
+
+    def test_venue_utilization_without_activities(self):
+        """Test the report of a venue that hosted no activity."""
+        venue = Venue.objects.create(name="Camp Nou")
+        response = self.client.get(
+            f"/api/v1/inventory/venues/{venue.public_id}/utilization"
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["periods"], [])
+
+    def test_list_venue_utilization(self):
+        """Test GET /api/v1/inventory/venues/utilization."""
+        response = self.client.get(
+            "/api/v1/inventory/venues/utilization", {"start": "2025-04-01"}
+        )
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(len(data), 1)
+        self.assertEqual(len(data[0]["periods"]), 1)
+
+    def test_cache_invalidated_on_roster_change(self):
+        """Test that reports are refreshed when activities change."""
+        self.client.get(self.url)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.competition.athletes.set(self.athletes)
+        april = self.client.get(self.url).json()["periods"][1]
+        self.assertEqual(april["headcount"], 4)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.competition.soft_delete()
+        self.assertEqual(len(self.client.get(self.url).json()["periods"]), 1)
+
+
+class VenueAdminTestCase(TestCase):
+    """Test suite for the utilization columns of the venue admin."""
+
+    def setUp(self):
+        """Set up sample data before each test."""
+        user = get_user_model().objects.create_superuser(
+            "admin", "admin@example.com", "password"
+        )
+        self.client.force_login(user)
+        self.season = Season.objects.create(
+            name="2024-2025 Season",
+            start_date=date(2024, 9, 1),
+            end_date=date(2025, 6, 30),
+        )
+
+    def _add_venue(self, number):
+        venue = Venue.objects.create(name=f"Venue {number}", capacity=10)
+        training = Training.objects.create(
+            name="Session",
+            date=timezone.now() - timedelta(days=1),
+            season=self.season,
+            venue=venue,
+        )
+        training.athletes.add(
+            Athlete.objects.create(
+                first_name="Athlete",
+                last_name=str(number),
+                email=f"athlete{number}@example.com",
+            )
+        )
+
+    def _changelist_queries(self):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get("/admin/inventory/venue/")
+        self.assertEqual(response.status_code, 200)
+        return len(context.captured_queries), response
+
+    def test_changelist_does_not_query_per_row(self):
+        """Test that the number of queries does not grow with the venues."""
+        self._add_venue(0)
+        queries, response = self._changelist_queries()
+        self.assertContains(response, "10.0%")
+
+        for number in range(1, 5):
+            self._add_venue(number)
+        self.assertEqual(self._changelist_queries()[0], queries)
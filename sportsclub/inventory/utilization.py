@@ -0,0 +1,225 @@
+# inventory/utilization.py
+"""
+Venue utilization: how busy each venue is, per week or month.
+
+Reports are computed by Postgres with `date_trunc()` over the competitions and
+trainings held at each venue, and cached in a single `core.cache` namespace
+that is bumped whenever an activity, its list of athletes or a venue changes.
+Activities live in the scheduling app, which depends on this one, so their
+models are looked up lazily.
+"""
+
+from datetime import date, timedelta
+from enum import StrEnum
+
+from core import cache
+from django.apps import apps
+from django.conf import settings
+from django.db import connection
+from django.db.models import Count, F, IntegerField, OuterRef, QuerySet, Subquery
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from inventory.models import Venue
+
+CACHE_NAMESPACE = "venue-utilization"
+
+ACTIVITY_MODELS = (("Competition", "competition"), ("Training", "training"))
+
+
+class Period(StrEnum):
+    """Length of the periods a utilization report is broken down into."""
+
+    WEEK = "week"
+    MONTH = "month"
+
+
+def invalidate():
+    """Drop every cached utilization report."""
+    cache.bump_version(CACHE_NAMESPACE)
+
+
+def _occupancy(headcount: float | None, capacity: int | None) -> float | None:
+    if headcount is None or not capacity:
+        return None
+    return round(headcount / capacity, 4)
+
+
+def compute_utilization(
+    period: Period,
+    venue_id: int | None = None,
+    start: date | None = None,
+    end: date | None = None,
+) -> list[dict]:
+    """
+    Count activities and athletes per venue and period.
+
+    Args:
+        period: Break the report down by week (starting on Monday) or month
+        venue_id: Only report on this venue
+        start: Only count activities on or after this day
+        end: Only count activities on or before this day
+
+    Returns:
+        One dictionary per venue with at least one activity, ordered by name,
+        holding the list of periods in chronological order
+    """
+    qn = connection.ops.quote_name
+    conditions, params = ["a.deleted_at IS NULL", "a.venue_id IS NOT NULL"], []
+    if venue_id is not None:
+        conditions.append("a.venue_id = %s")
+        params.append(venue_id)
+    if start is not None:
+        conditions.append("(a.date AT TIME ZONE %s)::date >= %s")
+        params += [settings.TIME_ZONE, start]
+    if end is not None:
+        conditions.append("(a.date AT TIME ZONE %s)::date <= %s")
+        params += [settings.TIME_ZONE, end]
+
+    selects, select_params = [], []
+    for model_name, kind in ACTIVITY_MODELS:
+        model = apps.get_model("scheduling", model_name)
+        through = model.athletes.through
+        selects.append(
+            f"""
+            SELECT a.venue_id, '{kind}' AS kind,
+                   (a.date AT TIME ZONE %s) AS local_date,
+                   (SELECT COUNT(*) FROM {qn(through._meta.db_table)} t
+                    WHERE t.{kind}_id = a.id) AS headcount
+            FROM {qn(model._meta.db_table)} a
+            WHERE {" AND ".join(conditions)}
+            """
+        )
+        select_params += [settings.TIME_ZONE, *params]
+
+    # `period` is validated by `Period`, so it can be inlined in the SQL
+    sql = f"""
+        WITH activities AS ({" UNION ALL ".join(selects)}),
+        days AS (
+            SELECT venue_id, DATE_TRUNC('{period}', local_date) AS period,
+                   local_date::date AS day, COUNT(*) AS activities,
+                   SUM(headcount) AS headcount
+            FROM activities
+            GROUP BY 1, 2, 3
+        ),
+        peaks AS (
+            SELECT DISTINCT ON (venue_id, period) venue_id, period, day, activities
+            FROM days
+            ORDER BY venue_id, period, activities DESC, headcount DESC, day
+        )
+        SELECT v.public_id, v.name, v.capacity, v.indoor,
+               a.period::date,
+               COUNT(*),
+               COUNT(*) FILTER (WHERE a.kind = 'competition'),
+               COUNT(*) FILTER (WHERE a.kind = 'training'),
+               SUM(a.headcount),
+               AVG(a.headcount)::float8,
+               MAX(a.headcount),
+               p.day, p.activities
+        FROM (
+            SELECT venue_id, kind, headcount,
+                   DATE_TRUNC('{period}', local_date) AS period
+            FROM activities
+        ) AS a
+        JOIN peaks p ON p.venue_id = a.venue_id AND p.period = a.period
+        JOIN {qn(Venue._meta.db_table)} v ON v.id = a.venue_id
+        WHERE v.deleted_at IS NULL
+        GROUP BY v.id, a.period, p.day, p.activities
+        ORDER BY v.name, v.id, a.period
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(sql, select_params)
+        rows = cursor.fetchall()
+
+    venues = []
+    for (
+        public_id,
+        name,
+        capacity,
+        indoor,
+        period_start,
+        activities,
+        competitions,
+        trainings,
+        headcount,
+        average_headcount,
+        peak_headcount,
+        peak_day,
+        peak_day_activities,
+    ) in rows:
+        if not venues or venues[-1]["venue"]["public_id"] != public_id:
+            venues.append(
+                {
+                    "venue": {"public_id": public_id, "name": name},
+                    "capacity": capacity,
+                    "indoor": indoor,
+                    "periods": [],
+                }
+            )
+        venues[-1]["periods"].append(
+            {
+                "period_start": period_start,
+                "activities": activities,
+                "competitions": competitions,
+                "trainings": trainings,
+                "headcount": headcount,
+                "average_headcount": average_headcount,
+                "peak_headcount": peak_headcount,
+                "average_occupancy": _occupancy(average_headcount, capacity),
+                "peak_occupancy": _occupancy(peak_headcount, capacity),
+                "peak_day": peak_day,
+                "peak_day_activities": peak_day_activities,
+            }
+        )
+    return venues
+
+
+def venue_utilization(
+    period: Period,
+    venue_id: int | None = None,
+    start: date | None = None,
+    end: date | None = None,
+) -> list[dict]:
+    """Return a utilization report, from the cache when possible."""
+    return cache.get_or_set(
+        CACHE_NAMESPACE,
+        (period, venue_id or "all", start, end),
+        lambda: compute_utilization(period, venue_id, start, end),
+        timeout=None,
+    )
+
+
+def annotate_recent_activity(queryset: QuerySet, days: int = 30) -> QuerySet:
+    """
+    Annotate venues with their activities and head-count over the last days.
+
+    Adds `recent_activities` and `recent_headcount`, computed with correlated
+    subqueries so a page of venues is annotated in a single query.
+    """
+    since = timezone.now() - timedelta(days=days)
+    annotations = {}
+    for model_name, kind in ACTIVITY_MODELS:
+        recent = (
+            apps.get_model("scheduling", model_name)
+            .objects.filter(venue=OuterRef("pk"), date__gte=since)
+            .order_by()
+            .values("venue")
+        )
+        annotations[f"_{kind}_count"] = Coalesce(
+            Subquery(
+                recent.annotate(count=Count("pk")).values("count"),
+                output_field=IntegerField(),
+            ),
+            0,
+        )
+        annotations[f"_{kind}_headcount"] = Coalesce(
+            Subquery(
+                recent.annotate(count=Count("athletes")).values("count"),
+                output_field=IntegerField(),
+            ),
+            0,
+        )
+    return queryset.annotate(**annotations).annotate(
+        recent_activities=F("_competition_count") + F("_training_count"),
+        recent_headcount=F("_competition_headcount") + F("_training_headcount"),
+    )
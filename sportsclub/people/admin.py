@@ -1,9 +1,17 @@
 # people/admin.py
 from django.contrib import admin
 
+from .anonymisation import anonymise
 from .models import Athlete, Coach
 
 
+@admin.action(description="Anonymise selected people (cannot be undone)")
+def anonymise_selected(modeladmin, request, queryset):
+    """Scrub the personal fields of the selected people."""
+    count = sum(anonymise(queryset))
+    modeladmin.message_user(request, f"{count} people anonymised.")
+
+
 @admin.register(Coach)
 class CoachAdmin(admin.ModelAdmin):
     """Admin interface for Coach model."""
@@ -28,6 +36,7 @@ class CoachAdmin(admin.ModelAdmin):
     list_per_page = 50
     ordering = ["last_name", "first_name"]
     save_on_top = True
+    actions = [anonymise_selected]
 
     fieldsets = (
         (
@@ -54,14 +63,20 @@ class CoachAdmin(admin.ModelAdmin):
         (
             "System information",
             {
-                "fields": ("id", "public_id", "created_at", "updated_at"),
+                "fields": (
+                    "id",
+                    "public_id",
+                    "created_at",
+                    "updated_at",
+                    "anonymised_at",
+                ),
                 "classes": ("collapse",),
                 "description": "Read-only system fields",
             },
         ),
     )
 
-    readonly_fields = ["id", "public_id", "created_at", "updated_at"]
+    readonly_fields = ["id", "public_id", "created_at", "updated_at", "anonymised_at"]
     autocomplete_fields = ["address"]
 
     @admin.display(description="Name")
@@ -102,6 +117,7 @@ class AthleteAdmin(admin.ModelAdmin):
     list_per_page = 50
     ordering = ["last_name", "first_name"]
     save_on_top = True
+    actions = [anonymise_selected]
 
     fieldsets = (
         (
@@ -128,14 +144,20 @@ class AthleteAdmin(admin.ModelAdmin):
         (
             "System information",
             {
-                "fields": ("id", "public_id", "created_at", "updated_at"),
+                "fields": (
+                    "id",
+                    "public_id",
+                    "created_at",
+                    "updated_at",
+                    "anonymised_at",
+                ),
                 "classes": ("collapse",),
                 "description": "Read-only system fields",
             },
         ),
     )
 
-    readonly_fields = ["id", "public_id", "created_at", "updated_at"]
+    readonly_fields = ["id", "public_id", "created_at", "updated_at", "anonymised_at"]
     autocomplete_fields = ["address"]
 
     @admin.display(description="Name")
@@ -0,0 +1,300 @@
+# people/analytics.py
+"""
+Vectorised statistics on the physical metrics of athletes.
+
+Heights, weights and birth years are loaded once into NumPy arrays (a
+"snapshot") that is kept in process memory and reused until an `Athlete` is
+written, which bumps the version of the `athlete-metrics` cache namespace.
+Rows are streamed with `COPY ... TO STDOUT` and parsed by NumPy directly, so
+no Python object is created per athlete, neither when loading nor when
+computing statistics.
+"""
+
+import io
+import threading
+from dataclasses import dataclass
+from datetime import date
+from enum import StrEnum
+
+import numpy as np
+from core import cache
+from core.models.enums import AgeCategory
+from django.apps import apps
+from django.db import connection
+
+from people.models import Athlete
+
+CACHE_NAMESPACE = "athlete-metrics"
+
+PERCENTILES = (10, 25, 50, 75, 90)
+
+# Histogram bin edges: BMI in kg/m², age in years
+BMI_BIN_EDGES = np.arange(10, 42, 2)
+AGE_BIN_EDGES = np.arange(4, 82, 2)
+
+# Upper age limits of the categories, in the order of `AgeCategory`
+AGE_CATEGORY_LIMITS = np.array([10, 12, 14, 16, 18, 20])
+
+
+class GroupBy(StrEnum):
+    """Ways of grouping athletes when computing their metrics."""
+
+    ALL = "all"
+    SEASON = "season"
+    VENUE = "venue"
+    AGE_CATEGORY = "age_category"
+
+
+@dataclass(frozen=True)
+class MetricsSnapshot:
+    """Physical metrics of all live athletes, as arrays sorted by athlete ID."""
+
+    ids: np.ndarray
+    height: np.ndarray
+    weight: np.ndarray
+    birth_year: np.ndarray
+
+    @property
+    def bmi(self) -> np.ndarray:
+        """Body mass index, NaN where height or weight is unknown."""
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return self.weight / (self.height / 100) ** 2
+
+    def positions_of(self, athlete_ids: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Map athlete IDs to positions in the arrays.
+
+        Returns:
+            The positions, and a mask telling which IDs are known (athletes
+            soft-deleted after their participation are not)
+        """
+        if not len(self.ids):
+            # Both of the length of the IDs, so the mask can index the positions
+            unknown = np.zeros(len(athlete_ids), dtype=bool)
+            return np.zeros(len(athlete_ids), dtype=np.intp), unknown
+        positions = np.searchsorted(self.ids, athlete_ids)
+        positions = np.minimum(positions, len(self.ids) - 1)
+        return positions, self.ids[positions] == athlete_ids
+
+
+_snapshot_lock = threading.Lock()
+_snapshot: tuple[int, MetricsSnapshot] | None = None
+
+
+def _copy_to_array(sql: str, params: list, columns: int) -> np.ndarray:
+    """Run a query through `COPY` and parse its CSV output as a float matrix."""
+    buffer = io.StringIO()
+    with connection.cursor() as cursor:
+        query = cursor.mogrify(sql, params).decode()
+        cursor.copy_expert(
+            f"COPY ({query}) TO STDOUT WITH (FORMAT csv, NULL 'nan')", buffer
+        )
+    if not buffer.tell():
+        return np.empty((0, columns))
+    buffer.seek(0)
+    return np.loadtxt(buffer, delimiter=",", dtype=np.float64, ndmin=2)
+
+
+def _load_snapshot() -> MetricsSnapshot:
+    table = connection.ops.quote_name(Athlete._meta.db_table)
+    rows = _copy_to_array(
+        f"""
+        SELECT id, height::float8, weight::float8,
+               EXTRACT(YEAR FROM date_of_birth)::float8
+        FROM {table}
+        WHERE deleted_at IS NULL
+        ORDER BY id
+        """,
+        [],
+        columns=4,
+    )
+    return MetricsSnapshot(
+        ids=rows[:, 0].astype(np.int64),
+        height=rows[:, 1],
+        weight=rows[:, 2],
+        birth_year=rows[:, 3],
+    )
+
+
+def get_snapshot() -> MetricsSnapshot:
+    """Return the metrics snapshot, reloading it if athletes have changed."""
+    global _snapshot
+
+    version = cache.get_version(CACHE_NAMESPACE)
+    current = _snapshot
+    if current is not None and current[0] == version:
+        return current[1]
+
+    with _snapshot_lock:
+        if _snapshot is None or _snapshot[0] != version:
+            _snapshot = (version, _load_snapshot())
+        return _snapshot[1]
+
+
+def invalidate_snapshot():
+    """Discard the snapshot of every process sharing the cache."""
+    cache.bump_version(CACHE_NAMESPACE)
+
+
+def _memberships(group_by: GroupBy, season_id: int | None) -> np.ndarray:
+    """
+    Return distinct (group ID, athlete ID) pairs of a season or venue grouping.
+
+    Athletes belong to a season, or to a venue, when they take part in any of
+    its competitions or trainings.
+    """
+    qn = connection.ops.quote_name
+    group_column = "season_id" if group_by == GroupBy.SEASON else "venue_id"
+    selects, params = [], []
+    for model_name in ("Competition", "Training"):
+        model = apps.get_model("scheduling", model_name)
+        through = model.athletes.through
+        condition = "a.deleted_at IS NULL"
+        if group_by == GroupBy.VENUE:
+            condition += " AND a.venue_id IS NOT NULL"
+        if season_id is not None:
+            condition += " AND a.season_id = %s"
+            params.append(season_id)
+        selects.append(
+            f"""
+            SELECT a.{group_column}::float8, t.athlete_id::float8
+            FROM {qn(through._meta.db_table)} t
+            JOIN {qn(model._meta.db_table)} a ON a.id = t.{model_name.lower()}_id
+            WHERE {condition}
+            """
+        )
+    return _copy_to_array(" UNION ".join(selects), params, columns=2)
+
+
+def _group_labels(group_by: GroupBy, group_ids: np.ndarray) -> dict[int, tuple]:
+    if group_by == GroupBy.SEASON:
+        model = apps.get_model("scheduling", "Season")
+    else:
+        model = apps.get_model("inventory", "Venue")
+    return {
+        pk: (public_id, name)
+        for pk, public_id, name in model.objects.filter(
+            pk__in=group_ids.tolist()
+        ).values_list("pk", "public_id", "name")
+    }
+
+
+def summarize(values: np.ndarray) -> dict:
+    """Count, mean, spread and percentiles of the known (non-NaN) values."""
+    known = values[~np.isnan(values)]
+    if not len(known):
+        return {"count": 0}
+
+    percentiles = np.percentile(known, PERCENTILES)
+    summary = {
+        "count": int(len(known)),
+        "mean": float(known.mean()),
+        "std": float(known.std()),
+        "min": float(known.min()),
+        "max": float(known.max()),
+    }
+    summary.update(
+        {
+            f"p{p}": float(value)
+            for p, value in zip(PERCENTILES, percentiles, strict=True)
+        }
+    )
+    return summary
+
+
+def histogram(values: np.ndarray, edges: np.ndarray) -> dict:
+    """Histogram of the known values, clipped to the outer edges."""
+    known = values[~np.isnan(values)]
+    counts, _ = np.histogram(np.clip(known, edges[0], edges[-1]), bins=edges)
+    return {"edges": edges.tolist(), "counts": counts.tolist()}
+
+
+def _group_stats(
+    key: str, label: str, snapshot: MetricsSnapshot, indices, reference_year: int
+) -> dict:
+    ages = reference_year - snapshot.birth_year[indices]
+    bmi = snapshot.bmi[indices]
+    return {
+        "key": key,
+        "label": label,
+        "athletes": int(len(indices)),
+        "height": summarize(snapshot.height[indices]),
+        "weight": summarize(snapshot.weight[indices]),
+        "bmi": summarize(bmi),
+        "age": summarize(ages),
+        "bmi_histogram": histogram(bmi, BMI_BIN_EDGES),
+        "age_histogram": histogram(ages, AGE_BIN_EDGES),
+    }
+
+
+def athlete_metrics(
+    group_by: GroupBy, season_id: int | None = None, reference_year: int | None = None
+) -> list[dict]:
+    """
+    Compute statistics of height, weight, BMI and age per group of athletes.
+
+    Args:
+        group_by: How to group athletes
+        season_id: Only consider athletes taking part in this season
+        reference_year: Year ages are computed for (defaults to the current one)
+
+    Returns:
+        One dictionary of statistics per group, ordered by group
+    """
+    snapshot = get_snapshot()
+    reference_year = reference_year or date.today().year
+
+    if season_id is None or group_by in (GroupBy.SEASON, GroupBy.VENUE):
+        roster = np.arange(len(snapshot.ids))
+    else:
+        pairs = _memberships(GroupBy.SEASON, season_id)
+        positions, known = snapshot.positions_of(pairs[:, 1].astype(np.int64))
+        roster = np.unique(positions[known])
+
+    if group_by == GroupBy.ALL:
+        return [_group_stats("all", "All athletes", snapshot, roster, reference_year)]
+
+    if group_by == GroupBy.AGE_CATEGORY:
+        ages = reference_year - snapshot.birth_year[roster]
+        # NaN ages (unknown date of birth) fall past the last limit; they are
+        # told apart from seniors below.
+        positions = np.searchsorted(AGE_CATEGORY_LIMITS, ages, side="right")
+        positions[np.isnan(ages)] = len(AGE_CATEGORY_LIMITS) + 1
+        categories = list(AgeCategory)
+        groups = []
+        for position in np.unique(positions):
+            category = categories[position]
+            groups.append(
+                _group_stats(
+                    category.value,
+                    category.value.upper(),
+                    snapshot,
+                    roster[positions == position],
+                    reference_year,
+                )
+            )
+        return groups
+
+    pairs = _memberships(group_by, season_id)
+    group_ids = pairs[:, 0].astype(np.int64)
+    athlete_ids = pairs[:, 1].astype(np.int64)
+
+    # Drop memberships of soft-deleted athletes, then sort pairs by group so
+    # each group is a contiguous slice of positions.
+    positions, known = snapshot.positions_of(athlete_ids)
+    group_ids, positions = group_ids[known], positions[known]
+    order = np.argsort(group_ids, kind="stable")
+    group_ids, positions = group_ids[order], positions[order]
+    unique_ids, starts = np.unique(group_ids, return_index=True)
+    if not len(unique_ids):
+        # np.split() would still return one, empty, group
+        return []
+
+    labels = _group_labels(group_by, unique_ids)
+    groups = []
+    for group_id, members in zip(
+        unique_ids, np.split(positions, starts[1:]), strict=True
+    ):
+        public_id, name = labels.get(int(group_id), (str(group_id), ""))
+        groups.append(_group_stats(public_id, name, snapshot, members, reference_year))
+    return groups
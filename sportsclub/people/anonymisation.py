@@ -0,0 +1,114 @@
+# people/anonymisation.py
+"""
+GDPR anonymisation of athletes and coaches.
+
+Personal fields (name, email, phone, date of birth and address) are scrubbed,
+while the rows themselves stay, so results, rankings and activity memberships
+keep pointing at them. People are processed by primary key in chunks, each
+written with one `bulk_update()` in its own transaction, and marked with
+`anonymised_at` in the same write: an interrupted run is resumed by running it
+again over the same selection.
+
+Scrubbed emails are derived from the public ID, which is unique and not
+personal, so the unique index on live emails stays consistent. Addresses left
+without any reference are deleted, as they are personal data too, and the
+personal fields are removed from the change history of the people.
+
+`bulk_update()` sends no signals, so `post_anonymise` is sent after each chunk
+for the caches that embed names to be dropped.
+"""
+
+from collections.abc import Iterator
+
+from core import history
+from core.models import Address
+from django.db import models, transaction
+from django.dispatch import Signal
+from django.utils import timezone
+
+from people.models import Person
+
+SCRUBBED_FIELDS = [
+    "first_name",
+    "last_name",
+    "email",
+    "phone",
+    "date_of_birth",
+    "address",
+    "anonymised_at",
+    "updated_at",
+]
+
+# Fields holding personal data, as the change history records them
+PERSONAL_FIELDS = [
+    "first_name",
+    "last_name",
+    "email",
+    "phone",
+    "date_of_birth",
+    "address_id",
+]
+
+# Sent with `pks`, the primary keys of the people anonymised in a chunk
+post_anonymise = Signal()
+
+
+def anonymous_email(public_id: str) -> str:
+    """Return the placeholder email of an anonymised person."""
+    # The .invalid top-level domain is reserved and never delivers (RFC 2606)
+    return f"anonymised-{public_id.lower()}@example.invalid"
+
+
+def _scrub(person: Person, now):
+    person.first_name = "Anonymous"
+    person.last_name = person._meta.verbose_name.title()
+    person.email = anonymous_email(person.public_id)
+    person.phone = ""
+    person.date_of_birth = None
+    person.address = None
+    person.anonymised_at = now
+    person.updated_at = now
+
+
+def _delete_orphan_addresses(address_ids: set[int]):
+    """Delete the addresses no venue nor person refers to any longer."""
+    unreferenced = models.Q()
+    for relation in Address._meta.related_objects:
+        unreferenced &= models.Q(**{f"{relation.name}__isnull": True})
+    Address.all_objects.filter(unreferenced, pk__in=address_ids).delete()
+
+
+def anonymise(queryset: models.QuerySet, chunk_size: int = 500) -> Iterator[int]:
+    """
+    Anonymise the people of a queryset of athletes or coaches, chunk by chunk.
+
+    People already anonymised are skipped. The generator yields the number of
+    people anonymised after each committed chunk.
+    """
+    model = queryset.model
+    pending = queryset.filter(anonymised_at__isnull=True).order_by("pk")
+    last_pk = 0
+    while True:
+        with transaction.atomic():
+            chunk = list(
+                pending.filter(pk__gt=last_pk)
+                .select_for_update(skip_locked=True)
+                .only("pk", "public_id", "address_id")[:chunk_size]
+            )
+            if not chunk:
+                return
+
+            now = timezone.now()
+            address_ids = {person.address_id for person in chunk} - {None}
+            for person in chunk:
+                _scrub(person, now)
+            model.all_objects.bulk_update(chunk, SCRUBBED_FIELDS)
+            _delete_orphan_addresses(address_ids)
+            history.redact(
+                model, [person.public_id for person in chunk], PERSONAL_FIELDS
+            )
+
+            pks = [person.pk for person in chunk]
+            post_anonymise.send(sender=model, pks=pks)
+        last_pk = pks[-1]
+        yield len(chunk)
@@ -1,9 +1,12 @@
 # people/api/__init__.py
 from ninja import Router
 
+from people.api.analytics import router as analytics_router
 from people.api.athletes import router as athletes_router
 from people.api.coaches import router as coaches_router
 
 router = Router(tags=["people"])
+# Before the athletes router, so "analytics" is not taken for a public ID
+router.add_router("", analytics_router)
 router.add_router("", athletes_router)
 router.add_router("", coaches_router)
@@ -0,0 +1,36 @@
+# people/api/analytics.py
+from datetime import date
+
+from django.apps import apps
+from django.shortcuts import get_object_or_404
+from ninja import Router
+
+from people.analytics import GroupBy, athlete_metrics
+from people.schemas import AthleteMetricsOut
+
+router = Router(tags=["people"])
+
+
+@router.get("/athletes/analytics", response=AthleteMetricsOut)
+def get_athlete_analytics(
+    request, group_by: GroupBy = GroupBy.ALL, season_public_id: str | None = None
+):
+    """
+    Get statistics of the height, weight, BMI and age of athletes.
+
+    When a season is given, only athletes taking part in its competitions or
+    trainings are considered, and ages are computed for the year it starts.
+    """
+    season_id, reference_year = None, date.today().year
+    if season_public_id:
+        season = get_object_or_404(
+            apps.get_model("scheduling", "Season"), public_id=season_public_id
+        )
+        season_id, reference_year = season.pk, season.start_date.year
+
+    return {
+        "group_by": group_by,
+        "season_public_id": season_public_id,
+        "reference_year": reference_year,
+        "groups": athlete_metrics(group_by, season_id, reference_year),
+    }
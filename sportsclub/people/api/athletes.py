@@ -1,9 +1,15 @@
 # people/api.py
 import logging
 
+from core.deletion import delete_response
+from core.exports import export_response
 from core.models import Address
+from core.schemas import ExportFilter, SyncFilter, SyncOut
+from core.sync import sync_page
+from django.db.models import F
+from django.http import HttpResponse
 from django.shortcuts import get_object_or_404
-from ninja import Router
+from ninja import Query, Router
 
 from people.models import Athlete
 from people.schemas import (
@@ -24,6 +30,42 @@ def list_athletes(request):
     return Athlete.objects.all()
 
 
+@router.get("/athletes/sync", response=SyncOut[AthleteListOut])
+def sync_athletes(request, filters: Query[SyncFilter]):
+    """
+    List the athletes created, updated or deleted since the previous sync.
+
+    Pass the `next_token` of each response as `updated_since` in the next
+    request; deleted athletes are returned by public ID only.
+    """
+    return sync_page(Athlete.all_objects.all(), filters.updated_since, filters.limit)
+
+
+@router.get("/athletes/export")
+def export_athletes(request, filters: Query[ExportFilter]):
+    """Stream every athlete as NDJSON or CSV (gzipped if accepted)."""
+    return export_response(
+        request,
+        Athlete.objects.all(),
+        [
+            "public_id",
+            "first_name",
+            "last_name",
+            "email",
+            "phone",
+            "date_of_birth",
+            "height",
+            "weight",
+            "jersey_number",
+            "created_at",
+            "updated_at",
+        ],
+        {"address_public_id": F("address__public_id")},
+        filters.format,
+        "athletes",
+    )
+
+
 @router.get("/athletes/{public_id}", response=AthleteOut)
 def get_athlete(request, public_id: str):
     """Get a single athlete by public ID."""
@@ -82,8 +124,14 @@ def partial_update_athlete(request, public_id: str, payload: AthletePatch):
 
 
 @router.delete("/athletes/{public_id}", response={204: None})
-def delete_athlete(request, public_id: str):
-    """Delete an athlete."""
-    athlete = get_object_or_404(Athlete, public_id=public_id)
-    athlete.delete()
-    return 204, None
+def delete_athlete(
+    request, response: HttpResponse, public_id: str, purge: bool = False
+):
+    """
+    Soft-delete an athlete and their results.
+
+    With `purge=true` it is permanently deleted instead, even if already
+    soft-deleted. The X-Deleted-At header of a soft delete can be posted to
+    /api/v1/core/restore to undo it.
+    """
+    return delete_response(response, Athlete, public_id, purge)
@@ -1,7 +1,13 @@
 # people/api/coaches.py
+from core.deletion import delete_response
+from core.exports import export_response
 from core.models import Address
+from core.schemas import ExportFilter, SyncFilter, SyncOut
+from core.sync import sync_page
+from django.db.models import F
+from django.http import HttpResponse
 from django.shortcuts import get_object_or_404
-from ninja import Router
+from ninja import Query, Router
 
 from people.models import Coach
 from people.schemas import (
@@ -20,6 +26,40 @@ def list_coaches(request):
     return Coach.objects.all()
 
 
+@router.get("/coaches/sync", response=SyncOut[CoachListOut])
+def sync_coaches(request, filters: Query[SyncFilter]):
+    """
+    List the coaches created, updated or deleted since the previous sync.
+
+    Pass the `next_token` of each response as `updated_since` in the next
+    request; deleted coaches are returned by public ID only.
+    """
+    return sync_page(Coach.all_objects.all(), filters.updated_since, filters.limit)
+
+
+@router.get("/coaches/export")
+def export_coaches(request, filters: Query[ExportFilter]):
+    """Stream every coach as NDJSON or CSV (gzipped if accepted)."""
+    return export_response(
+        request,
+        Coach.objects.all(),
+        [
+            "public_id",
+            "first_name",
+            "last_name",
+            "email",
+            "phone",
+            "date_of_birth",
+            "certification",
+            "created_at",
+            "updated_at",
+        ],
+        {"address_public_id": F("address__public_id")},
+        filters.format,
+        "coaches",
+    )
+
+
 @router.get("/coaches/{public_id}", response=CoachOut)
 def get_coach(request, public_id: str):
     """Get a single coach by public ID."""
@@ -77,8 +117,12 @@ def partial_update_coach(request, public_id: str, payload: CoachPatch):
 
 
 @router.delete("/coaches/{public_id}", response={204: None})
-def delete_coach(request, public_id: str):
-    """Delete a coach."""
-    coach = get_object_or_404(Coach, public_id=public_id)
-    coach.delete()
-    return 204, None
+def delete_coach(request, response: HttpResponse, public_id: str, purge: bool = False):
+    """
+    Soft-delete a coach.
+
+    With `purge=true` it is permanently deleted instead, even if already
+    soft-deleted. The X-Deleted-At header of a soft delete can be posted to
+    /api/v1/core/restore to undo it.
+    """
+    return delete_response(response, Coach, public_id, purge)
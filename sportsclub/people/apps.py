@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class PeopleConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "people"
+
+    def ready(self):
+        # Connect signal handlers
+        from people import signals  # noqa: F401
@@ -0,0 +1 @@
+# people/management/__init__.py
@@ -0,0 +1 @@
+# people/management/commands/__init__.py
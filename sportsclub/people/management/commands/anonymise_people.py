@@ -0,0 +1,100 @@
+# people/management/commands/anonymise_people.py
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from people.anonymisation import anonymise
+from people.models import Athlete, Coach
+
+
+class Command(BaseCommand):
+    help = (
+        "Scrub the personal fields of athletes and coaches, keeping their "
+        "participation history. Interrupted runs resume where they stopped "
+        "when run again with the same options."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--athlete",
+            action="append",
+            default=[],
+            metavar="PUBLIC_ID",
+            help="Public ID of an athlete to anonymise (repeatable)",
+        )
+        parser.add_argument(
+            "--coach",
+            action="append",
+            default=[],
+            metavar="PUBLIC_ID",
+            help="Public ID of a coach to anonymise (repeatable)",
+        )
+        parser.add_argument(
+            "--deleted-days",
+            type=int,
+            default=None,
+            help="Anonymise everybody soft-deleted more than this many days ago",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=500,
+            help="People per bulk update and transaction (default: 500)",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only count the people that would be anonymised",
+        )
+
+    def handle(self, *args, **options):
+        if not (
+            options["athlete"]
+            or options["coach"]
+            or options["deleted_days"] is not None
+        ):
+            raise CommandError(
+                "Select people with --athlete, --coach or --deleted-days"
+            )
+        if options["chunk_size"] < 1:
+            raise CommandError("--chunk-size must be positive")
+
+        selections = [
+            self._select(model, public_ids, options["deleted_days"])
+            for model, public_ids in (
+                (Athlete, options["athlete"]),
+                (Coach, options["coach"]),
+            )
+        ]
+        for selected in selections:
+            label = selected.model._meta.verbose_name_plural.lower()
+            if options["dry_run"]:
+                due = selected.filter(anonymised_at__isnull=True).count()
+                self.stdout.write(f"{due} {label} to be anonymised")
+                continue
+
+            done = 0
+            for count in anonymise(selected, options["chunk_size"]):
+                done += count
+                self.stdout.write(f"{label.capitalize()}: {done} anonymised")
+
+        if not options["dry_run"]:
+            self.stdout.write(self.style.SUCCESS("Anonymisation complete"))
+
+    def _select(self, model, public_ids: list[str], deleted_days: int | None):
+        selected = model.all_objects.none()
+        if public_ids:
+            selected = model.all_objects.filter(public_id__in=public_ids)
+            missing = set(public_ids) - set(
+                selected.values_list("public_id", flat=True)
+            )
+            if missing:
+                raise CommandError(
+                    f"Unknown {model._meta.verbose_name.lower()} public IDs: "
+                    f"{', '.join(sorted(missing))}"
+                )
+        if deleted_days is not None:
+            cutoff = timezone.now() - timedelta(days=deleted_days)
+            selected |= model.all_objects.filter(deleted_at__lt=cutoff)
+        return selected
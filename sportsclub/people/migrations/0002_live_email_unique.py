@@ -0,0 +1,32 @@
+# Generated by Django 6.0.2 on 2026-10-19 00:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_apikey_live_key'),
+        ('people', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='athlete',
+            name='email',
+            field=models.EmailField(max_length=254),
+        ),
+        migrations.AlterField(
+            model_name='coach',
+            name='email',
+            field=models.EmailField(max_length=254),
+        ),
+        migrations.AddConstraint(
+            model_name='athlete',
+            constraint=models.UniqueConstraint(condition=models.Q(('deleted_at__isnull', True)), fields=('email',), name='people_athlete_live_email'),
+        ),
+        migrations.AddConstraint(
+            model_name='coach',
+            constraint=models.UniqueConstraint(condition=models.Q(('deleted_at__isnull', True)), fields=('email',), name='people_coach_live_email'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 6.0.2 on 2026-10-19 00:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('people', '0002_live_email_unique'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='athlete',
+            name='anonymised_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='coach',
+            name='anonymised_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 6.0.2 on 2026-10-19 01:05
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    # Build the indexes without blocking writes
+    atomic = False
+
+    dependencies = [
+        ('core', '0005_sync_indexes'),
+        ('people', '0003_person_anonymised_at'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='athlete',
+            index=models.Index(fields=['updated_at', 'id'], name='people_athlete_sync'),
+        ),
+        AddIndexConcurrently(
+            model_name='coach',
+            index=models.Index(fields=['updated_at', 'id'], name='people_coach_sync'),
+        ),
+    ]
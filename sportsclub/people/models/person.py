@@ -1,7 +1,7 @@
 # people/models/person.py
 from core.models import Auditory
+from core.models.fields import NanoidField
 from django.db import models
-from nanoid_field import NanoidField
 
 
 class Person(Auditory):
@@ -11,12 +11,29 @@ class Person(Auditory):
     public_id = NanoidField(unique=True, editable=False, db_index=True)
     first_name = models.CharField(max_length=100)
     last_name = models.CharField(max_length=100)
-    email = models.EmailField(unique=True)
+    email = models.EmailField()
     phone = models.CharField(max_length=20, blank=True)
     date_of_birth = models.DateField(blank=True, null=True)
+    # Set when personal fields were scrubbed (see `people.anonymisation`)
+    anonymised_at = models.DateTimeField(null=True, blank=True, editable=False)
 
     class Meta:
         abstract = True
+        # Emails are unique among live records only, so the email of a
+        # soft-deleted person can be used again.
+        constraints = [
+            models.UniqueConstraint(
+                fields=["email"],
+                condition=models.Q(deleted_at__isnull=True),
+                name="%(app_label)s_%(class)s_live_email",
+            ),
+        ]
+        indexes = [
+            # Range scans of the delta sync (see `core.sync`)
+            models.Index(
+                fields=["updated_at", "id"], name="%(app_label)s_%(class)s_sync"
+            ),
+        ]
 
     address = models.ForeignKey(
         "core.Address", null=True, blank=True, on_delete=models.SET_NULL
@@ -1,4 +1,10 @@
 # people/schemas/__init__.py
+from people.schemas.analytics import (
+    AthleteMetricsGroupOut,
+    AthleteMetricsOut,
+    Histogram,
+    MetricSummary,
+)
 from people.schemas.athletes import (
     AthleteIn,
     AthleteListOut,
@@ -27,4 +33,8 @@ __all__ = [
     "CoachOut",
     "CoachPatch",
     "CoachRef",
+    "AthleteMetricsGroupOut",
+    "AthleteMetricsOut",
+    "Histogram",
+    "MetricSummary",
 ]
@@ -0,0 +1,47 @@
+# people/schemas/analytics.py
+from ninja import Schema
+
+
+class MetricSummary(Schema):
+    """Distribution of a metric over the athletes for whom it is known."""
+
+    count: int
+    mean: float | None = None
+    std: float | None = None
+    min: float | None = None
+    p10: float | None = None
+    p25: float | None = None
+    p50: float | None = None
+    p75: float | None = None
+    p90: float | None = None
+    max: float | None = None
+
+
+class Histogram(Schema):
+    """Counts of values between consecutive bin edges."""
+
+    edges: list[float]
+    counts: list[int]
+
+
+class AthleteMetricsGroupOut(Schema):
+    """Metrics of a group of athletes (a season, a venue, an age category...)."""
+
+    key: str
+    label: str
+    athletes: int
+    height: MetricSummary
+    weight: MetricSummary
+    bmi: MetricSummary
+    age: MetricSummary
+    bmi_histogram: Histogram
+    age_histogram: Histogram
+
+
+class AthleteMetricsOut(Schema):
+    """Height, weight, BMI and age statistics of athletes, per group."""
+
+    group_by: str
+    season_public_id: str | None
+    reference_year: int
+    groups: list[AthleteMetricsGroupOut]
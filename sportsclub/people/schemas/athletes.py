@@ -1,7 +1,7 @@
 # people/schemas/athletes.py
 from datetime import date
 
-from core.schemas import AddressOut
+from core.schemas import AddressOut, resolve_live
 from ninja import Field, Schema
 from pydantic import EmailStr
 
@@ -83,6 +83,4 @@ class AthleteOut(Schema):
     weight: float | None
     jersey_number: int | None
 
-    @staticmethod
-    def resolve_address(obj):
-        return obj.address if obj.address else None
+    resolve_address = resolve_live("address")
@@ -1,7 +1,7 @@
 # people/schemas/coaches.py
 from datetime import date
 
-from core.schemas import AddressOut
+from core.schemas import AddressOut, resolve_live
 from ninja import Field, Schema
 from pydantic import EmailStr
 
@@ -60,6 +60,4 @@ class CoachOut(Schema):
     address: AddressOut | None
     certification: CoachingCertification | None
 
-    @staticmethod
-    def resolve_address(obj):
-        return obj.address if obj.address else None
+    resolve_address = resolve_live("address")
@@ -0,0 +1,48 @@
+# people/signals.py
+"""Signal handlers keeping derived people data up to date."""
+
+from core import events, imports
+from core.deletion import pre_cascade_update
+from core.imports import post_import
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from people.analytics import invalidate_snapshot
+from people.anonymisation import post_anonymise
+from people.models import Athlete, Coach
+from people.schemas import AthleteIn, CoachIn
+
+events.register(Athlete, "athletes")
+events.register(Coach, "coaches")
+imports.register(Athlete, "athletes", AthleteIn)
+imports.register(Coach, "coaches", CoachIn)
+
+
+# Soft deletes and restores go through `save()` and are covered as well.
+# Queryset `update()` and `bulk_update()` bypass signals: callers using them
+# must invalidate the snapshot themselves.
+@receiver(post_save, sender=Athlete)
+def invalidate_metrics_on_athlete_save(sender, instance, **kwargs):
+    transaction.on_commit(invalidate_snapshot)
+
+
+@receiver(post_delete, sender=Athlete)
+def invalidate_metrics_on_athlete_delete(sender, instance, **kwargs):
+    transaction.on_commit(invalidate_snapshot)
+
+
+# Set-based soft deletes and restores (see `core.deletion`), anonymisation and
+# imports
+@receiver(pre_cascade_update, sender=Athlete)
+@receiver(post_anonymise, sender=Athlete)
+@receiver(post_import, sender=Athlete)
+def invalidate_metrics_on_cascade_update(sender, **kwargs):
+    transaction.on_commit(invalidate_snapshot)
+
+
+# `bulk_update()` sends no `post_save`: publish the renames of anonymisation
+@receiver(post_anonymise, sender=Athlete)
+@receiver(post_anonymise, sender=Coach)
+def publish_anonymise(sender, pks, **kwargs):
+    events.publish(sender.all_objects.filter(pk__in=pks), events.Operation.UPDATE)
@@ -0,0 +1,137 @@
+# people/tests/test_anonymisation.py
+"""Tests for the anonymisation of athletes and coaches."""
+
+from datetime import UTC, date, datetime, timedelta
+from io import StringIO
+
+from core.models import Address
+from django.core.cache import cache
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+from django.utils import timezone
+from inventory.models import Venue
+from scheduling.models import Competition, Ranking, Result, Season
+
+from people.anonymisation import anonymise, anonymous_email
+from people.models import Athlete, Coach
+
+
+class AnonymisationTest(TestCase):
+    """Test suite for the anonymisation pipeline."""
+
+    def setUp(self):
+        """Set up test data."""
+        cache.clear()
+        self.home = Address.objects.create(line1="Carrer Major 1", city="Palma")
+        self.shared = Address.objects.create(line1="Passeig Marítim", city="Palma")
+        Venue.objects.create(name="Son Moix", address=self.shared)
+        self.athlete = Athlete.objects.create(
+            first_name="Usain",
+            last_name="Bolt",
+            email="usain.bolt@example.com",
+            phone="+34 600 000 000",
+            date_of_birth=date(2012, 8, 21),
+            address=self.home,
+        )
+        self.coach = Coach.objects.create(
+            first_name="Glen",
+            last_name="Mills",
+            email="glen.mills@example.com",
+            address=self.shared,
+        )
+        self.season = Season.objects.create(
+            name="2024-2025 Season",
+            start_date=date(2024, 9, 1),
+            end_date=date(2025, 6, 30),
+        )
+        competition = Competition.objects.create(
+            name="Spring Championship",
+            date=datetime(2025, 4, 15, 10, 0, tzinfo=UTC),
+            season=self.season,
+        )
+        competition.athletes.add(self.athlete)
+        self.result = Result.objects.create(
+            competition=competition,
+            athlete=self.athlete,
+            discipline="sprints",
+            mark="9.58",
+        )
+        Ranking.refresh_season(self.season.pk)
+
+    def test_anonymise_athlete(self):
+        """Test that personal fields are scrubbed and the history is kept."""
+        self.assertEqual(sum(anonymise(Athlete.objects.all())), 1)
+
+        self.athlete.refresh_from_db()
+        self.assertEqual(str(self.athlete), "Anonymous Athlete")
+        self.assertEqual(self.athlete.email, anonymous_email(self.athlete.public_id))
+        self.assertEqual(self.athlete.phone, "")
+        self.assertIsNone(self.athlete.date_of_birth)
+        self.assertIsNone(self.athlete.address)
+        self.assertIsNotNone(self.athlete.anonymised_at)
+
+        self.assertEqual(self.result.athlete_id, self.athlete.pk)
+        self.assertTrue(Result.objects.filter(pk=self.result.pk).exists())
+        self.assertTrue(self.athlete.competition_activities.exists())
+        # The address was only the athlete's, so it is gone
+        self.assertFalse(Address.all_objects.filter(pk=self.home.pk).exists())
+
+    def test_shared_address_is_kept(self):
+        """Test that an address still used by a venue is not deleted."""
+        list(anonymise(Coach.objects.all()))
+        self.assertTrue(Address.objects.filter(pk=self.shared.pk).exists())
+
+    def test_email_can_be_reused(self):
+        """Test that the original email is free again after anonymisation."""
+        list(anonymise(Athlete.objects.all()))
+        Athlete.objects.create(
+            first_name="Usain", last_name="Bolt", email="usain.bolt@example.com"
+        )
+        self.assertEqual(Athlete.objects.count(), 2)
+
+    def test_resume_after_interruption(self):
+        """Test that a run stopped after a chunk is finished by a later run."""
+        for number in range(4):
+            Athlete.objects.create(
+                first_name="Athlete",
+                last_name=str(number),
+                email=f"athlete{number}@example.com",
+            )
+        chunks = anonymise(Athlete.objects.all(), chunk_size=2)
+        self.assertEqual(next(chunks), 2)
+        chunks.close()
+        self.assertEqual(Athlete.objects.filter(anonymised_at__isnull=True).count(), 3)
+
+        self.assertEqual(list(anonymise(Athlete.objects.all(), chunk_size=2)), [2, 1])
+        self.assertFalse(Athlete.objects.filter(anonymised_at__isnull=True).exists())
+
+    def test_ranking_cache_is_invalidated(self):
+        """Test that cached rankings no longer show the athlete's name."""
+        url = f"/api/v1/scheduling/rankings/{self.season.public_id}/sprints/u14"
+        self.assertEqual(
+            self.client.get(url).json()["entries"][0]["athlete"]["display_name"],
+            "Usain Bolt",
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            list(anonymise(Athlete.objects.all()))
+        self.assertEqual(
+            self.client.get(url).json()["entries"][0]["athlete"]["display_name"],
+            "Anonymous Athlete",
+        )
+
+    def test_command_deleted_days(self):
+        """Test anonymising people soft-deleted more than N days ago."""
+        self.athlete.soft_delete(timezone.now() - timedelta(days=400))
+        out = StringIO()
+        call_command("anonymise_people", "--deleted-days=365", stdout=out)
+        self.assertIn("Athletes: 1 anonymised", out.getvalue())
+        self.coach.refresh_from_db()
+        self.assertIsNone(self.coach.anonymised_at)
+
+    def test_command_requires_selection(self):
+        """Test that the command refuses to run without a selection."""
+        with self.assertRaises(CommandError):
+            call_command("anonymise_people")
+        with self.assertRaises(CommandError):
+            call_command("anonymise_people", "--coach=nonexistent123")
@@ -0,0 +1,170 @@
+# people/tests/test_api_analytics.py
+from datetime import UTC, date, datetime
+
+import numpy as np
+from django.core.cache import cache
+from django.test import TestCase
+from inventory.models import Venue
+from scheduling.models import Competition, Season, Training
+
+from people.analytics import (
+    GroupBy,
+    athlete_metrics,
+    get_snapshot,
+    histogram,
+    summarize,
+)
+from people.models import Athlete
+
+
+class AthleteMetricsTest(TestCase):
+    """Test suite for the NumPy statistics helpers."""
+
+    def test_summarize_ignores_unknown_values(self):
+        """Test that NaN values are left out of every statistic."""
+        summary = summarize(np.array([170.0, np.nan, 180.0, 190.0]))
+        self.assertEqual(summary["count"], 3)
+        self.assertEqual(summary["mean"], 180.0)
+        self.assertEqual(summary["min"], 170.0)
+        self.assertEqual(summary["p50"], 180.0)
+        self.assertEqual(summary["max"], 190.0)
+
+    def test_summarize_without_values(self):
+        """Test that a group without known values only reports its count."""
+        self.assertEqual(summarize(np.array([np.nan])), {"count": 0})
+
+    def test_histogram_clips_outliers(self):
+        """Test that values out of range are counted in the outer bins."""
+        result = histogram(np.array([5.0, 11.0, 50.0, np.nan]), np.arange(10, 16, 2))
+        self.assertEqual(result["edges"], [10, 12, 14])
+        self.assertEqual(result["counts"], [2, 1])
+
+
+class AthleteAnalyticsAPITestCase(TestCase):
+    """Test suite for the athlete analytics endpoint."""
+
+    def setUp(self):
+        """Set up test data."""
+        cache.clear()
+        self.season = Season.objects.create(
+            name="2024-2025 Season",
+            start_date=date(2024, 9, 1),
+            end_date=date(2025, 6, 30),
+        )
+        self.venue = Venue.objects.create(name="Camp Nou")
+        self.athlete1 = Athlete.objects.create(
+            first_name="Usain",
+            last_name="Bolt",
+            email="usain.bolt@example.com",
+            date_of_birth=date(2012, 8, 21),
+            height=150.0,
+            weight=45.0,
+        )
+        self.athlete2 = Athlete.objects.create(
+            first_name="Carl",
+            last_name="Lewis",
+            email="carl.lewis@example.com",
+            date_of_birth=date(1990, 7, 1),
+            height=190.0,
+            weight=81.0,
+        )
+        self.athlete3 = Athlete.objects.create(
+            first_name="Jesse",
+            last_name="Owens",
+            email="jesse.owens@example.com",
+        )
+        competition = Competition.objects.create(
+            name="Spring Championship",
+            date=datetime(2025, 4, 15, 10, 0, tzinfo=UTC),
+            season=self.season,
+            venue=self.venue,
+        )
+        competition.athletes.set([self.athlete1, self.athlete2])
+        training = Training.objects.create(
+            name="Morning session",
+            date=datetime(2025, 4, 10, 8, 0, tzinfo=UTC),
+            season=self.season,
+            venue=self.venue,
+        )
+        training.athletes.set([self.athlete1])
+
+    def test_analytics_all(self):
+        """Test GET /api/v1/people/athletes/analytics."""
+        response = self.client.get("/api/v1/people/athletes/analytics")
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data["group_by"], "all")
+        self.assertEqual(len(data["groups"]), 1)
+
+        group = data["groups"][0]
+        self.assertEqual(group["athletes"], 3)
+        self.assertEqual(group["height"]["count"], 2)
+        self.assertEqual(group["height"]["mean"], 170.0)
+        self.assertEqual(group["bmi"]["count"], 2)
+        self.assertAlmostEqual(group["bmi"]["min"], 20.0)
+        self.assertAlmostEqual(group["bmi"]["max"], 22.44, places=2)
+        self.assertEqual(sum(group["bmi_histogram"]["counts"]), 2)
+
+    def test_analytics_by_age_category(self):
+        """Test grouping athletes by the age category of the season."""
+        response = self.client.get(
+            "/api/v1/people/athletes/analytics",
+            {"group_by": "age_category", "season_public_id": self.season.public_id},
+        )
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data["reference_year"], 2024)
+        # Only the athletes taking part in the season are grouped
+        self.assertEqual(
+            {group["key"]: group["athletes"] for group in data["groups"]},
+            {"u14": 1, "senior": 1},
+        )
+
+    def test_analytics_by_venue(self):
+        """Test grouping athletes by the venues they compete or train at."""
+        response = self.client.get(
+            "/api/v1/people/athletes/analytics", {"group_by": "venue"}
+        )
+        self.assertEqual(response.status_code, 200)
+        groups = response.json()["groups"]
+        self.assertEqual(len(groups), 1)
+        self.assertEqual(groups[0]["key"], self.venue.public_id)
+        self.assertEqual(groups[0]["label"], "Camp Nou")
+        # Athletes are counted once, whatever the number of activities
+        self.assertEqual(groups[0]["athletes"], 2)
+
+    def test_analytics_invalid_season(self):
+        """Test filtering by a season that does not exist."""
+        response = self.client.get(
+            "/api/v1/people/athletes/analytics", {"season_public_id": "nonexistent"}
+        )
+        self.assertEqual(response.status_code, 404)
+
+    def test_snapshot_invalidated_on_athlete_change(self):
+        """Test that the cached snapshot is reloaded after an athlete is saved."""
+        snapshot = get_snapshot()
+        self.assertIs(get_snapshot(), snapshot)
+        self.assertEqual(athlete_metrics(GroupBy.ALL)[0]["athletes"], 3)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.athlete3.soft_delete()
+
+        self.assertIsNot(get_snapshot(), snapshot)
+        self.assertEqual(athlete_metrics(GroupBy.ALL)[0]["athletes"], 2)
+
+    def test_analytics_without_athletes(self):
+        """Test a club whose athletes were all soft-deleted after taking part."""
+        for athlete in (self.athlete1, self.athlete2, self.athlete3):
+            athlete.soft_delete()
+
+        for params in (
+            {"group_by": "all"},
+            {"group_by": "age_category", "season_public_id": self.season.public_id},
+            {"group_by": "season"},
+            {"group_by": "venue"},
+        ):
+            with self.subTest(**params):
+                response = self.client.get("/api/v1/people/athletes/analytics", params)
+                self.assertEqual(response.status_code, 200)
+                groups = response.json()["groups"]
+                self.assertEqual(sum(group["athletes"] for group in groups), 0)
@@ -230,6 +230,22 @@ class AthleteAPITestCase(TestCase):
         self.assertEqual(response.status_code, 204)
         self.assertFalse(Athlete.objects.filter(pk=self.athlete1.pk).exists())
 
+    def test_restore_athlete_email_taken(self):
+        """Test that restoring an athlete whose email was reused returns 409."""
+        response = self.client.delete(
+            f"/api/v1/people/athletes/{self.athlete1.public_id}"
+        )
+        Athlete.objects.create(
+            first_name="New", last_name="Athlete", email=self.athlete1.email
+        )
+        response = self.client.post(
+            "/api/v1/core/restore",
+            data=json.dumps({"deleted_at": response["X-Deleted-At"]}),
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, 409)
+        self.assertFalse(Athlete.objects.filter(pk=self.athlete1.pk).exists())
+
     def test_delete_athlete_not_found(self):
         """Test DELETE with non-existent public_id returns 404."""
         response = self.client.delete("/api/v1/people/athletes/nonexistent123")
@@ -70,6 +70,20 @@ class AthleteModelTest(TestCase):
                 email="usain.bolt@example.com",
             )
 
+    def test_email_of_soft_deleted_athlete_can_be_reused(self):
+        """Test that uniqueness of emails only applies to live athletes."""
+        self.athlete.soft_delete()
+        athlete = Athlete.objects.create(
+            first_name="Usain",
+            last_name="Bolt",
+            email="usain.bolt@example.com",
+        )
+        self.assertNotEqual(athlete.pk, self.athlete.pk)
+
+        # Restoring the old athlete would duplicate a live email
+        with self.assertRaises(IntegrityError):
+            self.athlete.restore()
+
     def test_address_relationship(self):
         """Test athlete can have an address."""
         self.assertEqual(self.athlete.address, self.address)
@@ -58,6 +58,16 @@ class CoachModelTest(TestCase):
                 email="carlo.ancelotti@example.com",
             )
 
+    def test_email_of_soft_deleted_coach_can_be_reused(self):
+        """Test that uniqueness of emails only applies to live coaches."""
+        self.coach.soft_delete()
+        coach = Coach.objects.create(
+            first_name="Carlo",
+            last_name="Ancelotti",
+            email="carlo.ancelotti@example.com",
+        )
+        self.assertNotEqual(coach.pk, self.coach.pk)
+
     def test_certification_choices(self):
         """Test certification uses CoachingCertification enum."""
         self.assertEqual(
@@ -1,6 +1,7 @@
 # scheduling/admin/__init__.py
 from scheduling.admin.competition import CompetitionAdmin
+from scheduling.admin.result import ResultAdmin
 from scheduling.admin.season import SeasonAdmin
 from scheduling.admin.training import TrainingAdmin
 
-__all__ = ["SeasonAdmin", "CompetitionAdmin", "TrainingAdmin"]
+__all__ = ["SeasonAdmin", "CompetitionAdmin", "TrainingAdmin", "ResultAdmin"]
@@ -1,5 +1,7 @@
 # scheduling/admin/competition.py
 from django.contrib import admin
+from django.db.models import Count, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
 
 from scheduling.models.competition import Competition
 
@@ -18,6 +20,8 @@ class CompetitionAdmin(admin.ModelAdmin):
         "has_score",
     ]
     list_display_links = ["public_id", "name"]
+    # The venue is nullable, so it is not joined unless listed here
+    list_select_related = ["venue", "season"]
     search_fields = [
         "public_id",
         "name",
@@ -66,10 +70,31 @@ class CompetitionAdmin(admin.ModelAdmin):
     autocomplete_fields = ["venue", "season"]
     filter_horizontal = ["coaches", "athletes"]
 
-    @admin.display(description="Athletes")
+    def get_queryset(self, request):
+        """Annotate the live athletes, so the column does not query per row."""
+        athletes = (
+            Competition.athletes.through.objects.filter(
+                competition=OuterRef("pk"), athlete__deleted_at__isnull=True
+            )
+            .order_by()
+            .values("competition")
+            .annotate(count=Count("pk"))
+            .values("count")
+        )
+        return (
+            super()
+            .get_queryset(request)
+            .annotate(
+                athlete_total=Coalesce(
+                    Subquery(athletes, output_field=IntegerField()), 0
+                )
+            )
+        )
+
+    @admin.display(description="Athletes", ordering="athlete_total")
     def athlete_count(self, obj):
         """Display the number of participating athletes."""
-        return obj.athletes.count()
+        return obj.athlete_total
 
     # `boolean=True` shows a checkbox icon instead of True/False
     @admin.display(description="Scored", boolean=True)
@@ -0,0 +1,60 @@
+# scheduling/admin/result.py
+from django.contrib import admin
+
+from scheduling.models.result import Result
+
+
+@admin.register(Result)
+class ResultAdmin(admin.ModelAdmin):
+    """Admin interface for Result model."""
+
+    list_display = [
+        "public_id",
+        "competition",
+        "athlete",
+        "discipline",
+        "age_category",
+        "mark",
+        "position",
+    ]
+    list_display_links = ["public_id"]
+    search_fields = [
+        "public_id",
+        "competition__name",
+        "athlete__first_name",
+        "athlete__last_name",
+    ]
+    list_filter = ["discipline", "age_category", "competition__season"]
+    list_per_page = 50
+    ordering = ["competition", "discipline", "position"]
+    save_on_top = True
+
+    # Avoids one query per row for the competition and athlete columns
+    list_select_related = ["competition", "athlete"]
+
+    fieldsets = (
+        (
+            "Result information",
+            {
+                "fields": ("competition", "athlete", "discipline", "mark", "position"),
+                "description": "Mark achieved by the athlete",
+            },
+        ),
+        (
+            "System information",
+            {
+                "fields": (
+                    "id",
+                    "public_id",
+                    "age_category",
+                    "created_at",
+                    "updated_at",
+                ),
+                "classes": ("collapse",),
+                "description": "Read-only system fields",
+            },
+        ),
+    )
+
+    readonly_fields = ["id", "public_id", "age_category", "created_at", "updated_at"]
+    autocomplete_fields = ["competition", "athlete"]
@@ -1,5 +1,7 @@
 # scheduling/admin/training.py
 from django.contrib import admin
+from django.db.models import Count, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
 
 from scheduling.models.training import Training
 
@@ -18,6 +20,8 @@ class TrainingAdmin(admin.ModelAdmin):
         "athlete_count",
     ]
     list_display_links = ["public_id", "name"]
+    # The venue is nullable, so it is not joined unless listed here
+    list_select_related = ["venue", "season"]
     search_fields = [
         "public_id",
         "name",
@@ -67,7 +71,28 @@ class TrainingAdmin(admin.ModelAdmin):
     # Provides a nice dual-list widget for ManyToMany fields
     filter_horizontal = ["coaches", "athletes"]
 
-    @admin.display(description="Athletes")
+    def get_queryset(self, request):
+        """Annotate the live athletes, so the column does not query per row."""
+        athletes = (
+            Training.athletes.through.objects.filter(
+                training=OuterRef("pk"), athlete__deleted_at__isnull=True
+            )
+            .order_by()
+            .values("training")
+            .annotate(count=Count("pk"))
+            .values("count")
+        )
+        return (
+            super()
+            .get_queryset(request)
+            .annotate(
+                athlete_total=Coalesce(
+                    Subquery(athletes, output_field=IntegerField()), 0
+                )
+            )
+        )
+
+    @admin.display(description="Athletes", ordering="athlete_total")
     def athlete_count(self, obj):
         """Display the number of participating athletes."""
-        return obj.athletes.count()
+        return obj.athlete_total
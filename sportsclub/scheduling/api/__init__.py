@@ -1,7 +1,11 @@
 # scheduling/api/__init__.py
 from ninja import Router
 
+from scheduling.api.calendars import router as calendars_router
 from scheduling.api.competitions import router as competitions_router
+from scheduling.api.participation import router as participation_router
+from scheduling.api.rankings import router as rankings_router
+from scheduling.api.results import router as results_router
 from scheduling.api.seasons import router as seasons_router
 from scheduling.api.trainings import router as trainings_router
 
@@ -9,3 +13,7 @@ router = Router(tags=["scheduling"])
 router.add_router("", seasons_router)
 router.add_router("", competitions_router)
 router.add_router("", trainings_router)
+router.add_router("", results_router)
+router.add_router("", rankings_router)
+router.add_router("", participation_router)
+router.add_router("", calendars_router)
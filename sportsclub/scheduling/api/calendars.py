@@ -0,0 +1,79 @@
+# scheduling/api/calendars.py
+from core.streaming import streaming_body
+from django.http import HttpResponse, HttpResponseNotModified, StreamingHttpResponse
+from django.shortcuts import get_object_or_404
+from django.utils.http import parse_etags
+from inventory.models import Venue
+from ninja import Router
+from people.models import Athlete, Coach
+
+from scheduling.calendars import (
+    FeedKind,
+    cache_rendered,
+    feed_etag,
+    get_cached_feed,
+    render_feed,
+)
+from scheduling.models import Season
+
+router = Router(tags=["calendars"])
+
+CONTENT_TYPE = "text/calendar; charset=utf-8"
+
+
+def _feed_response(request, kind: FeedKind, public_id: str, model):
+    """
+    Serve a calendar feed, answering conditional requests from the cache.
+
+    Calendar apps poll feeds every few minutes: when the ETag they send is
+    still current, the only work done is looking the object up, so feeds of
+    missing or soft-deleted objects are not found, and reading the cached ETag.
+    Otherwise the feed is served from the cache, or streamed from the database.
+    """
+    instance = get_object_or_404(model, public_id=public_id)
+    etag = feed_etag(kind, public_id, str(instance))
+    if_none_match = parse_etags(request.headers.get("If-None-Match", ""))
+    if etag in if_none_match or "*" in if_none_match:
+        response = HttpResponseNotModified()
+        response["ETag"] = etag
+        return response
+
+    body = get_cached_feed(kind, public_id, etag)
+    if body is not None:
+        response = HttpResponse(body, content_type=CONTENT_TYPE)
+    else:
+        chunks = render_feed(kind, public_id, str(instance))
+        response = StreamingHttpResponse(
+            streaming_body(request, cache_rendered(chunks, kind, public_id, etag)),
+            content_type=CONTENT_TYPE,
+        )
+
+    response["ETag"] = etag
+    # Clients may keep the feed, but must revalidate it before using it
+    response["Cache-Control"] = "private, no-cache"
+    response["Content-Disposition"] = f'inline; filename="{kind}-{public_id}.ics"'
+    return response
+
+
+@router.get("/calendars/seasons/{public_id}.ics")
+def get_season_calendar(request, public_id: str):
+    """Get the iCalendar feed of the competitions and trainings of a season."""
+    return _feed_response(request, FeedKind.SEASON, public_id, Season)
+
+
+@router.get("/calendars/venues/{public_id}.ics")
+def get_venue_calendar(request, public_id: str):
+    """Get the iCalendar feed of the competitions and trainings at a venue."""
+    return _feed_response(request, FeedKind.VENUE, public_id, Venue)
+
+
+@router.get("/calendars/athletes/{public_id}.ics")
+def get_athlete_calendar(request, public_id: str):
+    """Get the iCalendar feed of the competitions and trainings of an athlete."""
+    return _feed_response(request, FeedKind.ATHLETE, public_id, Athlete)
+
+
+@router.get("/calendars/coaches/{public_id}.ics")
+def get_coach_calendar(request, public_id: str):
+    """Get the iCalendar feed of the competitions and trainings of a coach."""
+    return _feed_response(request, FeedKind.COACH, public_id, Coach)
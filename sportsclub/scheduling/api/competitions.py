@@ -1,11 +1,18 @@
 # scheduling/api/competitions.py
+from core.deletion import delete_response
+from core.exports import export_response, related_public_ids
+from core.schemas import ExportFilter, SyncFilter, SyncOut
+from core.sync import sync_page
+from django.db.models import F
+from django.http import HttpResponse
 from django.shortcuts import get_object_or_404
 from inventory.models import Venue
-from ninja import Router
+from ninja import Query, Router
 from people.models import Athlete, Coach
 
 from scheduling.models import Competition, Season
 from scheduling.schemas import (
+    CompetitionFilter,
     CompetitionIn,
     CompetitionListOut,
     CompetitionOut,
@@ -47,9 +54,61 @@ def _process_competition_payload(payload, exclude_unset=False):
 
 
 @router.get("/competitions", response=list[CompetitionListOut])
-def list_competitions(request):
-    """List all competitions."""
-    return _get_competition_queryset()
+def list_competitions(request, filters: Query[CompetitionFilter]):
+    """
+    List all competitions.
+
+    Medal filters apply to the given discipline, or to any discipline if none is
+    given, e.g. `?discipline=relays&min_gold=1` for relays won at least once.
+    """
+    competitions = _get_competition_queryset()
+    if filters.season_public_id:
+        competitions = competitions.filter(season__public_id=filters.season_public_id)
+
+    score_path = Competition.score_path(
+        filters.discipline, filters.min_gold, filters.min_silver, filters.min_bronze
+    )
+    if score_path:
+        competitions = competitions.filter(score__path_exists=score_path)
+    return competitions
+
+
+@router.get("/competitions/sync", response=SyncOut[CompetitionListOut])
+def sync_competitions(request, filters: Query[SyncFilter]):
+    """
+    List the competitions created, updated or deleted since the previous sync.
+
+    Pass the `next_token` of each response as `updated_since` in the next
+    request; deleted competitions are returned by public ID only.
+    """
+    return sync_page(
+        Competition.all_objects.select_related("season"),
+        filters.updated_since,
+        filters.limit,
+    )
+
+
+@router.get("/competitions/export")
+def export_competitions(request, filters: Query[ExportFilter]):
+    """
+    Stream every competition as NDJSON or CSV (gzipped if accepted).
+
+    Participants are listed by public ID; in CSV, separated by semicolons, and
+    scores as JSON.
+    """
+    return export_response(
+        request,
+        Competition.objects.all(),
+        ["public_id", "name", "date", "score", "created_at", "updated_at"],
+        {
+            "season_public_id": F("season__public_id"),
+            "venue_public_id": F("venue__public_id"),
+            "athlete_public_ids": related_public_ids(Competition, "athletes"),
+            "coach_public_ids": related_public_ids(Competition, "coaches"),
+        },
+        filters.format,
+        "competitions",
+    )
 
 
 @router.get("/competitions/{public_id}", response=CompetitionOut)
@@ -157,8 +216,14 @@ def partial_update_competition(request, public_id: str, payload: CompetitionPatc
 
 
 @router.delete("/competitions/{public_id}", response={204: None})
-def delete_competition(request, public_id: str):
-    """Delete a competition."""
-    competition = get_object_or_404(Competition, public_id=public_id)
-    competition.delete()
-    return 204, None
+def delete_competition(
+    request, response: HttpResponse, public_id: str, purge: bool = False
+):
+    """
+    Soft-delete a competition and its results.
+
+    With `purge=true` it is permanently deleted instead, even if already
+    soft-deleted. The X-Deleted-At header of a soft delete can be posted to
+    /api/v1/core/restore to undo it.
+    """
+    return delete_response(response, Competition, public_id, purge)
@@ -0,0 +1,47 @@
+# scheduling/api/participation.py
+from core import cache
+from django.http import Http404
+from django.shortcuts import get_object_or_404
+from ninja import Router
+
+from scheduling.models import Season
+from scheduling.participation import cache_namespace, season_participation
+from scheduling.schemas import AthleteParticipationOut, ParticipationOut
+
+router = Router(tags=["participation"])
+
+
+def _cached_participation(season_public_id: str) -> list[dict]:
+    def compute():
+        season = get_object_or_404(Season, public_id=season_public_id)
+        return season_participation(season.pk)
+
+    return cache.get_or_set(
+        cache_namespace(season_public_id), ("athletes",), compute, timeout=None
+    )
+
+
+@router.get("/seasons/{public_id}/participation", response=ParticipationOut)
+def get_season_participation(request, public_id: str):
+    """
+    Get the trainings and competitions attended by each athlete in a season.
+
+    Season and monthly totals are served from the cache, which is invalidated
+    whenever an activity of the season or its list of athletes changes.
+    """
+    return {
+        "season_public_id": public_id,
+        "athletes": _cached_participation(public_id),
+    }
+
+
+@router.get(
+    "/seasons/{public_id}/participation/{athlete_public_id}",
+    response=AthleteParticipationOut,
+)
+def get_athlete_participation(request, public_id: str, athlete_public_id: str):
+    """Get the trainings and competitions attended by an athlete in a season."""
+    for entry in _cached_participation(public_id):
+        if entry["athlete"]["public_id"] == athlete_public_id:
+            return entry
+    raise Http404("Athlete did not take part in this season")
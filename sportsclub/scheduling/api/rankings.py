@@ -0,0 +1,79 @@
+# scheduling/api/rankings.py
+from core import cache
+from core.models.enums import AgeCategory, Discipline
+from django.conf import settings
+from django.shortcuts import get_object_or_404
+from ninja import Query, Router
+
+from scheduling.models import Ranking, Season
+from scheduling.schemas import RankingEntryOut, RankingOut
+
+router = Router(tags=["rankings"])
+
+
+@router.get(
+    "/rankings/{season_public_id}/{discipline}/{age_category}", response=RankingOut
+)
+def get_ranking(
+    request,
+    season_public_id: str,
+    discipline: Discipline,
+    age_category: AgeCategory,
+    limit: int = Query(settings.RANKINGS_TOP_N, ge=1, le=settings.RANKINGS_TOP_N),
+):
+    """
+    Get the top athletes of a season ranking.
+
+    Entries are served from the cache, which is only invalidated when a new
+    result changes the first `RANKINGS_TOP_N` positions, so a hit only looks
+    the season up.
+
+    Raises:
+        Http404: If the season does not exist or is soft-deleted
+    """
+    get_object_or_404(Season, public_id=season_public_id)
+    entries = cache.get_or_set(
+        Ranking.cache_namespace(season_public_id, discipline, age_category),
+        ("top",),
+        lambda: Ranking.top(
+            season_public_id, discipline, age_category, settings.RANKINGS_TOP_N
+        ),
+        timeout=None,
+    )
+    return {
+        "season_public_id": season_public_id,
+        "discipline": discipline,
+        "age_category": age_category,
+        "entries": entries[:limit],
+    }
+
+
+@router.get(
+    "/rankings/{season_public_id}/{discipline}/{age_category}/athletes/{athlete_public_id}",  # noqa: E501
+    response=RankingEntryOut,
+)
+def get_athlete_ranking(
+    request,
+    season_public_id: str,
+    discipline: Discipline,
+    age_category: AgeCategory,
+    athlete_public_id: str,
+):
+    """Get the rank of an athlete in a season ranking."""
+    season = get_object_or_404(Season, public_id=season_public_id)
+    entry = get_object_or_404(
+        Ranking.objects.select_related("athlete"),
+        season=season,
+        discipline=discipline,
+        age_category=age_category,
+        athlete__public_id=athlete_public_id,
+    )
+    return {
+        "rank": entry.rank,
+        "athlete": {
+            "public_id": entry.athlete.public_id,
+            "display_name": str(entry.athlete),
+            "jersey_number": entry.athlete.jersey_number,
+        },
+        "best_mark": entry.best_mark,
+    }
@@ -0,0 +1,61 @@
+# scheduling/api/results.py
+from decimal import Decimal
+
+from core.deletion import delete_response
+from django.http import HttpResponse
+from django.shortcuts import get_object_or_404
+from ninja import Router
+from people.models import Athlete
+
+from scheduling.models import Competition, Result
+from scheduling.schemas import ResultIn, ResultOut
+
+router = Router(tags=["results"])
+
+
+def _get_result_queryset():
+    """Return optimized queryset for results."""
+    return Result.objects.select_related("competition", "athlete")
+
+
+@router.get("/competitions/{public_id}/results", response=list[ResultOut])
+def list_competition_results(request, public_id: str):
+    """List the results of a competition."""
+    competition = get_object_or_404(Competition, public_id=public_id)
+    return _get_result_queryset().filter(competition=competition)
+
+
+@router.post("/competitions/{public_id}/results", response={201: ResultOut})
+def create_competition_result(request, public_id: str, payload: ResultIn):
+    """Record the result of an athlete in a competition."""
+    competition = get_object_or_404(
+        Competition.objects.select_related("season"), public_id=public_id
+    )
+    athlete = get_object_or_404(Athlete, public_id=payload.athlete_public_id)
+    result = Result.objects.create(
+        competition=competition,
+        athlete=athlete,
+        discipline=payload.discipline,
+        # Keep the exact decimal the client sent, not its binary approximation
+        mark=Decimal(str(payload.mark)),
+        position=payload.position,
+    )
+    return 201, result
+
+
+@router.get("/results/{public_id}", response=ResultOut)
+def get_result(request, public_id: str):
+    """Get a single result by public ID."""
+    return get_object_or_404(_get_result_queryset(), public_id=public_id)
+
+
+@router.delete("/results/{public_id}", response={204: None})
+def delete_result(request, response: HttpResponse, public_id: str, purge: bool = False):
+    """
+    Soft-delete a result.
+
+    With `purge=true` it is permanently deleted instead, even if already
+    soft-deleted. The X-Deleted-At header of a soft delete can be posted to
+    /api/v1/core/restore to undo it.
+    """
+    return delete_response(response, Result, public_id, purge)
@@ -1,9 +1,17 @@
 # scheduling/api/seasons.py
+from core.deletion import delete_response
+from core.schemas import SyncFilter, SyncOut
+from core.sync import sync_page
+from django.http import HttpResponse
 from django.shortcuts import get_object_or_404
-from ninja import Router
+from ninja import Query, Router
+from ninja.errors import HttpError
 
 from scheduling.models import Season
+from scheduling.rollover import SeasonCloneError, clone_season, date_shift
 from scheduling.schemas import (
+    SeasonCloneIn,
+    SeasonCloneOut,
     SeasonIn,
     SeasonListOut,
     SeasonOut,
@@ -19,6 +27,17 @@ def list_seasons(request):
     return Season.objects.all()
 
 
+@router.get("/seasons/sync", response=SyncOut[SeasonListOut])
+def sync_seasons(request, filters: Query[SyncFilter]):
+    """
+    List the seasons created, updated or deleted since the previous sync.
+
+    Pass the `next_token` of each response as `updated_since` in the next
+    request; deleted seasons are returned by public ID only.
+    """
+    return sync_page(Season.all_objects.all(), filters.updated_since, filters.limit)
+
+
 @router.get("/seasons/{public_id}", response=SeasonOut)
 def get_season(request, public_id: str):
     """Get a single season by public ID."""
@@ -53,8 +72,41 @@ def partial_update_season(request, public_id: str, payload: SeasonPatch):
 
 
 @router.delete("/seasons/{public_id}", response={204: None})
-def delete_season(request, public_id: str):
-    """Delete a season."""
-    season = get_object_or_404(Season, public_id=public_id)
-    season.delete()
-    return 204, None
+def delete_season(request, response: HttpResponse, public_id: str, purge: bool = False):
+    """
+    Soft-delete a season with its activities and their results.
+
+    With `purge=true` it is permanently deleted instead, even if already
+    soft-deleted. The X-Deleted-At header of a soft delete can be posted to
+    /api/v1/core/restore to undo it.
+    """
+    return delete_response(response, Season, public_id, purge)
+
+
+@router.post(
+    "/seasons/{public_id}/clone", response={200: SeasonCloneOut, 201: SeasonCloneOut}
+)
+def clone_season_plan(request, public_id: str, payload: SeasonCloneIn):
+    """
+    Copy the trainings (and optionally competitions) of a season into another.
+
+    Dates are shifted by the difference between season starts, rounded to
+    whole weeks so activities keep their weekday, and athlete and coach
+    memberships are copied along. A dry run only reports the counts.
+    """
+    source = get_object_or_404(Season, public_id=public_id)
+    target = get_object_or_404(Season, public_id=payload.target_season_public_id)
+    try:
+        counts = clone_season(
+            source, target, payload.include_competitions, payload.dry_run
+        )
+    except SeasonCloneError as err:
+        raise HttpError(409, str(err)) from err
+
+    return 200 if payload.dry_run else 201, {
+        "source": source,
+        "target": target,
+        "dry_run": payload.dry_run,
+        "days_shifted": date_shift(source, target).days,
+        **counts.as_dict(),
+    }
@@ -1,7 +1,13 @@
 # scheduling/api/trainings.py
+from core.deletion import delete_response
+from core.exports import export_response, related_public_ids
+from core.schemas import ExportFilter, SyncFilter, SyncOut
+from core.sync import sync_page
+from django.db.models import F
+from django.http import HttpResponse
 from django.shortcuts import get_object_or_404
 from inventory.models import Venue
-from ninja import Router
+from ninja import Query, Router
 from people.models import Athlete, Coach
 
 from scheduling.models import Season, Training
@@ -28,6 +34,43 @@ def list_trainings(request):
     return _get_training_queryset()
 
 
+@router.get("/trainings/sync", response=SyncOut[TrainingListOut])
+def sync_trainings(request, filters: Query[SyncFilter]):
+    """
+    List the training sessions created, updated or deleted since the previous sync.
+
+    Pass the `next_token` of each response as `updated_since` in the next
+    request; deleted training sessions are returned by public ID only.
+    """
+    return sync_page(
+        Training.all_objects.select_related("season"),
+        filters.updated_since,
+        filters.limit,
+    )
+
+
+@router.get("/trainings/export")
+def export_trainings(request, filters: Query[ExportFilter]):
+    """
+    Stream every training session as NDJSON or CSV (gzipped if accepted).
+
+    Participants are listed by public ID; in CSV, separated by semicolons.
+    """
+    return export_response(
+        request,
+        Training.objects.all(),
+        ["public_id", "name", "date", "focus", "created_at", "updated_at"],
+        {
+            "season_public_id": F("season__public_id"),
+            "venue_public_id": F("venue__public_id"),
+            "athlete_public_ids": related_public_ids(Training, "athletes"),
+            "coach_public_ids": related_public_ids(Training, "coaches"),
+        },
+        filters.format,
+        "trainings",
+    )
+
+
 @router.get("/trainings/{public_id}", response=TrainingOut)
 def get_training(request, public_id: str):
     """Get a single training session by public ID."""
@@ -138,8 +181,14 @@ def partial_update_training(request, public_id: str, payload: TrainingPatch):
 
 
 @router.delete("/trainings/{public_id}", response={204: None})
-def delete_training(request, public_id: str):
-    """Delete a training session."""
-    training = get_object_or_404(Training, public_id=public_id)
-    training.delete()
-    return 204, None
+def delete_training(
+    request, response: HttpResponse, public_id: str, purge: bool = False
+):
+    """
+    Soft-delete a training session.
+
+    With `purge=true` it is permanently deleted instead, even if already
+    soft-deleted. The X-Deleted-At header of a soft delete can be posted to
+    /api/v1/core/restore to undo it.
+    """
+    return delete_response(response, Training, public_id, purge)
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class SchedulingConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "scheduling"
+
+    def ready(self):
+        # Connect signal handlers
+        from scheduling import signals  # noqa: F401
@@ -0,0 +1,803 @@
+# scheduling/benchmarks.py
+"""
+Benchmarks of the API against a synthetic club.
+
+Every route under `/api/v1/` has a `Scenario` (see `scenarios()`), or is
+listed in `SKIPPED` with the reason why: the lists, details, creates, updates
+and deletes of every resource, and the other reads and writes of the API.
+Requests go through the test client, in this process: latencies are those of
+Django, the API and Postgres, without the network or the ASGI server.
+
+Benchmarks run in a database of their own, `<database>_benchmark`, which holds
+a club generated by `scheduling.synthetic` at a given scale and seed, with
+results and rankings for its competitions. Reads pick their records from the
+club with a generator seeded per scenario, so every run requests the same
+records. Writes work on records the scenario creates through the API
+beforehand, without timing them, and every record a scenario creates is
+purged after it, so the club is the same for every scenario and every run.
+
+Each scenario is timed over a number of requests, after a few warm-up ones,
+and reported as latency percentiles. The queries and the peak memory
+allocated by Python (`tracemalloc`) per request are measured in another pass,
+as counting and tracing slow requests down. Results are saved as JSON, and
+`compare()` reports the scenarios slower, making more queries or using more
+memory than in a baseline taken at the same scale and seed. Latencies depend
+on the machine: baselines should be taken where they are compared.
+"""
+
+import csv
+import io
+import json
+import math
+import platform
+import random
+import statistics
+import time
+import tracemalloc
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from decimal import Decimal
+
+import django
+from core import history
+from core.models import Address, ApiKey
+from core.models.enums import AgeCategory, Discipline
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection, models
+from django.http import HttpResponse
+from django.test import Client, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from inventory.models import Venue
+from inventory.models.venue import VenueType
+from people.models import Athlete, Coach, CoachingCertification
+
+from scheduling import synthetic
+from scheduling.models import Competition, Ranking, Result, Season, Training
+
+FORMAT_VERSION = 1
+PREFIX = "/api/v1"
+BASELINE = settings.BASE_DIR / "benchmarks" / "baseline.json"
+# Records of each model that reads pick from
+SAMPLE_SIZE = 1000
+# Requests measured for queries and memory, per scenario
+PROFILED_REQUESTS = 10
+# Exports and clones read or write whole tables or seasons
+SLOW_REQUESTS = 5
+# Latencies and memory are only regressions beyond these, whatever the ratio
+LATENCY_SLACK_MS = 0.5
+MEMORY_SLACK_KIB = 64
+IMPORT_MARK = "Benchmark import"
+DOMAIN = "benchmark.example.org"
+
+SKIPPED = {
+    "GET /core/events": "streams change events until the client goes away",
+}
+
+
+class BenchmarkError(Exception):
+    """A benchmark cannot run, or its results cannot be compared."""
+
+
+@dataclass
+class Request:
+    """A request of a scenario."""
+
+    method: str
+    # Path under `PREFIX`, with its query string
+    path: str
+    body: dict | None = None
+    # CSV file uploaded as a form instead of a JSON body
+    file: bytes | None = None
+
+
+class Dataset:
+    """The club requested by the scenarios, and the records they create."""
+
+    def __init__(self, client: Client):
+        self.client = client
+        self._samples: dict[object, list] = {}
+        self._created: list[models.QuerySet] = []
+
+    def sample(self, key, rows: Callable[[], models.QuerySet]) -> list:
+        if key not in self._samples:
+            self._samples[key] = list(rows()[:SAMPLE_SIZE])
+            if not self._samples[key]:
+                raise BenchmarkError(f"The club has no {key}")
+        return self._samples[key]
+
+    def pick(self, model: type[models.Model], rng: random.Random) -> str:
+        """Public ID of a live record of the club."""
+        return rng.choice(self.picks(model, rng, 1))
+
+    def picks(self, model: type[models.Model], rng: random.Random, count: int):
+        public_ids = self.sample(
+            model,
+            lambda: model.objects.order_by("pk").values_list("public_id", flat=True),
+        )
+        return rng.sample(public_ids, min(count, len(public_ids)))
+
+    def send(self, request: Request) -> HttpResponse:
+        """Send a request, reading the whole body of streaming responses."""
+        path = PREFIX + request.path
+        if request.file is not None:
+            response = self.client.post(
+                path, {"file": SimpleUploadedFile("records.csv", request.file)}
+            )
+        else:
+            body = "" if request.body is None else json.dumps(request.body)
+            response = self.client.generic(
+                request.method, path, body, content_type="application/json"
+            )
+        if response.streaming:
+            for _ in response.streaming_content:
+                pass
+        if response.status_code >= 400:
+            raise BenchmarkError(
+                f"{request.method} {request.path} answered {response.status_code}: "
+                f"{response.content[:200]!r}"
+            )
+        return response
+
+    def track(self, queryset: models.QuerySet):
+        """Purge the rows of a queryset once the scenario is over."""
+        self._created.append(queryset)
+
+    def create(self, model: type[models.Model], route: str, body: dict) -> str:
+        """Create a record through the API, and return its public ID."""
+        public_id = self.send(Request("POST", route, body)).json()["public_id"]
+        self.track(model.all_objects.filter(public_id=public_id))
+        return public_id
+
+    def clean_up(self):
+        while self._created:
+            self._created.pop().delete()
+
+
+@dataclass
+class Scenario:
+    """Requests to one route of the API."""
+
+    method: str
+    # Route as documented in the OpenAPI schema, under `PREFIX`
+    route: str
+    # Build the next request, creating the records it needs
+    prepare: Callable[[Dataset, random.Random], Request]
+    # Model of the record created by each request, purged afterwards
+    creates: type[models.Model] | None = None
+    # At most this many requests, for the slowest routes
+    max_requests: int | None = None
+
+    @property
+    def name(self) -> str:
+        return f"{self.method} {self.route}"
+
+
+# Request bodies
+
+
+def _address(dataset: Dataset, rng: random.Random) -> dict:
+    city, postal_prefix = rng.choice(synthetic.CITIES)
+    return {
+        "line1": f"{rng.choice(synthetic.STREETS)}, {rng.randint(1, 120)}",
+        "postal_code": f"{postal_prefix}{rng.randint(0, 99):02}",
+        "city": city,
+        "state": "Illes Balears",
+        "country": "Spain",
+    }
+
+
+def _venue(dataset: Dataset, rng: random.Random) -> dict:
+    return {
+        "name": f"Benchmark {rng.randint(1, 999)}",
+        "venue_type": rng.choice(VenueType.values),
+        "capacity": rng.randrange(100, 20_000, 50),
+        "address_public_id": dataset.pick(Address, rng),
+        "indoor": rng.random() < 0.5,
+    }
+
+
+def _person(dataset: Dataset, rng: random.Random) -> dict:
+    first_name = rng.choice(synthetic.FIRST_NAMES)
+    last_name = rng.choice(synthetic.LAST_NAMES)
+    return {
+        "first_name": first_name,
+        "last_name": last_name,
+        # Unique among the live people, created ones included
+        "email": f"{first_name}.{last_name}.{rng.getrandbits(64):x}@{DOMAIN}".lower(),
+        "date_of_birth": f"{rng.randint(1975, 2012)}-{rng.randint(1, 12):02}-01",
+        "address_public_id": dataset.pick(Address, rng),
+    }
+
+
+def _athlete(dataset: Dataset, rng: random.Random) -> dict:
+    return {
+        **_person(dataset, rng),
+        "height": round(rng.uniform(140, 200), 2),
+        "weight": round(rng.uniform(35, 100), 2),
+        "jersey_number": rng.randint(1, 999),
+    }
+
+
+def _coach(dataset: Dataset, rng: random.Random) -> dict:
+    return {
+        **_person(dataset, rng),
+        "certification": rng.choice(CoachingCertification.values),
+    }
+
+
+def _season(dataset: Dataset, rng: random.Random) -> dict:
+    year = rng.randint(2030, 2099)
+    return {
+        "name": f"Benchmark {year}",
+        "start_date": f"{year}-01-01",
+        "end_date": f"{year}-12-31",
+    }
+
+
+def _activity(dataset: Dataset, rng: random.Random) -> dict:
+    return {
+        "name": f"Benchmark {rng.randint(1, 999)}",
+        "date": datetime(
+            2025, rng.randint(1, 12), rng.randint(1, 28), rng.randint(8, 20), tzinfo=UTC
+        ).isoformat(),
+        "venue_public_id": dataset.pick(Venue, rng),
+        "season_public_id": dataset.pick(Season, rng),
+        "coach_public_ids": dataset.picks(Coach, rng, 2),
+        "athlete_public_ids": dataset.picks(Athlete, rng, 12),
+    }
+
+
+def _training(dataset: Dataset, rng: random.Random) -> dict:
+    return {**_activity(dataset, rng), "focus": "Series de 200 m"}
+
+
+def _competition(dataset: Dataset, rng: random.Random) -> dict:
+    medals = {medal: rng.randint(0, 3) for medal in ("gold", "silver", "bronze")}
+    return {
+        **_activity(dataset, rng),
+        "score": {"results": {rng.choice(list(Discipline)).value: medals}},
+    }
+
+
+def _result(dataset: Dataset, rng: random.Random) -> dict:
+    return {
+        "athlete_public_id": dataset.pick(Athlete, rng),
+        "discipline": rng.choice(list(Discipline)).value,
+        "mark": round(rng.uniform(10, 300), 2),
+        "position": rng.randint(1, 8),
+    }
+
+
+# Scenarios
+
+
+@dataclass
+class _Resource:
+    """A resource with list, detail, create, update and delete routes."""
+
+    model: type[models.Model]
+    route: str
+    # Body of creates and full updates
+    body: Callable[[Dataset, random.Random], dict]
+    # Body of partial updates
+    patch: dict
+    exported: bool = True
+
+    def create(self, dataset: Dataset, rng: random.Random) -> str:
+        return dataset.create(self.model, self.route, self.body(dataset, rng))
+
+    def scenarios(self) -> Iterator[Scenario]:
+        route, detail = self.route, f"{self.route}/{{public_id}}"
+        yield Scenario("GET", route, lambda dataset, rng: Request("GET", route))
+        yield Scenario(
+            "POST",
+            route,
+            lambda dataset, rng: Request("POST", route, self.body(dataset, rng)),
+            creates=self.model,
+        )
+        yield Scenario(
+            "GET",
+            detail,
+            lambda dataset, rng: Request(
+                "GET", f"{route}/{dataset.pick(self.model, rng)}"
+            ),
+        )
+        yield Scenario(
+            "PUT",
+            detail,
+            lambda dataset, rng: Request(
+                "PUT", f"{route}/{self.create(dataset, rng)}", self.body(dataset, rng)
+            ),
+        )
+        yield Scenario(
+            "PATCH",
+            detail,
+            lambda dataset, rng: Request(
+                "PATCH", f"{route}/{self.create(dataset, rng)}", self.patch
+            ),
+        )
+        yield Scenario(
+            "DELETE",
+            detail,
+            lambda dataset, rng: Request(
+                "DELETE", f"{route}/{self.create(dataset, rng)}"
+            ),
+        )
+        yield Scenario(
+            "GET", f"{route}/sync", lambda dataset, rng: Request("GET", f"{route}/sync")
+        )
+        if self.exported:
+            yield Scenario(
+                "GET",
+                f"{route}/export",
+                lambda dataset, rng: Request("GET", f"{route}/export"),
+                max_requests=SLOW_REQUESTS,
+            )
+
+
+ADDRESSES = _Resource(Address, "/core/addresses", _address, {"line2": "Benchmark"})
+VENUES = _Resource(Venue, "/inventory/venues", _venue, {"capacity": 500})
+ATHLETES = _Resource(Athlete, "/people/athletes", _athlete, {"phone": "+34 600000000"})
+COACHES = _Resource(Coach, "/people/coaches", _coach, {"phone": "+34 600000000"})
+SEASONS = _Resource(
+    Season, "/scheduling/seasons", _season, {"name": "Benchmark"}, exported=False
+)
+TRAININGS = _Resource(
+    Training, "/scheduling/trainings", _training, {"name": "Benchmark"}
+)
+COMPETITIONS = _Resource(
+    Competition, "/scheduling/competitions", _competition, {"name": "Benchmark"}
+)
+RESOURCES = [ADDRESSES, VENUES, ATHLETES, COACHES, SEASONS, TRAININGS, COMPETITIONS]
+
+
+def _restore(dataset: Dataset, rng: random.Random) -> Request:
+    public_id = ADDRESSES.create(dataset, rng)
+    deleted_at = timezone.now()
+    Address.objects.get(public_id=public_id).soft_delete(deleted_at)
+    return Request("POST", "/core/restore", {"deleted_at": deleted_at.isoformat()})
+
+
+def _import(dataset: Dataset, rng: random.Random) -> Request:
+    file = io.StringIO()
+    writer = csv.DictWriter(file, ["line1", "postal_code", "city", "state", "country"])
+    writer.writeheader()
+    for number in range(20):
+        writer.writerow({**_address(dataset, rng), "line1": f"{IMPORT_MARK} {number}"})
+    dataset.track(Address.all_objects.filter(line1__startswith=IMPORT_MARK))
+    return Request("POST", "/core/imports/addresses", file=file.getvalue().encode())
+
+
+def _clone(dataset: Dataset, rng: random.Random) -> Request:
+    # Activities cloned into the new season are purged along with it
+    target = SEASONS.create(dataset, rng)
+    return Request(
+        "POST",
+        f"/scheduling/seasons/{dataset.pick(Season, rng)}/clone",
+        {"target_season_public_id": target, "include_competitions": True},
+    )
+
+
+def _ranking(dataset: Dataset, rng: random.Random) -> tuple:
+    return rng.choice(
+        dataset.sample(
+            Ranking,
+            lambda: Ranking.objects.order_by("pk").values_list(
+                "season__public_id",
+                "discipline",
+                "age_category",
+                "athlete__public_id",
+            ),
+        )
+    )
+
+
+def _participant(dataset: Dataset, rng: random.Random) -> tuple:
+    """A season, and an athlete who trained in it."""
+    return rng.choice(
+        dataset.sample(
+            "participants",
+            lambda: Training.athletes.through.objects.order_by("pk").values_list(
+                "training__season__public_id", "athlete__public_id"
+            ),
+        )
+    )
+
+
+def _result_of(dataset: Dataset, rng: random.Random) -> str:
+    competition = dataset.pick(Competition, rng)
+    return dataset.create(
+        Result, f"/scheduling/competitions/{competition}/results", _result(dataset, rng)
+    )
+
+
+def scenarios() -> list[Scenario]:
+    """Every scenario, one per route of the API but those in `SKIPPED`."""
+    suite = [scenario for resource in RESOURCES for scenario in resource.scenarios()]
+
+    def get(route: str, path: Callable[[Dataset, random.Random], str], **kwargs):
+        suite.append(
+            Scenario(
+                "GET",
+                route,
+                lambda dataset, rng: Request("GET", path(dataset, rng)),
+                **kwargs,
+            )
+        )
+
+    suite += [
+        Scenario("POST", "/core/restore", _restore),
+        Scenario(
+            "POST", "/core/imports/{resource}", _import, max_requests=SLOW_REQUESTS
+        ),
+        Scenario(
+            "POST",
+            "/scheduling/seasons/{public_id}/clone",
+            _clone,
+            max_requests=SLOW_REQUESTS,
+        ),
+        Scenario(
+            "POST",
+            "/scheduling/competitions/{public_id}/results",
+            lambda dataset, rng: Request(
+                "POST",
+                f"/scheduling/competitions/{dataset.pick(Competition, rng)}/results",
+                _result(dataset, rng),
+            ),
+            creates=Result,
+        ),
+        Scenario(
+            "DELETE",
+            "/scheduling/results/{public_id}",
+            lambda dataset, rng: Request(
+                "DELETE", f"/scheduling/results/{_result_of(dataset, rng)}"
+            ),
+        ),
+    ]
+    get("/core/changes", lambda dataset, rng: "/core/changes")
+    get(
+        "/inventory/venues/utilization",
+        lambda dataset, rng: "/inventory/venues/utilization",
+    )
+    get(
+        "/inventory/venues/{public_id}/utilization",
+        lambda dataset, rng: (
+            f"/inventory/venues/{dataset.pick(Venue, rng)}/utilization"
+        ),
+    )
+    get(
+        "/people/athletes/analytics",
+        lambda dataset, rng: "/people/athletes/analytics",
+    )
+    get(
+        "/scheduling/competitions/{public_id}/results",
+        lambda dataset, rng: (
+            f"/scheduling/competitions/{dataset.pick(Competition, rng)}/results"
+        ),
+    )
+    get(
+        "/scheduling/results/{public_id}",
+        lambda dataset, rng: f"/scheduling/results/{dataset.pick(Result, rng)}",
+    )
+    get(
+        "/scheduling/rankings/{season_public_id}/{discipline}/{age_category}",
+        lambda dataset, rng: "/scheduling/rankings/{}/{}/{}".format(
+            *_ranking(dataset, rng)[:3]
+        ),
+    )
+    get(
+        "/scheduling/rankings/{season_public_id}/{discipline}/{age_category}"
+        "/athletes/{athlete_public_id}",
+        lambda dataset, rng: "/scheduling/rankings/{}/{}/{}/athletes/{}".format(
+            *_ranking(dataset, rng)
+        ),
+    )
+    get(
+        "/scheduling/seasons/{public_id}/participation",
+        lambda dataset, rng: (
+            f"/scheduling/seasons/{dataset.pick(Season, rng)}/participation"
+        ),
+    )
+    get(
+        "/scheduling/seasons/{public_id}/participation/{athlete_public_id}",
+        lambda dataset, rng: "/scheduling/seasons/{}/participation/{}".format(
+            *_participant(dataset, rng)
+        ),
+    )
+    for kind, model in [
+        ("seasons", Season),
+        ("venues", Venue),
+        ("athletes", Athlete),
+        ("coaches", Coach),
+    ]:
+        get(
+            f"/scheduling/calendars/{kind}/{{public_id}}.ics",
+            lambda dataset, rng, kind=kind, model=model: (
+                f"/scheduling/calendars/{kind}/{dataset.pick(model, rng)}.ics"
+            ),
+        )
+    return suite
+
+
+# The club
+
+
+@contextmanager
+def benchmark_database(keepdb: bool = False):
+    """
+    Switch to the benchmark database, created for the block unless kept.
+
+    As with the test database, the configured database is left untouched.
+    """
+    settings_dict = connection.settings_dict
+    old_name = settings_dict["NAME"]
+    settings_dict["TEST"] = {**settings_dict["TEST"], "NAME": f"{old_name}_benchmark"}
+    connection.creation.create_test_db(
+        verbosity=0, autoclobber=True, serialize=False, keepdb=keepdb
+    )
+    try:
+        yield
+    finally:
+        # The records still queued would be written to the dropped database
+        history.flush()
+        connection.creation.destroy_test_db(old_name, verbosity=0, keepdb=keepdb)
+
+
+def _add_results(seed: int):
+    """Record a result for every athlete of every competition, and rank them."""
+    rng = random.Random(f"{seed}:results")
+    seasons = dict(Season.objects.values_list("pk", "start_date__year"))
+    competitions = dict(Competition.objects.values_list("pk", "season_id"))
+    birth_years = dict(Athlete.objects.values_list("pk", "date_of_birth__year"))
+    results = [
+        Result(
+            competition_id=competition_id,
+            athlete_id=athlete_id,
+            discipline=rng.choice(list(Discipline)),
+            age_category=AgeCategory.for_birth_year(
+                birth_years[athlete_id], seasons[competitions[competition_id]]
+            ),
+            mark=Decimal(f"{rng.uniform(10, 300):.2f}"),
+            position=rng.randint(1, 8),
+        )
+        for competition_id, athlete_id in Competition.athletes.through.objects.order_by(
+            "pk"
+        ).values_list("competition_id", "athlete_id")
+    ]
+    Result.objects.bulk_create(results, batch_size=5000)
+    for season_id in seasons:
+        Ranking.refresh_season(season_id)
+
+
+def prepare_club(size: synthetic.ClubSize, seed: int, workers: int) -> dict[str, int]:
+    """
+    Generate the club in the benchmark database, unless it is there already.
+
+    Raises:
+        BenchmarkError: If the database holds a club of another size
+
+    Returns:
+        Number of records of each model
+    """
+    counts = {model: model.all_objects.count() for model in synthetic.MODELS}
+    if not any(counts.values()):
+        synthetic.generate_club(size, seed=seed, workers=workers)
+        _add_results(seed)
+    elif counts != {model: size.count(model) for model in synthetic.MODELS}:
+        raise BenchmarkError(
+            "The kept benchmark database holds a club of another size: "
+            "run once without keeping it"
+        )
+    return {
+        model._meta.label_lower: model._base_manager.count()
+        for model in [*synthetic.MODELS, Result, Ranking]
+    }
+
+
+# Measurements
+
+
+def _percentile(values: list[float], percent: float) -> float:
+    """Nearest-rank percentile of sorted values."""
+    return values[max(0, math.ceil(percent / 100 * len(values)) - 1)]
+
+
+def _track(scenario: Scenario, dataset: Dataset, response: HttpResponse):
+    if scenario.creates is not None:
+        public_id = response.json()["public_id"]
+        dataset.track(scenario.creates.all_objects.filter(public_id=public_id))
+
+
+def run_scenario(
+    scenario: Scenario, dataset: Dataset, requests: int, warmup: int, seed: int
+) -> dict:
+    """
+    Time the requests of a scenario, then count their queries and memory.
+
+    Returns:
+        Latency percentiles in milliseconds, and the median number of queries
+        and highest memory peak of a request
+    """
+    rng = random.Random(f"{seed}:{scenario.name}")
+    requests = min(requests, scenario.max_requests or requests)
+    try:
+        for _ in range(warmup):
+            _track(scenario, dataset, dataset.send(scenario.prepare(dataset, rng)))
+
+        latencies = []
+        for _ in range(requests):
+            request = scenario.prepare(dataset, rng)
+            start = time.perf_counter()
+            response = dataset.send(request)
+            latencies.append((time.perf_counter() - start) * 1000)
+            _track(scenario, dataset, response)
+
+        queries, peaks = [], []
+        tracemalloc.start()
+        try:
+            for _ in range(min(requests, PROFILED_REQUESTS)):
+                request = scenario.prepare(dataset, rng)
+                with CaptureQueriesContext(connection) as captured:
+                    tracemalloc.reset_peak()
+                    before = tracemalloc.get_traced_memory()[0]
+                    response = dataset.send(request)
+                    peaks.append(tracemalloc.get_traced_memory()[1] - before)
+                queries.append(len(captured))
+                _track(scenario, dataset, response)
+        finally:
+            tracemalloc.stop()
+    finally:
+        dataset.clean_up()
+
+    latencies.sort()
+    return {
+        "requests": requests,
+        "latency_ms": {
+            "mean": round(statistics.fmean(latencies), 3),
+            "p50": round(_percentile(latencies, 50), 3),
+            "p90": round(_percentile(latencies, 90), 3),
+            "p99": round(_percentile(latencies, 99), 3),
+            "max": round(latencies[-1], 3),
+        },
+        "queries": int(statistics.median_low(queries)),
+        "peak_memory_kib": round(max(peaks) / 1024, 1),
+    }
+
+
+def _api_key() -> str:
+    user, _ = get_user_model().objects.get_or_create(username="benchmark")
+    return ApiKey.objects.create(user=user, name="Benchmarks").key
+
+
+def run_benchmarks(
+    suite: list[Scenario],
+    requests: int,
+    warmup: int,
+    seed: int,
+    progress: Callable[[str, dict], None] | None = None,
+) -> dict[str, dict]:
+    """
+    Run scenarios against the club of the current database.
+
+    Args:
+        suite: Scenarios to run, in order
+        requests: Requests timed per scenario
+        warmup: Requests sent before timing, e.g. to fill the caches
+        seed: Seed of the records picked by the scenarios
+        progress: Called with the name and results of each scenario
+
+    Returns:
+        Results of each scenario, by name
+    """
+    if requests < 1:
+        raise BenchmarkError("Scenarios need at least one request")
+    results = {}
+    with override_settings(ALLOWED_HOSTS=["testserver"]):
+        dataset = Dataset(Client(headers={"X-API-Key": _api_key()}))
+        for scenario in suite:
+            results[scenario.name] = run_scenario(
+                scenario, dataset, requests, warmup, seed
+            )
+            if progress:
+                progress(scenario.name, results[scenario.name])
+    return results
+
+
+def report(
+    results: dict[str, dict], club: dict[str, int], scale: float, seed: int
+) -> dict:
+    """Results of a run, with what they were measured against."""
+    return {
+        "version": FORMAT_VERSION,
+        "created_at": timezone.now().isoformat(),
+        "environment": {
+            "python": platform.python_version(),
+            "django": django.get_version(),
+            "postgres": connection.pg_version,
+            "machine": platform.machine(),
+        },
+        "club": {"scale": scale, "seed": seed, "rows": club},
+        "scenarios": results,
+    }
+
+
+@dataclass
+class Regression:
+    """A measurement of a scenario worse than in the baseline."""
+
+    scenario: str
+    metric: str
+    baseline: float
+    current: float
+
+    def __str__(self) -> str:
+        return f"{self.scenario}: {self.metric} {self.baseline} -> {self.current}"
+
+
+@dataclass
+class Comparison:
+    """Differences between a run and its baseline."""
+
+    regressions: list[Regression] = field(default_factory=list)
+    # Scenarios without a baseline yet
+    new: list[str] = field(default_factory=list)
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> Comparison:
+    """
+    Compare a run to a baseline taken against the same club.
+
+    Latencies (p50 and p90) and memory peaks are regressions when they grow by
+    more than `threshold` (e.g. 0.25 for 25%), and by more than a small
+    absolute slack, as very short requests vary relatively more. Query
+    counts do not depend on the machine: any increase is a regression.
+
+    Raises:
+        BenchmarkError: If the baseline is of another format, or was taken
+            against a club of another scale or seed
+    """
+    if baseline.get("version") != FORMAT_VERSION:
+        raise BenchmarkError(f"Unsupported baseline version {baseline.get('version')}")
+    for key in ("scale", "seed"):
+        if current["club"][key] != baseline["club"][key]:
+            raise BenchmarkError(
+                f"The baseline was taken with {key} {baseline['club'][key]}, "
+                f"not {current['club'][key]}"
+            )
+
+    comparison = Comparison()
+    for name, result in current["scenarios"].items():
+        before = baseline["scenarios"].get(name)
+        if before is None:
+            comparison.new.append(name)
+            continue
+        checks = [
+            (
+                f"latency {percentile} (ms)",
+                before["latency_ms"][percentile],
+                result["latency_ms"][percentile],
+                LATENCY_SLACK_MS,
+            )
+            for percentile in ("p50", "p90")
+        ]
+        checks.append(
+            (
+                "peak memory (KiB)",
+                before["peak_memory_kib"],
+                result["peak_memory_kib"],
+                MEMORY_SLACK_KIB,
+            )
+        )
+        for metric, old, new, slack in checks:
+            if new > old * (1 + threshold) and new - old > slack:
+                comparison.regressions.append(Regression(name, metric, old, new))
+        if result["queries"] > before["queries"]:
+            comparison.regressions.append(
+                Regression(name, "queries", before["queries"], result["queries"])
+            )
+    return comparison
@@ -0,0 +1,220 @@
+# scheduling/calendars.py
+"""
+iCalendar (RFC 5545) feeds of activities, per season, venue, athlete or coach.
+
+Feeds are rendered line by line from server-side cursors, so memory does not
+grow with the number of activities. The ETag of a feed is a digest of its data:
+the feed name, and the number, IDs and latest `updated_at` of its activities
+and of their venues. It is the same in every process and after restarts, and
+computing it costs an aggregate query over the activities, so it is cached.
+Each feed has a `core.cache` namespace, plus a global one for data shown in
+every feed (venue names), whose versions key the cached ETag: an unchanged
+feed is answered from the cache alone. The rendered body is kept in the cache
+too, under its ETag, when small enough.
+"""
+
+import hashlib
+from collections.abc import Iterable, Iterator
+from datetime import UTC, datetime, timedelta
+from enum import StrEnum
+
+from core import cache
+from django.conf import settings
+from django.core.cache import cache as default_cache
+from django.db.models import Count, Max, QuerySet, Sum, Value
+
+from scheduling.models import Competition, Training
+
+GLOBAL_NAMESPACE = "calendar"
+
+PRODUCT_ID = "-//Athletics Sports Club//Calendar feeds//EN"
+
+# Rows fetched per round trip from the server-side cursors
+CHUNK_SIZE = 500
+
+
+class FeedKind(StrEnum):
+    """Resources that have a calendar feed."""
+
+    SEASON = "season"
+    VENUE = "venue"
+    ATHLETE = "athlete"
+    COACH = "coach"
+
+    @property
+    def lookup(self) -> str:
+        """Activity lookup selecting the activities of a feed by public ID."""
+        return {
+            FeedKind.SEASON: "season__public_id",
+            FeedKind.VENUE: "venue__public_id",
+            FeedKind.ATHLETE: "athletes__public_id",
+            FeedKind.COACH: "coaches__public_id",
+        }[self]
+
+
+def feed_namespace(kind: FeedKind, public_id: str) -> str:
+    """Cache namespace of the feed of a season, venue, athlete or coach."""
+    return f"calendar:{kind}:{public_id}"
+
+
+def _fingerprint(kind: FeedKind, public_id: str, name: str) -> list:
+    """Return what a feed is rendered from, as far as it can change."""
+    # The count and sum of the IDs change when activities join or leave the
+    # feed, even if none of them was saved
+    competitions, trainings = (
+        model.objects.filter(**{kind.lookup: public_id})
+        .annotate(category=Value(model._meta.model_name))
+        .order_by()
+        .values("category")
+        .annotate(
+            count=Count("id"),
+            ids=Sum("id"),
+            updated_at=Max("updated_at"),
+            venue_updated_at=Max("venue__updated_at"),
+        )
+        for model in (Competition, Training)
+    )
+    # One row per model, as the constant category is not grouped by
+    rows = sorted(competitions.union(trainings, all=True), key=str)
+    return [name, settings.CALENDAR_EVENT_DURATION_MINUTES, *rows]
+
+
+def feed_etag(kind: FeedKind, public_id: str, name: str) -> str:
+    """Return the (quoted) ETag of a feed, built from its data."""
+    namespace = feed_namespace(kind, public_id)
+    global_version, feed_version = cache.get_versions(GLOBAL_NAMESPACE, namespace)
+    key = f"{namespace}:etag:{global_version}.{feed_version}"
+    etag = default_cache.get(key)
+    if etag is None:
+        fingerprint = repr(_fingerprint(kind, public_id, name)).encode()
+        etag = f'"{hashlib.sha256(fingerprint).hexdigest()[:32]}"'
+        default_cache.set(key, etag, None)
+    return etag
+
+
+def invalidate_feeds(kind: FeedKind, public_ids: Iterable[str]):
+    """Drop the cached ETag of the given feeds, to compute it from their data."""
+    for public_id in set(public_ids):
+        cache.bump_version(feed_namespace(kind, public_id))
+
+
+def invalidate_all_feeds():
+    """Drop every cached feed, e.g. after a venue is renamed."""
+    cache.bump_version(GLOBAL_NAMESPACE)
+
+
+def escape_text(value: str) -> str:
+    """Escape a TEXT property value."""
+    return (
+        value.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+    )
+
+
+def fold(line: str) -> str:
+    """Fold a content line at 75 octets and terminate it with CRLF."""
+    encoded = line.encode()
+    if len(encoded) <= 75:
+        return line + "\r\n"
+
+    parts, start, limit = [], 0, 75
+    while start < len(encoded):
+        end = min(start + limit, len(encoded))
+        # Do not split multi-byte UTF-8 sequences
+        while end < len(encoded) and encoded[end] & 0xC0 == 0x80:
+            end -= 1
+        parts.append(encoded[start:end].decode())
+        # Continuation lines start with a space, which counts towards the limit
+        start, limit = end, 74
+    return "\r\n ".join(parts) + "\r\n"
+
+
+def _timestamp(value: datetime) -> str:
+    return value.astimezone(UTC).strftime("%Y%m%dT%H%M%SZ")
+
+
+def _activities(kind: FeedKind, public_id: str) -> Iterator[dict]:
+    """Stream the activities of a feed as dictionaries, competitions first."""
+    for model, category in ((Competition, "Competition"), (Training, "Training")):
+        fields = ["public_id", "name", "date", "updated_at", "venue__name"]
+        if model is Training:
+            fields.append("focus")
+        queryset: QuerySet = (
+            model.objects.filter(**{kind.lookup: public_id})
+            .order_by("date", "id")
+            .values(*fields)
+        )
+        for activity in queryset.iterator(chunk_size=CHUNK_SIZE):
+            yield {**activity, "category": category}
+
+
+def _event(activity: dict, duration: timedelta) -> str:
+    lines = [
+        "BEGIN:VEVENT",
+        f"UID:{activity['public_id']}@sportsclub",
+        f"DTSTAMP:{_timestamp(activity['updated_at'])}",
+        f"DTSTART:{_timestamp(activity['date'])}",
+        f"DTEND:{_timestamp(activity['date'] + duration)}",
+        f"SUMMARY:{escape_text(activity['name'])}",
+        f"CATEGORIES:{activity['category'].upper()}",
+    ]
+    if activity["venue__name"]:
+        lines.append(f"LOCATION:{escape_text(activity['venue__name'])}")
+    if activity.get("focus"):
+        lines.append(f"DESCRIPTION:{escape_text(activity['focus'])}")
+    lines.append("END:VEVENT")
+    return "".join(fold(line) for line in lines)
+
+
+def render_feed(kind: FeedKind, public_id: str, name: str) -> Iterator[str]:
+    """Yield an iCalendar feed piece by piece: header, one VEVENT each, footer."""
+    duration = timedelta(minutes=settings.CALENDAR_EVENT_DURATION_MINUTES)
+    yield "".join(
+        fold(line)
+        for line in (
+            "BEGIN:VCALENDAR",
+            "VERSION:2.0",
+            f"PRODID:{PRODUCT_ID}",
+            "CALSCALE:GREGORIAN",
+            "METHOD:PUBLISH",
+            f"X-WR-CALNAME:{escape_text(name)}",
+        )
+    )
+    for activity in _activities(kind, public_id):
+        yield _event(activity, duration)
+    yield fold("END:VCALENDAR")
+
+
+def _body_key(kind: FeedKind, public_id: str, etag: str) -> str:
+    digest = etag.strip('"')
+    return f"{feed_namespace(kind, public_id)}:body:{digest}"
+
+
+def get_cached_feed(kind: FeedKind, public_id: str, etag: str) -> bytes | None:
+    """Return the rendered feed matching an ETag, if it is in the cache."""
+    return default_cache.get(_body_key(kind, public_id, etag))
+
+
+def cache_rendered(
+    chunks: Iterator[str], kind: FeedKind, public_id: str, etag: str
+) -> Iterator[bytes]:
+    """
+    Encode a feed while it is streamed, and cache it once complete.
+
+    The body is stored under the ETag read before rendering started, so a feed
+    invalidated meanwhile is stored under a key nobody will read again.
+    """
+    body, size = [], 0
+    for chunk in chunks:
+        encoded = chunk.encode()
+        if body is not None:
+            size += len(encoded)
+            body.append(encoded)
+            if size > settings.CALENDAR_CACHE_MAX_BYTES:
+                body = None
+        yield encoded
+    if body is not None:
+        default_cache.set(_body_key(kind, public_id, etag), b"".join(body), None)
@@ -0,0 +1 @@
+# scheduling/management/__init__.py
@@ -0,0 +1 @@
+# scheduling/management/commands/__init__.py
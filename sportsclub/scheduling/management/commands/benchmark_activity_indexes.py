@@ -0,0 +1,98 @@
+# scheduling/management/commands/benchmark_activity_indexes.py
+import re
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.utils import timezone
+
+from scheduling.models import Season, Training
+
+PARTIAL_INDEXES = ["scheduling_train_live_season", "scheduling_train_live_date"]
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare query plans on a large trainings table with and without the "
+        "partial indexes on live rows. Everything runs in a transaction that is "
+        "rolled back, but tables are locked meanwhile: do not run it against a "
+        "production database."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--rows",
+            type=int,
+            default=200_000,
+            help="Number of trainings to generate (default: 200000)",
+        )
+        parser.add_argument(
+            "--deleted-ratio",
+            type=float,
+            default=0.5,
+            help="Share of generated trainings that are soft-deleted (default: 0.5)",
+        )
+
+    def handle(self, *args, **options):
+        if not 0 <= options["deleted_ratio"] < 1:
+            raise CommandError("--deleted-ratio must be between 0 and 1")
+
+        with transaction.atomic():
+            self._run(options["rows"], options["deleted_ratio"])
+            # Undo everything the benchmark wrote
+            transaction.set_rollback(True)
+
+    def _run(self, rows: int, deleted_ratio: float):
+        now = timezone.now()
+        seasons = [
+            Season.objects.create(
+                name=f"Benchmark {year}",
+                start_date=(now - timedelta(days=365 * year)).date(),
+                end_date=(now - timedelta(days=365 * (year - 1))).date(),
+            )
+            for year in range(1, 11)
+        ]
+        self.stdout.write(f"Generating {rows} trainings...")
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                INSERT INTO {connection.ops.quote_name(Training._meta.db_table)}
+                    (public_id, name, date, season_id, focus, created_at,
+                     updated_at, deleted_at)
+                SELECT 'benchmark-' || g, 'Benchmark', %s - g * INTERVAL '30 min',
+                       (%s::bigint[])[1 + g %% 10], '', %s, %s,
+                       CASE WHEN random() < %s THEN %s END
+                FROM generate_series(1, %s) AS g
+                """,
+                [now, [s.pk for s in seasons], now, now, deleted_ratio, now, rows],
+            )
+            cursor.execute(f"ANALYZE {Training._meta.db_table}")
+
+        queries = {
+            "Trainings of a season by date": Training.objects.filter(
+                season=seasons[0]
+            ).order_by("date")[:50],
+            "Trainings of the last week": Training.objects.filter(
+                date__range=(now - timedelta(days=7), now)
+            ),
+        }
+        for label, queryset in queries.items():
+            self.stdout.write(self.style.MIGRATE_HEADING(label))
+            with transaction.atomic():
+                # Dropped in a savepoint, so they are back for the second run
+                with connection.cursor() as cursor:
+                    for index in PARTIAL_INDEXES:
+                        cursor.execute(f"DROP INDEX {index}")
+                self._explain("Without partial indexes", queryset)
+                transaction.set_rollback(True)
+            self._explain("With partial indexes", queryset)
+
+    def _explain(self, label: str, queryset):
+        plan = queryset.explain(analyze=True)
+        lines = plan.splitlines()
+        timing = re.search(r"Execution Time: ([\d.]+) ms", plan)
+        self.stdout.write(f"  {label}: {timing.group(1) if timing else '?'} ms")
+        self.stdout.write(f"    {lines[0].strip()}")
+        for line in lines[1:]:
+            if "Scan" in line:
+                self.stdout.write(f"    {line.strip()}")
@@ -0,0 +1,180 @@
+# scheduling/management/commands/benchmark_api.py
+import json
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from scheduling import benchmarks
+from scheduling.synthetic import ClubSize
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark every route of the API against a synthetic club, in a "
+        "database of its own, and compare the latencies, queries and memory "
+        "of each route to a baseline. Fails when a route regressed."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--scale",
+            type=float,
+            default=1,
+            help="Size of the club relative to a 100 athletes club (default: 1)",
+        )
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=0,
+            help="Seed of the club and of the records requested (default: 0)",
+        )
+        parser.add_argument(
+            "--requests",
+            type=int,
+            default=50,
+            help="Requests timed per route (default: 50)",
+        )
+        parser.add_argument(
+            "--warmup",
+            type=int,
+            default=5,
+            help="Requests sent per route before timing (default: 5)",
+        )
+        parser.add_argument(
+            "--route",
+            action="append",
+            default=[],
+            help="Only benchmark the routes containing this text, e.g. "
+            "'/people/athletes' (repeatable)",
+        )
+        parser.add_argument(
+            "--output", type=Path, help="Write the results to this JSON file"
+        )
+        parser.add_argument(
+            "--baseline",
+            type=Path,
+            default=benchmarks.BASELINE,
+            help="Results to compare against (default: benchmarks/baseline.json)",
+        )
+        parser.add_argument(
+            "--save-baseline",
+            action="store_true",
+            help="Replace the baseline with the results instead of comparing",
+        )
+        parser.add_argument(
+            "--threshold",
+            type=float,
+            default=0.25,
+            help="Slowdown counted as a regression, e.g. 0.25 for 25%% (default)",
+        )
+        parser.add_argument(
+            "--keepdb",
+            action="store_true",
+            help="Keep the benchmark database and its club for the next run",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=4,
+            help="Processes generating the club, 0 for none (default: 4)",
+        )
+
+    def handle(self, *args, **options):
+        if settings.DEBUG:
+            raise CommandError(
+                "Benchmarks must run with DEBUG off: queries would be kept in "
+                "memory, and API keys not checked"
+            )
+        if options["scale"] <= 0:
+            raise CommandError("--scale must be positive")
+        if options["requests"] < 1:
+            raise CommandError("--requests must be positive")
+        if options["warmup"] < 0:
+            raise CommandError("--warmup cannot be negative")
+        if options["threshold"] <= 0:
+            raise CommandError("--threshold must be positive")
+
+        suite = [
+            scenario
+            for scenario in benchmarks.scenarios()
+            if not options["route"]
+            or any(text in scenario.route for text in options["route"])
+        ]
+        if not suite:
+            raise CommandError("No route matches --route")
+
+        size = ClubSize.at_scale(options["scale"])
+        try:
+            with benchmarks.benchmark_database(options["keepdb"]):
+                self.stdout.write("Preparing the club...")
+                club = benchmarks.prepare_club(
+                    size, options["seed"], options["workers"]
+                )
+                results = benchmarks.run_benchmarks(
+                    suite,
+                    options["requests"],
+                    options["warmup"],
+                    options["seed"],
+                    progress=self._progress,
+                )
+                report = benchmarks.report(
+                    results, club, options["scale"], options["seed"]
+                )
+        except benchmarks.BenchmarkError as err:
+            raise CommandError(str(err)) from err
+
+        if options["output"]:
+            self._write(options["output"], report)
+        if options["save_baseline"]:
+            self._write(options["baseline"], report)
+            self.stdout.write(
+                self.style.SUCCESS(f"Saved the baseline to {options['baseline']}")
+            )
+            return
+        self._compare(report, options["baseline"], options["threshold"])
+
+    def _progress(self, name: str, result: dict):
+        latency = result["latency_ms"]
+        self.stdout.write(
+            f"{name}: p50 {latency['p50']} ms, p90 {latency['p90']} ms, "
+            f"p99 {latency['p99']} ms, {result['queries']} queries, "
+            f"{result['peak_memory_kib']} KiB"
+        )
+
+    def _write(self, path: Path, report: dict):
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(report, indent=2) + "\n")
+        except OSError as err:
+            raise CommandError(str(err)) from err
+
+    def _compare(self, report: dict, path: Path, threshold: float):
+        try:
+            baseline = json.loads(path.read_text())
+        except FileNotFoundError:
+            self.stdout.write(
+                self.style.WARNING(f"No baseline at {path}: nothing compared")
+            )
+            return
+        except (OSError, ValueError) as err:
+            raise CommandError(f"Cannot read the baseline: {err}") from err
+
+        try:
+            comparison = benchmarks.compare(report, baseline, threshold)
+        except benchmarks.BenchmarkError as err:
+            raise CommandError(str(err)) from err
+        for name in comparison.new:
+            self.stdout.write(self.style.WARNING(f"{name}: not in the baseline"))
+        for regression in comparison.regressions:
+            self.stdout.write(self.style.ERROR(str(regression)))
+        if comparison.regressions:
+            raise CommandError(
+                f"{len(comparison.regressions)} regression(s) against {path}"
+            )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{len(report['scenarios'])} route(s) within {threshold:.0%} "
+                f"of the baseline"
+            )
+        )
@@ -0,0 +1,55 @@
+# scheduling/management/commands/clone_season.py
+from django.core.management.base import BaseCommand, CommandError
+
+from scheduling.models import Season
+from scheduling.rollover import SeasonCloneError, clone_season, date_shift
+
+
+class Command(BaseCommand):
+    help = "Copy the trainings (and optionally competitions) of a season"
+
+    def add_arguments(self, parser):
+        parser.add_argument("source", help="Public ID of the season to copy from")
+        parser.add_argument("target", help="Public ID of the season to copy into")
+        parser.add_argument(
+            "--include-competitions",
+            action="store_true",
+            help="Copy competitions too (without their scores)",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report what would be copied",
+        )
+
+    def handle(self, *args, **options):
+        seasons = {}
+        for argument in ("source", "target"):
+            try:
+                seasons[argument] = Season.objects.get(public_id=options[argument])
+            except Season.DoesNotExist as err:
+                raise CommandError(
+                    f"Season '{options[argument]}' does not exist"
+                ) from err
+
+        source, target = seasons["source"], seasons["target"]
+        try:
+            counts = clone_season(
+                source,
+                target,
+                include_competitions=options["include_competitions"],
+                dry_run=options["dry_run"],
+            )
+        except SeasonCloneError as err:
+            raise CommandError(str(err)) from err
+
+        verb = "Would copy" if options["dry_run"] else "Copied"
+        self.stdout.write(
+            f"{verb} from {source} to {target}, "
+            f"shifting dates by {date_shift(source, target).days} days:"
+        )
+        for name, count in counts.as_dict().items():
+            self.stdout.write(f"  {name.replace('_', ' ')}: {count}")
+
+        if not options["dry_run"]:
+            self.stdout.write(self.style.SUCCESS("Season cloned successfully!"))
@@ -0,0 +1,44 @@
+# scheduling/management/commands/export_warehouse.py
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from scheduling.warehouse import DATABASE, WarehouseError, export_warehouse
+
+
+class Command(BaseCommand):
+    help = (
+        "Export the trainings and competitions, with their seasons, venues and "
+        "participants, and the people and venues of the club to a DuckDB "
+        "database and Parquet files, for analytics. Only the changes since the "
+        "previous export are read, unless --full is given."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "directory",
+            type=Path,
+            help=f"Directory of the warehouse, with {DATABASE} and the Parquet files",
+        )
+        parser.add_argument(
+            "--full",
+            action="store_true",
+            help="Export every row again, e.g. to drop the rows purged since",
+        )
+
+    def handle(self, *args, **options):
+        directory: Path = options["directory"]
+        try:
+            export = export_warehouse(directory, full=options["full"])
+        except (OSError, WarehouseError) as err:
+            raise CommandError(str(err)) from err
+
+        for table, rows in export.rows.items():
+            self.stdout.write(f"{table}: {rows}")
+        kind = "full export" if export.full else "changes since the previous export"
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Exported {sum(export.rows.values())} row(s) up to "
+                f"{export.exported_until.isoformat()} to {directory} ({kind})"
+            )
+        )
@@ -0,0 +1,83 @@
+# scheduling/management/commands/generate_synthetic_club.py
+from django.core.management.base import BaseCommand, CommandError
+from django.db import IntegrityError
+
+from scheduling.synthetic import ClubSize, generate_club
+
+
+class Command(BaseCommand):
+    help = (
+        "Add a reproducible synthetic club to the database, for load testing: "
+        "addresses, venues, coaches, athletes, seasons, and their trainings and "
+        "competitions. At scale 1 the club has 100 athletes and 500 trainings "
+        "per season; scale 400 gives a million trainings over 5 seasons."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--scale",
+            type=float,
+            default=1,
+            help="Size of the club relative to a 100 athletes club (default: 1)",
+        )
+        parser.add_argument(
+            "--seasons",
+            type=int,
+            default=5,
+            help="Number of yearly seasons (default: 5)",
+        )
+        parser.add_argument(
+            "--first-year",
+            type=int,
+            default=2020,
+            help="Year of the first season (default: 2020)",
+        )
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=0,
+            help="The same seed and size give the same club (default: 0)",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=4,
+            help="Processes generating records, 0 for none (default: 4)",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=10_000,
+            help="Records generated by a process at once (default: 10000)",
+        )
+
+    def handle(self, *args, **options):
+        if options["scale"] <= 0:
+            raise CommandError("--scale must be positive")
+        if options["seasons"] < 1:
+            raise CommandError("--seasons must be positive")
+        if options["workers"] < 0:
+            raise CommandError("--workers cannot be negative")
+        if options["chunk_size"] < 1:
+            raise CommandError("--chunk-size must be positive")
+
+        size = ClubSize.at_scale(options["scale"], options["seasons"])
+        try:
+            tables = generate_club(
+                size,
+                seed=options["seed"],
+                first_year=options["first_year"],
+                workers=options["workers"],
+                chunk_size=options["chunk_size"],
+            )
+        except IntegrityError as err:
+            raise CommandError(
+                f"Cannot generate the club of seed {options['seed']}, was it "
+                f"generated already? {err}"
+            ) from err
+
+        for table, rows in tables.items():
+            self.stdout.write(f"{table}: {rows}")
+        self.stdout.write(
+            self.style.SUCCESS(f"Generated {sum(tables.values())} row(s)")
+        )
@@ -0,0 +1,43 @@
+# scheduling/management/commands/refresh_rankings.py
+from core import cache
+from django.core.management.base import BaseCommand, CommandError
+
+from scheduling.models import Ranking, Result, Season
+
+
+class Command(BaseCommand):
+    help = "Rebuild the ranking snapshots of one or all seasons"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--season",
+            type=str,
+            default=None,
+            help="Public ID of the season to rebuild (all seasons if omitted)",
+        )
+
+    def handle(self, *args, **options):
+        seasons = Season.objects.all()
+        if options["season"]:
+            seasons = seasons.filter(public_id=options["season"])
+            if not seasons.exists():
+                raise CommandError(f"Season '{options['season']}' does not exist")
+
+        for season in seasons:
+            ranked = Ranking.refresh_season(season.pk)
+
+            # Drop the cached top entries of every partition of the season
+            partitions = (
+                Result.objects.filter(competition__season=season)
+                .values_list("discipline", "age_category")
+                .distinct()
+                .order_by()
+            )
+            for discipline, age_category in partitions:
+                cache.bump_version(
+                    Ranking.cache_namespace(season.public_id, discipline, age_category)
+                )
+
+            self.stdout.write(f"{season.name}: {ranked} ranking entries")
+
+        self.stdout.write(self.style.SUCCESS("Rankings refreshed successfully!"))
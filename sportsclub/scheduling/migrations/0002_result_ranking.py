@@ -0,0 +1,58 @@
+# Generated by Django 6.0.2 on 2026-10-19 00:26
+
+import django.db.models.deletion
+import nanoid_field.fields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('people', '0001_initial'),
+        ('scheduling', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Ranking',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('discipline', models.CharField(max_length=20)),
+                ('age_category', models.CharField(max_length=10)),
+                ('rank', models.PositiveIntegerField()),
+                ('best_mark', models.DecimalField(decimal_places=2, max_digits=8)),
+                ('refreshed_at', models.DateTimeField()),
+                ('athlete', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='rankings', to='people.athlete')),
+                ('season', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='rankings', to='scheduling.season')),
+            ],
+            options={
+                'verbose_name': 'Ranking',
+                'verbose_name_plural': 'Rankings',
+                'ordering': ['season', 'discipline', 'age_category', 'rank'],
+                'indexes': [models.Index(fields=['season', 'discipline', 'age_category', 'rank'], name='scheduling__season__6152cd_idx')],
+                'constraints': [models.UniqueConstraint(fields=('season', 'discipline', 'age_category', 'athlete'), name='scheduling_ranking_unique_athlete')],
+            },
+        ),
+        migrations.CreateModel(
+            name='Result',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('public_id', nanoid_field.fields.NanoidField(alphabet='0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ', editable=False, max_length=21, unique=True)),
+                ('discipline', models.CharField(choices=[('sprints', 'Sprints'), ('long_distance', 'Long distance'), ('relays', 'Relays'), ('high_jump', 'High jump'), ('long_jump', 'Long jump')], max_length=20)),
+                ('age_category', models.CharField(choices=[('u10', 'U10'), ('u12', 'U12'), ('u14', 'U14'), ('u16', 'U16'), ('u18', 'U18'), ('u20', 'U20'), ('senior', 'SENIOR'), ('open', 'OPEN')], editable=False, max_length=10)),
+                ('mark', models.DecimalField(decimal_places=2, help_text='Time in seconds for races, distance or height in metres for jumps', max_digits=8)),
+                ('position', models.PositiveSmallIntegerField(blank=True, help_text='Finishing position in the event', null=True)),
+                ('athlete', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='results', to='people.athlete')),
+                ('competition', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='results', to='scheduling.competition')),
+            ],
+            options={
+                'verbose_name': 'Result',
+                'verbose_name_plural': 'Results',
+                'ordering': ['competition', 'discipline', 'position'],
+                'indexes': [models.Index(fields=['discipline', 'age_category'], name='scheduling__discipl_bb5be1_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 6.0.2 on 2026-10-19 00:28
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    # Build the index without blocking writes to the competitions table
+    atomic = False
+
+    dependencies = [
+        ('inventory', '0001_initial'),
+        ('people', '0001_initial'),
+        ('scheduling', '0002_result_ranking'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='competition',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['score'], name='scheduling_comp_score_gin'),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 6.0.2 on 2026-10-19 00:41
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    # Build the indexes without blocking writes to the activity tables
+    atomic = False
+
+    dependencies = [
+        ('inventory', '0001_initial'),
+        ('people', '0002_live_email_unique'),
+        ('scheduling', '0003_competition_score_gin'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='competition',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['season', 'date'], name='scheduling_comp_live_season'),
+        ),
+        AddIndexConcurrently(
+            model_name='competition',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['date'], name='scheduling_comp_live_date'),
+        ),
+        AddIndexConcurrently(
+            model_name='training',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['season', 'date'], name='scheduling_train_live_season'),
+        ),
+        AddIndexConcurrently(
+            model_name='training',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['date'], name='scheduling_train_live_date'),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 6.0.2 on 2026-10-19 01:05
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    # Build the indexes without blocking writes
+    atomic = False
+
+    dependencies = [
+        ('inventory', '0002_sync_indexes'),
+        ('people', '0004_sync_indexes'),
+        ('scheduling', '0004_activity_live_indexes'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='competition',
+            index=models.Index(fields=['updated_at', 'id'], name='scheduling_comp_sync'),
+        ),
+        AddIndexConcurrently(
+            model_name='season',
+            index=models.Index(fields=['updated_at', 'id'], name='scheduling_season_sync'),
+        ),
+        AddIndexConcurrently(
+            model_name='training',
+            index=models.Index(fields=['updated_at', 'id'], name='scheduling_train_sync'),
+        ),
+    ]
@@ -1,12 +1,16 @@
 # scheduling/models/__init__.py
 from .activity import Activity
 from .competition import Competition
+from .ranking import Ranking
+from .result import Result
 from .season import Season
 from .training import Training
 
 __all__ = [
     "Activity",
     "Competition",
+    "Ranking",
+    "Result",
     "Season",
     "Training",
 ]
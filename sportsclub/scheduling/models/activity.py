@@ -1,8 +1,8 @@
 # scheduling/models/activity.py
 from core.models import Auditory
+from core.models.fields import NanoidField
 from django.db import models
 from inventory.models import Venue
-from nanoid_field import NanoidField
 from people.models import Athlete, Coach
 
 from scheduling.models.season import Season
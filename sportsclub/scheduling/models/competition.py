@@ -1,4 +1,6 @@
 # scheduling/models/competition.py
+from core.models.enums import Discipline
+from django.contrib.postgres.indexes import GinIndex
 from django.core.exceptions import ValidationError
 from django.db import models
 from pydantic import ValidationError as PydanticValidationError
@@ -24,3 +26,53 @@ class Competition(Activity):
         verbose_name = "Competition"
         verbose_name_plural = "Competitions"
         ordering = ["-date"]
+        # The default `jsonb_ops` operator class indexes keys as well as values,
+        # so path queries such as `$.results.relays ? (@.gold >= 1)` can use it
+        # to find the competitions scored in a discipline.
+        indexes = [
+            GinIndex(fields=["score"], name="scheduling_comp_score_gin"),
+            # Partial indexes matching the `SoftDeleteManager` predicate, for
+            # listing the activities of a season or a date range
+            models.Index(
+                fields=["season", "date"],
+                condition=models.Q(deleted_at__isnull=True),
+                name="scheduling_comp_live_season",
+            ),
+            models.Index(
+                fields=["date"],
+                condition=models.Q(deleted_at__isnull=True),
+                name="scheduling_comp_live_date",
+            ),
+            # Range scans of the delta sync (see `core.sync`)
+            models.Index(fields=["updated_at", "id"], name="scheduling_comp_sync"),
+        ]
+
+    @staticmethod
+    def score_path(
+        discipline: Discipline | None = None,
+        min_gold: int | None = None,
+        min_silver: int | None = None,
+        min_bronze: int | None = None,
+    ) -> str | None:
+        """
+        Build the SQL/JSON path matching scores with at least the given medals.
+
+        Only the discipline narrows the index lookup: medal thresholds are range
+        comparisons, which Postgres rechecks on the rows returned by the index.
+
+        Returns:
+            A path for the `path_exists` lookup, or None if nothing is filtered
+        """
+        thresholds = {"gold": min_gold, "silver": min_silver, "bronze": min_bronze}
+        conditions = [
+            f"@.{medal} >= {int(minimum)}"
+            for medal, minimum in thresholds.items()
+            if minimum is not None
+        ]
+        if discipline is None and not conditions:
+            return None
+
+        path = f"$.results.{Discipline(discipline).value if discipline else '*'}"
+        if conditions:
+            path += f" ? ({' && '.join(conditions)})"
+        return path
@@ -0,0 +1,203 @@
+# scheduling/models/ranking.py
+from core.models.enums import Discipline
+from django.db import connection, models, transaction
+from people.models import Athlete
+
+from scheduling.models.competition import Competition
+from scheduling.models.result import Result
+from scheduling.models.season import Season
+
+
+class Ranking(models.Model):
+    """
+    Precomputed snapshot of the season ranking of a discipline and age category.
+
+    Rows are derived from `Result` and rebuilt one partition at a time, so they
+    do not inherit from `Auditory`: they are never edited nor soft-deleted.
+    """
+
+    id = models.BigAutoField(primary_key=True)
+    season = models.ForeignKey(
+        Season, on_delete=models.CASCADE, related_name="rankings"
+    )
+    discipline = models.CharField(max_length=20)
+    age_category = models.CharField(max_length=10)
+    athlete = models.ForeignKey(
+        Athlete, on_delete=models.CASCADE, related_name="rankings"
+    )
+    rank = models.PositiveIntegerField()
+    best_mark = models.DecimalField(max_digits=8, decimal_places=2)
+    refreshed_at = models.DateTimeField()
+
+    class Meta:
+        verbose_name = "Ranking"
+        verbose_name_plural = "Rankings"
+        ordering = ["season", "discipline", "age_category", "rank"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["season", "discipline", "age_category", "athlete"],
+                name="scheduling_ranking_unique_athlete",
+            ),
+        ]
+        # Serves top-N reads as an index range scan
+        indexes = [
+            models.Index(fields=["season", "discipline", "age_category", "rank"]),
+        ]
+
+    def __str__(self):
+        return f"#{self.rank} {self.athlete} ({self.discipline}, {self.age_category})"
+
+    @staticmethod
+    def cache_namespace(season_public_id: str, discipline: str, age_category: str):
+        """Cache namespace holding the serialized top entries of a ranking."""
+        return f"rankings:{season_public_id}:{discipline}:{age_category}"
+
+    @classmethod
+    def refresh_partition(
+        cls, season_id: int, discipline: str, age_category: str
+    ) -> int:
+        """
+        Rebuild the ranking of one season, discipline and age category.
+
+        Personal bests and ranks are computed by Postgres with an aggregate and
+        a `RANK()` window function, and written with a single `INSERT ...
+        SELECT`, so no result is loaded into Python.
+
+        Returns:
+            Number of ranked athletes
+        """
+        discipline = Discipline(discipline)
+        direction, best = (
+            ("ASC", "MIN") if discipline.lower_is_better else ("DESC", "MAX")
+        )
+        qn = connection.ops.quote_name
+        sql = f"""
+            INSERT INTO {qn(cls._meta.db_table)}
+                (season_id, discipline, age_category, athlete_id, rank, best_mark,
+                 refreshed_at)
+            SELECT %s, %s, %s, best.athlete_id,
+                   RANK() OVER (ORDER BY best.best_mark {direction}),
+                   best.best_mark, NOW()
+            FROM (
+                SELECT r.athlete_id, {best}(r.mark) AS best_mark
+                FROM {qn(Result._meta.db_table)} r
+                JOIN {qn(Competition._meta.db_table)} c ON c.id = r.competition_id
+                JOIN {qn(Athlete._meta.db_table)} a ON a.id = r.athlete_id
+                WHERE c.season_id = %s
+                  AND r.discipline = %s
+                  AND r.age_category = %s
+                  AND r.deleted_at IS NULL
+                  AND c.deleted_at IS NULL
+                  AND a.deleted_at IS NULL
+                GROUP BY r.athlete_id
+            ) AS best
+        """
+        params = [season_id, discipline.value, age_category]
+
+        with transaction.atomic():
+            cls.objects.filter(
+                season_id=season_id, discipline=discipline, age_category=age_category
+            ).delete()
+            with connection.cursor() as cursor:
+                cursor.execute(sql, params + params)
+                return cursor.rowcount
+
+    @classmethod
+    def refresh_season(cls, season_id: int) -> int:
+        """Rebuild every ranking partition of a season that has results."""
+        partitions = (
+            Result.objects.filter(competition__season_id=season_id)
+            .values_list("discipline", "age_category")
+            .distinct()
+            .order_by()
+        )
+        stale = cls.objects.filter(season_id=season_id)
+        ranked = 0
+        with transaction.atomic():
+            stale.delete()
+            for discipline, age_category in partitions:
+                ranked += cls.refresh_partition(season_id, discipline, age_category)
+        return ranked
+
+    @classmethod
+    def top(
+        cls, season_public_id: str, discipline: str, age_category: str, limit: int
+    ) -> list[dict]:
+        """Return the first `limit` entries of a ranking as plain dictionaries."""
+        rows = (
+            cls.objects.filter(
+                season__public_id=season_public_id,
+                discipline=discipline,
+                age_category=age_category,
+            )
+            .select_related("athlete")
+            .order_by("rank", "athlete_id")[:limit]
+        )
+        return [
+            {
+                "rank": row.rank,
+                "athlete": {
+                    "public_id": row.athlete.public_id,
+                    "display_name": str(row.athlete),
+                    "jersey_number": row.athlete.jersey_number,
+                },
+                "best_mark": row.best_mark,
+            }
+            for row in rows
+        ]
+
+    @classmethod
+    def apply_result(cls, result: Result, top_n: int, created: bool) -> bool:
+        """
+        Bring the snapshot up to date after `result` was written or removed.
+
+        A new result that does not improve the athlete's best mark cannot move
+        anybody, so the partition is only rebuilt when it does. Edited and
+        removed results always rebuild it, as they may have been the best mark.
+
+        Returns:
+            Whether the first `top_n` entries of the ranking changed
+        """
+        season_id = (
+            Competition.all_objects.filter(pk=result.competition_id)
+            .values_list("season_id", flat=True)
+            .first()
+        )
+        if season_id is None:
+            return False
+
+        partition = {
+            "season_id": season_id,
+            "discipline": result.discipline,
+            "age_category": result.age_category,
+        }
+        removed = (
+            result.deleted_at is not None
+            or not Result.objects.filter(pk=result.pk).exists()
+        )
+        if created and not removed:
+            previous_best = (
+                cls.objects.filter(**partition, athlete_id=result.athlete_id)
+                .values_list("best_mark", flat=True)
+                .first()
+            )
+            if previous_best is not None:
+                lower_is_better = Discipline(result.discipline).lower_is_better
+                improved = (
+                    result.mark < previous_best
+                    if lower_is_better
+                    else result.mark > previous_best
+                )
+                if not improved:
+                    return False
+
+        def head():
+            return list(
+                cls.objects.filter(**partition)
+                .order_by("rank", "athlete_id")
+                .values_list("athlete_id", "rank", "best_mark")[:top_n]
+            )
+
+        before = head()
+        cls.refresh_partition(**partition)
+        return head() != before
@@ -0,0 +1,64 @@
+# scheduling/models/result.py
+from core.models import Auditory
+from core.models.enums import AgeCategory, Discipline
+from core.models.fields import NanoidField
+from django.db import models
+from people.models import Athlete
+
+from scheduling.models.competition import Competition
+
+
+class Result(Auditory):
+    """The mark achieved by an athlete in a discipline of a competition."""
+
+    id = models.BigAutoField(primary_key=True)
+    public_id = NanoidField(unique=True, editable=False)
+    competition = models.ForeignKey(
+        Competition, on_delete=models.CASCADE, related_name="results"
+    )
+    athlete = models.ForeignKey(
+        Athlete, on_delete=models.CASCADE, related_name="results"
+    )
+    discipline = models.CharField(
+        max_length=20,
+        choices=[(d.value, d.value.replace("_", " ").capitalize()) for d in Discipline],
+    )
+    # Denormalised at creation time, so rankings can be partitioned by category
+    # without recomputing ages on every query.
+    age_category = models.CharField(
+        max_length=10,
+        choices=[(c.value, c.value.upper()) for c in AgeCategory],
+        editable=False,
+    )
+    mark = models.DecimalField(
+        max_digits=8,
+        decimal_places=2,
+        help_text="Time in seconds for races, distance or height in metres for jumps",
+    )
+    position = models.PositiveSmallIntegerField(
+        null=True, blank=True, help_text="Finishing position in the event"
+    )
+
+    class Meta:
+        verbose_name = "Result"
+        verbose_name_plural = "Results"
+        ordering = ["competition", "discipline", "position"]
+        indexes = [
+            models.Index(fields=["discipline", "age_category"]),
+        ]
+
+    def __str__(self):
+        return f"{self.athlete} - {self.discipline}: {self.mark}"
+
+    def save(self, *args, **kwargs):
+        if not self.age_category:
+            self.age_category = self.compute_age_category()
+        super().save(*args, **kwargs)
+
+    def compute_age_category(self) -> AgeCategory:
+        """Return the age category of the athlete in the competition's season."""
+        date_of_birth = self.athlete.date_of_birth
+        return AgeCategory.for_birth_year(
+            date_of_birth.year if date_of_birth else None,
+            self.competition.season.start_date.year,
+        )
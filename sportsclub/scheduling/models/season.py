@@ -1,7 +1,7 @@
 # scheduling/models/season.py
 from core.models import Auditory
+from core.models.fields import NanoidField
 from django.db import models
-from nanoid_field import NanoidField
 
 
 class Season(Auditory):
@@ -17,6 +17,10 @@ class Season(Auditory):
         verbose_name = "Season"
         verbose_name_plural = "Seasons"
         ordering = ["-start_date"]
+        indexes = [
+            # Range scans of the delta sync (see `core.sync`)
+            models.Index(fields=["updated_at", "id"], name="scheduling_season_sync"),
+        ]
 
     def __str__(self):
         return self.name
@@ -15,3 +15,19 @@ class Training(Activity):
         verbose_name = "Training session"
         verbose_name_plural = "Training sessions"
         ordering = ["-date"]
+        indexes = [
+            # Partial indexes matching the `SoftDeleteManager` predicate, for
+            # listing the activities of a season or a date range
+            models.Index(
+                fields=["season", "date"],
+                condition=models.Q(deleted_at__isnull=True),
+                name="scheduling_train_live_season",
+            ),
+            models.Index(
+                fields=["date"],
+                condition=models.Q(deleted_at__isnull=True),
+                name="scheduling_train_live_date",
+            ),
+            # Range scans of the delta sync (see `core.sync`)
+            models.Index(fields=["updated_at", "id"], name="scheduling_train_sync"),
+        ]
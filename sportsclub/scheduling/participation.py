@@ -0,0 +1,121 @@
+# scheduling/participation.py
+"""
+Participation statistics: trainings and competitions attended per athlete.
+
+Counts are computed by Postgres from the activity through tables with a single
+`GROUP BY GROUPING SETS` query, which yields both the season totals and the
+monthly breakdown of every athlete, and cached per season. Signal handlers
+bump the cache namespace of a season when its activities or rosters change.
+"""
+
+from collections.abc import Iterable
+
+from core import cache
+from django.conf import settings
+from django.db import connection
+from people.models import Athlete
+
+from scheduling.models import Competition, Season, Training
+
+
+def cache_namespace(season_public_id: str) -> str:
+    """Cache namespace holding the participation statistics of a season."""
+    return f"participation:{season_public_id}"
+
+
+def invalidate_seasons(season_ids: Iterable[int]):
+    """Drop the cached statistics of the given seasons (by primary key)."""
+    season_ids = {season_id for season_id in season_ids if season_id is not None}
+    if not season_ids:
+        return
+    for public_id in Season.all_objects.filter(pk__in=season_ids).values_list(
+        "public_id", flat=True
+    ):
+        cache.bump_version(cache_namespace(public_id))
+
+
+def athlete_season_ids(athlete_id: int) -> set[int]:
+    """Return the seasons in which an athlete took part in any activity."""
+    season_ids = set()
+    for model in (Competition, Training):
+        season_ids.update(
+            model.all_objects.filter(athletes=athlete_id)
+            .values_list("season_id", flat=True)
+            .distinct()
+            .order_by()
+        )
+    return season_ids
+
+
+def season_participation(season_id: int) -> list[dict]:
+    """
+    Count the trainings and competitions attended by each athlete in a season.
+
+    Returns:
+        One dictionary per athlete with at least one activity, ordered by
+        name, holding the season totals and a list of monthly totals
+    """
+    qn = connection.ops.quote_name
+    selects, params = [], []
+    for model, kind in ((Competition, "competition"), (Training, "training")):
+        through = model.athletes.through
+        selects.append(
+            f"""
+            SELECT t.athlete_id, '{kind}' AS kind,
+                   DATE_TRUNC('month', a.date AT TIME ZONE %s)::date AS month
+            FROM {qn(through._meta.db_table)} t
+            JOIN {qn(model._meta.db_table)} a ON a.id = t.{kind}_id
+            WHERE a.season_id = %s AND a.deleted_at IS NULL
+            """
+        )
+        params += [settings.TIME_ZONE, season_id]
+    # The grouping set without month yields the season totals of each athlete;
+    # GROUPING(p.month) tells them apart from the monthly rows.
+    sql = f"""
+        SELECT ath.public_id, ath.first_name, ath.last_name, ath.jersey_number,
+               p.month, GROUPING(p.month) = 1,
+               COUNT(*) FILTER (WHERE p.kind = 'training'),
+               COUNT(*) FILTER (WHERE p.kind = 'competition')
+        FROM ({" UNION ALL ".join(selects)}) AS p
+        JOIN {qn(Athlete._meta.db_table)} ath ON ath.id = p.athlete_id
+        WHERE ath.deleted_at IS NULL
+        GROUP BY ath.id, GROUPING SETS ((), (p.month))
+        ORDER BY ath.last_name, ath.first_name, ath.id, GROUPING(p.month) DESC,
+                 p.month
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        rows = cursor.fetchall()
+
+    athletes = []
+    for (
+        public_id,
+        first_name,
+        last_name,
+        jersey_number,
+        month,
+        is_total,
+        trainings,
+        competitions,
+    ) in rows:
+        counts = {
+            "trainings": trainings,
+            "competitions": competitions,
+            "total": trainings + competitions,
+        }
+        if is_total:
+            # Totals come first for each athlete, followed by their months
+            athletes.append(
+                {
+                    "athlete": {
+                        "public_id": public_id,
+                        "display_name": f"{first_name} {last_name}",
+                        "jersey_number": jersey_number,
+                    },
+                    **counts,
+                    "months": [],
+                }
+            )
+        else:
+            athletes[-1]["months"].append({"month": month, **counts})
+    return athletes
@@ -0,0 +1,207 @@
+# scheduling/rollover.py
+"""
+Season rollover: copy the plan of a season into the next one.
+
+Activities are copied with `INSERT ... SELECT` statements, one per activity
+type, whose data-modifying CTEs also copy the athlete and coach memberships,
+so only the IDs of the activities are loaded into Python whatever the size of
+the plan. Raw SQL does not send signals, so `post_clone` is sent for each
+activity type instead, and the caches derived from activities are dropped at
+the end.
+"""
+
+from dataclasses import asdict, dataclass
+from datetime import timedelta
+
+from core import nanoids
+from django.db import connection, transaction
+from django.dispatch import Signal
+from inventory import utilization
+from people.models import Athlete, Coach
+
+from scheduling.calendars import invalidate_all_feeds
+from scheduling.models import Competition, Season, Training
+from scheduling.participation import invalidate_seasons
+
+# Sent with `pks`, the primary keys of the activities copied into the season
+post_clone = Signal()
+
+
+class SeasonCloneError(Exception):
+    """The plan of a season cannot be cloned into the target season."""
+
+
+@dataclass
+class CloneCounts:
+    """Number of rows copied (or to be copied, in a dry run)."""
+
+    trainings: int = 0
+    competitions: int = 0
+    athlete_memberships: int = 0
+    coach_memberships: int = 0
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+def date_shift(source: Season, target: Season) -> timedelta:
+    """
+    Return the offset applied to the dates of cloned activities.
+
+    The offset between season start dates is rounded to whole weeks, so that
+    a training held on Tuesdays is still held on Tuesdays.
+    """
+    weeks = round((target.start_date - source.start_date).days / 7)
+    return timedelta(weeks=weeks)
+
+
+def _count(model, source: Season) -> tuple[int, int, int]:
+    """Count the activities of a type in a season, and their memberships."""
+    activities = model.objects.filter(season=source)
+    relation = f"{model._meta.model_name}_activities"
+    return (
+        activities.count(),
+        Athlete.objects.filter(**{f"{relation}__in": activities}).count(),
+        Coach.objects.filter(**{f"{relation}__in": activities}).count(),
+    )
+
+
+def _copy(
+    model, source: Season, target: Season, shift: timedelta
+) -> tuple[list[int], int, int]:
+    """
+    Copy the activities of a type and their memberships with one statement.
+
+    The activities are locked and fetched first, and the statement copies
+    exactly those, so there is one public ID per copied row even if another
+    transaction adds or deletes activities of the season meanwhile.
+
+    Returns:
+        Primary keys of the copies, and the number of athlete and coach
+        memberships copied
+    """
+    qn = connection.ops.quote_name
+    kind = model._meta.model_name
+    table = qn(model._meta.db_table)
+    athletes_table = qn(model.athletes.through._meta.db_table)
+    coaches_table = qn(model.coaches.through._meta.db_table)
+    # Fields specific to each activity type: trainings keep their focus,
+    # competitions start the season without a score.
+    extra_columns, extra_values = (
+        (", focus", ", src.focus") if model is Training else (", score", ", NULL")
+    )
+
+    ids = list(
+        model.objects.select_for_update()
+        .filter(season=source)
+        .order_by("pk")
+        .values_list("pk", flat=True)
+    )
+    sql = f"""
+        WITH src AS (
+            SELECT a.*, ROW_NUMBER() OVER (ORDER BY a.id) AS rn
+            FROM {table} a
+            WHERE a.id = ANY(%s)
+        ),
+        new_ids AS (
+            SELECT public_id, rn
+            FROM UNNEST(%s::varchar[]) WITH ORDINALITY AS ids(public_id, rn)
+        ),
+        inserted AS (
+            INSERT INTO {table}
+                (public_id, name, date, venue_id, season_id, created_at,
+                 updated_at, deleted_at{extra_columns})
+            SELECT new_ids.public_id, src.name, src.date + %s, src.venue_id, %s,
+                   NOW(), NOW(), NULL{extra_values}
+            FROM src JOIN new_ids USING (rn)
+            RETURNING id, public_id
+        ),
+        mapping AS (
+            SELECT src.id AS old_id, inserted.id AS new_id
+            FROM inserted
+            JOIN new_ids USING (public_id)
+            JOIN src USING (rn)
+        ),
+        athletes AS (
+            INSERT INTO {athletes_table} ({kind}_id, athlete_id)
+            SELECT mapping.new_id, m.athlete_id
+            FROM mapping
+            JOIN {athletes_table} m ON m.{kind}_id = mapping.old_id
+            JOIN {qn(Athlete._meta.db_table)} p
+                ON p.id = m.athlete_id AND p.deleted_at IS NULL
+            RETURNING 1
+        ),
+        coaches AS (
+            INSERT INTO {coaches_table} ({kind}_id, coach_id)
+            SELECT mapping.new_id, m.coach_id
+            FROM mapping
+            JOIN {coaches_table} m ON m.{kind}_id = mapping.old_id
+            JOIN {qn(Coach._meta.db_table)} p
+                ON p.id = m.coach_id AND p.deleted_at IS NULL
+            RETURNING 1
+        )
+        SELECT (SELECT ARRAY_AGG(id ORDER BY id) FROM inserted),
+               (SELECT COUNT(*) FROM athletes),
+               (SELECT COUNT(*) FROM coaches)
+    """
+    params = [ids, nanoids.unique(model, "public_id", len(ids)), shift, target.pk]
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        pks, athletes, coaches = cursor.fetchone()
+    return pks or [], athletes, coaches
+
+
+def clone_season(
+    source: Season,
+    target: Season,
+    include_competitions: bool = False,
+    dry_run: bool = False,
+) -> CloneCounts:
+    """
+    Copy the trainings (and optionally competitions) of a season into another.
+
+    Dates are shifted by `date_shift()`, and athlete and coach memberships are
+    copied along. Soft-deleted activities and people are left behind, and
+    copied competitions have no score.
+
+    Raises:
+        SeasonCloneError: If both seasons are the same, or the target season
+            already has activities of a type to copy
+
+    Returns:
+        Number of copied rows, or of rows that would be copied in a dry run
+    """
+    if source.pk == target.pk:
+        raise SeasonCloneError("A season cannot be cloned into itself")
+
+    models = [Training, Competition] if include_competitions else [Training]
+    for model in models:
+        if model.objects.filter(season=target).exists():
+            raise SeasonCloneError(
+                f"Season '{target}' already has "
+                f"{model._meta.verbose_name_plural.lower()}"
+            )
+
+    counts = CloneCounts()
+    shift = date_shift(source, target)
+    with transaction.atomic():
+        for model in models:
+            if dry_run:
+                activities, athletes, coaches = _count(model, source)
+            else:
+                pks, athletes, coaches = _copy(model, source, target, shift)
+                activities = len(pks)
+                post_clone.send(sender=model, pks=pks)
+            setattr(counts, f"{model._meta.model_name}s", activities)
+            counts.athlete_memberships += athletes
+            counts.coach_memberships += coaches
+
+    if not dry_run:
+        transaction.on_commit(lambda: _invalidate_caches(target))
+    return counts
+
+
+def _invalidate_caches(target: Season):
+    invalidate_seasons([target.pk])
+    utilization.invalidate()
+    invalidate_all_feeds()
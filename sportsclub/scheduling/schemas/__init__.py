@@ -1,12 +1,26 @@
 # scheduling/schemas/__init__.py
 from scheduling.schemas.common import CompetitionScore, MedalCount
 from scheduling.schemas.competition import (
+    CompetitionFilter,
     CompetitionIn,
     CompetitionListOut,
     CompetitionOut,
     CompetitionPatch,
 )
+from scheduling.schemas.participation import (
+    AthleteParticipationOut,
+    MonthlyParticipationOut,
+    ParticipationOut,
+)
+from scheduling.schemas.ranking import (
+    RankedAthleteOut,
+    RankingEntryOut,
+    RankingOut,
+)
+from scheduling.schemas.result import ResultIn, ResultOut
 from scheduling.schemas.season import (
+    SeasonCloneIn,
+    SeasonCloneOut,
     SeasonIn,
     SeasonListOut,
     SeasonOut,
@@ -28,6 +42,9 @@ __all__ = [
     "SeasonOut",
     "SeasonPatch",
     "SeasonRef",
+    "SeasonCloneIn",
+    "SeasonCloneOut",
+    "CompetitionFilter",
     "CompetitionIn",
     "CompetitionListOut",
     "CompetitionOut",
@@ -36,4 +53,12 @@ __all__ = [
     "TrainingListOut",
     "TrainingOut",
     "TrainingPatch",
+    "RankedAthleteOut",
+    "RankingEntryOut",
+    "RankingOut",
+    "ResultIn",
+    "ResultOut",
+    "AthleteParticipationOut",
+    "MonthlyParticipationOut",
+    "ParticipationOut",
 ]
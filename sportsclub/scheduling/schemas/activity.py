@@ -1,6 +1,7 @@
 # scheduling/schemas/activity.py
 from datetime import datetime
 
+from core.schemas import resolve_live
 from inventory.schemas import VenueRef
 from ninja import Field, Schema
 from people.schemas import AthleteRef, CoachRef
@@ -54,9 +55,7 @@ class ActivityOut(Schema):
     coaches: list[CoachRef]
     athletes: list[AthleteRef]
 
-    @staticmethod
-    def resolve_venue(obj):
-        return obj.venue if obj.venue else None
+    resolve_venue = resolve_live("venue")
 
     @staticmethod
     def resolve_season(obj):
@@ -1,6 +1,8 @@
 # scheduling/schemas/competition.py
 from datetime import datetime
 
+from core.models.enums import Discipline
+from core.schemas import resolve_live
 from inventory.schemas import VenueRef
 from ninja import Field, Schema
 from people.schemas import AthleteRef, CoachRef
@@ -39,6 +41,20 @@ class CompetitionPatch(Schema):
     score: CompetitionScore | None = None
 
 
+class CompetitionFilter(Schema):
+    """Query parameters for filtering the list of competitions."""
+
+    season_public_id: str | None = Field(
+        None, description="Only competitions of this season"
+    )
+    discipline: Discipline | None = Field(
+        None, description="Only competitions with a score in this discipline"
+    )
+    min_gold: int | None = Field(None, ge=1, description="Minimum gold medals")
+    min_silver: int | None = Field(None, ge=1, description="Minimum silver medals")
+    min_bronze: int | None = Field(None, ge=1, description="Minimum bronze medals")
+
+
 class CompetitionListOut(Schema):
     """Schema for listing competitions (minimal fields)."""
 
@@ -64,9 +80,7 @@ class CompetitionOut(Schema):
     athletes: list[AthleteRef]
     score: CompetitionScore | None
 
-    @staticmethod
-    def resolve_venue(obj):
-        return obj.venue if obj.venue else None
+    resolve_venue = resolve_live("venue")
 
     @staticmethod
     def resolve_season(obj):
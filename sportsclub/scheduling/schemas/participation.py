@@ -0,0 +1,32 @@
+# scheduling/schemas/participation.py
+from datetime import date
+
+from ninja import Schema
+
+from scheduling.schemas.ranking import RankedAthleteOut
+
+
+class MonthlyParticipationOut(Schema):
+    """Activities attended by an athlete during a calendar month."""
+
+    month: date
+    trainings: int
+    competitions: int
+    total: int
+
+
+class AthleteParticipationOut(Schema):
+    """Activities attended by an athlete during a season."""
+
+    athlete: RankedAthleteOut
+    trainings: int
+    competitions: int
+    total: int
+    months: list[MonthlyParticipationOut]
+
+
+class ParticipationOut(Schema):
+    """Participation of every athlete taking part in a season."""
+
+    season_public_id: str
+    athletes: list[AthleteParticipationOut]
@@ -0,0 +1,33 @@
+# scheduling/schemas/ranking.py
+from core.models.enums import AgeCategory, Discipline
+from ninja import Schema
+
+
+class RankedAthleteOut(Schema):
+    """
+    Athlete embedded in a ranking entry or in participation statistics.
+
+    Both are served from precomputed dictionaries, so unlike `AthleteRef` the
+    display name is read as is instead of being resolved from a model.
+    """
+
+    public_id: str
+    display_name: str
+    jersey_number: int | None
+
+
+class RankingEntryOut(Schema):
+    """Position of an athlete in a ranking."""
+
+    rank: int
+    athlete: RankedAthleteOut
+    best_mark: float
+
+
+class RankingOut(Schema):
+    """Top entries of a season ranking for a discipline and age category."""
+
+    season_public_id: str
+    discipline: Discipline
+    age_category: AgeCategory
+    entries: list[RankingEntryOut]
@@ -0,0 +1,34 @@
+# scheduling/schemas/result.py
+from core.models.enums import AgeCategory, Discipline
+from ninja import Field, Schema
+from people.schemas import AthleteRef
+
+
+class ResultIn(Schema):
+    """Schema for recording a result of a competition (POST)."""
+
+    athlete_public_id: str = Field(..., description="Athlete who achieved the mark")
+    discipline: Discipline
+    mark: float = Field(
+        ...,
+        gt=0,
+        description="Time in seconds for races, distance or height in metres for jumps",
+        json_schema_extra={"example": 12.35},
+    )
+    position: int | None = Field(None, ge=1, description="Finishing position")
+
+
+class ResultOut(Schema):
+    """Schema for full result details."""
+
+    public_id: str
+    competition_public_id: str
+    athlete: AthleteRef
+    discipline: Discipline
+    age_category: AgeCategory
+    mark: float
+    position: int | None
+
+    @staticmethod
+    def resolve_competition_public_id(obj):
+        return obj.competition.public_id
@@ -43,3 +43,24 @@ class SeasonOut(Schema):
     name: str
     start_date: date
     end_date: date
+
+
+class SeasonCloneIn(Schema):
+    """Schema for cloning the plan of a season into another one."""
+
+    target_season_public_id: str
+    include_competitions: bool = False
+    dry_run: bool = Field(False, description="Only report what would be copied")
+
+
+class SeasonCloneOut(Schema):
+    """Number of activities and memberships copied into the target season."""
+
+    source: SeasonRef
+    target: SeasonRef
+    dry_run: bool
+    days_shifted: int
+    trainings: int
+    competitions: int
+    athlete_memberships: int
+    coach_memberships: int
@@ -1,6 +1,7 @@
 # scheduling/schemas/training.py
 from datetime import datetime
 
+from core.schemas import resolve_live
 from inventory.schemas import VenueRef
 from ninja import Field, Schema
 from people.schemas import AthleteRef, CoachRef
@@ -58,9 +59,7 @@ class TrainingOut(Schema):
     athletes: list[AthleteRef]
     focus: str
 
-    @staticmethod
-    def resolve_venue(obj):
-        return obj.venue if obj.venue else None
+    resolve_venue = resolve_live("venue")
 
     @staticmethod
     def resolve_season(obj):
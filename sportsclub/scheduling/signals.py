@@ -0,0 +1,409 @@
+# scheduling/signals.py
+"""Signal handlers keeping derived scheduling data up to date."""
+
+from functools import partial
+
+from core import cache, events
+from core.deletion import pre_cascade_update
+from core.imports import post_import
+from core.signals import record_bulk_create
+from django.conf import settings
+from django.db import transaction
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_save,
+    pre_delete,
+    pre_save,
+)
+from django.dispatch import receiver
+from inventory import utilization
+from inventory.models import Venue
+from people.anonymisation import post_anonymise
+from people.models import Athlete, Coach
+
+from scheduling.calendars import FeedKind, invalidate_all_feeds, invalidate_feeds
+from scheduling.models import Competition, Ranking, Result, Season, Training
+from scheduling.participation import athlete_season_ids, invalidate_seasons
+from scheduling.rollover import post_clone
+
+events.register(Season, "seasons", season="public_id")
+events.register(Competition, "competitions", season="season__public_id")
+events.register(Training, "trainings", season="season__public_id")
+events.register(Result, "results", season="competition__season__public_id")
+
+post_clone.connect(record_bulk_create)
+
+
+# Season rollovers insert activities with raw SQL, which sends no `post_save`
+@receiver(post_clone)
+def publish_clone(sender, pks, **kwargs):
+    events.publish(sender.objects.filter(pk__in=pks), events.Operation.CREATE)
+
+
+def _apply_result(result: Result, created: bool):
+    """Update the ranking snapshot and drop its cached top entries if they moved."""
+    if Ranking.apply_result(result, settings.RANKINGS_TOP_N, created):
+        season_public_id = (
+            Season.all_objects.filter(competition_activities=result.competition_id)
+            .values_list("public_id", flat=True)
+            .first()
+        )
+        cache.bump_version(
+            Ranking.cache_namespace(
+                season_public_id, result.discipline, result.age_category
+            )
+        )
+
+
+def _ranking_partitions(results) -> list[tuple[int, str, str, str]]:
+    """Return the ranking partitions fed by a queryset of results."""
+    return list(
+        results.values_list(
+            "competition__season_id",
+            "competition__season__public_id",
+            "discipline",
+            "age_category",
+        )
+        .distinct()
+        .order_by()
+    )
+
+
+def _refresh_partitions(partitions: list[tuple[int, str, str, str]]):
+    for season_id, season_public_id, discipline, age_category in partitions:
+        Ranking.refresh_partition(season_id, discipline, age_category)
+        cache.bump_version(
+            Ranking.cache_namespace(season_public_id, discipline, age_category)
+        )
+
+
+def _refresh_competition_rankings(competition: Competition):
+    """Rebuild the rankings fed by the results of a competition."""
+    _refresh_partitions(
+        _ranking_partitions(Result.all_objects.filter(competition_id=competition.pk))
+    )
+
+
+# Rankings are refreshed after the transaction commits, so the window functions
+# see the new result and a rolled back write leaves the snapshot untouched.
+@receiver(post_save, sender=Result)
+def update_rankings_on_result_save(sender, instance, created, **kwargs):
+    transaction.on_commit(partial(_apply_result, instance, created))
+
+
+@receiver(post_delete, sender=Result)
+def update_rankings_on_result_delete(sender, instance, **kwargs):
+    transaction.on_commit(partial(_apply_result, instance, False))
+
+
+# A competition being soft-deleted or restored adds or removes all its results.
+# Moving it to another season leaves the old season stale until the
+# `refresh_rankings` command is run.
+@receiver(post_save, sender=Competition)
+def update_rankings_on_competition_save(sender, instance, created, **kwargs):
+    if not created:
+        transaction.on_commit(partial(_refresh_competition_rankings, instance))
+
+
+# Participation statistics are cached per season; any change to an activity
+# (date, season, soft delete) or to its list of athletes makes them stale.
+@receiver(pre_save, sender=Competition)
+@receiver(pre_save, sender=Training)
+def remember_previous_placement(sender, instance, **kwargs):
+    previous = (
+        sender.all_objects.filter(pk=instance.pk)
+        .values_list("season_id", "venue_id")
+        .first()
+        if instance.pk
+        else None
+    )
+    instance._previous_season_id, instance._previous_venue_id = previous or (
+        None,
+        None,
+    )
+
+
+@receiver(post_save, sender=Competition)
+@receiver(post_save, sender=Training)
+@receiver(post_delete, sender=Competition)
+@receiver(post_delete, sender=Training)
+def invalidate_participation_on_activity_change(sender, instance, **kwargs):
+    season_ids = {instance.season_id, getattr(instance, "_previous_season_id", None)}
+    transaction.on_commit(partial(invalidate_seasons, season_ids))
+
+
+@receiver(m2m_changed, sender=Competition.athletes.through)
+@receiver(m2m_changed, sender=Training.athletes.through)
+def invalidate_participation_on_roster_change(
+    sender, instance, action, reverse, model, pk_set, **kwargs
+):
+    if not reverse:
+        # activity.athletes.add(...), remove(...) or clear()
+        if action in ("post_add", "post_remove", "post_clear"):
+            transaction.on_commit(partial(invalidate_seasons, {instance.season_id}))
+        return
+
+    # athlete.<kind>_activities.add(...), remove(...) or clear(): the seasons
+    # to drop are those of the activities, which are gone after a clear.
+    if action == "pre_clear":
+        instance._cleared_season_ids = set(
+            model.all_objects.filter(athletes=instance).values_list(
+                "season_id", flat=True
+            )
+        )
+    elif action in ("post_add", "post_remove"):
+        season_ids = set(
+            model.all_objects.filter(pk__in=pk_set).values_list("season_id", flat=True)
+        )
+        transaction.on_commit(partial(invalidate_seasons, season_ids))
+    elif action == "post_clear":
+        season_ids = getattr(instance, "_cleared_season_ids", set())
+        transaction.on_commit(partial(invalidate_seasons, season_ids))
+
+
+# Participation statistics and cached rankings embed the athlete's name (and
+# rankings their jersey number) and leave out soft-deleted athletes, so they
+# are dropped for every season and ranking the athlete is part of.
+@receiver(post_save, sender=Athlete)
+def invalidate_participation_on_athlete_save(sender, instance, created, **kwargs):
+    if not created:
+        transaction.on_commit(
+            lambda: invalidate_seasons(athlete_season_ids(instance.pk))
+        )
+        namespaces = _ranking_namespaces([instance.pk])
+        transaction.on_commit(partial(_bump_versions, namespaces))
+
+
+@receiver(pre_delete, sender=Athlete)
+def invalidate_participation_on_athlete_delete(sender, instance, **kwargs):
+    # Collected before the through rows are deleted along with the athlete
+    season_ids = athlete_season_ids(instance.pk)
+    transaction.on_commit(partial(invalidate_seasons, season_ids))
+
+
+# Venue utilization reports are cached in a single namespace, dropped on any
+# change to an activity or to its list of athletes.
+@receiver(post_save, sender=Competition)
+@receiver(post_save, sender=Training)
+@receiver(post_delete, sender=Competition)
+@receiver(post_delete, sender=Training)
+def invalidate_utilization_on_activity_change(sender, instance, **kwargs):
+    transaction.on_commit(utilization.invalidate)
+
+
+@receiver(m2m_changed, sender=Competition.athletes.through)
+@receiver(m2m_changed, sender=Training.athletes.through)
+def invalidate_utilization_on_roster_change(sender, action, **kwargs):
+    if action in ("post_add", "post_remove", "post_clear"):
+        transaction.on_commit(utilization.invalidate)
+
+
+# Calendar feeds are cached per season, venue, athlete and coach. Saving or
+# deleting an activity changes the feeds it appears in; names shown in feeds
+# change their own feed, except venue names which appear everywhere.
+def _activity_feeds(activity) -> dict[FeedKind, list[str]]:
+    """Return the public IDs of the feeds an activity appears (or appeared) in."""
+    season_ids = {activity.season_id, getattr(activity, "_previous_season_id", None)}
+    venue_ids = {activity.venue_id, getattr(activity, "_previous_venue_id", None)}
+    relation = f"{activity._meta.model_name}_activities"
+    return {
+        FeedKind.SEASON: list(
+            Season.all_objects.filter(pk__in=season_ids - {None}).values_list(
+                "public_id", flat=True
+            )
+        ),
+        FeedKind.VENUE: list(
+            Venue.all_objects.filter(pk__in=venue_ids - {None}).values_list(
+                "public_id", flat=True
+            )
+        ),
+        FeedKind.ATHLETE: list(
+            Athlete.all_objects.filter(**{relation: activity.pk}).values_list(
+                "public_id", flat=True
+            )
+        ),
+        FeedKind.COACH: list(
+            Coach.all_objects.filter(**{relation: activity.pk}).values_list(
+                "public_id", flat=True
+            )
+        ),
+    }
+
+
+def _invalidate_feeds(feeds: dict[FeedKind, list[str]]):
+    for kind, public_ids in feeds.items():
+        invalidate_feeds(kind, public_ids)
+
+
+@receiver(post_save, sender=Competition)
+@receiver(post_save, sender=Training)
+def invalidate_calendars_on_activity_save(sender, instance, **kwargs):
+    transaction.on_commit(lambda: _invalidate_feeds(_activity_feeds(instance)))
+
+
+@receiver(pre_delete, sender=Competition)
+@receiver(pre_delete, sender=Training)
+def invalidate_calendars_on_activity_delete(sender, instance, **kwargs):
+    # Collected before the memberships are deleted along with the activity
+    feeds = _activity_feeds(instance)
+    transaction.on_commit(partial(_invalidate_feeds, feeds))
+
+
+@receiver(m2m_changed, sender=Competition.athletes.through)
+@receiver(m2m_changed, sender=Competition.coaches.through)
+@receiver(m2m_changed, sender=Training.athletes.through)
+@receiver(m2m_changed, sender=Training.coaches.through)
+def invalidate_calendars_on_roster_change(
+    sender, instance, action, reverse, model, pk_set, **kwargs
+):
+    if reverse:
+        # person.<kind>_activities.add(...), remove(...) or clear()
+        if action in ("post_add", "post_remove", "post_clear"):
+            kind = FeedKind.ATHLETE if isinstance(instance, Athlete) else FeedKind.COACH
+            transaction.on_commit(partial(invalidate_feeds, kind, [instance.public_id]))
+        return
+
+    kind = FeedKind.ATHLETE if model is Athlete else FeedKind.COACH
+    if action == "pre_clear":
+        instance._cleared_feed_ids = list(
+            model.all_objects.filter(
+                **{f"{instance._meta.model_name}_activities": instance.pk}
+            ).values_list("public_id", flat=True)
+        )
+    elif action in ("post_add", "post_remove"):
+        public_ids = list(
+            model.all_objects.filter(pk__in=pk_set).values_list("public_id", flat=True)
+        )
+        transaction.on_commit(partial(invalidate_feeds, kind, public_ids))
+    elif action == "post_clear":
+        public_ids = getattr(instance, "_cleared_feed_ids", [])
+        transaction.on_commit(partial(invalidate_feeds, kind, public_ids))
+
+
+@receiver(post_save, sender=Season)
+@receiver(post_save, sender=Athlete)
+@receiver(post_save, sender=Coach)
+def invalidate_calendar_on_rename(sender, instance, created, **kwargs):
+    if not created:
+        kind = {Season: FeedKind.SEASON, Athlete: FeedKind.ATHLETE}.get(
+            sender, FeedKind.COACH
+        )
+        transaction.on_commit(partial(invalidate_feeds, kind, [instance.public_id]))
+
+
+@receiver(post_save, sender=Venue)
+@receiver(post_delete, sender=Venue)
+def invalidate_calendars_on_venue_change(sender, instance, **kwargs):
+    transaction.on_commit(invalidate_all_feeds)
+
+
+# Set-based soft deletes and restores (see `core.deletion`) send no
+# `post_save`: the data derived from the updated rows is collected before they
+# change, and dropped once the transaction commits. Cascades are rare, so whole
+# namespaces are dropped where working out the exact feeds would cost queries.
+@receiver(pre_cascade_update, sender=Result)
+def refresh_rankings_on_cascade_update(sender, queryset, **kwargs):
+    partitions = _ranking_partitions(queryset)
+    transaction.on_commit(partial(_refresh_partitions, partitions))
+
+
+@receiver(pre_cascade_update, sender=Competition)
+@receiver(pre_cascade_update, sender=Training)
+def invalidate_on_activity_cascade_update(sender, queryset, **kwargs):
+    season_ids = set(queryset.values_list("season_id", flat=True))
+    if not season_ids:
+        return
+
+    if sender is Competition:
+        partitions = _ranking_partitions(
+            Result.all_objects.filter(competition__in=queryset)
+        )
+        transaction.on_commit(partial(_refresh_partitions, partitions))
+
+    transaction.on_commit(partial(invalidate_seasons, season_ids))
+    transaction.on_commit(utilization.invalidate)
+    transaction.on_commit(invalidate_all_feeds)
+
+
+@receiver(pre_cascade_update, sender=Season)
+def invalidate_on_season_cascade_update(sender, queryset, **kwargs):
+    seasons = list(queryset.values_list("pk", "public_id"))
+    transaction.on_commit(
+        partial(invalidate_seasons, [season_id for season_id, _ in seasons])
+    )
+    transaction.on_commit(
+        partial(
+            invalidate_feeds,
+            FeedKind.SEASON,
+            [public_id for _, public_id in seasons],
+        )
+    )
+
+
+def _season_ids_of_athletes(athletes) -> set[int]:
+    """Return the seasons in which any of the given athletes took part."""
+    season_ids = set()
+    for model in (Competition, Training):
+        season_ids.update(
+            model.all_objects.filter(athletes__in=athletes)
+            .values_list("season_id", flat=True)
+            .distinct()
+            .order_by()
+        )
+    return season_ids
+
+
+@receiver(pre_cascade_update, sender=Athlete)
+@receiver(pre_cascade_update, sender=Coach)
+def invalidate_on_person_cascade_update(sender, queryset, **kwargs):
+    kind = FeedKind.ATHLETE if sender is Athlete else FeedKind.COACH
+    public_ids = list(queryset.values_list("public_id", flat=True))
+    transaction.on_commit(partial(invalidate_feeds, kind, public_ids))
+    if sender is Athlete:
+        season_ids = _season_ids_of_athletes(queryset)
+        transaction.on_commit(partial(invalidate_seasons, season_ids))
+
+
+@receiver(pre_cascade_update, sender=Venue)
+@receiver(post_import, sender=Venue)
+def invalidate_calendars_on_venue_cascade_update(sender, **kwargs):
+    transaction.on_commit(invalidate_all_feeds)
+
+
+# Anonymisation and imports rename people with set-based writes, which send no
+# `post_save`: drop their feeds, and the statistics and rankings showing them.
+@receiver(post_anonymise, sender=Athlete)
+@receiver(post_anonymise, sender=Coach)
+@receiver(post_import, sender=Athlete)
+@receiver(post_import, sender=Coach)
+def invalidate_on_bulk_rename(sender, pks, **kwargs):
+    kind = FeedKind.ATHLETE if sender is Athlete else FeedKind.COACH
+    public_ids = list(
+        sender.all_objects.filter(pk__in=pks).values_list("public_id", flat=True)
+    )
+    transaction.on_commit(partial(invalidate_feeds, kind, public_ids))
+    if sender is not Athlete:
+        return
+
+    season_ids = _season_ids_of_athletes(pks)
+    transaction.on_commit(partial(invalidate_seasons, season_ids))
+
+    namespaces = _ranking_namespaces(pks)
+    transaction.on_commit(partial(_bump_versions, namespaces))
+
+
+def _ranking_namespaces(athlete_pks: list[int]) -> list[str]:
+    """Return the cache namespaces of the rankings the athletes are part of."""
+    return [
+        Ranking.cache_namespace(*partition)
+        for partition in Ranking.objects.filter(athlete_id__in=athlete_pks)
+        .values_list("season__public_id", "discipline", "age_category")
+        .distinct()
+        .order_by()
+    ]
+
+
+def _bump_versions(namespaces: list[str]):
+    for namespace in namespaces:
+        cache.bump_version(namespace)
@@ -0,0 +1,440 @@
+# scheduling/synthetic.py
+"""
+Synthetic clubs for load testing.
+
+The fixtures describe a handful of records, too few to reproduce the slowness
+of a club with years of activities. `generate_club()` adds a made-up club of a
+given `ClubSize` to the database: addresses, venues, coaches, athletes,
+seasons, and their trainings and competitions with rosters and scores.
+
+Data is reproducible: every record is generated by its own random generator,
+seeded with the seed of the club, the kind of record and its position, so the
+same seed and size give the same club whatever the number of processes or the
+chunk size. Only primary keys (reserved from the sequences of the tables when
+generating) and timestamps (the time of generation) differ between runs.
+Public IDs and emails are derived from the seed, so each seed can be generated
+only once in a database.
+
+Chunks of records are generated by a pool of processes, and copied into the
+tables with `COPY` in dependency order, in one transaction. As with
+`core.bulk_fixtures`, no signal is sent: caches are flushed, and no change
+events or history are written.
+"""
+
+import io
+import json
+import random
+from collections import defaultdict
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, time
+
+from core import invalidation
+from core.bulk import copy_value, ordered_map, quote
+from core.models import Address
+from core.models.enums import Discipline
+from django.core.cache import cache
+from django.db import connection, models, transaction
+from django.utils import timezone
+from inventory.models import Venue
+from inventory.models.venue import VenueType
+from people.models import Athlete, Coach, CoachingCertification
+
+from scheduling.models import Competition, Season, Training
+
+DOMAIN = "synthetic.example.org"
+
+FIRST_NAMES = (
+    "Aina", "Antoni", "Bartomeu", "Biel", "Carla", "Catalina", "Joan", "Jaume",
+    "Laura", "Llucia", "Marc", "Margalida", "Maria", "Miquel", "Neus", "Pau",
+    "Pere", "Rafel", "Sara", "Toni", "Xisca", "Guillem", "Marta", "Julia",
+)  # fmt: skip
+LAST_NAMES = (
+    "Alcover", "Barcelo", "Bauza", "Bestard", "Bonet", "Cladera", "Coll",
+    "Crespi", "Ferrer", "Fiol", "Garau", "Llull", "Mas", "Mir", "Moll", "Nadal",
+    "Oliver", "Pons", "Ramis", "Riera", "Rossello", "Salva", "Serra", "Vidal",
+)  # fmt: skip
+# Cities with their postal code prefix
+CITIES = (
+    ("Palma", "070"), ("Inca", "073"), ("Manacor", "075"), ("Llucmajor", "076"),
+    ("Marratxi", "071"), ("Calvia", "071"), ("Alcudia", "074"), ("Soller", "071"),
+    ("Felanitx", "072"), ("Eivissa", "078"), ("Mao", "077"), ("Ciutadella", "077"),
+)  # fmt: skip
+STREETS = (
+    "Carrer Major", "Carrer de Sant Miquel", "Avinguda de Jaume III",
+    "Passeig Maritim", "Carrer del Sol", "Carrer de la Lluna", "Gran Via",
+    "Carrer de Ramon Llull", "Avinguda d'Alemanya", "Placa de l'Esglesia",
+)  # fmt: skip
+# Training names with their focus
+TRAININGS = (
+    ("Entrenament velocitat", "Velocitat i explosivitat"),
+    ("Entrenament resistencia", "Resistencia aerobica"),
+    ("Tecnica de salt", "Salts i pliometria"),
+    ("Forca general", "Forca i prevencio de lesions"),
+    ("Series en pista", "Ritme de competicio"),
+    ("Tecnica de relleus", "Passades del testimoni"),
+)
+COMPETITIONS = (
+    "Campionat de Balears {year}",
+    "Trofeu Ciutat de {city} {year}",
+    "Control federat de {city} {year}",
+    "Cros de {city} {year}",
+    "Lliga de clubs {year}",
+)
+
+
+@dataclass(frozen=True)
+class ClubSize:
+    """Number of records of a synthetic club."""
+
+    venues: int
+    coaches: int
+    athletes: int
+    seasons: int
+    # Activities of each season
+    trainings: int
+    competitions: int
+
+    def __post_init__(self):
+        for name, value in vars(self).items():
+            if value < 1:
+                raise ValueError(f"A club needs at least one of {name}")
+
+    @classmethod
+    def at_scale(cls, scale: float, seasons: int = 5) -> "ClubSize":
+        """
+        Size of a club `scale` times as large as a small club.
+
+        At scale 1, the club has 100 athletes, 5 coaches and 2 venues, with 500
+        trainings and 20 competitions per season. Scale 400 gives a million
+        trainings over 5 seasons.
+        """
+        return cls(
+            venues=max(1, round(2 * scale)),
+            coaches=max(1, round(5 * scale)),
+            athletes=max(1, round(100 * scale)),
+            seasons=seasons,
+            trainings=max(1, round(500 * scale)),
+            competitions=max(1, round(20 * scale)),
+        )
+
+    def count(self, model: type[models.Model]) -> int:
+        """Number of records of a model."""
+        return {
+            # One per venue, coach and athlete
+            Address: self.venues + self.coaches + self.athletes,
+            Venue: self.venues,
+            Coach: self.coaches,
+            Athlete: self.athletes,
+            Season: self.seasons,
+            Training: self.seasons * self.trainings,
+            Competition: self.seasons * self.competitions,
+        }[model]
+
+
+@dataclass(frozen=True)
+class Plan:
+    """What a worker process needs to generate records on its own."""
+
+    seed: int
+    size: ClubSize
+    first_year: int
+    # First primary key reserved for each model
+    first_ids: dict[str, int]
+    generated_at: str
+
+    def id(self, model: type[models.Model], index: int) -> int:
+        return self.first_ids[model._meta.label_lower] + index
+
+
+# Models in dependency order
+MODELS = [Address, Venue, Coach, Athlete, Season, Training, Competition]
+
+
+# Record generation, run by the worker processes
+
+
+def _record(rng: random.Random, plan: Plan, model, index: int) -> dict:
+    """Columns shared by every generated model."""
+    field = model._meta.get_field("public_id")
+    return {
+        "id": plan.id(model, index),
+        "public_id": "".join(rng.choices(field.alphabet, k=field.max_length)),
+        "created_at": plan.generated_at,
+        "updated_at": plan.generated_at,
+    }
+
+
+def _address(rng: random.Random, plan: Plan, index: int):
+    city, postal_prefix = rng.choice(CITIES)
+    yield (
+        Address,
+        {
+            **_record(rng, plan, Address, index),
+            "line1": f"{rng.choice(STREETS)}, {rng.randint(1, 120)}",
+            "line2": rng.choice(
+                ["", "", "", f"{rng.randint(1, 6)}o {rng.randint(1, 4)}a"]
+            ),
+            "postal_code": f"{postal_prefix}{rng.randint(0, 99):02}",
+            "city": city,
+            "state": "Illes Balears",
+            "country": "Spain",
+        },
+    )
+
+
+def _venue(rng: random.Random, plan: Plan, index: int):
+    city, _ = rng.choice(CITIES)
+    venue_type = rng.choice(VenueType.values)
+    yield (
+        Venue,
+        {
+            **_record(rng, plan, Venue, index),
+            "name": f"{VenueType(venue_type).label} de {city} {index + 1}",
+            "venue_type": venue_type,
+            "capacity": rng.choice([None, rng.randrange(100, 20_000, 50)]),
+            "address_id": plan.id(Address, index),
+            "indoor": venue_type == VenueType.GYMNASIUM,
+        },
+    )
+
+
+def _person(rng: random.Random, plan: Plan, model, index: int, birth_years) -> dict:
+    first_name, last_name = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    return {
+        **_record(rng, plan, model, index),
+        "first_name": first_name,
+        "last_name": last_name,
+        "email": f"{first_name}.{last_name}.{plan.seed}.{index}@{DOMAIN}".lower(),
+        "phone": f"+34 6{rng.randint(0, 99_999_999):08}",
+        "date_of_birth": date(
+            rng.randint(*birth_years), rng.randint(1, 12), rng.randint(1, 28)
+        ),
+    }
+
+
+def _coach(rng: random.Random, plan: Plan, index: int):
+    size = plan.size
+    yield (
+        Coach,
+        {
+            **_person(rng, plan, Coach, index, (1960, 2000)),
+            "certification": rng.choice([None, *CoachingCertification.values]),
+            "address_id": plan.id(Address, size.venues + index),
+        },
+    )
+
+
+def _athlete(rng: random.Random, plan: Plan, index: int):
+    size = plan.size
+    first_year = plan.first_year
+    yield (
+        Athlete,
+        {
+            # From U10 to veterans over the generated seasons
+            **_person(rng, plan, Athlete, index, (first_year - 45, first_year - 8)),
+            "height": f"{rng.uniform(140, 200):.2f}",
+            "weight": f"{rng.uniform(35, 100):.2f}",
+            "jersey_number": rng.choice([None, rng.randint(1, 999)]),
+            "address_id": plan.id(Address, size.venues + size.coaches + index),
+        },
+    )
+
+
+def _season(rng: random.Random, plan: Plan, index: int):
+    year = plan.first_year + index
+    yield (
+        Season,
+        {
+            **_record(rng, plan, Season, index),
+            "name": f"Temporada {year} ({plan.seed})",
+            "start_date": date(year, 1, 1),
+            "end_date": date(year, 12, 31),
+        },
+    )
+
+
+def _activity(
+    rng: random.Random, plan: Plan, model, index: int, roster: tuple[int, int]
+) -> tuple[dict, list[tuple]]:
+    """
+    Generate the columns shared by activities.
+
+    Returns:
+        The columns, and the rows of the rosters of the activity
+    """
+    size = plan.size
+    per_season = size.trainings if model is Training else size.competitions
+    season = index // per_season
+    day = date(plan.first_year + season, 1, 1).toordinal() + rng.randrange(365)
+    values = {
+        **_record(rng, plan, model, index),
+        "date": datetime.combine(
+            date.fromordinal(day), time(rng.randint(8, 20)), tzinfo=UTC
+        ),
+        "season_id": plan.id(Season, season),
+        "venue_id": rng.choice([None, plan.id(Venue, rng.randrange(size.venues))]),
+    }
+    members = []
+    for field, related, count in (
+        ("coaches", Coach, rng.randint(1, 3)),
+        ("athletes", Athlete, rng.randint(*roster)),
+    ):
+        through = model._meta.get_field(field).remote_field.through
+        population = plan.size.count(related)
+        members += [
+            (
+                through,
+                {
+                    f"{model._meta.model_name}_id": values["id"],
+                    f"{related._meta.model_name}_id": plan.id(related, member),
+                },
+            )
+            for member in rng.sample(range(population), min(count, population))
+        ]
+    return values, members
+
+
+def _training(rng: random.Random, plan: Plan, index: int):
+    values, members = _activity(rng, plan, Training, index, (4, 20))
+    name, focus = rng.choice(TRAININGS)
+    yield Training, {**values, "name": name, "focus": focus}
+    yield from members
+
+
+def _competition(rng: random.Random, plan: Plan, index: int):
+    values, members = _activity(rng, plan, Competition, index, (8, 40))
+    city, _ = rng.choice(CITIES)
+    # Upcoming or unscored competitions have no score
+    score = None
+    if rng.random() < 0.8:
+        score = {
+            "results": {
+                discipline.value: {
+                    medal: rng.randint(0, 3) for medal in ("gold", "silver", "bronze")
+                }
+                for discipline in rng.sample(list(Discipline), rng.randint(1, 3))
+            }
+        }
+    yield (
+        Competition,
+        {
+            **values,
+            "name": rng.choice(COMPETITIONS).format(
+                city=city, year=values["date"].year
+            ),
+            "score": json.dumps(score) if score else None,
+        },
+    )
+    yield from members
+
+
+GENERATORS = {
+    Address: _address,
+    Venue: _venue,
+    Coach: _coach,
+    Athlete: _athlete,
+    Season: _season,
+    Training: _training,
+    Competition: _competition,
+}
+
+
+def _generate(
+    model: type[models.Model], plan: Plan, start: int, stop: int
+) -> dict[tuple[str, tuple[str, ...]], str]:
+    """
+    Generate the records of a model from position `start` to `stop`.
+
+    Returns:
+        Rows in `COPY` text format, by table and columns
+    """
+    lines = defaultdict(list)
+    for index in range(start, stop):
+        rng = random.Random(f"{plan.seed}:{model._meta.label_lower}:{index}")
+        for row_model, values in GENERATORS[model](rng, plan, index):
+            key = (row_model._meta.db_table, tuple(values))
+            lines[key].append(
+                "\t".join(copy_value(value) for value in values.values()) + "\n"
+            )
+    return {key: "".join(rows) for key, rows in lines.items()}
+
+
+# Loading, run in the generating process
+
+
+def _reserve(model: type[models.Model], count: int) -> int:
+    """
+    Reserve primary keys from the sequence of a table.
+
+    Returns:
+        The first of `count` consecutive keys
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT setval(seq, nextval(seq) + %s - 1) "
+            "FROM pg_get_serial_sequence(%s, %s) AS seq",
+            [count, model._meta.db_table, model._meta.pk.column],
+        )
+        (last,) = cursor.fetchone()
+    return last - count + 1
+
+
+def _tasks(plan: Plan, chunk_size: int) -> Iterator[tuple]:
+    for model in MODELS:
+        count = plan.size.count(model)
+        for start in range(0, count, chunk_size):
+            yield model, plan, start, min(start + chunk_size, count)
+
+
+def generate_club(
+    size: ClubSize,
+    seed: int = 0,
+    first_year: int = 2020,
+    workers: int = 0,
+    chunk_size: int = 10_000,
+) -> dict[str, int]:
+    """
+    Add a synthetic club to the database.
+
+    Args:
+        size: Number of records of each kind
+        seed: Seed of the random generators, giving the same club every time
+        first_year: Year of the first season, one season per year after it
+        workers: Processes generating records, or 0 to generate them in this one
+        chunk_size: Records generated by a process, and copied, at once
+
+    Returns:
+        Number of rows copied per table
+    """
+    tables: dict[str, int] = defaultdict(int)
+    with transaction.atomic():
+        plan = Plan(
+            seed=seed,
+            size=size,
+            first_year=first_year,
+            first_ids={
+                model._meta.label_lower: _reserve(model, size.count(model))
+                for model in MODELS
+            },
+            generated_at=timezone.now().isoformat(),
+        )
+        for chunk in ordered_map(_generate, _tasks(plan, chunk_size), workers):
+            # Raising Django's exceptions, e.g. `IntegrityError`, as `execute()`
+            with connection.cursor() as cursor, connection.wrap_database_errors:
+                for (table, columns), text in chunk.items():
+                    cursor.copy_expert(
+                        f"COPY {quote(table)} "
+                        f"({', '.join(quote(column) for column in columns)}) "
+                        "FROM STDIN",
+                        io.StringIO(text),
+                    )
+                    tables[table] += text.count("\n")
+        with connection.cursor() as cursor:
+            # Benchmarks run right after would otherwise be planned without
+            # statistics on the new rows
+            for table in tables:
+                cursor.execute(f"ANALYZE {quote(table)}")
+        invalidation.publish_flush()
+    cache.clear()
+    return dict(tables)
@@ -0,0 +1,59 @@
+# scheduling/tests/test_admin.py
+"""Tests for the admin of the activities."""
+
+from datetime import UTC, date, datetime
+
+from core.test import query_budget
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from inventory.models import Venue
+from people.models import Athlete
+
+from scheduling.models import Competition, Season, Training
+
+
+class ActivityAdminTestCase(TestCase):
+    """Test suite for the changelists of trainings and competitions."""
+
+    def setUp(self):
+        """Set up activities at their own venues, in their own seasons."""
+        user = get_user_model().objects.create_superuser(
+            "admin", "admin@example.com", "password"
+        )
+        self.client.force_login(user)
+        self.athletes = [
+            Athlete.objects.create(
+                first_name="Athlete",
+                last_name=str(number),
+                email=f"athlete{number}@example.com",
+            )
+            for number in range(3)
+        ]
+        for number in range(5):
+            season = Season.objects.create(
+                name=f"Season {number}",
+                start_date=date(2020 + number, 1, 1),
+                end_date=date(2020 + number, 12, 31),
+            )
+            venue = Venue.objects.create(name=f"Venue {number}")
+            for model in (Training, Competition):
+                activity = model.objects.create(
+                    name=f"{model.__name__} {number}",
+                    date=datetime(2020 + number, 3, 1, 9, tzinfo=UTC),
+                    season=season,
+                    venue=venue,
+                )
+                activity.athletes.set(self.athletes)
+
+    @query_budget(10)
+    def test_training_changelist(self):
+        """Test that the training list does not query per row."""
+        response = self.client.get("/admin/scheduling/training/")
+        self.assertEqual(response.status_code, 200)
+
+    @query_budget(9)
+    def test_competition_changelist(self):
+        """Test that the competition list does not query per row."""
+        self.athletes[0].soft_delete()
+        response = self.client.get("/admin/scheduling/competition/")
+        self.assertContains(response, '<td class="field-athlete_count">2</td>')
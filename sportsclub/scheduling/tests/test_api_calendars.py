@@ -0,0 +1,208 @@
+# scheduling/tests/test_api_calendars.py
+from datetime import UTC, date, datetime
+
+from django.core.cache import cache
+from django.test import TestCase
+from inventory.models import Venue
+from people.models import Athlete, Coach
+
+from scheduling.calendars import escape_text, fold
+from scheduling.models import Competition, Season, Training
+
+
+class CalendarFormatTest(TestCase):
+    """Test suite for iCalendar text helpers."""
+
+    def test_escape_text(self):
+        """Test escaping of special characters in TEXT values."""
+        self.assertEqual(escape_text("a,b;c\\d\ne"), "a\\,b\\;c\\\\d\\ne")
+
+    def test_fold_long_lines(self):
+        """Test that lines are folded at 75 octets without splitting UTF-8."""
+        line = "SUMMARY:" + "é" * 60
+        folded = fold(line)
+        physical = folded.removesuffix("\r\n").split("\r\n")
+        self.assertGreater(len(physical), 1)
+        for part in physical:
+            self.assertLessEqual(len(part.encode()), 75)
+        self.assertEqual(folded.replace("\r\n ", "").removesuffix("\r\n"), line)
+
+
+class CalendarAPITestCase(TestCase):
+    """Test suite for the calendar feed endpoints."""
+
+    def setUp(self):
+        """Set up test data."""
+        cache.clear()
+        self.season = Season.objects.create(
+            name="2024-2025 Season",
+            start_date=date(2024, 9, 1),
+            end_date=date(2025, 6, 30),
+        )
+        self.venue = Venue.objects.create(name="Estadi Olímpic, Barcelona")
+        self.athlete = Athlete.objects.create(
+            first_name="Usain", last_name="Bolt", email="usain.bolt@example.com"
+        )
+        self.coach = Coach.objects.create(
+            first_name="Glen", last_name="Mills", email="glen.mills@example.com"
+        )
+        self.competition = Competition.objects.create(
+            name="Spring Championship",
+            date=datetime(2025, 4, 15, 10, 0, tzinfo=UTC),
+            season=self.season,
+            venue=self.venue,
+        )
+        self.competition.athletes.add(self.athlete)
+        self.training = Training.objects.create(
+            name="Morning session",
+            date=datetime(2025, 4, 10, 8, 30, tzinfo=UTC),
+            season=self.season,
+            focus="Starts; block clearance",
+        )
+        self.training.athletes.add(self.athlete)
+        self.training.coaches.add(self.coach)
+        self.season_url = (
+            f"/api/v1/scheduling/calendars/seasons/{self.season.public_id}.ics"
+        )
+
+    def _body(self, response):
+        return b"".join(response.streaming_content).decode()
+
+    def test_season_calendar(self):
+        """Test GET /api/v1/scheduling/calendars/seasons/{public_id}.ics."""
+        response = self.client.get(self.season_url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "text/calendar; charset=utf-8")
+        self.assertTrue(response.streaming)
+        self.assertIn("ETag", response)
+
+        body = self._body(response)
+        self.assertTrue(body.startswith("BEGIN:VCALENDAR\r\n"))
+        self.assertTrue(body.endswith("END:VCALENDAR\r\n"))
+        self.assertIn("X-WR-CALNAME:2024-2025 Season\r\n", body)
+        self.assertEqual(body.count("BEGIN:VEVENT"), 2)
+        self.assertIn(f"UID:{self.competition.public_id}@sportsclub\r\n", body)
+        self.assertIn("DTSTART:20250415T100000Z\r\n", body)
+        self.assertIn("DTEND:20250415T113000Z\r\n", body)
+        self.assertIn("LOCATION:Estadi Olímpic\\, Barcelona\r\n", body)
+        self.assertIn("DESCRIPTION:Starts\\; block clearance\r\n", body)
+
+    def test_person_and_venue_calendars(self):
+        """Test the feeds of an athlete, a coach and a venue."""
+        base = "/api/v1/scheduling/calendars"
+        for url, events in (
+            (f"{base}/athletes/{self.athlete.public_id}.ics", 2),
+            (f"{base}/coaches/{self.coach.public_id}.ics", 1),
+            (f"{base}/venues/{self.venue.public_id}.ics", 1),
+        ):
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(self._body(response).count("BEGIN:VEVENT"), events)
+
+    def test_calendar_not_found(self):
+        """Test the feed of a season that does not exist."""
+        response = self.client.get(
+            "/api/v1/scheduling/calendars/seasons/nonexistent.ics"
+        )
+        self.assertEqual(response.status_code, 404)
+
+    def test_not_modified(self):
+        """Test that an unchanged feed costs one lookup besides authentication."""
+        response = self.client.get(self.season_url)
+        self._body(response)
+        etag = response["ETag"]
+
+        with self.assertNumQueries(2):
+            response = self.client.get(self.season_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+
+    def test_etag_survives_restarts(self):
+        """Test that the ETag comes from the data, not from the cache state."""
+        url = f"/api/v1/scheduling/calendars/athletes/{self.athlete.public_id}.ics"
+        etag = self.client.get(url)["ETag"]
+
+        # As in another process, or after a restart
+        cache.clear()
+        with self.assertNumQueries(3):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        self.training.athletes.remove(self.athlete)
+        cache.clear()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+    def test_not_modified_needs_the_object(self):
+        """Test that conditional requests for missing objects are not found."""
+        response = self.client.get(
+            "/api/v1/scheduling/calendars/seasons/nonexistent.ics",
+            HTTP_IF_NONE_MATCH="*",
+        )
+        self.assertEqual(response.status_code, 404)
+
+        response = self.client.get(self.season_url)
+        self._body(response)
+        self.season.soft_delete()
+        for etag in (response["ETag"], "*"):
+            response = self.client.get(self.season_url, HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(response.status_code, 404)
+
+    async def test_asgi_streams(self):
+        """Test that ASGI responses produce the feed a chunk at a time."""
+        response = await self.async_client.get(self.season_url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.is_async)
+        body = b"".join([chunk async for chunk in response]).decode()
+        self.assertEqual(body.count("BEGIN:VEVENT"), 2)
+
+    def test_cached_feed(self):
+        """Test that a complete feed is served from the cache afterwards."""
+        body = self._body(self.client.get(self.season_url))
+
+        with self.assertNumQueries(2):
+            response = self.client.get(self.season_url)
+        self.assertFalse(response.streaming)
+        self.assertEqual(response.content.decode(), body)
+
+    def test_invalidated_on_activity_change(self):
+        """Test that saving an activity changes the ETag of its feeds."""
+        response = self.client.get(self.season_url)
+        self._body(response)
+        etag = response["ETag"]
+
+        self.competition.name = "Spring Open"
+        with self.captureOnCommitCallbacks(execute=True):
+            self.competition.save()
+
+        response = self.client.get(self.season_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("SUMMARY:Spring Open\r\n", self._body(response))
+
+    def test_invalidated_on_roster_change(self):
+        """Test that removing an athlete from an activity changes their feed."""
+        url = f"/api/v1/scheduling/calendars/athletes/{self.athlete.public_id}.ics"
+        response = self.client.get(url)
+        self._body(response)
+        season_etag = self.client.get(self.season_url)["ETag"]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.training.athletes.remove(self.athlete)
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(self._body(response).count("BEGIN:VEVENT"), 1)
+        # Other feeds keep their ETag
+        response = self.client.get(self.season_url, HTTP_IF_NONE_MATCH=season_etag)
+        self.assertEqual(response.status_code, 304)
+
+    def test_invalidated_on_venue_change(self):
+        """Test that renaming a venue changes every feed."""
+        etag = self.client.get(self.season_url)["ETag"]
+
+        self.venue.name = "Estadi Lluís Companys"
+        with self.captureOnCommitCallbacks(execute=True):
+            self.venue.save()
+
+        response = self.client.get(self.season_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
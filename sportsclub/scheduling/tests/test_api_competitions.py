@@ -3,6 +3,7 @@ import json
 from datetime import UTC, date, datetime
 
 from core.models import Address
+from core.test import query_budget
 from django.test import TestCase
 from inventory.models import Venue
 from people.models import Athlete, Coach
@@ -58,6 +59,22 @@ class CompetitionAPITestCase(TestCase):
         data = response.json()
         self.assertEqual(len(data), 1)
 
+    @query_budget(7)
+    def test_list_competitions_query_budget(self):
+        """Test that listing competitions does not query per row."""
+        for number in range(5):
+            competition = Competition.objects.create(
+                name=f"Competition {number}",
+                date=datetime(2025, 4, 1 + number, 10, 0, tzinfo=UTC),
+                venue=Venue.objects.create(name=f"Venue {number}"),
+                season=self.season,
+            )
+            competition.coaches.add(self.coach)
+            competition.athletes.add(self.athlete)
+
+        response = self.client.get("/api/v1/scheduling/competitions")
+        self.assertEqual(len(response.json()), 6)
+
     def test_list_competitions_returns_expected_fields(self):
         """Test that list response contains expected fields."""
         response = self.client.get("/api/v1/scheduling/competitions")
@@ -199,3 +216,83 @@ class CompetitionAPITestCase(TestCase):
         """Test DELETE with non-existent public_id returns 404."""
         response = self.client.delete("/api/v1/scheduling/competitions/nonexistent123")
         self.assertEqual(response.status_code, 404)
+
+
+class CompetitionFilterAPITestCase(TestCase):
+    """Test suite for filtering the list of competitions."""
+
+    def setUp(self):
+        """Set up test data."""
+        self.season = Season.objects.create(
+            name="2024-2025 Season",
+            start_date=date(2024, 9, 1),
+            end_date=date(2025, 6, 30),
+        )
+        self.other_season = Season.objects.create(
+            name="2023-2024 Season",
+            start_date=date(2023, 9, 1),
+            end_date=date(2024, 6, 30),
+        )
+        self.relays_gold = Competition.objects.create(
+            name="Relays Cup",
+            date=datetime(2025, 3, 1, 10, 0, tzinfo=UTC),
+            season=self.season,
+            score={"results": {"relays": {"gold": 2, "silver": 0, "bronze": 1}}},
+        )
+        self.relays_bronze = Competition.objects.create(
+            name="Relays Open",
+            date=datetime(2025, 4, 1, 10, 0, tzinfo=UTC),
+            season=self.season,
+            score={"results": {"relays": {"gold": 0, "silver": 0, "bronze": 1}}},
+        )
+        self.sprints_gold = Competition.objects.create(
+            name="Sprint Meeting",
+            date=datetime(2024, 3, 1, 10, 0, tzinfo=UTC),
+            season=self.other_season,
+            score={"results": {"sprints": {"gold": 1, "silver": 1, "bronze": 0}}},
+        )
+        self.unscored = Competition.objects.create(
+            name="Friendly",
+            date=datetime(2025, 5, 1, 10, 0, tzinfo=UTC),
+            season=self.season,
+        )
+
+    def _names(self, query):
+        response = self.client.get(f"/api/v1/scheduling/competitions?{query}")
+        self.assertEqual(response.status_code, 200)
+        return {competition["name"] for competition in response.json()}
+
+    def test_filter_by_discipline(self):
+        """Test competitions scored in a discipline are returned."""
+        self.assertEqual(
+            self._names("discipline=relays"), {"Relays Cup", "Relays Open"}
+        )
+
+    def test_filter_by_discipline_and_medals(self):
+        """Test medal thresholds apply to the given discipline."""
+        self.assertEqual(self._names("discipline=relays&min_gold=1"), {"Relays Cup"})
+        self.assertEqual(self._names("discipline=sprints&min_bronze=1"), set())
+
+    def test_filter_by_medals_in_any_discipline(self):
+        """Test medal thresholds without a discipline match any discipline."""
+        self.assertEqual(self._names("min_gold=1"), {"Relays Cup", "Sprint Meeting"})
+
+    def test_filter_by_season(self):
+        """Test competitions can be restricted to a season."""
+        self.assertEqual(
+            self._names(f"season_public_id={self.other_season.public_id}"),
+            {"Sprint Meeting"},
+        )
+        self.assertEqual(
+            self._names(
+                f"season_public_id={self.season.public_id}&discipline=relays&min_gold=1"
+            ),
+            {"Relays Cup"},
+        )
+
+    def test_invalid_filters(self):
+        """Test unknown disciplines and non-positive thresholds are rejected."""
+        response = self.client.get("/api/v1/scheduling/competitions?discipline=chess")
+        self.assertEqual(response.status_code, 422)
+        response = self.client.get("/api/v1/scheduling/competitions?min_gold=0")
+        self.assertEqual(response.status_code, 422)
@@ -0,0 +1,135 @@
+# scheduling/tests/test_api_participation.py
+from datetime import UTC, date, datetime
+
+from django.core.cache import cache
+from django.test import TestCase
+from people.models import Athlete
+
+from scheduling.models import Competition, Season, Training
+
+
+class ParticipationAPITestCase(TestCase):
+    """Test suite for the participation statistics endpoints."""
+
+    def setUp(self):
+        """Set up test data."""
+        cache.clear()
+        self.season = Season.objects.create(
+            name="2024-2025 Season",
+            start_date=date(2024, 9, 1),
+            end_date=date(2025, 6, 30),
+        )
+        self.athlete1 = Athlete.objects.create(
+            first_name="Usain",
+            last_name="Bolt",
+            email="usain.bolt@example.com",
+            jersey_number=9,
+        )
+        self.athlete2 = Athlete.objects.create(
+            first_name="Carl",
+            last_name="Lewis",
+            email="carl.lewis@example.com",
+        )
+        self.competition = Competition.objects.create(
+            name="Spring Championship",
+            date=datetime(2025, 4, 15, 10, 0, tzinfo=UTC),
+            season=self.season,
+        )
+        self.competition.athletes.set([self.athlete1, self.athlete2])
+        for day in (3, 10):
+            training = Training.objects.create(
+                name="Morning session",
+                date=datetime(2025, 3, day, 8, 0, tzinfo=UTC),
+                season=self.season,
+            )
+            training.athletes.set([self.athlete1])
+        self.url = f"/api/v1/scheduling/seasons/{self.season.public_id}/participation"
+
+    def test_season_participation(self):
+        """Test GET /api/v1/scheduling/seasons/{public_id}/participation."""
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data["season_public_id"], self.season.public_id)
+
+        # Ordered by last name
+        bolt, lewis = data["athletes"]
+        self.assertEqual(bolt["athlete"]["public_id"], self.athlete1.public_id)
+        self.assertEqual(bolt["athlete"]["display_name"], "Usain Bolt")
+        self.assertEqual(bolt["athlete"]["jersey_number"], 9)
+        self.assertEqual(bolt["trainings"], 2)
+        self.assertEqual(bolt["competitions"], 1)
+        self.assertEqual(bolt["total"], 3)
+        self.assertEqual(
+            bolt["months"],
+            [
+                {"month": "2025-03-01", "trainings": 2, "competitions": 0, "total": 2},
+                {"month": "2025-04-01", "trainings": 0, "competitions": 1, "total": 1},
+            ],
+        )
+        self.assertEqual(lewis["total"], 1)
+        self.assertEqual(len(lewis["months"]), 1)
+
+    def test_season_participation_not_found(self):
+        """Test getting the participation of a season that does not exist."""
+        response = self.client.get(
+            "/api/v1/scheduling/seasons/nonexistent/participation"
+        )
+        self.assertEqual(response.status_code, 404)
+
+    def test_athlete_participation(self):
+        """Test GET .../participation/{athlete_public_id}."""
+        response = self.client.get(f"{self.url}/{self.athlete2.public_id}")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["competitions"], 1)
+
+        athlete = Athlete.objects.create(
+            first_name="Jesse", last_name="Owens", email="jesse.owens@example.com"
+        )
+        response = self.client.get(f"{self.url}/{athlete.public_id}")
+        self.assertEqual(response.status_code, 404)
+
+    def test_participation_is_cached(self):
+        """Test that a cache hit does not query the participation tables."""
+        self.client.get(self.url)
+        with self.assertNumQueries(1):
+            # The only query is the authentication of the request
+            self.client.get(self.url)
+
+    def test_cache_invalidated_on_roster_change(self):
+        """Test that adding or removing athletes refreshes the statistics."""
+        self.assertEqual(len(self.client.get(self.url).json()["athletes"]), 2)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.competition.athletes.remove(self.athlete2)
+        self.assertEqual(len(self.client.get(self.url).json()["athletes"]), 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.athlete2.competition_activities.add(self.competition)
+        self.assertEqual(len(self.client.get(self.url).json()["athletes"]), 2)
+
+    def test_cache_invalidated_on_activity_change(self):
+        """Test that moving or deleting an activity refreshes the statistics."""
+        self.client.get(self.url)
+
+        self.competition.date = datetime(2025, 5, 2, 10, 0, tzinfo=UTC)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.competition.save()
+        bolt = self.client.get(self.url).json()["athletes"][0]
+        self.assertEqual(bolt["months"][-1]["month"], "2025-05-01")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.competition.soft_delete()
+        data = self.client.get(self.url).json()
+        self.assertEqual(len(data["athletes"]), 1)
+        self.assertEqual(data["athletes"][0]["competitions"], 0)
+
+    def test_cache_invalidated_on_athlete_change(self):
+        """Test that renaming an athlete refreshes the statistics."""
+        self.client.get(self.url)
+
+        self.athlete2.first_name = "Frederick"
+        with self.captureOnCommitCallbacks(execute=True):
+            self.athlete2.save()
+        lewis = self.client.get(self.url).json()["athletes"][1]
+        self.assertEqual(lewis["athlete"]["display_name"], "Frederick Lewis")
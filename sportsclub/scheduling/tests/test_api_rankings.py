@@ -0,0 +1,201 @@
+# scheduling/tests/test_api_rankings.py
+import json
+from datetime import UTC, date, datetime
+
+from django.core.cache import cache
+from django.test import TestCase
+from people.models import Athlete
+
+from scheduling.models import Competition, Ranking, Result, Season
+
+
+class RankingAPITestCase(TestCase):
+    """Test suite for Result and Ranking API endpoints."""
+
+    def setUp(self):
+        """Set up test data."""
+        cache.clear()
+        self.season = Season.objects.create(
+            name="2024-2025 Season",
+            start_date=date(2024, 9, 1),
+            end_date=date(2025, 6, 30),
+        )
+        self.competition = Competition.objects.create(
+            name="Spring Championship",
+            date=datetime(2025, 4, 15, 10, 0, tzinfo=UTC),
+            season=self.season,
+        )
+        self.athlete1 = Athlete.objects.create(
+            first_name="Usain",
+            last_name="Bolt",
+            email="usain@example.com",
+            date_of_birth=date(2012, 8, 21),
+        )
+        self.athlete2 = Athlete.objects.create(
+            first_name="Yohan",
+            last_name="Blake",
+            email="yohan@example.com",
+            date_of_birth=date(2012, 12, 26),
+        )
+        self.ranking_url = (
+            f"/api/v1/scheduling/rankings/{self.season.public_id}/sprints/u14"
+        )
+
+    def _post_result(self, athlete, mark):
+        with self.captureOnCommitCallbacks(execute=True):
+            return self.client.post(
+                f"/api/v1/scheduling/competitions/{self.competition.public_id}/results",
+                data=json.dumps(
+                    {
+                        "athlete_public_id": athlete.public_id,
+                        "discipline": "sprints",
+                        "mark": mark,
+                    }
+                ),
+                content_type="application/json",
+            )
+
+    def test_create_result(self):
+        """Test POST /api/v1/scheduling/competitions/{public_id}/results."""
+        response = self._post_result(self.athlete1, 8.75)
+        self.assertEqual(response.status_code, 201)
+        data = response.json()
+        self.assertEqual(data["competition_public_id"], self.competition.public_id)
+        self.assertEqual(data["age_category"], "u14")
+        self.assertEqual(data["mark"], 8.75)
+
+    def test_list_competition_results(self):
+        """Test GET /api/v1/scheduling/competitions/{public_id}/results."""
+        self._post_result(self.athlete1, 8.75)
+        response = self.client.get(
+            f"/api/v1/scheduling/competitions/{self.competition.public_id}/results"
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()), 1)
+
+    def test_ranking_updated_by_new_results(self):
+        """Test new results are reflected in the cached ranking."""
+        self._post_result(self.athlete1, 8.75)
+        response = self.client.get(self.ranking_url)
+        self.assertEqual(response.status_code, 200)
+        entries = response.json()["entries"]
+        self.assertEqual(len(entries), 1)
+        self.assertEqual(entries[0]["athlete"]["public_id"], self.athlete1.public_id)
+
+        # A faster athlete takes the lead and invalidates the cached entries
+        self._post_result(self.athlete2, 8.60)
+        entries = self.client.get(self.ranking_url).json()["entries"]
+        self.assertEqual(
+            [entry["athlete"]["public_id"] for entry in entries],
+            [self.athlete2.public_id, self.athlete1.public_id],
+        )
+        self.assertEqual([entry["rank"] for entry in entries], [1, 2])
+
+    def test_ranking_served_from_cache(self):
+        """Test a cached ranking does not read the snapshot table again."""
+        self._post_result(self.athlete1, 8.75)
+        self.client.get(self.ranking_url)
+
+        # Rows removed behind the cache's back are still served
+        Ranking.objects.all().delete()
+        entries = self.client.get(self.ranking_url).json()["entries"]
+        self.assertEqual(len(entries), 1)
+
+    def test_ranking_season_not_found(self):
+        """Test an unknown or soft-deleted season returns 404."""
+        response = self.client.get(
+            "/api/v1/scheduling/rankings/nonexistent/sprints/u14"
+        )
+        self.assertEqual(response.status_code, 404)
+
+        self._post_result(self.athlete1, 8.75)
+        self.client.get(self.ranking_url)
+        self.season.soft_delete()
+        for url in (
+            self.ranking_url,
+            f"{self.ranking_url}/athletes/{self.athlete1.public_id}",
+        ):
+            self.assertEqual(self.client.get(url).status_code, 404)
+
+    def test_ranking_updated_by_athlete_rename(self):
+        """Test that renaming a ranked athlete refreshes the cached ranking."""
+        self._post_result(self.athlete1, 8.75)
+        self.client.get(self.ranking_url)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.patch(
+                f"/api/v1/people/athletes/{self.athlete1.public_id}",
+                data=json.dumps({"last_name": "Lightning", "jersey_number": 9}),
+                content_type="application/json",
+            )
+
+        (entry,) = self.client.get(self.ranking_url).json()["entries"]
+        self.assertEqual(entry["athlete"]["display_name"], "Usain Lightning")
+        self.assertEqual(entry["athlete"]["jersey_number"], 9)
+
+    def test_ranking_limit(self):
+        """Test the limit query parameter trims the entries."""
+        self._post_result(self.athlete1, 8.75)
+        self._post_result(self.athlete2, 8.60)
+        response = self.client.get(f"{self.ranking_url}?limit=1")
+        self.assertEqual(len(response.json()["entries"]), 1)
+
+    def test_get_athlete_ranking(self):
+        """Test GET .../athletes/{athlete_public_id} returns the athlete's rank."""
+        self._post_result(self.athlete1, 8.75)
+        self._post_result(self.athlete2, 8.60)
+        response = self.client.get(
+            f"{self.ranking_url}/athletes/{self.athlete1.public_id}"
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["rank"], 2)
+        self.assertEqual(response.json()["best_mark"], 8.75)
+
+    def test_get_athlete_ranking_not_found(self):
+        """Test an unranked athlete returns 404."""
+        response = self.client.get(
+            f"{self.ranking_url}/athletes/{self.athlete1.public_id}"
+        )
+        self.assertEqual(response.status_code, 404)
+
+    def test_delete_result_updates_ranking(self):
+        """Test DELETE /api/v1/scheduling/results/{public_id} removes its mark."""
+        self._post_result(self.athlete1, 8.75)
+        result = Result.objects.get()
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.delete(
+                f"/api/v1/scheduling/results/{result.public_id}"
+            )
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(self.client.get(self.ranking_url).json()["entries"], [])
+
+    def test_delete_and_restore_athlete_updates_ranking(self):
+        """Test that results soft-deleted with their athlete leave the ranking."""
+        self._post_result(self.athlete1, 8.75)
+        self._post_result(self.athlete2, 8.90)
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.delete(
+                f"/api/v1/people/athletes/{self.athlete1.public_id}"
+            )
+        self.assertEqual(response.status_code, 204)
+        entries = self.client.get(self.ranking_url).json()["entries"]
+        self.assertEqual(
+            [entry["athlete"]["public_id"] for entry in entries],
+            [self.athlete2.public_id],
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(
+                "/api/v1/core/restore",
+                data=json.dumps({"deleted_at": response["X-Deleted-At"]}),
+                content_type="application/json",
+            )
+        entries = self.client.get(self.ranking_url).json()["entries"]
+        self.assertEqual(entries[0]["athlete"]["public_id"], self.athlete1.public_id)
+
+    def test_invalid_discipline(self):
+        """Test an unknown discipline is rejected."""
+        response = self.client.get(
+            f"/api/v1/scheduling/rankings/{self.season.public_id}/curling/u14"
+        )
+        self.assertEqual(response.status_code, 422)
@@ -1,10 +1,17 @@
 # scheduling/tests/test_api_seasons.py
 import json
-from datetime import date
+from datetime import UTC, date, datetime
+from io import StringIO
 
+from core.models import OutboxMessage, WebhookEndpoint
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from people.models import Athlete, Coach
 
-from scheduling.models import Season
+from scheduling.models import Competition, Result, Season, Training
 
 
 class SeasonAPITestCase(TestCase):
@@ -126,3 +133,292 @@ class SeasonAPITestCase(TestCase):
         """Test DELETE with non-existent public_id returns 404."""
         response = self.client.delete("/api/v1/scheduling/seasons/nonexistent123")
         self.assertEqual(response.status_code, 404)
+
+
+class SeasonDeletionAPITestCase(TestCase):
+    """Test suite for soft-deleting, restoring and purging seasons."""
+
+    def setUp(self):
+        """Set up test data."""
+        self.season = Season.objects.create(
+            name="2024-2025 Season",
+            start_date=date(2024, 9, 1),
+            end_date=date(2025, 6, 30),
+        )
+        self.athlete = Athlete.objects.create(
+            first_name="Usain", last_name="Bolt", email="usain.bolt@example.com"
+        )
+        self.competition = Competition.objects.create(
+            name="Spring Championship",
+            date=datetime(2025, 4, 15, 10, 0, tzinfo=UTC),
+            season=self.season,
+        )
+        self.result = Result.objects.create(
+            competition=self.competition,
+            athlete=self.athlete,
+            discipline="sprints",
+            mark="9.58",
+        )
+        self.trainings = [
+            Training.objects.create(
+                name=f"Session {day}",
+                date=datetime(2025, 3, day, 8, 0, tzinfo=UTC),
+                season=self.season,
+            )
+            for day in (3, 5)
+        ]
+        self.url = f"/api/v1/scheduling/seasons/{self.season.public_id}"
+
+    def _restore(self, deleted_at):
+        return self.client.post(
+            "/api/v1/core/restore",
+            data=json.dumps({"deleted_at": deleted_at}),
+            content_type="application/json",
+        )
+
+    def test_delete_season_cascades(self):
+        """Test that dependants share the soft-delete timestamp of the season."""
+        response = self.client.delete(self.url)
+        self.assertEqual(response.status_code, 204)
+        self.season.refresh_from_db()
+        self.assertEqual(response["X-Deleted-At"], self.season.deleted_at.isoformat())
+
+        for model in (Training, Competition, Result):
+            self.assertFalse(model.objects.exists())
+            self.assertEqual(
+                model.all_objects.filter(deleted_at=self.season.deleted_at).count(),
+                model.all_objects.count(),
+            )
+        self.assertTrue(Athlete.objects.filter(pk=self.athlete.pk).exists())
+
+    def _season_with_trainings(self, year, count):
+        season = Season.objects.create(
+            name=f"{year}-{year + 1} Season",
+            start_date=date(year, 9, 1),
+            end_date=date(year + 1, 6, 30),
+        )
+        for day in range(1, count + 1):
+            training = Training.objects.create(
+                name=f"Session {day}",
+                date=datetime(year, 10, day, 8, 0, tzinfo=UTC),
+                season=season,
+            )
+            training.athletes.add(self.athlete)
+        return season
+
+    def _delete_queries(self, season):
+        with CaptureQueriesContext(connection) as context:
+            self.client.delete(f"/api/v1/scheduling/seasons/{season.public_id}")
+        return len(context.captured_queries)
+
+    def test_delete_season_queries_do_not_grow(self):
+        """Test that cascades are applied without loading the dependants."""
+        # The first request also creates the API user
+        self.client.get(self.url)
+        small = self._season_with_trainings(2025, 2)
+        large = self._season_with_trainings(2026, 20)
+        self.assertEqual(self._delete_queries(large), self._delete_queries(small))
+        self.assertFalse(Training.objects.filter(season=large).exists())
+
+    def test_restore_season(self):
+        """Test POST /api/v1/core/restore reverses the cascade."""
+        self.trainings[0].soft_delete()
+        deleted_at = self.client.delete(self.url)["X-Deleted-At"]
+
+        response = self._restore(deleted_at)
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data["total"], 4)
+        self.assertEqual(
+            data["restored"],
+            {
+                "scheduling.Season": 1,
+                "scheduling.Training": 1,
+                "scheduling.Competition": 1,
+                "scheduling.Result": 1,
+            },
+        )
+        self.assertEqual(self.client.get(self.url).status_code, 200)
+        # Deleted on its own before the season, so it stays deleted
+        self.assertEqual(
+            list(Training.objects.values_list("pk", flat=True)),
+            [self.trainings[1].pk],
+        )
+
+    def test_restore_unknown_timestamp(self):
+        """Test that restoring a timestamp nothing was deleted at returns 404."""
+        response = self._restore("2025-01-01T00:00:00+00:00")
+        self.assertEqual(response.status_code, 404)
+
+    def test_purge_season(self):
+        """Test that purge=true permanently deletes a soft-deleted season."""
+        self.client.delete(self.url)
+        response = self.client.delete(f"{self.url}?purge=true")
+        self.assertEqual(response.status_code, 204)
+        self.assertNotIn("X-Deleted-At", response)
+        self.assertFalse(Season.all_objects.exists())
+        self.assertFalse(Training.all_objects.exists())
+        self.assertFalse(Result.all_objects.exists())
+
+    def test_delete_soft_deleted_season(self):
+        """Test that a soft-deleted season cannot be soft-deleted again."""
+        self.client.delete(self.url)
+        self.assertEqual(self.client.delete(self.url).status_code, 404)
+
+
+class SeasonCloneAPITestCase(TestCase):
+    """Test suite for cloning the plan of a season."""
+
+    def setUp(self):
+        """Set up test data."""
+        self.source = Season.objects.create(
+            name="2024-2025 Season",
+            start_date=date(2024, 9, 2),
+            end_date=date(2025, 6, 30),
+        )
+        self.target = Season.objects.create(
+            name="2025-2026 Season",
+            start_date=date(2025, 9, 1),
+            end_date=date(2026, 6, 30),
+        )
+        self.athlete = Athlete.objects.create(
+            first_name="Usain", last_name="Bolt", email="usain.bolt@example.com"
+        )
+        retired = Athlete.objects.create(
+            first_name="Carl", last_name="Lewis", email="carl.lewis@example.com"
+        )
+        self.coach = Coach.objects.create(
+            first_name="Glen", last_name="Mills", email="glen.mills@example.com"
+        )
+        # Tuesday 10 September 2024
+        self.training = Training.objects.create(
+            name="Sprint drills",
+            date=datetime(2024, 9, 10, 18, 0, tzinfo=UTC),
+            season=self.source,
+            focus="Starts",
+        )
+        self.training.athletes.set([self.athlete, retired])
+        self.training.coaches.set([self.coach])
+        retired.soft_delete()
+        cancelled = Training.objects.create(
+            name="Cancelled session",
+            date=datetime(2024, 9, 12, 18, 0, tzinfo=UTC),
+            season=self.source,
+        )
+        cancelled.soft_delete()
+        competition = Competition.objects.create(
+            name="Autumn Cup",
+            date=datetime(2024, 10, 5, 10, 0, tzinfo=UTC),
+            season=self.source,
+            score={"results": {"sprints": {"gold": 1, "silver": 0, "bronze": 0}}},
+        )
+        competition.athletes.set([self.athlete])
+        self.url = f"/api/v1/scheduling/seasons/{self.source.public_id}/clone"
+
+    def _clone(self, **payload):
+        payload.setdefault("target_season_public_id", self.target.public_id)
+        return self.client.post(
+            self.url, data=json.dumps(payload), content_type="application/json"
+        )
+
+    def test_clone_trainings(self):
+        """Test POST /api/v1/scheduling/seasons/{public_id}/clone."""
+        response = self._clone()
+        self.assertEqual(response.status_code, 201)
+        data = response.json()
+        self.assertEqual(data["target"]["public_id"], self.target.public_id)
+        self.assertEqual(data["days_shifted"], 364)
+        self.assertEqual(data["trainings"], 1)
+        self.assertEqual(data["competitions"], 0)
+        self.assertEqual(data["athlete_memberships"], 1)
+        self.assertEqual(data["coach_memberships"], 1)
+
+        clone = Training.objects.get(season=self.target)
+        self.assertNotEqual(clone.public_id, self.training.public_id)
+        self.assertEqual(clone.name, "Sprint drills")
+        self.assertEqual(clone.focus, "Starts")
+        # Tuesday 9 September 2025
+        self.assertEqual(clone.date, datetime(2025, 9, 9, 18, 0, tzinfo=UTC))
+        self.assertEqual(list(clone.athletes.all()), [self.athlete])
+        self.assertEqual(list(clone.coaches.all()), [self.coach])
+        self.assertFalse(Competition.objects.filter(season=self.target).exists())
+
+    def test_clone_with_competitions(self):
+        """Test copying competitions, which start without a score."""
+        response = self._clone(include_competitions=True)
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json()["competitions"], 1)
+        self.assertEqual(response.json()["athlete_memberships"], 2)
+
+        clone = Competition.objects.get(season=self.target)
+        self.assertIsNone(clone.score)
+        self.assertEqual(list(clone.athletes.all()), [self.athlete])
+
+    def test_clone_dry_run(self):
+        """Test that a dry run reports counts without copying anything."""
+        response = self._clone(include_competitions=True, dry_run=True)
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertTrue(data["dry_run"])
+        self.assertEqual(data["trainings"], 1)
+        self.assertEqual(data["competitions"], 1)
+        self.assertEqual(data["athlete_memberships"], 2)
+        self.assertEqual(data["coach_memberships"], 1)
+        self.assertFalse(Training.objects.filter(season=self.target).exists())
+
+    def test_clone_publishes_events(self):
+        """Test that the cloned activities are published as created."""
+        WebhookEndpoint.objects.create(
+            name="Federation",
+            url="http://127.0.0.1:9/",
+            resources=["trainings", "competitions"],
+        )
+        self._clone(include_competitions=True)
+
+        events = [message.event for message in OutboxMessage.objects.all()]
+        self.assertEqual(
+            sorted((event["public_id"], event["operation"]) for event in events),
+            sorted(
+                (activity.public_id, "create")
+                for model in (Training, Competition)
+                for activity in model.objects.filter(season=self.target)
+            ),
+        )
+        self.assertEqual({event["season"] for event in events}, {self.target.public_id})
+
+    def test_clone_locks_source(self):
+        """Test that the copied activities are locked before their IDs are made."""
+        with CaptureQueriesContext(connection) as queries:
+            self._clone(include_competitions=True)
+        locks = [
+            query["sql"] for query in queries if query["sql"].endswith("FOR UPDATE")
+        ]
+        self.assertEqual(len(locks), 2)
+
+    def test_clone_into_planned_season(self):
+        """Test that a season with trainings cannot be cloned into."""
+        self.assertEqual(self._clone().status_code, 201)
+        self.assertEqual(self._clone().status_code, 409)
+        self.assertEqual(Training.objects.filter(season=self.target).count(), 1)
+
+    def test_clone_target_not_found(self):
+        """Test cloning into a season that does not exist."""
+        response = self._clone(target_season_public_id="nonexistent")
+        self.assertEqual(response.status_code, 404)
+
+    def test_clone_command(self):
+        """Test the clone_season management command."""
+        out = StringIO()
+        call_command(
+            "clone_season", self.source.public_id, self.target.public_id, stdout=out
+        )
+        self.assertIn("trainings: 1", out.getvalue())
+        self.assertEqual(Training.objects.filter(season=self.target).count(), 1)
+
+        with self.assertRaises(CommandError):
+            call_command(
+                "clone_season",
+                self.source.public_id,
+                self.target.public_id,
+                stdout=StringIO(),
+            )
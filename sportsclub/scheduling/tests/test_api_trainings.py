@@ -3,6 +3,7 @@ import json
 from datetime import UTC, date, datetime
 
 from core.models import Address
+from core.test import query_budget
 from django.test import TestCase
 from inventory.models import Venue
 from people.models import Athlete, Coach
@@ -59,6 +60,22 @@ class TrainingAPITestCase(TestCase):
         data = response.json()
         self.assertEqual(len(data), 1)
 
+    @query_budget(7)
+    def test_list_trainings_query_budget(self):
+        """Test that listing trainings does not query per row."""
+        for number in range(5):
+            training = Training.objects.create(
+                name=f"Training {number}",
+                date=datetime(2025, 4, 1 + number, 10, 0, tzinfo=UTC),
+                venue=Venue.objects.create(name=f"Venue {number}"),
+                season=self.season,
+            )
+            training.coaches.add(self.coach)
+            training.athletes.add(self.athlete)
+
+        response = self.client.get("/api/v1/scheduling/trainings")
+        self.assertEqual(len(response.json()), 6)
+
     def test_list_trainings_returns_expected_fields(self):
         """Test that list response contains expected fields."""
         response = self.client.get("/api/v1/scheduling/trainings")
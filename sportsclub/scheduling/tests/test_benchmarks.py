@@ -0,0 +1,132 @@
+# scheduling/tests/test_benchmarks.py
+"""Tests for the API benchmarks."""
+
+import copy
+import random
+
+from core.models import Address
+from django.test import TestCase
+from people.models import Athlete
+
+from scheduling import benchmarks
+from scheduling.models import Ranking, Result, Training
+from scheduling.synthetic import ClubSize, generate_club
+from sportsclub.api import api
+
+SIZE = ClubSize(
+    venues=2, coaches=3, athletes=12, seasons=1, trainings=5, competitions=3
+)
+
+
+def _result(p50: float, p90: float, queries: int, memory: float) -> dict:
+    return {
+        "requests": 50,
+        "latency_ms": {"mean": p50, "p50": p50, "p90": p90, "p99": p90, "max": p90},
+        "queries": queries,
+        "peak_memory_kib": memory,
+    }
+
+
+def _report(**scenarios) -> dict:
+    return benchmarks.report(scenarios, {}, scale=1, seed=0)
+
+
+class BenchmarkSuiteTest(TestCase):
+    """Test suite for the scenarios of the benchmarks."""
+
+    def test_every_route_is_benchmarked(self):
+        """Test that every operation of the API has a scenario or a reason not to."""
+        operations = {
+            f"{method.upper()} {path.removeprefix(benchmarks.PREFIX)}"
+            for path, methods in api.get_openapi_schema()["paths"].items()
+            for method in methods
+        }
+        names = [scenario.name for scenario in benchmarks.scenarios()]
+
+        self.assertEqual(len(names), len(set(names)))
+        self.assertEqual(set(names) | set(benchmarks.SKIPPED), operations)
+        self.assertFalse(set(names) & set(benchmarks.SKIPPED))
+
+    def test_run(self):
+        """Test that every scenario runs, and leaves the club as it found it."""
+        generate_club(SIZE, seed=1)
+        benchmarks._add_results(seed=1)
+        counts = {
+            model: model._base_manager.count()
+            for model in [Address, Athlete, Training, Result, Ranking]
+        }
+
+        results = benchmarks.run_benchmarks(
+            benchmarks.scenarios(), requests=2, warmup=1, seed=1
+        )
+
+        self.assertEqual(len(results), len(benchmarks.scenarios()))
+        for result in results.values():
+            self.assertGreater(result["latency_ms"]["p50"], 0)
+            self.assertGreater(result["queries"], 0)
+        self.assertEqual(
+            {model: model._base_manager.count() for model in counts}, counts
+        )
+
+    def test_same_records_every_run(self):
+        """Test that scenarios request the same records for the same seed."""
+        generate_club(SIZE, seed=1)
+        (scenario,) = [
+            scenario
+            for scenario in benchmarks.scenarios()
+            if scenario.name == "GET /people/athletes/{public_id}"
+        ]
+
+        paths = []
+        for _ in range(2):
+            dataset = benchmarks.Dataset(self.client)
+            rng = random.Random("1:athletes")
+            paths.append([scenario.prepare(dataset, rng).path for _ in range(5)])
+        self.assertEqual(paths[0], paths[1])
+
+
+class CompareTest(TestCase):
+    """Test suite for comparing results to a baseline."""
+
+    def setUp(self):
+        """Set up a baseline of one route."""
+        self.baseline = _report(**{"GET /a": _result(10, 20, 3, 500)})
+
+    def test_within_threshold(self):
+        """Test that small slowdowns are not regressions."""
+        current = _report(**{"GET /a": _result(12, 24, 3, 600)})
+        comparison = benchmarks.compare(current, self.baseline, threshold=0.25)
+        self.assertEqual(comparison.regressions, [])
+
+    def test_regressions(self):
+        """Test that slower, hungrier or chattier routes are regressions."""
+        current = _report(**{"GET /a": _result(14, 20, 4, 700)})
+        comparison = benchmarks.compare(current, self.baseline, threshold=0.25)
+
+        self.assertEqual(
+            [regression.metric for regression in comparison.regressions],
+            ["latency p50 (ms)", "peak memory (KiB)", "queries"],
+        )
+        self.assertEqual(comparison.regressions[0].baseline, 10)
+
+    def test_slack(self):
+        """Test that tiny absolute differences are not regressions."""
+        baseline = _report(**{"GET /a": _result(0.2, 0.3, 1, 10)})
+        current = _report(**{"GET /a": _result(0.6, 0.7, 1, 60)})
+        comparison = benchmarks.compare(current, baseline, threshold=0.25)
+        self.assertEqual(comparison.regressions, [])
+
+    def test_new_routes(self):
+        """Test that routes missing from the baseline are reported apart."""
+        current = _report(
+            **{"GET /a": _result(10, 20, 3, 500), "GET /b": _result(1, 1, 1, 1)}
+        )
+        comparison = benchmarks.compare(current, self.baseline, threshold=0.25)
+        self.assertEqual(comparison.new, ["GET /b"])
+
+    def test_other_club(self):
+        """Test that baselines of another club cannot be compared to."""
+        current = copy.deepcopy(self.baseline)
+        current["club"]["scale"] = 2
+        with self.assertRaises(benchmarks.BenchmarkError):
+            benchmarks.compare(current, self.baseline, threshold=0.25)
@@ -2,6 +2,8 @@
 from datetime import UTC, date, datetime
 
 from core.models import Address
+from core.models.enums import Discipline
+from django.db import connection
 from django.test import TestCase
 from inventory.models import Venue
 from people.models import Athlete, Coach
@@ -133,3 +135,64 @@ class CompetitionModelTest(TestCase):
         competitions = list(Competition.objects.all())
         self.assertEqual(competitions[0], self.competition)
         self.assertEqual(competitions[1], older_competition)
+
+    def test_score_path(self):
+        """Test score filters compile to SQL/JSON path expressions."""
+        self.assertIsNone(Competition.score_path())
+        self.assertEqual(Competition.score_path(Discipline.RELAYS), "$.results.relays")
+        self.assertEqual(
+            Competition.score_path(Discipline.RELAYS, min_gold=1, min_bronze=2),
+            "$.results.relays ? (@.gold >= 1 && @.bronze >= 2)",
+        )
+        self.assertEqual(
+            Competition.score_path(min_silver=3), "$.results.* ? (@.silver >= 3)"
+        )
+
+
+class CompetitionScoreIndexTest(TestCase):
+    """Test that score filters are served by the GIN index."""
+
+    def setUp(self):
+        """Create enough scored competitions for the planner to consider."""
+        season = Season.objects.create(
+            name="2024-2025 Season",
+            start_date=date(2024, 9, 1),
+            end_date=date(2025, 6, 30),
+        )
+        disciplines = list(Discipline)
+        Competition.objects.bulk_create(
+            Competition(
+                name=f"Meeting {i}",
+                date=datetime(2025, 1, 1, 10, 0, tzinfo=UTC),
+                season=season,
+                score={
+                    "results": {
+                        disciplines[i % len(disciplines)].value: {
+                            "gold": i % 3,
+                            "silver": 0,
+                            "bronze": 1,
+                        }
+                    }
+                },
+            )
+            for i in range(500)
+        )
+
+    def test_discipline_filter_uses_gin_index(self):
+        """Test EXPLAIN shows the GIN index for a discipline and medal filter."""
+        path = Competition.score_path(Discipline.RELAYS, min_gold=1)
+        # Without the `deleted_at IS NULL` predicate, so the partial indexes
+        # on live rows cannot stand in for the GIN index on such a small table
+        queryset = Competition.all_objects.filter(score__path_exists=path)
+
+        # Make the planner pick the index whenever it is usable at all, so the
+        # result does not depend on table statistics.
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+        plan = queryset.explain()
+
+        self.assertIn("scheduling_comp_score_gin", plan)
+        self.assertEqual(
+            queryset.count(),
+            sum(1 for i in range(500) if i % 5 == 2 and i % 3 >= 1),
+        )
@@ -0,0 +1,176 @@
+# scheduling/tests/test_models_ranking.py
+from datetime import UTC, date, datetime
+from decimal import Decimal
+
+from core.models.enums import AgeCategory, Discipline
+from django.test import TestCase
+from people.models import Athlete
+
+from scheduling.models import Competition, Ranking, Result, Season
+
+
+class ResultModelTest(TestCase):
+    """Test suite for Result model."""
+
+    def setUp(self):
+        """Set up test data."""
+        self.season = Season.objects.create(
+            name="2024-2025 Season",
+            start_date=date(2024, 9, 1),
+            end_date=date(2025, 6, 30),
+        )
+        self.competition = Competition.objects.create(
+            name="Spring Championship",
+            date=datetime(2025, 4, 15, 10, 0, tzinfo=UTC),
+            season=self.season,
+        )
+
+    def test_age_category_from_season_year(self):
+        """Test the category depends on the age reached in the season's year."""
+        athlete = Athlete.objects.create(
+            first_name="Ana",
+            last_name="Peleteiro",
+            email="ana@example.com",
+            date_of_birth=date(2011, 12, 31),
+        )
+        result = Result.objects.create(
+            competition=self.competition,
+            athlete=athlete,
+            discipline=Discipline.LONG_JUMP,
+            mark=Decimal("4.10"),
+        )
+        self.assertEqual(result.age_category, AgeCategory.U14)
+
+    def test_age_category_without_date_of_birth(self):
+        """Test athletes without a date of birth compete in the open category."""
+        athlete = Athlete.objects.create(
+            first_name="Ruth", last_name="Beitia", email="ruth@example.com"
+        )
+        result = Result.objects.create(
+            competition=self.competition,
+            athlete=athlete,
+            discipline=Discipline.HIGH_JUMP,
+            mark=Decimal("1.20"),
+        )
+        self.assertEqual(result.age_category, AgeCategory.OPEN)
+
+
+class RankingModelTest(TestCase):
+    """Test suite for Ranking snapshots."""
+
+    def setUp(self):
+        """Set up test data."""
+        self.season = Season.objects.create(
+            name="2024-2025 Season",
+            start_date=date(2024, 9, 1),
+            end_date=date(2025, 6, 30),
+        )
+        self.competition = Competition.objects.create(
+            name="Spring Championship",
+            date=datetime(2025, 4, 15, 10, 0, tzinfo=UTC),
+            season=self.season,
+        )
+        self.athletes = [
+            Athlete.objects.create(
+                first_name=f"Athlete{i}",
+                last_name="Test",
+                email=f"athlete{i}@example.com",
+                date_of_birth=date(2012, 1, 1),
+            )
+            for i in range(4)
+        ]
+
+    def _record(self, athlete, discipline, mark):
+        return Result.objects.create(
+            competition=self.competition,
+            athlete=athlete,
+            discipline=discipline,
+            mark=Decimal(mark),
+        )
+
+    def _ranks(self, discipline):
+        return list(
+            Ranking.objects.filter(
+                season=self.season, discipline=discipline, age_category="u14"
+            )
+            .order_by("rank", "athlete_id")
+            .values_list("athlete_id", "rank", "best_mark")
+        )
+
+    def test_races_rank_lowest_time_first(self):
+        """Test timed disciplines rank the best (lowest) personal mark first."""
+        self._record(self.athletes[0], Discipline.SPRINTS, "9.10")
+        self._record(self.athletes[0], Discipline.SPRINTS, "8.90")
+        self._record(self.athletes[1], Discipline.SPRINTS, "8.70")
+        self._record(self.athletes[2], Discipline.SPRINTS, "9.50")
+
+        Ranking.refresh_partition(self.season.pk, Discipline.SPRINTS, "u14")
+
+        self.assertEqual(
+            self._ranks(Discipline.SPRINTS),
+            [
+                (self.athletes[1].pk, 1, Decimal("8.70")),
+                (self.athletes[0].pk, 2, Decimal("8.90")),
+                (self.athletes[2].pk, 3, Decimal("9.50")),
+            ],
+        )
+
+    def test_jumps_rank_highest_mark_first_with_ties(self):
+        """Test jumps rank the highest mark first and ties share a rank."""
+        self._record(self.athletes[0], Discipline.LONG_JUMP, "4.00")
+        self._record(self.athletes[1], Discipline.LONG_JUMP, "4.50")
+        self._record(self.athletes[2], Discipline.LONG_JUMP, "4.50")
+        self._record(self.athletes[3], Discipline.LONG_JUMP, "3.90")
+
+        Ranking.refresh_partition(self.season.pk, Discipline.LONG_JUMP, "u14")
+
+        ranks = [rank for _, rank, _ in self._ranks(Discipline.LONG_JUMP)]
+        self.assertEqual(ranks, [1, 1, 3, 4])
+
+    def test_soft_deleted_results_are_not_ranked(self):
+        """Test soft-deleted results are excluded from the snapshot."""
+        result = self._record(self.athletes[0], Discipline.SPRINTS, "8.50")
+        self._record(self.athletes[1], Discipline.SPRINTS, "9.00")
+        result.soft_delete()
+
+        Ranking.refresh_partition(self.season.pk, Discipline.SPRINTS, "u14")
+
+        self.assertEqual(
+            self._ranks(Discipline.SPRINTS),
+            [(self.athletes[1].pk, 1, Decimal("9.00"))],
+        )
+
+    def test_apply_result_skips_marks_that_do_not_improve(self):
+        """Test a new mark worse than the personal best leaves the snapshot alone."""
+        self._record(self.athletes[0], Discipline.SPRINTS, "8.50")
+        Ranking.refresh_partition(self.season.pk, Discipline.SPRINTS, "u14")
+        refreshed_at = Ranking.objects.get().refreshed_at
+
+        slower = self._record(self.athletes[0], Discipline.SPRINTS, "9.00")
+
+        self.assertFalse(Ranking.apply_result(slower, top_n=10, created=True))
+        self.assertEqual(Ranking.objects.get().refreshed_at, refreshed_at)
+
+    def test_apply_result_reports_top_n_changes(self):
+        """Test only results entering the first positions report a change."""
+        for athlete, mark in zip(
+            self.athletes[:3], ["8.00", "8.50", "9.00"], strict=True
+        ):
+            self._record(athlete, Discipline.SPRINTS, mark)
+        Ranking.refresh_partition(self.season.pk, Discipline.SPRINTS, "u14")
+
+        outside = self._record(self.athletes[3], Discipline.SPRINTS, "9.50")
+        self.assertFalse(Ranking.apply_result(outside, top_n=2, created=True))
+        self.assertEqual(len(self._ranks(Discipline.SPRINTS)), 4)
+
+        inside = self._record(self.athletes[3], Discipline.SPRINTS, "7.90")
+        self.assertTrue(Ranking.apply_result(inside, top_n=2, created=True))
+        self.assertEqual(self._ranks(Discipline.SPRINTS)[0][0], self.athletes[3].pk)
+
+    def test_refresh_season(self):
+        """Test every partition of a season is rebuilt."""
+        self._record(self.athletes[0], Discipline.SPRINTS, "8.50")
+        self._record(self.athletes[0], Discipline.HIGH_JUMP, "1.30")
+
+        self.assertEqual(Ranking.refresh_season(self.season.pk), 2)
+        self.assertEqual(Ranking.objects.filter(season=self.season).count(), 2)
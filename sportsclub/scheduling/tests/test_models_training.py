@@ -2,6 +2,7 @@
 from datetime import UTC, date, datetime
 
 from core.models import Address
+from django.db import connection
 from django.test import TestCase
 from inventory.models import Venue
 from people.models import Athlete, Coach
@@ -117,3 +118,51 @@ class TrainingModelTest(TestCase):
         training_pk = self.training.pk
         self.season.delete()
         self.assertFalse(Training.objects.filter(pk=training_pk).exists())
+
+
+class TrainingLiveIndexTest(TestCase):
+    """Test that lookups on live trainings are served by partial indexes."""
+
+    def setUp(self):
+        """Create live and soft-deleted trainings over several seasons."""
+        self.seasons = [
+            Season.objects.create(
+                name=f"{year}-{year + 1} Season",
+                start_date=date(year, 9, 1),
+                end_date=date(year + 1, 6, 30),
+            )
+            for year in range(2020, 2025)
+        ]
+        Training.objects.bulk_create(
+            Training(
+                name=f"Session {i}",
+                date=datetime(2025, 1, 1 + i % 28, 10, 0, tzinfo=UTC),
+                season=self.seasons[i % 5],
+                deleted_at=datetime(2025, 2, 1, tzinfo=UTC) if i % 2 else None,
+            )
+            for i in range(1000)
+        )
+
+    def _plan(self, queryset):
+        # Make the planner pick an index whenever it is usable at all, based
+        # on up-to-date statistics
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE scheduling_training")
+            cursor.execute("SET LOCAL enable_seqscan = off")
+        return queryset.explain()
+
+    def test_season_lookup_uses_partial_index(self):
+        """Test EXPLAIN shows the partial index for the trainings of a season."""
+        queryset = Training.objects.filter(season=self.seasons[0]).order_by("date")
+        self.assertIn("scheduling_train_live_season", self._plan(queryset))
+        self.assertEqual(queryset.count(), 100)
+
+    def test_date_range_uses_partial_index(self):
+        """Test EXPLAIN shows the partial index for a range of dates."""
+        queryset = Training.objects.filter(
+            date__range=(
+                datetime(2025, 1, 1, tzinfo=UTC),
+                datetime(2025, 1, 7, tzinfo=UTC),
+            )
+        )
+        self.assertIn("scheduling_train_live_date", self._plan(queryset))
@@ -0,0 +1,105 @@
+# scheduling/tests/test_synthetic.py
+"""Tests for the synthetic club generator."""
+
+import io
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import transaction
+from django.test import TestCase
+from people.models import Athlete
+
+from scheduling.models import Competition, Season, Training
+from scheduling.schemas import CompetitionScore
+from scheduling.synthetic import ClubSize, generate_club
+
+SIZE = ClubSize(
+    venues=2, coaches=3, athletes=30, seasons=2, trainings=10, competitions=4
+)
+
+
+def _snapshot() -> dict:
+    """The generated club, by public IDs rather than primary keys."""
+    return {
+        "athletes": sorted(
+            Athlete.objects.values_list("public_id", "email", "date_of_birth")
+        ),
+        "trainings": sorted(
+            (
+                training.public_id,
+                training.date,
+                training.season.public_id,
+                sorted(athlete.public_id for athlete in training.athletes.all()),
+            )
+            for training in Training.objects.select_related("season").prefetch_related(
+                "athletes"
+            )
+        ),
+        "scores": sorted(
+            Competition.objects.values_list("public_id", "score"),
+            key=lambda row: row[0],
+        ),
+    }
+
+
+class SyntheticClubTest(TestCase):
+    """Test suite for generating synthetic clubs."""
+
+    def test_counts(self):
+        """Test that the club has the requested size, rosters included."""
+        tables = generate_club(SIZE, seed=1)
+
+        self.assertEqual(Athlete.objects.count(), 30)
+        self.assertEqual(Season.objects.count(), 2)
+        self.assertEqual(Training.objects.count(), 20)
+        self.assertEqual(Competition.objects.count(), 8)
+        self.assertEqual(
+            tables["scheduling_training_athletes"],
+            Training.athletes.through.objects.count(),
+        )
+        # Every person and venue has an address
+        self.assertFalse(Athlete.objects.filter(address__isnull=True).exists())
+        self.assertEqual(tables["core_address"], 35)
+
+    def test_records_are_valid(self):
+        """Test that activities fall in their season and scores validate."""
+        generate_club(SIZE, seed=1, first_year=2023)
+
+        for training in Training.objects.select_related("season"):
+            self.assertEqual(training.date.year, training.season.start_date.year)
+            self.assertGreaterEqual(training.athletes.count(), 4)
+        scores = Competition.objects.exclude(score=None).values_list("score", flat=True)
+        self.assertTrue(scores)
+        for score in scores:
+            CompetitionScore.model_validate(score)
+
+    def test_reproducible(self):
+        """Test that a seed gives the same club with any workers and chunks."""
+        with transaction.atomic():
+            generate_club(SIZE, seed=7)
+            expected = _snapshot()
+            transaction.set_rollback(True)
+
+        generate_club(SIZE, seed=7, workers=2, chunk_size=3)
+
+        self.assertEqual(_snapshot(), expected)
+
+    def test_sequences_are_advanced(self):
+        """Test that records created afterwards get new primary keys."""
+        generate_club(SIZE, seed=1)
+        season = Season.objects.create(
+            name="Temporada 2030", start_date="2030-01-01", end_date="2030-12-31"
+        )
+        self.assertGreater(season.pk, Season.objects.exclude(pk=season.pk).count())
+
+    def test_command(self):
+        """Test that the command reports the rows copied, once per seed."""
+        out = io.StringIO()
+        call_command(
+            "generate_synthetic_club", "--scale=0.05", "--workers=0", stdout=out
+        )
+
+        self.assertIn("people_athlete: 5", out.getvalue())
+        self.assertIn("scheduling_training: 125", out.getvalue())
+        with self.assertRaisesMessage(CommandError, "generated already"):
+            call_command("generate_synthetic_club", "--scale=0.05", "--workers=0")
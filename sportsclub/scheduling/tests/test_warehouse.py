@@ -0,0 +1,189 @@
+# scheduling/tests/test_warehouse.py
+"""Tests for the analytics warehouse."""
+
+import io
+import tempfile
+from datetime import UTC, date, datetime
+from pathlib import Path
+
+import duckdb
+from core.models import Address
+from django.core.management import call_command
+from django.db import transaction
+from django.test import TransactionTestCase, override_settings
+from inventory.models import Venue
+from people.models import Athlete, Coach
+
+from scheduling.models import Competition, Season, Training
+from scheduling.warehouse import DATABASE, WarehouseError, export_warehouse
+
+
+@override_settings(SYNC_CLOCK_SKEW_SECONDS=0)
+class WarehouseTest(TransactionTestCase):
+    """Test suite for exporting the club to the analytics warehouse."""
+
+    def setUp(self):
+        """Set up a training and a competition at a venue, in a warehouse."""
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = Path(directory.name)
+
+        address = Address.objects.create(
+            line1="Carrer de Son Hugo, 1", city="Palma", country="Spain"
+        )
+        self.venue = Venue.objects.create(
+            name="Son Moix", venue_type="stadium", address=address
+        )
+        self.bolt = Athlete.objects.create(
+            first_name="Usain",
+            last_name="Bolt",
+            email="usain.bolt@example.com",
+            date_of_birth=date(1986, 8, 21),
+            height="1.95",
+            address=address,
+        )
+        self.mills = Coach.objects.create(
+            first_name="Glen", last_name="Mills", email="glen.mills@example.com"
+        )
+        self.season = Season.objects.create(
+            name="Temporada 2025",
+            start_date=date(2025, 1, 1),
+            end_date=date(2025, 12, 31),
+        )
+        self.training = Training.objects.create(
+            name="Series en pista",
+            date=datetime(2025, 3, 1, 9, tzinfo=UTC),
+            season=self.season,
+            venue=self.venue,
+        )
+        self.training.athletes.set([self.bolt])
+        self.training.coaches.set([self.mills])
+        Competition.objects.create(
+            name="Campionat de Balears",
+            date=datetime(2025, 6, 1, 10, tzinfo=UTC),
+            season=self.season,
+            score={"results": {"sprints": {"gold": 1}}},
+        )
+
+    def _query(self, sql: str) -> list[tuple]:
+        with duckdb.connect(str(self.directory / DATABASE), read_only=True) as db:
+            return db.execute(sql).fetchall()
+
+    def test_star_schema(self):
+        """Test that activities are denormalised with their participants."""
+        export = export_warehouse(self.directory)
+
+        self.assertTrue(export.full)
+        self.assertEqual(
+            export.rows, {"fact_activity": 2, "dim_person": 2, "dim_venue": 1}
+        )
+        ((name, season, venue, city, athletes, coaches),) = self._query(
+            """
+            SELECT name, season_name, venue_name, venue_city,
+                   athlete_public_ids, coach_public_ids
+            FROM fact_activity WHERE kind = 'training'
+            """
+        )
+        self.assertEqual(
+            (name, season, venue, city),
+            ("Series en pista", "Temporada 2025", "Son Moix", "Palma"),
+        )
+        self.assertEqual(athletes, [self.bolt.public_id])
+        self.assertEqual(coaches, [self.mills.public_id])
+        self.assertEqual(
+            self._query(
+                "SELECT score->>'$.results.sprints.gold' FROM fact_activity "
+                "WHERE kind = 'competition'"
+            ),
+            [("1",)],
+        )
+        self.assertEqual(
+            self._query(
+                "SELECT role, person_public_id FROM fact_participation ORDER BY role"
+            ),
+            [("athlete", self.bolt.public_id), ("coach", self.mills.public_id)],
+        )
+
+    def test_people_without_contact_details(self):
+        """Test that people are exported with a birth year and no contact details."""
+        export_warehouse(self.directory)
+
+        columns = {
+            name
+            for (name,) in self._query(
+                "SELECT name FROM pragma_table_info('dim_person')"
+            )
+        }
+        self.assertNotIn("email", columns)
+        self.assertNotIn("date_of_birth", columns)
+        self.assertEqual(
+            self._query(
+                "SELECT birth_year, height::VARCHAR, city FROM dim_person "
+                "WHERE role = 'athlete'"
+            ),
+            [(1986, "1.95", "Palma")],
+        )
+
+    def test_parquet(self):
+        """Test that every table is also written to a Parquet file."""
+        export_warehouse(self.directory)
+
+        for name, rows in [
+            ("fact_activity", 2),
+            ("fact_participation", 2),
+            ("dim_person", 2),
+            ("dim_venue", 1),
+        ]:
+            path = self.directory / f"{name}.parquet"
+            self.assertEqual(
+                self._query(f"SELECT count(*) FROM read_parquet('{path}')"), [(rows,)]
+            )
+
+    def test_incremental(self):
+        """Test that only the changed rows, and those denormalising them, are read."""
+        export_warehouse(self.directory)
+        self.assertEqual(sum(export_warehouse(self.directory).rows.values()), 0)
+
+        self.season.name = "Temporada 2025-26"
+        self.season.save()
+        self.mills.soft_delete()
+        export = export_warehouse(self.directory)
+
+        self.assertFalse(export.full)
+        self.assertEqual(
+            export.rows, {"fact_activity": 2, "dim_person": 1, "dim_venue": 0}
+        )
+        self.assertEqual(
+            self._query("SELECT DISTINCT season_name FROM fact_activity"),
+            [("Temporada 2025-26",)],
+        )
+        self.assertEqual(
+            self._query("SELECT count(*) FROM dim_person WHERE deleted_at IS NOT NULL"),
+            [(1,)],
+        )
+        # Merged by key, not appended
+        self.assertEqual(self._query("SELECT count(*) FROM fact_activity"), [(2,)])
+
+    def test_full(self):
+        """Test that a full export drops the rows purged from the database."""
+        export_warehouse(self.directory)
+        Competition.all_objects.all().delete()
+
+        self.assertEqual(export_warehouse(self.directory).rows["fact_activity"], 0)
+        self.assertEqual(self._query("SELECT count(*) FROM fact_activity"), [(2,)])
+        export = export_warehouse(self.directory, full=True)
+        self.assertEqual(export.rows["fact_activity"], 1)
+        self.assertEqual(self._query("SELECT count(*) FROM fact_activity"), [(1,)])
+
+    def test_export_is_isolated(self):
+        """Test that exports refuse to join the transaction of the caller."""
+        with transaction.atomic(), self.assertRaises(WarehouseError):
+            export_warehouse(self.directory)
+
+    def test_command(self):
+        """Test that the command reports the rows exported per table."""
+        out = io.StringIO()
+        call_command("export_warehouse", str(self.directory), stdout=out)
+
+        self.assertIn("fact_activity: 2", out.getvalue())
+        self.assertIn("(full export)", out.getvalue())
@@ -0,0 +1,443 @@
+# scheduling/warehouse.py
+"""
+Incremental export of the club to a local analytics warehouse.
+
+The warehouse is a DuckDB database file, `club.duckdb`, holding a star schema
+denormalised for analytical queries, and a Parquet file per table, for tools
+reading Parquet directly (pandas, Spark, notebooks, BI dashboards):
+
+- `fact_activity`: one row per training or competition (`kind`), with its
+  season, its venue and the address of the venue, and the public IDs of its
+  live athletes and coaches;
+- `fact_participation`: a view with one row per athlete or coach of a live
+  activity;
+- `dim_person`: athletes and coaches (`role`), with their address;
+- `dim_venue`: venues, with their address.
+
+People are exported without their contact details, and with their year of
+birth rather than their date of birth. Soft-deleted rows are kept, with their
+`deleted_at`, so that history can be analysed.
+
+Each export only reads the rows whose `updated_at` moved since the previous
+one, up to the watermark of the delta sync (see `core.sync`), along with the
+rows they are denormalised into (e.g. the activities of a renamed season), and
+merges them into the warehouse by public ID. As with the delta sync, a roster
+change alone does not move the `updated_at` of the activity, and rows purged
+by `core.archival` are not removed: both are caught up by a full export.
+
+Rows are read in one REPEATABLE READ transaction, streamed by `COPY ... TO
+STDOUT` into CSV files next to the warehouse, and loaded by DuckDB in one
+transaction, so the warehouse is consistent and a failed export changes
+nothing. The Parquet files are then rewritten from DuckDB without touching
+Postgres: analytical queries never run against the database of the API.
+"""
+
+import csv
+import os
+import tempfile
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import duckdb
+from core import sync
+from core.exports import related_public_ids
+from django.db import connection, models, transaction
+from django.db.models import F, Func, Q
+from django.db.models.functions import ExtractYear
+from inventory.models import Venue
+from people.models import Athlete, Coach
+
+from scheduling.models import Competition, Training
+
+DATABASE = "club.duckdb"
+EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+
+class WarehouseError(Exception):
+    """The warehouse cannot be exported, e.g. DuckDB is not installed."""
+
+
+@dataclass(frozen=True)
+class WarehouseTable:
+    """A table of the warehouse."""
+
+    name: str
+    # Columns identifying a row, replaced as a whole when exported again
+    key: tuple[str, ...]
+    # DuckDB types of the columns
+    columns: dict[str, str]
+    # Order of the rows in the Parquet file, which groups similar rows
+    order: tuple[str, ...]
+
+    def create_sql(self) -> str:
+        columns = ", ".join(f"{name} {type}" for name, type in self.columns.items())
+        return f"CREATE TABLE IF NOT EXISTS {self.name} ({columns})"
+
+
+AUDITORY_COLUMNS = {
+    "created_at": "TIMESTAMPTZ",
+    "updated_at": "TIMESTAMPTZ",
+    "deleted_at": "TIMESTAMPTZ",
+}
+ADDRESS_COLUMNS = {
+    "postal_code": "VARCHAR",
+    "city": "VARCHAR",
+    "state": "VARCHAR",
+    "country": "VARCHAR",
+}
+
+ACTIVITIES = WarehouseTable(
+    name="fact_activity",
+    key=("kind", "public_id"),
+    columns={
+        "kind": "VARCHAR",
+        "public_id": "VARCHAR",
+        "name": "VARCHAR",
+        "date": "TIMESTAMPTZ",
+        "season_public_id": "VARCHAR",
+        "season_name": "VARCHAR",
+        "season_start_date": "DATE",
+        "season_end_date": "DATE",
+        "venue_public_id": "VARCHAR",
+        "venue_name": "VARCHAR",
+        "venue_type": "VARCHAR",
+        "venue_indoor": "BOOLEAN",
+        "venue_city": "VARCHAR",
+        "venue_country": "VARCHAR",
+        "focus": "VARCHAR",
+        "score": "JSON",
+        "athlete_public_ids": "VARCHAR[]",
+        "coach_public_ids": "VARCHAR[]",
+        **AUDITORY_COLUMNS,
+    },
+    order=("date", "kind", "public_id"),
+)
+PEOPLE = WarehouseTable(
+    name="dim_person",
+    key=("role", "public_id"),
+    columns={
+        "role": "VARCHAR",
+        "public_id": "VARCHAR",
+        "first_name": "VARCHAR",
+        "last_name": "VARCHAR",
+        "birth_year": "INTEGER",
+        "height": "DECIMAL(5, 2)",
+        "weight": "DECIMAL(5, 2)",
+        "jersey_number": "INTEGER",
+        "certification": "VARCHAR",
+        **ADDRESS_COLUMNS,
+        "anonymised_at": "TIMESTAMPTZ",
+        **AUDITORY_COLUMNS,
+    },
+    order=("role", "public_id"),
+)
+VENUES = WarehouseTable(
+    name="dim_venue",
+    key=("public_id",),
+    columns={
+        "public_id": "VARCHAR",
+        "name": "VARCHAR",
+        "venue_type": "VARCHAR",
+        "capacity": "INTEGER",
+        "indoor": "BOOLEAN",
+        **ADDRESS_COLUMNS,
+        **AUDITORY_COLUMNS,
+    },
+    order=("public_id",),
+)
+TABLES = [ACTIVITIES, PEOPLE, VENUES]
+
+PARTICIPATION_VIEW = """
+    CREATE OR REPLACE VIEW fact_participation AS
+    SELECT kind, public_id AS activity_public_id, date, season_public_id,
+           venue_public_id, 'athlete' AS role,
+           UNNEST(athlete_public_ids) AS person_public_id
+    FROM fact_activity
+    WHERE deleted_at IS NULL
+    UNION ALL
+    SELECT kind, public_id, date, season_public_id, venue_public_id, 'coach',
+           UNNEST(coach_public_ids)
+    FROM fact_activity
+    WHERE deleted_at IS NULL
+"""
+
+RUNS_TABLE = """
+    CREATE TABLE IF NOT EXISTS export_runs (
+        exported_until TIMESTAMPTZ,
+        exported_at TIMESTAMPTZ,
+        full_export BOOLEAN,
+        exported_rows BIGINT
+    )
+"""
+
+
+class _ToJSON(Func):
+    # Arrays go through CSV as JSON, which DuckDB casts to lists
+    function = "to_json"
+    output_field = models.JSONField()
+
+
+@dataclass(frozen=True)
+class _Extract:
+    """Rows of a model exported to a table of the warehouse."""
+
+    table: WarehouseTable
+    model: type[models.Model]
+    # Columns, as given to `.values()`
+    fields: list[str]
+    expressions: dict[str, models.Expression]
+    # Columns set to the same value for every row of the model
+    constants: dict[str, str]
+    # Foreign keys (or paths of them) whose rows are denormalised into those
+    # of the model, which must be exported again when they change
+    depends_on: list[str] = field(default_factory=list)
+
+
+def _address() -> dict[str, models.Expression]:
+    return {column: F(f"address__{column}") for column in ADDRESS_COLUMNS}
+
+
+def _activity(model: type[models.Model], kind: str, fields: list[str]) -> _Extract:
+    return _Extract(
+        table=ACTIVITIES,
+        model=model,
+        fields=["public_id", "name", "date", *fields, *AUDITORY_COLUMNS],
+        expressions={
+            "season_public_id": F("season__public_id"),
+            "season_name": F("season__name"),
+            "season_start_date": F("season__start_date"),
+            "season_end_date": F("season__end_date"),
+            "venue_public_id": F("venue__public_id"),
+            "venue_name": F("venue__name"),
+            "venue_type": F("venue__venue_type"),
+            "venue_indoor": F("venue__indoor"),
+            "venue_city": F("venue__address__city"),
+            "venue_country": F("venue__address__country"),
+            "athlete_public_ids": _ToJSON(related_public_ids(model, "athletes")),
+            "coach_public_ids": _ToJSON(related_public_ids(model, "coaches")),
+        },
+        constants={"kind": kind},
+        depends_on=["season", "venue", "venue__address"],
+    )
+
+
+def _person(model: type[models.Model], role: str, fields: list[str]) -> _Extract:
+    return _Extract(
+        table=PEOPLE,
+        model=model,
+        fields=[
+            "public_id",
+            "first_name",
+            "last_name",
+            *fields,
+            "anonymised_at",
+            *AUDITORY_COLUMNS,
+        ],
+        expressions={"birth_year": ExtractYear("date_of_birth"), **_address()},
+        constants={"role": role},
+        depends_on=["address"],
+    )
+
+
+def _extracts() -> list[_Extract]:
+    return [
+        _activity(Training, "training", ["focus"]),
+        _activity(Competition, "competition", ["score"]),
+        _person(Athlete, "athlete", ["height", "weight", "jersey_number"]),
+        _person(Coach, "coach", ["certification"]),
+        _Extract(
+            table=VENUES,
+            model=Venue,
+            fields=[
+                "public_id",
+                "name",
+                "venue_type",
+                "capacity",
+                "indoor",
+                *AUDITORY_COLUMNS,
+            ],
+            expressions=_address(),
+            constants={},
+            depends_on=["address"],
+        ),
+    ]
+
+
+@dataclass
+class WarehouseExport:
+    """Outcome of an export of the warehouse."""
+
+    # Rows changed up to this time are in the warehouse
+    exported_until: datetime
+    full: bool
+    # Rows exported (i.e. changed) per table
+    rows: dict[str, int]
+
+
+def _changed(model: type[models.Model], window: Q, depends_on: list[str]):
+    """Rows changed within a window of `updated_at`, or referring to ones that did."""
+    condition = window
+    for path in depends_on:
+        name, _, rest = path.partition("__")
+        related = model._meta.get_field(name).related_model
+        changed = _changed(related, window, [rest] if rest else [])
+        condition |= Q(**{f"{name}__in": changed.values("pk")})
+    return model.all_objects.filter(condition)
+
+
+def _extract(
+    directory: Path, since: datetime | None, until: datetime
+) -> list[tuple[_Extract, Path]]:
+    """Copy the rows changed between two times to CSV files, one per extract."""
+    if since is None:
+        window = Q(updated_at__lt=until)
+    else:
+        window = Q(updated_at__gte=since, updated_at__lt=until)
+
+    files = []
+    with transaction.atomic(), connection.cursor() as cursor:
+        # Must come first in the transaction: every table is then read as of
+        # this point
+        cursor.execute("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ, READ ONLY")
+        for index, extract in enumerate(_extracts()):
+            # Every row is read anyway without a lower bound
+            depends_on = extract.depends_on if since is not None else []
+            rows = (
+                _changed(extract.model, window, depends_on)
+                .order_by()
+                .values(*extract.fields, **extract.expressions)
+            )
+            sql, params = rows.query.sql_with_params()
+            query = cursor.mogrify(sql, params).decode()
+            path = directory / f"{index}.csv"
+            with open(path, "wb") as file:
+                cursor.copy_expert(
+                    f"COPY ({query}) TO STDOUT WITH (FORMAT csv, HEADER)", file
+                )
+            files.append((extract, path))
+    return files
+
+
+def _literal(value: str) -> str:
+    return "'" + value.replace("'", "''") + "'"
+
+
+def _merge(db, extract: _Extract, path: Path) -> int:
+    """Replace the rows of a table by those of a CSV file, by key."""
+    table = extract.table
+    with open(path, newline="") as file:
+        header = next(csv.reader(file))
+    types = {
+        # Read as JSON, cast to a list when inserted
+        column: "JSON"
+        if table.columns[column].endswith("[]")
+        else table.columns[column]
+        for column in header
+    }
+    columns = ", ".join(
+        f"{_literal(name)}: {_literal(type)}" for name, type in types.items()
+    )
+    constants = "".join(
+        f", {_literal(value)} AS {name}" for name, value in extract.constants.items()
+    )
+    # Postgres writes NULL as an empty field, and empty strings quoted
+    db.execute(
+        f"""
+        CREATE OR REPLACE TEMP TABLE staging AS
+        SELECT *{constants}
+        FROM read_csv(
+            {_literal(str(path))}, header = true, allow_quoted_nulls = false,
+            columns = {{{columns}}}
+        )
+        """
+    )
+    keys = " AND ".join(f"{table.name}.{key} = staging.{key}" for key in table.key)
+    db.execute(f"DELETE FROM {table.name} USING staging WHERE {keys}")
+    db.execute(f"INSERT INTO {table.name} BY NAME SELECT * FROM staging")
+    return db.execute("SELECT count(*) FROM staging").fetchone()[0]
+
+
+def _exported_until(db) -> datetime | None:
+    (microseconds,) = db.execute(
+        "SELECT epoch_us(max(exported_until)) FROM export_runs"
+    ).fetchone()
+    if microseconds is None:
+        return None
+    return EPOCH + timedelta(microseconds=microseconds)
+
+
+def _write_parquet(db, directory: Path):
+    """Rewrite the Parquet files from the warehouse, each replaced at once."""
+    orders = {table.name: table.order for table in TABLES}
+    orders["fact_participation"] = ("date", "activity_public_id", "role")
+    for name, order in orders.items():
+        path = directory / f"{name}.parquet"
+        partial = path.with_name(f".{path.name}.tmp")
+        db.execute(
+            f"""
+            COPY (SELECT * FROM {name} ORDER BY {", ".join(order)})
+            TO {_literal(str(partial))} (FORMAT parquet, COMPRESSION zstd)
+            """
+        )
+        os.replace(partial, path)
+
+
+def export_warehouse(directory: Path, full: bool = False) -> WarehouseExport:
+    """
+    Export the changes since the previous export to the warehouse in a directory.
+
+    Args:
+        directory: Directory of the warehouse, created if needed
+        full: Export every row again, rather than the changes only
+
+    Raises:
+        WarehouseError: If DuckDB is not installed, the warehouse is in use
+            by another process, or when called within a transaction, as rows
+            would not be read in one snapshot
+
+    Returns:
+        The time up to which changes were exported, and the rows exported
+    """
+    if connection.in_atomic_block:
+        raise WarehouseError("The warehouse cannot be exported within a transaction")
+
+    directory.mkdir(parents=True, exist_ok=True)
+    try:
+        with (
+            duckdb.connect(str(directory / DATABASE)) as db,
+            tempfile.TemporaryDirectory(dir=directory) as staging,
+        ):
+            for table in TABLES:
+                db.execute(table.create_sql())
+            db.execute(RUNS_TABLE)
+            db.execute(PARTICIPATION_VIEW)
+
+            since = None if full else _exported_until(db)
+            until = sync.watermark()
+            files = _extract(Path(staging), since, until)
+
+            rows = dict.fromkeys((table.name for table in TABLES), 0)
+            db.begin()
+            if since is None:
+                for table in TABLES:
+                    db.execute(f"DELETE FROM {table.name}")
+            for extract, path in files:
+                rows[extract.table.name] += _merge(db, extract, path)
+            db.execute(
+                """
+                INSERT INTO export_runs
+                VALUES (make_timestamptz(?::BIGINT), now(), ?, ?)
+                """,
+                [
+                    (until - EPOCH) // timedelta(microseconds=1),
+                    since is None,
+                    sum(rows.values()),
+                ],
+            )
+            db.commit()
+
+            _write_parquet(db, directory)
+    except duckdb.Error as err:
+        raise WarehouseError(str(err)) from err
+    return WarehouseExport(exported_until=until, full=since is None, rows=rows)
@@ -1,6 +1,7 @@
 # sportsclub/api.py
 from core.api import router as core_router
 from core.auth import get_api_key_auth
+from core.sync import ExpiredSyncTokenError, InvalidSyncTokenError
 from django.db import IntegrityError
 from django.http import Http404
 from inventory.api import router as inventory_router
@@ -45,6 +46,26 @@ def handle_not_found(request, exc):
     )
 
 
+@api.exception_handler(InvalidSyncTokenError)
+def handle_invalid_sync_token(request, exc):
+    """Handle sync tokens that were tampered with or issued for another list."""
+    return api.create_response(
+        request,
+        {"detail": "Invalid sync token."},
+        status=400,
+    )
+
+
+@api.exception_handler(ExpiredSyncTokenError)
+def handle_expired_sync_token(request, exc):
+    """Handle sync tokens older than the deletions kept."""
+    return api.create_response(
+        request,
+        {"detail": "Sync token expired, sync again without a token."},
+        status=410,  # Gone
+    )
+
+
 @api.exception_handler(ValidationError)
 def handle_validation_error(request, exc):
     """Handle validation errors with detailed error messages."""
@@ -9,8 +9,12 @@ https://docs.djangoproject.com/en/5.2/howto/deployment/asgi/
 
 import os
 
+from core import invalidation
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "sportsclub.settings")
 
 application = get_asgi_application()
+
+# Evict the in-process caches of this worker on the writes of the others
+invalidation.start_listener()
@@ -35,6 +35,7 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
     # Third-party apps
     "corsheaders",
     "django_json_widget",
@@ -48,6 +49,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    # Off unless QUERY_REPEAT_THRESHOLD is set
+    "core.queries.RepeatedQueriesMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
@@ -57,6 +60,7 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "core.history.ChangeHistoryMiddleware",
 ]
 
 ROOT_URLCONF = "sportsclub.urls"
@@ -157,3 +161,105 @@ CORS_ALLOW_ALL_ORIGINS = True
 #     "http://localhost:3000",
 #     "http://127.0.0.1:3000",
 # ]
+
+# Rankings
+
+# Number of entries per ranking kept in the cache and served by the API
+RANKINGS_TOP_N = env.int("RANKINGS_TOP_N", default=10)
+
+# Calendar feeds
+
+# Activities have no end time, so events in .ics feeds last this long
+CALENDAR_EVENT_DURATION_MINUTES = env.int("CALENDAR_EVENT_DURATION_MINUTES", default=90)
+# Feeds larger than this are streamed on every request instead of being cached
+CALENDAR_CACHE_MAX_BYTES = env.int("CALENDAR_CACHE_MAX_BYTES", default=1024 * 1024)
+
+# Soft deletion
+
+# Rows soft-deleted longer ago than this are moved to the archive schema (or
+# purged) by the `archive_soft_deleted` command
+SOFT_DELETE_RETENTION_DAYS = env.int("SOFT_DELETE_RETENTION_DAYS", default=90)
+
+# Delta sync
+
+# Maximum number of changed records per page of a `/sync` endpoint
+SYNC_PAGE_SIZE = env.int("SYNC_PAGE_SIZE", default=500)
+# Rows are only synced once their `updated_at` is older than this, as the
+# application servers' clocks may drift from the database clock
+SYNC_CLOCK_SKEW_SECONDS = env.float("SYNC_CLOCK_SKEW_SECONDS", default=5.0)
+# A warning is logged when a transaction that has written has been open for
+# longer than this, as rows changed since it started are held back meanwhile
+SYNC_STALL_WARNING_SECONDS = env.float("SYNC_STALL_WARNING_SECONDS", default=60.0)
+
+# Exports
+
+# Rows fetched per round trip from the server-side cursor, and written at once
+EXPORT_CHUNK_SIZE = env.int("EXPORT_CHUNK_SIZE", default=2000)
+
+# CSV imports
+
+# Processes validating the rows of an import run by the import_csv command.
+# The endpoint validates in the request's own process.
+IMPORT_WORKERS = env.int("IMPORT_WORKERS", default=4)
+# Rows validated by a process, and copied to the database, at once
+IMPORT_CHUNK_SIZE = env.int("IMPORT_CHUNK_SIZE", default=1000)
+# Largest file the endpoint imports, as it holds a transaction for the whole
+# file; larger files go through the import_csv command
+IMPORT_MAX_UPLOAD_BYTES = env.int("IMPORT_MAX_UPLOAD_BYTES", default=5 * 1024 * 1024)
+# Rejected rows listed in a response of the endpoint; the others are counted
+IMPORT_MAX_REJECTS = env.int("IMPORT_MAX_REJECTS", default=100)
+
+# Change events
+
+# Latest events kept by each worker, to resume streams from a Last-Event-ID
+EVENTS_REPLAY_SIZE = env.int("EVENTS_REPLAY_SIZE", default=1000)
+# Events waiting for a client before its stream is closed as too slow
+EVENTS_QUEUE_SIZE = env.int("EVENTS_QUEUE_SIZE", default=1000)
+# Idle streams get a comment line this often, so proxies keep them open
+EVENTS_KEEPALIVE_SECONDS = env.float("EVENTS_KEEPALIVE_SECONDS", default=15.0)
+# Delay before a listener (change events, cache invalidation) reconnects to the
+# database after losing it
+EVENTS_RECONNECT_SECONDS = env.float("EVENTS_RECONNECT_SECONDS", default=5.0)
+
+# Cache invalidation
+
+# Run the listener evicting the in-process caches of each ASGI/WSGI worker
+CACHE_INVALIDATION_LISTEN = env.bool("CACHE_INVALIDATION_LISTEN", default=True)
+# A listener finding more invalidations than this waiting flushes its caches
+CACHE_INVALIDATION_MAX_BACKLOG = env.int("CACHE_INVALIDATION_MAX_BACKLOG", default=100)
+
+# Webhooks
+
+# Threads delivering the outbox, across all endpoints
+WEBHOOK_WORKERS = env.int("WEBHOOK_WORKERS", default=8)
+# Seconds between checks for due messages when the dispatcher is idle
+WEBHOOK_POLL_SECONDS = env.float("WEBHOOK_POLL_SECONDS", default=1.0)
+# Seconds to wait for an endpoint to answer a delivery
+WEBHOOK_TIMEOUT_SECONDS = env.float("WEBHOOK_TIMEOUT_SECONDS", default=10.0)
+# Failed deliveries are retried after this delay, doubled at every attempt...
+WEBHOOK_RETRY_BASE_SECONDS = env.float("WEBHOOK_RETRY_BASE_SECONDS", default=30.0)
+# ...up to this delay...
+WEBHOOK_RETRY_MAX_SECONDS = env.float("WEBHOOK_RETRY_MAX_SECONDS", default=6 * 3600)
+# ...and kept as dead letters after this many attempts
+WEBHOOK_MAX_ATTEMPTS = env.int("WEBHOOK_MAX_ATTEMPTS", default=10)
+
+# Change history
+
+# Records are written by a background thread, in batches of up to this size...
+CHANGE_HISTORY_BATCH_SIZE = env.int("CHANGE_HISTORY_BATCH_SIZE", default=500)
+# ...at most this many seconds after the first record of a batch was queued
+CHANGE_HISTORY_FLUSH_SECONDS = env.float("CHANGE_HISTORY_FLUSH_SECONDS", default=1.0)
+# Write records synchronously instead (set to False by the test runner)
+CHANGE_HISTORY_ASYNC = env.bool("CHANGE_HISTORY_ASYNC", default=True)
+# Monthly partitions older than this are dropped by `rotate_change_history`
+CHANGE_HISTORY_RETENTION_MONTHS = env.int("CHANGE_HISTORY_RETENTION_MONTHS", default=24)
+
+# Query fingerprints
+
+# Log a warning when a request runs the same statement, whatever its
+# parameters, more than this many times (e.g. once per row). 0 disables it.
+QUERY_REPEAT_THRESHOLD = env.int("QUERY_REPEAT_THRESHOLD", default=0)
+
+# Tests
+
+TEST_RUNNER = "core.test.TestRunner"
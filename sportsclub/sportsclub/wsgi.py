@@ -9,8 +9,12 @@ https://docs.djangoproject.com/en/5.2/howto/deployment/wsgi/
 
 import os
 
+from core import invalidation
 from django.core.wsgi import get_wsgi_application
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "sportsclub.settings")
 
 application = get_wsgi_application()
+
+# Evict the in-process caches of this worker on the writes of the others
+invalidation.start_listener()